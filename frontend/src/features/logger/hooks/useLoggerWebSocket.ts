@@ -33,56 +33,53 @@ interface UseLoggerWebSocketOptions {
   enabled?: boolean;
 }
 
-// Register log:entry listener ONCE at module level to avoid duplicates
+const toLogEntry = (data: Record<string, unknown>): LogEntry => {
+  const level = (['DEBUG', 'INFO', 'WARN', 'ERROR'].includes(data.level as string)
+    ? data.level
+    : 'INFO') as LogLevel;
+
+  return {
+    id: `${Date.now()}-${Math.random()}`,
+    timestamp: (data.timestamp as string) || new Date().toISOString(),
+    level,
+    category: (data.category as string) || 'UNKNOWN',
+    message: (data.message as string) || '',
+  };
+};
+
+// Register log:batch listener ONCE at module level to avoid duplicates
 // This listener stays active permanently to capture logs even when tab is inactive
-let logEntryListenerRegistered = false;
+let logBatchListenerRegistered = false;
 
-const registerLogEntryListener = () => {
-  if (logEntryListenerRegistered) return;
+const registerLogBatchListener = () => {
+  if (logBatchListenerRegistered) return;
 
-  socket.on('log:entry', (logData: unknown) => {
+  // Backend batches entries (every ~100 ms or 200 entries): { logs: [...] }
+  socket.on('log:batch', (batchData: unknown) => {
     try {
-      // Handle both direct log data and wrapped format
-      let data = logData as Record<string, unknown>;
-      if (!data || typeof data !== 'object') {
-        console.warn('Invalid log entry data:', logData);
+      const logs = (batchData as { logs?: unknown })?.logs;
+      if (!Array.isArray(logs)) {
+        console.warn('Invalid log batch data:', batchData);
         return;
       }
 
-      // Check if data is wrapped in a log property
-      if (!('level' in data) && 'log' in data) {
-        const wrapped = data.log as Record<string, unknown>;
-        if (wrapped && typeof wrapped === 'object') {
-          data = wrapped;
-        }
-      }
-
-      const level = (['DEBUG', 'INFO', 'WARN', 'ERROR'].includes(data.level as string)
-        ? data.level
-        : 'INFO') as LogLevel;
-
-      const log: LogEntry = {
-        id: `${Date.now()}-${Math.random()}`,
-        timestamp: (data.timestamp as string) || new Date().toISOString(),
-        level,
-        category: (data.category as string) || 'UNKNOWN',
-        message: (data.message as string) || '',
-      };
+      const entries = logs
+        .filter((data): data is Record<string, unknown> => !!data && typeof data === 'object')
+        .map(toLogEntry);
 
       // Add to store using getState() to always get fresh store instance
-      const store = useLoggerStreamStore.getState();
-      store.addLog(log);
+      useLoggerStreamStore.getState().addLogs(entries);
     } catch (error) {
-      console.error('Failed to process log entry:', error);
+      console.error('Failed to process log batch:', error);
     }
   });
 
-  logEntryListenerRegistered = true;
+  logBatchListenerRegistered = true;
 };
 
 /**
  * Connect to Socket.IO for real-time log streaming
- * Listens to 'log:entry' events from the backend
+ * Listens to 'log:batch' events from the backend
  */
 export const useLoggerWebSocket = ({
   enabled = true,
@@ -92,8 +89,8 @@ export const useLoggerWebSocket = ({
   useEffect(() => {
     if (!enabled) return;
 
-    // Register the permanent log:entry listener once
-    registerLogEntryListener();
+    // Register the permanent log:batch listener once
+    registerLogBatchListener();
 
     // Connection established
     const handleConnect = () => {
@@ -158,7 +155,7 @@ export const useLoggerWebSocket = ({
 
     return () => {
       // Cleanup: Only unregister connect/disconnect handlers
-      // log:entry listener stays active permanently
+      // log:batch listener stays active permanently
       socket.off('connect', handleConnect);
       socket.off('logs:history', handleLogHistory);
       socket.off('disconnect', handleDisconnect);
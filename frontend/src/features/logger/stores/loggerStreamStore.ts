@@ -15,6 +15,7 @@ const STORAGE_KEY = 'diuna-logger-stream';
 interface LoggerStreamStoreState {
   logs: LogEntry[];
   addLog: (log: LogEntry) => void;
+  addLogs: (logs: LogEntry[]) => void;
   clearLogs: () => void;
   setMaxLogs: (max: number) => void;
   maxLogs: number;
@@ -36,6 +37,13 @@ export const useLoggerStreamStore = create<LoggerStreamStoreState>()(
           return { logs: newLogs };
         }),
 
+      addLogs: (logs: LogEntry[]) =>
+        set((state) => {
+          if (logs.length === 0) return state;
+          // One state update per batch; keep only the last maxLogs entries
+          return { logs: [...state.logs, ...logs].slice(-state.maxLogs) };
+        }),
+
       clearLogs: () => set({ logs: [] }),
 
       setMaxLogs: (max: number) => set({ maxLogs: max }),
@@ -95,6 +95,19 @@ export function useTaskWebSocket(
           break;
         }
 
+        case "tasks:batch": {
+          // Task changes pushed in batches: { events: [{ type, task }] }
+          const events = (data as { events?: { type: string; task: unknown }[] })?.events;
+          if (!Array.isArray(events)) {
+            console.warn("[TaskMonitor] Invalid task batch:", data);
+            break;
+          }
+          for (const event of events) {
+            handleTaskEvent(event.type, event.task);
+          }
+          break;
+        }
+
         case "tasks:all":
         case "tasks:active": {
           // Handle both array format and wrapped format
@@ -164,6 +177,7 @@ export function useTaskWebSocket(
     const handleTaskCompleted = (task: unknown) => handleTaskEvent("task:completed", task);
     const handleTaskFailed = (task: unknown) => handleTaskEvent("task:failed", task);
     const handleTaskCancelled = (task: unknown) => handleTaskEvent("task:cancelled", task);
+    const handleTasksBatch = (batch: unknown) => handleTaskEvent("tasks:batch", batch);
     const handleTasksAll = (tasks: unknown) => handleTaskEvent("tasks:all", tasks);
     const handleTasksActive = (tasks: unknown) => handleTaskEvent("tasks:active", tasks);
     const handleTasksStats = (stats: unknown) => handleTaskEvent("tasks:stats", stats);
@@ -193,6 +207,7 @@ export function useTaskWebSocket(
     socket.on("task:completed", handleTaskCompleted);
     socket.on("task:failed", handleTaskFailed);
     socket.on("task:cancelled", handleTaskCancelled);
+    socket.on("tasks:batch", handleTasksBatch);
     socket.on("tasks:all", handleTasksAll);
     socket.on("tasks:active", handleTasksActive);
     socket.on("tasks:stats", handleTasksStats);
@@ -212,6 +227,7 @@ export function useTaskWebSocket(
       socket.off("task:completed", handleTaskCompleted);
       socket.off("task:failed", handleTaskFailed);
       socket.off("task:cancelled", handleTaskCancelled);
+      socket.off("tasks:batch", handleTasksBatch);
       socket.off("tasks:all", handleTasksAll);
       socket.off("tasks:active", handleTasksActive);
       socket.off("tasks:stats", handleTasksStats);
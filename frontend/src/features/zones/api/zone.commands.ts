@@ -35,4 +35,17 @@ export function setZoneAnimationParameters(
   return api.put(`/v1/zones/${zoneId}/animation/parameters`, {
     parameters,
   });
-}
\ No newline at end of file
+}
+export interface ZoneBatchItem {
+  zone_id: string;
+  color?: any;
+  brightness?: number;
+  is_on?: boolean;
+}
+
+/**
+ * Apply changes to many zones in one request (one frame push, one save).
+ */
+export function applyZoneBatch(zones: ZoneBatchItem[]): Promise<void> {
+  return api.post(`/v1/zones/batch`, { zones });
+}
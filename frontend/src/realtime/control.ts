@@ -0,0 +1,46 @@
+import { io, Socket } from 'socket.io-client';
+
+const SOCKET_URL =
+  import.meta.env.VITE_SOCKET_URL ?? 'http://localhost:8000';
+
+/**
+ * Continuous-control channel ('/control' namespace).
+ *
+ * Use for sliders / knobs instead of REST PUTs. Messages are compact
+ * [zone, field, value] triples; the server applies only the latest value
+ * per (zone, field) each render tick, so sending every input event is fine.
+ *
+ * Fields: 'h' hue 0-360, 'b' brightness 0-100, 'o' on/off (0/1),
+ * 'p:<param>' animation parameter (e.g. 'p:speed').
+ */
+export type ControlField = 'h' | 'b' | 'o' | `p:${string}`;
+
+// Shares the manager (one WebSocket) with the main socket
+export const controlSocket: Socket = io(`${SOCKET_URL}/control`, {
+  transports: ['websocket'],
+  autoConnect: true,
+  reconnection: true,
+  reconnectionAttempts: Infinity,
+  reconnectionDelay: 500,
+});
+
+controlSocket.on('error', (err: { message: string }) => {
+  console.warn('[control] rejected', err.message);
+});
+
+/**
+ * Send a control value. Volatile: dropped (not buffered) while disconnected,
+ * since only the latest value matters.
+ */
+export function sendControl(zoneId: string, field: ControlField, value: number | boolean): void {
+  controlSocket.volatile.emit('set', [zoneId, field, value]);
+}
+
+/**
+ * Send a control value and resolve once the server accepted it.
+ */
+export function sendControlAck(zoneId: string, field: ControlField, value: number | boolean): Promise<number> {
+  return new Promise((resolve) => {
+    controlSocket.emit('set', [zoneId, field, value], (accepted: number) => resolve(accepted));
+  });
+}
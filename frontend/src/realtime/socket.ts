@@ -3,8 +3,15 @@ import { io, Socket } from 'socket.io-client';
 const SOCKET_URL =
   import.meta.env.VITE_SOCKET_URL ?? 'http://localhost:8000';
 
+// Broadcast topics this client receives (initial state is sent per topic).
+// Kiosk builds can narrow it, e.g. VITE_SOCKET_SUBSCRIBE=zones
+const SOCKET_SUBSCRIBE: string[] = (
+  import.meta.env.VITE_SOCKET_SUBSCRIBE ?? 'zones,tasks,logs'
+).split(',').map((topic: string) => topic.trim()).filter(Boolean);
+
 export const socket: Socket = io(SOCKET_URL, {
   transports: ['websocket'],
+  auth: { subscribe: SOCKET_SUBSCRIBE },
   autoConnect: true,
   reconnection: true,
   reconnectionAttempts: Infinity,
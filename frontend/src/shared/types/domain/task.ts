@@ -61,11 +61,14 @@ export type TaskWebSocketMessageType =
   | "task:completed"
   | "task:failed"
   | "task:cancelled"
+  | "tasks:batch"
   | "tasks:snapshot"
   | "tasks:stats"
   | "tasks:all"
   | "tasks:active"
-  | "tasks:tree";
+  | "tasks:tree"
+  | "tasks:loop_lag"
+  | "tasks:stall";
 
 export interface TaskWebSocketMessage {
   type: TaskWebSocketMessageType;
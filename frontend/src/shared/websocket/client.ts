@@ -5,6 +5,7 @@
 
 import { io, Socket } from 'socket.io-client';
 import { config } from '@/config/constants';
+import { FrameDecoder, type DecodedFrame } from './frameCodec';
 
 class WebSocketService {
   private socket: Socket | null = null;
@@ -81,10 +82,43 @@ class WebSocketService {
   }
 
   /**
-   * Subscribe to frame updates (60 FPS)
+   * Subscribe to live LED frames (binary, delta encoded)
+   *
+   * Requests `fps` frames per second (server caps the rate, see 'frame:layout').
+   * Every decoded frame is acknowledged; the server sends no new frame
+   * until then, so a busy client skips frames instead of queueing them.
    */
-  onFrameUpdate(callback: (data: unknown) => void): void {
-    this.socket?.on('frame:update', callback);
+  onFrameUpdate(callback: (frame: DecodedFrame) => void, fps = 30): void {
+    const decoder = new FrameDecoder();
+
+    this.socket?.on('frame:update', (data: ArrayBuffer, ack?: () => void) => {
+      const frame = decoder.decode(data);
+      if (!frame) return; // not acknowledged: server resends a keyframe after its ack timeout
+      ack?.();
+      callback(frame);
+    });
+    this.socket?.on('connect', () => {
+      decoder.reset();
+      this.socket?.emit('frames_subscribe', { fps });
+    });
+    if (this.socket?.connected) {
+      this.socket.emit('frames_subscribe', { fps });
+    }
+  }
+
+  /**
+   * Channel/zone layout sent in response to frames_subscribe
+   */
+  onFrameLayout(callback: (data: unknown) => void): void {
+    this.socket?.on('frame:layout', callback);
+  }
+
+  /**
+   * Stop live LED frames
+   */
+  offFrameUpdate(): void {
+    this.socket?.off('frame:update');
+    this.socket?.emit('frames_unsubscribe');
   }
 
   // /**
@@ -0,0 +1,74 @@
+/**
+ * Frame Codec
+ * Decodes binary 'frame:update' payloads (keyframes and RGB run deltas).
+ * Mirrors src/api/socketio/frames/codec.py
+ */
+
+export const FRAME_FORMAT_VERSION = 1;
+const FLAG_KEYFRAME = 0x01;
+const HEADER_SIZE = 12;
+
+export interface DecodedFrame {
+  seq: number;
+  /** Packed RGB per LED channel (index order of 'frame:layout' channels) */
+  channels: Uint8Array[];
+}
+
+/**
+ * Keeps the last decoded frame so deltas can be applied on top of it.
+ */
+export class FrameDecoder {
+  private last: DecodedFrame | null = null;
+
+  decode(data: ArrayBuffer | Uint8Array): DecodedFrame | null {
+    const bytes = data instanceof Uint8Array ? data : new Uint8Array(data);
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+
+    const version = view.getUint8(0);
+    if (version !== FRAME_FORMAT_VERSION) {
+      console.warn(`[FrameDecoder] Unsupported frame format version ${version}`);
+      return null;
+    }
+    const flags = view.getUint8(1);
+    const channelCount = view.getUint16(2, true);
+    const seq = view.getUint32(4, true);
+    const baseSeq = view.getUint32(8, true);
+
+    let offset = HEADER_SIZE;
+    const channels: Uint8Array[] = [];
+
+    if (flags & FLAG_KEYFRAME) {
+      for (let c = 0; c < channelCount; c++) {
+        const pixels = view.getUint16(offset, true);
+        offset += 2;
+        channels.push(bytes.slice(offset, offset + pixels * 3));
+        offset += pixels * 3;
+      }
+    } else {
+      if (!this.last || this.last.seq !== baseSeq || this.last.channels.length !== channelCount) {
+        // Base frame missing - the server falls back to a keyframe after the ack timeout
+        return null;
+      }
+      for (let c = 0; c < channelCount; c++) {
+        const runCount = view.getUint16(offset + 2, true);
+        offset += 4;
+        const rgb = this.last.channels[c].slice();
+        for (let r = 0; r < runCount; r++) {
+          const first = view.getUint16(offset, true);
+          const count = view.getUint16(offset + 2, true);
+          offset += 4;
+          rgb.set(bytes.subarray(offset, offset + count * 3), first * 3);
+          offset += count * 3;
+        }
+        channels.push(rgb);
+      }
+    }
+
+    this.last = { seq, channels };
+    return this.last;
+  }
+
+  reset(): void {
+    this.last = null;
+  }
+}
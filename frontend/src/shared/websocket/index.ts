@@ -4,3 +4,4 @@
  */
 
 export { websocketService, default } from './client';
+export { FrameDecoder, type DecodedFrame } from './frameCodec';
@@ -118,22 +118,20 @@ class AnimationEngine:
             
             self.tasks[zone_id] = task
 
-            log.info(
-                f"Started animation {anim_id.name} on zone {zone_id.name}"
-            )
+            log.info("Started animation %s on zone %s", anim_id.name, zone_id.name)
 
             # Publish animation started event
-            asyncio.create_task(self.event_bus.publish(
+            self.event_bus.publish_nowait(
                 AnimationStartedEvent(
                     zone_id=zone_id,
                     animation_id=anim_id
                 )
-            ))
+            )
             
     async def stop_for_zone(self, zone_id: ZoneID):
         """Stop animation for a single zone."""
 
-        log.info(f"Stopping animation on zone {zone_id.name}")
+        log.info("Stopping animation on zone %s", zone_id.name)
 
         # Extract task without holding lock during await
         task = None
@@ -160,11 +158,11 @@ class AnimationEngine:
             self.active_animations.pop(zone_id, None)
 
         # Publish animation stopped event
-        # asyncio.create_task(self.event_bus.publish(
+        # self.event_bus.publish_nowait(
         #     AnimationStoppedEvent(zone_id=zone_id)
-        # ))
+        # )
 
-        log.info(f"Stopped animation on zone {zone_id.name}")
+        log.info("Stopped animation on zone %s", zone_id.name)
             
 
     async def stop_all(self):
@@ -203,7 +201,7 @@ class AnimationEngine:
         - renderer (FrameManager) controls FPS
         """
         
-        log.info(f"_run_loop started for {zone_id.name}")
+        log.info("_run_loop started for %s", zone_id.name)
         
         frames_sent = 0
         last_log = time.monotonic()
@@ -228,7 +226,7 @@ class AnimationEngine:
                 
                 await asyncio.sleep(1 / self.frame_manager.fps)
         except asyncio.CancelledError:
-            log.debug(f"Animation task for {zone_id.name} canceled")
+            log.debug("Animation task for %s canceled", zone_id.name)
                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                        
         except Exception as e:
             log.error(
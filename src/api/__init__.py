@@ -12,6 +12,13 @@ Structure:
 - websocket/  : Real-time communication (future)
 """
 
-from api.main import create_app
-
 __all__ = ["create_app"]
+
+
+def __getattr__(name):
+    # Lazy: importing api.schemas (e.g. from the log broadcaster) must not pull
+    # in FastAPI before the LEDs are up
+    if name == "create_app":
+        from api.main import create_app
+        return create_app
+    raise AttributeError(f"module 'api' has no attribute {name!r}")
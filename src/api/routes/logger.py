@@ -4,12 +4,17 @@ Logger API routes for exposing log levels, categories, and WebSocket streaming.
 Provides:
 - GET /api/v1/logger/levels - List available log levels
 - GET /api/v1/logger/categories - List available log categories
+- GET /api/v1/logger/recent - Page through persisted logs (time range, level, category)
 - WS /ws/logs - WebSocket endpoint for real-time log streaming
 """
 
-from fastapi import APIRouter
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
 from models.enums import LogLevel, LogCategory
 from api.schemas.logger import LogLevelResponse, LogCategoryResponse
+from services.log_store import get_log_store
 
 router = APIRouter(
     prefix="/logger",
@@ -42,23 +47,50 @@ async def get_log_categories():
 
 
 @router.get("/recent")
-async def get_recent_logs(limit: int = 100):
+async def get_recent_logs(
+    limit: int = Query(100, ge=1, le=1000),
+    level: Optional[str] = Query(None, description="Minimum level (DEBUG, INFO, WARN, ERROR)"),
+    category: Optional[List[str]] = Query(None, description="Only these categories (repeatable)"),
+    since: Optional[datetime] = Query(None, description="Only entries at/after this time (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="Only entries at/before this time (ISO 8601)"),
+    before_seq: Optional[int] = Query(None, ge=1, description="Paging cursor from a previous response"),
+):
     """
-    Get recently logged messages (fallback REST endpoint).
-
-    This endpoint provides a REST alternative for retrieving recent logs
-    when WebSocket is not available. Currently returns empty list as logs
-    are streamed via WebSocket only. Can be enhanced to store log history
-    if needed.
+    Get logged messages, newest page first (entries oldest to newest).
 
-    Args:
-        limit: Maximum number of recent logs to return (max 1000)
+    Served from the persistent on-disk log store, so logs from before a
+    restart or crash are available. Pass `next_before_seq` from the response
+    as `before_seq` to fetch the previous page.
 
     Returns:
-        List of recent log entries
+        {"logs": [...], "next_before_seq": int | None}
     """
-    # Limit to reasonable max
-    limit = min(limit, 1000)
-    # TODO: Implement log history storage in LogBroadcaster if needed
-    return {"logs": []}
+    try:
+        min_level = LogLevel[level.upper()] if level else None
+        categories = [LogCategory[c.upper()] for c in category] if category else None
+    except KeyError as e:
+        raise HTTPException(status_code=422, detail=f"Unknown log level or category: {e.args[0]}")
+
+    store = get_log_store()
+    if store is None:
+        # Persistent logging disabled - live logs are streamed via Socket.IO only
+        return {"logs": [], "next_before_seq": None}
+
+    logs, next_before_seq = store.query(
+        since=since.timestamp() if since else None,
+        until=until.timestamp() if until else None,
+        min_level=min_level,
+        categories=categories,
+        limit=limit,
+        before_seq=before_seq,
+    )
+    return {"logs": logs, "next_before_seq": next_before_seq}
+
 
+@router.get("/store")
+async def get_log_store_stats():
+    """Persistent log store statistics (capacity, size, oldest entry, per-category counts)."""
+    store = get_log_store()
+    if store is None:
+        raise HTTPException(status_code=404, detail="Persistent log store is not enabled")
+    return store.stats()
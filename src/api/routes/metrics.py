@@ -0,0 +1,26 @@
+"""
+Metrics API route - Prometheus / OpenMetrics scrape endpoint.
+
+Provides:
+- GET /metrics - Render, event bus, task and event loop metrics (OpenMetrics text)
+
+Mounted at the root (not under /api/v1), where scrapers look by default.
+"""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from api.dependencies import get_service_container
+from lifecycle.task_registry import TaskRegistry
+from runtime.loop_monitor import get_loop_monitor
+from services.metrics_exporter import CONTENT_TYPE, MetricsExporter
+from services.service_container import ServiceContainer
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=Response)
+async def get_metrics(services: ServiceContainer = Depends(get_service_container)) -> Response:
+    """Current metrics in OpenMetrics text format (formatted per scrape, nothing cached)."""
+    exporter = MetricsExporter(services, TaskRegistry.instance(), get_loop_monitor())
+    return Response(content=exporter.render(), media_type=CONTENT_TYPE)
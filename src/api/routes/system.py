@@ -2,10 +2,14 @@
 System endpoints - Task introspection, health, and monitoring
 """
 
-from fastapi import APIRouter, Depends
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from lifecycle.task_registry import TaskRegistry
+from models.enums import ZoneID
+from models.events import EventType
+from runtime.loop_monitor import get_loop_monitor
+from runtime.startup_tracer import get_startup_tracer
 from utils.logger import get_logger, LogCategory
 from api.dependencies import get_service_container
 
@@ -29,7 +33,7 @@ async def get_task_summary() -> Dict[str, Any]:
     registry = TaskRegistry.instance()
     return {
         "summary": registry.summary(),
-        "total": len(registry.list_all()),
+        "total": registry.get_stats()["total"],
         "active": len(registry.active()),
         "failed": len(registry.failed()),
         "cancelled": len(registry.cancelled())
@@ -149,6 +153,92 @@ async def get_failed_tasks() -> Dict[str, Any]:
     }
 
 
+@router.get("/events/queue")
+async def get_event_queue_metrics(
+    services = Depends(get_service_container)
+) -> Dict[str, Any]:
+    """
+    Get EventBus dispatch queue metrics.
+
+    Returns:
+        - depth / high_water: Queued events now / peak per worker queue
+        - enqueued, dispatched, dropped, coalesced, blocked: Counters since start
+        - queue_wait_avg_ms / queue_wait_max_ms: Time between enqueue and dispatch
+        - handler_latency_ms: Per EventType handler time (count, avg, max)
+    """
+    return services.event_bus.get_queue_metrics()
+
+
+@router.get("/events/history")
+async def get_event_history(
+    type_name: Optional[str] = Query(None, alias="type", description="EventType name, e.g. ENCODER_ROTATE"),
+    zone: Optional[str] = Query(None, description="Zone ID, e.g. FLOOR"),
+    limit: int = Query(100, ge=1, le=10_000),
+    since_seconds: Optional[float] = Query(None, gt=0),
+    services = Depends(get_service_container)
+) -> Dict[str, Any]:
+    """
+    Query the EventBus history ring (works without DEBUG logging).
+
+    Returns:
+        - stats: Ring capacity, size and per-type totals
+        - count: Number of returned events
+        - events: Matching events, oldest first (seq, type, zone_id, time, payload)
+    """
+    try:
+        event_type = EventType[type_name.upper()] if type_name else None
+    except KeyError:
+        raise HTTPException(status_code=422, detail=f"Unknown event type '{type_name}'")
+    try:
+        zone_id = ZoneID[zone.upper()] if zone else None
+    except KeyError:
+        raise HTTPException(status_code=422, detail=f"Unknown zone '{zone}'")
+
+    history = services.event_bus.history
+    events = history.query(
+        event_type=event_type,
+        zone_id=zone_id,
+        limit=limit,
+        since_seconds=since_seconds,
+    )
+    return {
+        "stats": history.stats(),
+        "count": len(events),
+        "events": events
+    }
+
+
+@router.get("/startup")
+async def get_startup_trace() -> Dict[str, Any]:
+    """
+    Startup timings from the StartupTracer.
+
+    Returns:
+        - time_to_first_light_ms: Tracer start → first frame on the strips
+        - ready_ms: Tracer start → API server started
+        - process_age_at_start_ms: Interpreter startup before the tracer (Linux)
+        - milestones: All milestones (ms from tracer start)
+        - phases: Startup phases and deferred imports, by start offset
+        - imports_ms: Total time spent in traced imports
+    """
+    return get_startup_tracer().get_summary()
+
+
+@router.get("/loop")
+async def get_loop_lag() -> Dict[str, Any]:
+    """
+    Event loop lag from the LoopLagMonitor.
+
+    Returns:
+        - interval_ms / stall_threshold_ms: Monitor settings
+        - samples, last_lag_ms, avg_lag_ms, max_lag_ms: Heartbeat lag
+        - stalls_total: Heartbeats late by more than the threshold
+        - histogram: Lag distribution (le_ms null = +Inf)
+        - recent_stalls: Latest stalls with the blocked task and stack
+    """
+    return get_loop_monitor().get_stats()
+
+
 @router.get("/health")
 async def health_check() -> Dict[str, Any]:
     """
@@ -179,7 +269,7 @@ async def health_check() -> Dict[str, Any]:
         "status": status,
         "reason": reason,
         "tasks": {
-            "total": len(registry.list_all()),
+            "total": registry.get_stats()["total"],
             "active": len(active),
             "failed": len(failed),
             "cancelled": len(registry.cancelled()),
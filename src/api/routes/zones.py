@@ -17,18 +17,19 @@ Example: @app.put("/zones/{zone_id}/color")
 - Return ZoneResponse which becomes JSON
 """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional, TYPE_CHECKING
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 
 from api.schemas.zone import (
     SetZoneColorRequest, SetZoneAnimationParamsRequest, SetZoneAnimationRequest,
-    SetZoneBrightnessRequest, SetZoneIsOnRequest, SetZoneRenderModeRequest
+    SetZoneBrightnessRequest, SetZoneIsOnRequest, SetZoneRenderModeRequest, ZoneBatchRequest
 )
 from api.schemas.animation import (
     AnimationStartRequest, AnimationStopRequest, AnimationParameterUpdateRequest
 )
 
 from models.animation_params.animation_param_id import AnimationParamID
-from models.color import Color
 from models.domain.animation import AnimationState
 from models.domain.zone import ZoneCombined
 from models.enums import LogCategory, ZoneID, ZoneRenderMode
@@ -38,6 +39,9 @@ from api.dependencies import get_service_container
 from utils.logger import get_logger
 from utils.serialization import Serializer
 
+if TYPE_CHECKING:
+    from services.snapshot_publisher import SnapshotPublisher
+
 log = get_logger().for_category(LogCategory.API)
 
 # Create router for zone endpoints
@@ -83,31 +87,81 @@ async def get_old_zone_service(
 # GET ENDPOINTS - Retrieve zone data (read-only, safe)
 # ============================================================================
 
-# @router.get(
-#     "",
-#     response_model=ZoneListResponse,
-#     summary="List all zones",
-#     description="Get all zones with their current state (color, brightness, mode)"
-# )
-# async def list_zones(
-#     zone_service: ZoneAPIService = Depends(get_zone_service)
-# ) -> ZoneListResponse:
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, "*" matches anything)"""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
-#     return zone_service.get_all_zones()
 
+def _cached_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
-# @router.get(
-#     "/{zone_id}",
-#     response_model=ZoneResponse,
-#     summary="Get zone details",
-#     description="Get a single zone's configuration and current state"
-# )
-# async def get_zone(
-#     zone_id: str,
-#     zone_service: ZoneAPIService = Depends(get_zone_service)
-# ) -> ZoneResponse:
-    
-#     return zone_service.get_zone(zone_id)
+
+def _get_publisher(services: ServiceContainer) -> "SnapshotPublisher":
+    if services.snapshot_publisher is None:
+        raise HTTPException(status_code=503, detail="Zone snapshots not available")
+    return services.snapshot_publisher
+
+
+@router.get(
+    "",
+    summary="List all zones",
+    description="All zone snapshots (same payload as the zones:snapshot Socket.IO event). "
+                "Supports ETag / If-None-Match."
+)
+async def list_zones(
+    if_none_match: Optional[str] = Header(default=None),
+    services: ServiceContainer = Depends(get_service_container)
+) -> Response:
+    publisher = _get_publisher(services)
+    entries = publisher.get_all_snapshots()
+    etag = publisher.collection_etag(entries)
+    if _etag_matches(if_none_match, etag):
+        return _cached_response(b"", etag, if_none_match)
+    body = b"[" + b",".join(entry.json for entry in entries) + b"]"
+    return _cached_response(body, etag, if_none_match)
+
+
+@router.get(
+    "/{zone_id}",
+    summary="Get zone snapshot",
+    description="A single zone's snapshot. Supports ETag / If-None-Match."
+)
+async def get_zone(
+    zone_id: ZoneID,
+    if_none_match: Optional[str] = Header(default=None),
+    services: ServiceContainer = Depends(get_service_container)
+) -> Response:
+    entry = _get_publisher(services).get_snapshot(zone_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Zone {zone_id.name} not found")
+    return _cached_response(entry.json, entry.etag, if_none_match)
+
+
+# ============================================================================
+# BATCH ENDPOINTS - Many zones in one transaction
+# ============================================================================
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Update many zones at once",
+    description="Apply color / brightness / is_on changes to several zones as one transaction: "
+                "one frame push, one snapshot broadcast and one state save."
+)
+async def apply_zone_batch(
+    req: ZoneBatchRequest,
+    services: ServiceContainer = Depends(get_service_container)
+) -> None:
+    try:
+        services.zone_service.apply_static_batch(req.to_changes(services.color_manager))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 # ============================================================================
@@ -155,13 +209,7 @@ async def set_zone_color(
     req: SetZoneColorRequest,
     services: ServiceContainer = Depends(get_service_container)
 ) -> None:
-    color_req = req.color
-    if color_req.mode == "PRESET" and color_req.preset_name:
-        color = Color.from_preset(color_req.preset_name, services.color_manager)
-        services.zone_service.set_color(zone_id, color)
-    else:
-        color = Color.from_request(color_req)
-        services.zone_service.set_color(zone_id, color)
+    services.zone_service.set_color(zone_id, req.color.to_color(services.color_manager))
     
 
 @router.put(
@@ -4,11 +4,13 @@ Includes: Color, ZoneState, ZoneRenderMode, and complete Zone information
 """
 
 from pydantic import BaseModel, Field, model_validator, validator
-from typing import Optional, Dict, Any, Literal, Tuple
+from typing import Optional, Dict, Any, List, Literal, Tuple
 from enum import Enum
 
 from models.animation_params.animation_param_id import AnimationParamID
-from models.enums import AnimationID, ZoneRenderMode
+from models.color import Color
+from models.domain.zone import ZoneStaticChange
+from models.enums import AnimationID, ZoneID, ZoneRenderMode
 
 
 class ColorRequest(BaseModel):
@@ -44,6 +46,12 @@ class ColorRequest(BaseModel):
         if self.mode == "PRESET" and self.preset_name is None:
             raise ValueError("preset_name is required for PRESET mode")
         return self
+
+    def to_color(self, color_manager) -> Color:
+        """Domain Color (PRESET mode needs color_manager for RGB lookup)"""
+        if self.mode == "PRESET":
+            return Color.from_preset(self.preset_name, color_manager)
+        return Color.from_request(self)
     
     
 class SetZoneBrightnessRequest(BaseModel):
@@ -87,6 +95,33 @@ class SetZoneAnimationParamsRequest(BaseModel):
     )
 
 
+class ZoneBatchItem(BaseModel):
+    """One zone's changes in a batch update (omitted fields stay unchanged)"""
+    zone_id: ZoneID
+    color: Optional[ColorRequest] = None
+    brightness: Optional[int] = Field(None, ge=0, le=100, description="New brightness 0-100%")
+    is_on: Optional[bool] = None
+
+
+class ZoneBatchRequest(BaseModel):
+    """Request to change many zones at once (applied as one transaction)"""
+    zones: List[ZoneBatchItem] = Field(
+        min_length=1,
+        description="Per-zone changes; each zone may appear once"
+    )
+
+    def to_changes(self, color_manager) -> List[ZoneStaticChange]:
+        return [
+            ZoneStaticChange(
+                zone_id=item.zone_id,
+                color=item.color.to_color(color_manager) if item.color else None,
+                brightness=item.brightness,
+                is_on=item.is_on,
+            )
+            for item in self.zones
+        ]
+
+
 class ColorModeEnum(str, Enum):
     """Color mode enumeration - matches domain ColorMode"""
     RGB = "RGB"
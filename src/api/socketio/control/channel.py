@@ -0,0 +1,199 @@
+"""
+Low-latency control channel for continuous controls ('/control' namespace).
+
+Sliders and knobs in the UI send compact updates instead of REST calls:
+
+    emit("set", ["FLOOR", "h", 120])                          one update
+    emit("set", [["FLOOR", "h", 120], ["LAMP", "b", 40]])     several
+
+Fields:
+    "h"          hue 0-360 (switches the zone color to HUE mode)
+    "b"          brightness 0-100
+    "o"          is_on (0/1)
+    "p:<param>"  animation parameter, e.g. "p:speed"
+
+Updates are not applied on arrival. The latest value per (zone, field) is
+kept and applied once per render tick, so intermediate values of a drag
+are dropped server-side. Static fields of all zones go through one
+ZoneService.apply_static_batch (one frame push). The state file is written
+once the controls have been idle for a while, not per tick.
+
+Acknowledgements are optional: the 'set' handler returns the number of
+accepted updates, which Socket.IO only sends back if the client asked for
+an ack.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.animation_params.animation_param_id import AnimationParamID
+from models.color import Color
+from models.domain import ZoneStaticChange
+from models.enums import ZoneID
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.SOCKETIO)
+
+CONTROL_NAMESPACE = "/control"
+
+STATIC_FIELDS = ("h", "b", "o")
+PARAM_PREFIX = "p:"
+
+Update = Tuple[ZoneID, str, Any]
+
+
+def parse_update(raw: Any) -> Update:
+    """
+    Validate one compact update [zone, field, value].
+
+    Raises:
+        ValueError: Malformed update, unknown zone / field or bad value
+    """
+    if not isinstance(raw, (list, tuple)) or len(raw) != 3:
+        raise ValueError(f"Update must be [zone, field, value], got {raw!r}")
+    zone_name, field, value = raw
+
+    try:
+        zone_id = ZoneID(str(zone_name).upper())
+    except ValueError:
+        raise ValueError(f"Unknown zone: {zone_name!r}") from None
+
+    if field == "h":
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError(f"Hue must be a number, got {value!r}")
+        return zone_id, field, int(value) % 360
+    if field == "b":
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError(f"Brightness must be a number, got {value!r}")
+        return zone_id, field, max(0, min(100, int(value)))
+    if field == "o":
+        return zone_id, field, bool(value)
+    if isinstance(field, str) and field.startswith(PARAM_PREFIX):
+        try:
+            AnimationParamID(field[len(PARAM_PREFIX):].lower())
+        except ValueError:
+            raise ValueError(f"Unknown animation parameter: {field!r}") from None
+        return zone_id, field.lower(), value
+
+    raise ValueError(f"Unknown field: {field!r} (expected h, b, o or p:<param>)")
+
+
+def parse_updates(data: Any) -> List[Update]:
+    """Accept a single [zone, field, value] or a list of them"""
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], (list, tuple)):
+        return [parse_update(raw) for raw in data]
+    return [parse_update(data)]
+
+
+class ControlChannel:
+    """
+    Latest-value-wins buffer between continuous controls and ZoneService.
+
+    At most one apply per tick; the first update after a quiet period is
+    applied on the next loop iteration, later ones wait for the tick.
+    """
+
+    def __init__(self, zone_service, tick: float, idle_save: float = 0.5):
+        """
+        Args:
+            zone_service: ZoneService the updates are applied to
+            tick: Seconds between applies (one render frame)
+            idle_save: Persist state after this many seconds without updates
+        """
+        self.zone_service = zone_service
+        self.tick = tick
+        self.idle_save = idle_save
+
+        self._pending: Dict[Tuple[ZoneID, str], Any] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._last_flush = 0.0
+
+        self.received = 0
+        self.applied = 0
+
+    def submit(self, updates: List[Update]) -> None:
+        for zone_id, field, value in updates:
+            self._pending[(zone_id, field)] = value
+        self.received += len(updates)
+
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._last_flush + self.tick - loop.time())
+            self._flush_handle = loop.call_later(delay, self._flush)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "received": self.received,
+            "applied": self.applied,
+            "dropped": self.received - self.applied - len(self._pending),
+            "pending": len(self._pending),
+        }
+
+    def _flush(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._flush_handle = None
+        self._last_flush = loop.time()
+        pending, self._pending = self._pending, {}
+        self.applied += len(pending)
+
+        static: Dict[ZoneID, Dict[str, Any]] = {}
+        params: List[Update] = []
+        for (zone_id, field), value in pending.items():
+            if field in STATIC_FIELDS:
+                static.setdefault(zone_id, {})[field] = value
+            else:
+                params.append((zone_id, field, value))
+
+        if static:
+            changes = [
+                ZoneStaticChange(
+                    zone_id=zone_id,
+                    color=Color.from_hue(fields["h"]) if "h" in fields else None,
+                    brightness=fields.get("b"),
+                    is_on=fields.get("o"),
+                )
+                for zone_id, fields in static.items()
+            ]
+            try:
+                self.zone_service.apply_static_batch(changes, save=False)
+            except (TypeError, ValueError) as e:
+                log.warn(f"Control update rejected: {e}")
+
+        for zone_id, field, value in params:
+            param_id = AnimationParamID(field[len(PARAM_PREFIX):])
+            try:
+                self.zone_service.set_animation_param(zone_id, param_id, value)
+            except (TypeError, ValueError) as e:
+                log.warn(f"Control update rejected: {zone_id.name} {param_id.name}: {e}")
+
+        if static:
+            if self._save_handle is not None:
+                self._save_handle.cancel()
+            self._save_handle = loop.call_later(self.idle_save, self._save)
+
+    def _save(self) -> None:
+        self._save_handle = None
+        self.zone_service.save_state()
+
+
+def register_control(sio, services) -> ControlChannel:
+    """
+    Registers the '/control' namespace for continuous controls.
+    Returns the ControlChannel (one per server, shared by all clients).
+    """
+    channel = ControlChannel(services.zone_service, tick=1.0 / services.frame_manager.fps)
+
+    @sio.on("set", namespace=CONTROL_NAMESPACE)
+    async def control_set(sid: str, data):
+        """Client command: queue continuous control updates (ack = accepted count)"""
+        try:
+            updates = parse_updates(data)
+        except ValueError as e:
+            await sio.emit("error", {"message": str(e)}, room=sid, namespace=CONTROL_NAMESPACE)
+            return 0
+        channel.submit(updates)
+        return len(updates)
+
+    log.info("Control channel registered", namespace=CONTROL_NAMESPACE)
+    return channel
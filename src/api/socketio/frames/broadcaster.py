@@ -0,0 +1,247 @@
+"""
+Live LED frame streaming over Socket.IO ('frame:update').
+
+Clients subscribe with a requested rate; the streamer samples the rendered
+LED channel buffers, packs each new frame once and sends every client a
+binary delta against the last frame it acknowledged (see codec.py).
+
+Flow control: each 'frame:update' is emitted with an ack callback and a
+client gets no new frame while its previous one is unacknowledged, so a
+slow client skips frames instead of building a backlog.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from api.socketio.frames.codec import encode_delta, encode_keyframe, pack_rgb
+from lifecycle.task_registry import create_tracked_task, TaskCategory
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.SOCKETIO)
+
+
+@dataclass
+class FrameClient:
+    """Per-client streaming state"""
+    interval: float                  # seconds between frames (negotiated rate)
+    next_due: float = 0.0
+    acked_seq: int = 0               # frame the client has (delta base), 0 = none
+    in_flight_seq: int = 0           # sent, not yet acknowledged
+    in_flight_since: float = 0.0
+    sent: int = 0
+    skipped: int = 0                 # due while previous frame was unacknowledged
+
+
+class FrameStreamer:
+    """
+    Samples FrameManager LED channels and streams binary frames to subscribers.
+
+    Serialization happens once per frame per distinct delta base (clients at
+    the same rate share one), independent of the number of clients.
+    """
+
+    def __init__(self, sio, frame_manager, max_fps: float = 30.0, history: int = 8, ack_timeout: float = 1.0):
+        """
+        Args:
+            sio: Socket.IO AsyncServer
+            frame_manager: FrameManager whose led_channels are streamed
+            max_fps: Upper bound for negotiated client rates
+            history: Recent frames kept as delta bases
+            ack_timeout: Unacknowledged frames older than this are considered lost
+        """
+        self.sio = sio
+        self.frame_manager = frame_manager
+        self.max_fps = max_fps
+        self.history = history
+        self.ack_timeout = ack_timeout
+
+        self.clients: Dict[str, FrameClient] = {}
+        self._frames: "OrderedDict[int, List[bytes]]" = OrderedDict()
+        self._seq = 0
+        self._rendered_at_capture = -1
+        self._payloads: Dict[int, Optional[bytes]] = {}      # base seq -> payload for current seq
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.frames_captured = 0
+        self.payloads_encoded = 0
+
+    # === Subscriptions ===
+
+    def subscribe(self, sid: str, fps: float) -> float:
+        """Add or update a subscriber. Returns the granted rate."""
+        granted = max(1.0, min(float(fps), self.max_fps))
+        client = self.clients.get(sid)
+        if client is None:
+            self.clients[sid] = FrameClient(interval=1.0 / granted)
+        else:
+            client.interval = 1.0 / granted
+
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = create_tracked_task(
+                self._stream_loop(),
+                category=TaskCategory.API,
+                description="FrameStreamer: frame:update streaming (Socket.IO)"
+            )
+        return granted
+
+    def unsubscribe(self, sid: str) -> None:
+        self.clients.pop(sid, None)
+
+    def layout(self) -> dict:
+        """Channel / zone layout needed to interpret frame payloads"""
+        return {
+            "channels": [
+                {
+                    "index": index,
+                    "pixel_count": channel.pixel_count,
+                    "zones": [
+                        {"zone_id": zone_id.name, "indices": channel.mapper.get_indices(zone_id)}
+                        for zone_id in channel.mapper.all_zone_ids()
+                    ],
+                }
+                for index, channel in enumerate(self.frame_manager.led_channels)
+            ]
+        }
+
+    def get_stats(self) -> dict:
+        return {
+            "clients": len(self.clients),
+            "frames_captured": self.frames_captured,
+            "payloads_encoded": self.payloads_encoded,
+            "sent": sum(c.sent for c in self.clients.values()),
+            "skipped": sum(c.skipped for c in self.clients.values()),
+        }
+
+    # === Frame capture / encoding ===
+
+    def _capture(self) -> None:
+        """Pack the LED channel buffers if FrameManager rendered since the last capture"""
+        rendered = self.frame_manager.frames_rendered
+        if rendered == self._rendered_at_capture and self._frames:
+            return
+        self._rendered_at_capture = rendered
+
+        channels = [pack_rgb(channel.get_frame()) for channel in self.frame_manager.led_channels]
+        if self._frames and channels == self._frames[self._seq]:
+            return
+
+        self._seq += 1
+        self._frames[self._seq] = channels
+        while len(self._frames) > self.history:
+            self._frames.popitem(last=False)
+        self._payloads.clear()
+        self.frames_captured += 1
+
+    def _payload_for(self, base_seq: int) -> Optional[bytes]:
+        """Encoded current frame against base_seq (keyframe if the base is gone); cached"""
+        if base_seq not in self._frames:
+            base_seq = 0
+        if base_seq in self._payloads:
+            return self._payloads[base_seq]
+
+        channels = self._frames[self._seq]
+        if base_seq:
+            payload = encode_delta(self._seq, channels, base_seq, self._frames[base_seq])
+        else:
+            payload = encode_keyframe(self._seq, channels)
+        self._payloads[base_seq] = payload
+        self.payloads_encoded += 1
+        return payload
+
+    # === Streaming ===
+
+    async def _send(self, sid: str, client: FrameClient, now: float) -> None:
+        if client.in_flight_seq:
+            if now - client.in_flight_since < self.ack_timeout:
+                client.skipped += 1
+                return
+            # Lost or never acknowledged - resend from a keyframe
+            client.in_flight_seq = 0
+            client.acked_seq = 0
+
+        if client.acked_seq == self._seq:
+            return
+        payload = self._payload_for(client.acked_seq)
+        if payload is None:                                  # no visible change vs client's frame
+            client.acked_seq = self._seq
+            return
+
+        seq = self._seq
+
+        def on_ack(*_args) -> None:
+            if client.in_flight_seq == seq:
+                client.acked_seq = seq
+                client.in_flight_seq = 0
+
+        client.in_flight_seq = seq
+        client.in_flight_since = now
+        client.sent += 1
+        await self.sio.emit("frame:update", payload, to=sid, callback=on_ack)
+
+    async def _stream_loop(self) -> None:
+        """Send due clients their next frame; exits when nobody is subscribed"""
+        while self.clients:
+            try:
+                now = time.monotonic()
+                due = [(sid, c) for sid, c in self.clients.items() if c.next_due <= now]
+                if due:
+                    self._capture()
+                    for sid, client in due:
+                        client.next_due = max(client.next_due + client.interval, now)
+                        await self._send(sid, client, now)
+
+                next_due = min((c.next_due for c in self.clients.values()), default=now)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_due - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.error(f"Frame streaming error: {e}", exc_info=True)
+                await asyncio.sleep(0.5)
+
+
+# Global instance (created by register_frames)
+_streamer: Optional[FrameStreamer] = None
+
+
+def get_frame_streamer() -> Optional[FrameStreamer]:
+    """Return the FrameStreamer, or None if frame streaming is not registered"""
+    return _streamer
+
+
+def register_frames(sio, services, max_fps: float = 30.0):
+    """
+    Registers Socket.IO handlers for live frame streaming.
+    Clients opt in with frames_subscribe {"fps": 20} and receive 'frame:layout'
+    followed by binary 'frame:update' payloads (acknowledge each one).
+    """
+    global _streamer
+    streamer = _streamer = FrameStreamer(sio, services.frame_manager, max_fps=max_fps)
+
+    @sio.event
+    async def frames_subscribe(sid: str, data: dict | None = None):
+        """Client command: Start (or re-negotiate) frame streaming"""
+        try:
+            fps = float((data or {}).get("fps", max_fps))
+            granted = streamer.subscribe(sid, fps)
+            await sio.emit("frame:layout", {"fps": granted, **streamer.layout()}, room=sid)
+            log.debug("Frame streaming for %s at %.0f fps", sid, granted)
+
+        except (TypeError, ValueError) as e:
+            await sio.emit("error", {"message": f"Invalid frames_subscribe request: {e}"}, room=sid)
+
+    @sio.event
+    async def frames_unsubscribe(sid: str, data: dict | None = None):
+        """Client command: Stop frame streaming"""
+        streamer.unsubscribe(sid)
+
+    log.info("Frame streamer registered")
+    return streamer
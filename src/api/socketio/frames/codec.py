@@ -0,0 +1,148 @@
+"""
+Binary frame codec for 'frame:update' Socket.IO payloads.
+
+Frames are the packed RGB contents of every LED channel. A keyframe carries
+all pixels; a delta carries only runs of pixels that changed since a base
+frame the client already has.
+
+Layout (little-endian):
+
+    Header (12 bytes)
+      0   B    format version
+      1   B    flags (bit 0: keyframe)
+      2   H    channel count
+      4   I    frame sequence
+      8   I    base sequence (0 for keyframes)
+
+    Keyframe channel
+      0   H    pixel count
+      2   ...  pixel_count * 3 bytes RGB
+
+    Delta channel
+      0   H    pixel count
+      2   H    run count
+      4   ...  runs: H first pixel, H pixel count, then count * 3 bytes RGB
+"""
+
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from models.color import Color
+
+FRAME_FORMAT_VERSION = 1
+FLAG_KEYFRAME = 0x01
+
+_header = struct.Struct("<BBHII")
+_u16 = struct.Struct("<H")
+_pair = struct.Struct("<HH")
+
+# Unchanged pixels between two changed runs that are cheaper to resend than
+# to start a new run (a run header costs 4 bytes, a pixel 3)
+_MERGE_GAP = 1
+
+
+def pack_rgb(colors: Sequence[Color]) -> bytes:
+    """Pack a channel's colors as contiguous RGB bytes"""
+    out = bytearray(len(colors) * 3)
+    i = 0
+    for color in colors:
+        out[i], out[i + 1], out[i + 2] = color.to_rgb()
+        i += 3
+    return bytes(out)
+
+
+def changed_runs(old: bytes, new: bytes) -> List[Tuple[int, int]]:
+    """(first pixel, pixel count) runs where new differs from old (same length)"""
+    if old == new:
+        return []
+
+    runs: List[Tuple[int, int]] = []
+    start = -1
+    last_changed = -1
+    for pixel, i in enumerate(range(0, len(new), 3)):
+        if old[i:i + 3] == new[i:i + 3]:
+            continue
+        if start >= 0 and pixel - last_changed - 1 > _MERGE_GAP:
+            runs.append((start, last_changed - start + 1))
+            start = -1
+        if start < 0:
+            start = pixel
+        last_changed = pixel
+    if start >= 0:
+        runs.append((start, last_changed - start + 1))
+    return runs
+
+
+def encode_keyframe(seq: int, channels: Sequence[bytes]) -> bytes:
+    parts = [_header.pack(FRAME_FORMAT_VERSION, FLAG_KEYFRAME, len(channels), seq, 0)]
+    for rgb in channels:
+        parts.append(_u16.pack(len(rgb) // 3))
+        parts.append(rgb)
+    return b"".join(parts)
+
+
+def encode_delta(seq: int, channels: Sequence[bytes], base_seq: int, base: Sequence[bytes]) -> Optional[bytes]:
+    """
+    Delta of channels against base.
+
+    Returns:
+        Payload, None if nothing changed, or a keyframe if the channel
+        layout differs from the base.
+    """
+    if len(channels) != len(base) or any(len(a) != len(b) for a, b in zip(channels, base)):
+        return encode_keyframe(seq, channels)
+
+    parts = [_header.pack(FRAME_FORMAT_VERSION, 0, len(channels), seq, base_seq)]
+    changed = False
+    for rgb, old in zip(channels, base):
+        runs = changed_runs(old, rgb)
+        parts.append(_pair.pack(len(rgb) // 3, len(runs)))
+        for first, count in runs:
+            parts.append(_pair.pack(first, count))
+            parts.append(rgb[first * 3:(first + count) * 3])
+        changed = changed or bool(runs)
+    return b"".join(parts) if changed else None
+
+
+def decode_frame(payload: bytes, previous: Optional[Sequence[bytes]] = None) -> Tuple[int, int, List[bytes]]:
+    """
+    Decode a payload (reference implementation for tests and tools).
+
+    Args:
+        payload: Encoded frame
+        previous: Channels of the base frame (required for deltas)
+
+    Returns:
+        (seq, base_seq, channels)
+
+    Raises:
+        ValueError: Unknown format version or delta without a base
+    """
+    version, flags, channel_count, seq, base_seq = _header.unpack_from(payload, 0)
+    if version != FRAME_FORMAT_VERSION:
+        raise ValueError(f"Unsupported frame format version {version}")
+
+    offset = _header.size
+    channels: List[bytes] = []
+    if flags & FLAG_KEYFRAME:
+        for _ in range(channel_count):
+            (pixels,) = _u16.unpack_from(payload, offset)
+            offset += 2
+            channels.append(bytes(payload[offset:offset + pixels * 3]))
+            offset += pixels * 3
+        return seq, base_seq, channels
+
+    if previous is None or len(previous) != channel_count:
+        raise ValueError(f"Delta frame {seq} needs base frame {base_seq}")
+
+    for index in range(channel_count):
+        pixels, run_count = _pair.unpack_from(payload, offset)
+        offset += 4
+        rgb = bytearray(previous[index])
+        for _ in range(run_count):
+            first, count = _pair.unpack_from(payload, offset)
+            offset += 4
+            rgb[first * 3:(first + count) * 3] = payload[offset:offset + count * 3]
+            offset += count * 3
+        channels.append(bytes(rgb))
+    return seq, base_seq, channels
@@ -1,4 +1,4 @@
-from services.log_broadcaster import get_broadcaster
+from services.log_broadcaster import get_broadcaster, LogClientFilter
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.SOCKETIO)
@@ -7,7 +7,7 @@ log = get_logger().for_category(LogCategory.SOCKETIO)
 def register_logs(sio):
     """
     Registers Socket.IO integration for log streaming.
-    Sets up the log broadcaster output and history request handler.
+    Sets up the log broadcaster output, per-client filters and history request handler.
     """
 
     broadcaster = get_broadcaster()
@@ -22,12 +22,29 @@ def register_logs(sio):
         """Client command: Request recent log history"""
         try:
             limit = data.get("limit", 100)
-            logs = broadcaster.get_recent_logs(limit)
+            logs = broadcaster.get_recent_logs(limit, broadcaster.get_client_filter(sid))
             payload = [entry.model_dump() for entry in logs]
 
             await sio.emit("logs:history", {'logs': payload}, room=sid)
-            log.debug(f"Sent {len(payload)} logs to {sid}")
+            log.debug("Sent %s logs to %s", len(payload), sid)
 
         except Exception as e:
             log.error("Failed to send log history", exc_info=True)
-            await sio.emit("error", {"message": str(e)}, room=sid)
\ No newline at end of file
+            await sio.emit("error", {"message": str(e)}, room=sid)
+
+    @sio.event
+    async def logs_subscribe(sid: str, data: dict):
+        """Client command: Only stream entries >= level and in categories ({"level": "INFO", "categories": [...]})"""
+        try:
+            client_filter = LogClientFilter.from_request(data or {})
+            await broadcaster.set_client_filter(sid, client_filter)
+            await sio.emit("logs:subscribed", {"room": client_filter.room}, room=sid)
+            log.debug("Log filter for %s: %s", sid, client_filter.room)
+
+        except ValueError as e:
+            await sio.emit("error", {"message": str(e)}, room=sid)
+
+    @sio.event
+    async def logs_unsubscribe(sid: str, data: dict | None = None):
+        """Client command: Remove server-side filter (stream all entries again, stays subscribed)"""
+        await broadcaster.clear_client_filter(sid)
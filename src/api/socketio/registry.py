@@ -1,19 +1,31 @@
 from api.socketio.on_connect import register_on_connect
 from api.socketio.zones.broadcaster import register_zone_broadcaster
+from api.socketio.zones.commands import register_zone_commands
 from api.socketio.logs.broadcaster import register_logs
 from api.socketio.tasks.broadcaster import register_tasks
+from api.socketio.frames.broadcaster import register_frames
+from api.socketio.control.channel import register_control
+from api.socketio.subscriptions import register_subscriptions
 
 
 def register_socketio(sio, services):
     """
     Registers all Socket.IO handlers and EventBus subscriptions.
     """
-    # Connection lifecycle - sends initial state (zones, tasks, logs)
-    register_on_connect(sio, services)
+    # Subscription protocol (topic rooms) + connection lifecycle - initial state per topic
+    subscriptions = register_subscriptions(sio, services)
+    register_on_connect(sio, services, subscriptions)
 
     # EventBus subscriptions for real-time updates
     register_zone_broadcaster(sio, services)
 
     # Client command handlers (for on-demand requests)
+    register_zone_commands(sio, services)
     register_logs(sio)
-    register_tasks(sio)
\ No newline at end of file
+    register_tasks(sio)
+
+    # Live binary LED frames (opt-in per client)
+    register_frames(sio, services)
+
+    # Continuous controls (sliders / knobs) on the '/control' namespace
+    register_control(sio, services)
@@ -0,0 +1,177 @@
+"""
+Socket.IO subscription protocol.
+
+Clients choose which broadcasts they receive, either when connecting
+(auth={"subscribe": [...]}) or later with the 'subscribe' / 'unsubscribe'
+events. Each topic maps to Socket.IO rooms, and initial state is sent per
+subscribed topic only:
+
+    "zones"           zone:snapshot broadcasts        initial zones:snapshot
+    "tasks"           task broadcasts                 initial tasks:all + tasks:stats
+    "logs[:LEVEL]"    log:batch (>= LEVEL)            initial logs:history
+    "frames[:FPS]"    binary frame:update             frame:layout
+
+Clients that send no subscription list get DEFAULT_SUBSCRIPTIONS.
+"""
+
+from dataclasses import asdict
+from typing import Iterable, List, Optional, Tuple
+
+from api.socketio.frames.broadcaster import get_frame_streamer
+from api.socketio.zones.dto import ZoneSnapshotDTO
+from lifecycle.task_registry import TaskRegistry
+from services.log_broadcaster import get_broadcaster, LogClientFilter
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.SOCKETIO)
+
+ZONES_ROOM = "zones"
+TASKS_ROOM = "tasks"
+
+TOPICS = ("zones", "tasks", "logs", "frames")
+
+# Full dashboard behaviour for clients that don't choose (pre-subscription clients)
+DEFAULT_SUBSCRIPTIONS = ("zones", "tasks", "logs")
+
+
+def room_has_members(sio, room: str, namespace: str = "/") -> bool:
+    """True if anyone is in the room (lets broadcasters skip serialization)"""
+    return bool(sio.manager.rooms.get(namespace, {}).get(room))
+
+
+def parse_topic(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    Split "logs:WARN" into ("logs", "WARN").
+
+    Raises:
+        ValueError: Unknown topic or malformed spec
+    """
+    if not isinstance(spec, str):
+        raise ValueError(f"Subscription must be a string, got {spec!r}")
+    topic, _, arg = spec.partition(":")
+    topic = topic.strip().lower()
+    if topic not in TOPICS:
+        raise ValueError(f"Unknown subscription topic: {topic!r} (expected one of {', '.join(TOPICS)})")
+    return topic, arg.strip() or None
+
+
+def parse_topics(specs: Iterable[str]) -> List[Tuple[str, Optional[str]]]:
+    if isinstance(specs, str):
+        specs = [specs]
+    return [parse_topic(spec) for spec in specs]
+
+
+class SocketSubscriptions:
+    """Joins / leaves topic rooms and sends per-topic initial state"""
+
+    def __init__(self, sio, services):
+        self.sio = sio
+        self.services = services
+
+    async def subscribe(self, sid: str, topics: List[Tuple[str, Optional[str]]]) -> None:
+        for topic, arg in topics:
+            await getattr(self, f"_join_{topic}")(sid, arg)
+
+    async def unsubscribe(self, sid: str, topics: List[Tuple[str, Optional[str]]]) -> None:
+        for topic, _ in topics:
+            await getattr(self, f"_leave_{topic}")(sid)
+
+    def list(self, sid: str) -> List[str]:
+        """Current subscriptions of a client, in subscribe-spec form"""
+        rooms = set(self.sio.rooms(sid))
+        active = [room for room in (ZONES_ROOM, TASKS_ROOM) if room in rooms]
+
+        log_filter = get_broadcaster().get_client_filter(sid)
+        if log_filter is not None:
+            active.append(f"logs:{log_filter.level_name}")
+
+        streamer = get_frame_streamer()
+        if streamer and sid in streamer.clients:
+            active.append(f"frames:{round(1 / streamer.clients[sid].interval)}")
+        return active
+
+    # === zones ===
+
+    async def _join_zones(self, sid: str, arg: Optional[str]) -> None:
+        await self.sio.enter_room(sid, ZONES_ROOM)
+        publisher = self.services.snapshot_publisher if self.services else None
+        if publisher is not None:
+            payload = [entry.payload for entry in publisher.get_all_snapshots()]
+            await self.sio.emit("zones:snapshot", payload, room=sid)
+        elif self.services and self.services.zone_service:
+            zones = self.services.zone_service.get_all()
+            payload = [asdict(ZoneSnapshotDTO.from_zone(z)) for z in zones]
+            await self.sio.emit("zones:snapshot", payload, room=sid)
+        else:
+            log.warn(f"Skipping initial zone snapshot for {sid}: services not ready")
+
+    async def _leave_zones(self, sid: str) -> None:
+        await self.sio.leave_room(sid, ZONES_ROOM)
+
+    # === tasks ===
+
+    async def _join_tasks(self, sid: str, arg: Optional[str]) -> None:
+        await self.sio.enter_room(sid, TASKS_ROOM)
+        registry = TaskRegistry.instance()
+        await self.sio.emit("tasks:all", {'tasks': registry.get_all_as_dicts()}, room=sid)
+        await self.sio.emit("tasks:stats", {'stats': registry.get_stats()}, room=sid)
+
+    async def _leave_tasks(self, sid: str) -> None:
+        await self.sio.leave_room(sid, TASKS_ROOM)
+
+    # === logs ===
+
+    async def _join_logs(self, sid: str, arg: Optional[str]) -> None:
+        broadcaster = get_broadcaster()
+        client_filter = LogClientFilter.from_request({"level": arg})
+        await broadcaster.set_client_filter(sid, client_filter)
+
+        logs = broadcaster.get_recent_logs(limit=100, client_filter=client_filter)
+        await self.sio.emit("logs:history", {'logs': [entry.model_dump() for entry in logs]}, room=sid)
+
+    async def _leave_logs(self, sid: str) -> None:
+        await get_broadcaster().remove_client_filter(sid)
+
+    # === frames ===
+
+    async def _join_frames(self, sid: str, arg: Optional[str]) -> None:
+        streamer = get_frame_streamer()
+        if streamer is None:
+            raise ValueError("Frame streaming is not available")
+        granted = streamer.subscribe(sid, float(arg) if arg else streamer.max_fps)
+        await self.sio.emit("frame:layout", {"fps": granted, **streamer.layout()}, room=sid)
+
+    async def _leave_frames(self, sid: str) -> None:
+        streamer = get_frame_streamer()
+        if streamer:
+            streamer.unsubscribe(sid)
+
+
+def register_subscriptions(sio, services) -> SocketSubscriptions:
+    """
+    Registers the 'subscribe' / 'unsubscribe' client commands.
+    Returns the SocketSubscriptions used by the connect handler.
+    """
+    subscriptions = SocketSubscriptions(sio, services)
+
+    @sio.event
+    async def subscribe(sid: str, data):
+        """Client command: subscribe to topics (["zones", "logs:WARN", ...] or {"topics": [...]})"""
+        try:
+            specs = data.get("topics", []) if isinstance(data, dict) else data
+            await subscriptions.subscribe(sid, parse_topics(specs or []))
+            await sio.emit("subscriptions", {"topics": subscriptions.list(sid)}, room=sid)
+        except ValueError as e:
+            await sio.emit("error", {"message": str(e)}, room=sid)
+
+    @sio.event
+    async def unsubscribe(sid: str, data):
+        """Client command: unsubscribe from topics"""
+        try:
+            specs = data.get("topics", []) if isinstance(data, dict) else data
+            await subscriptions.unsubscribe(sid, parse_topics(specs or []))
+            await sio.emit("subscriptions", {"topics": subscriptions.list(sid)}, room=sid)
+        except ValueError as e:
+            await sio.emit("error", {"message": str(e)}, room=sid)
+
+    return subscriptions
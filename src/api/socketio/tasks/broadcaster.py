@@ -1,4 +1,10 @@
-from lifecycle.task_registry import TaskRegistry
+from typing import List, Tuple
+
+from api.socketio.subscriptions import TASKS_ROOM, room_has_members
+from dataclasses import asdict
+
+from lifecycle.task_registry import TaskRegistry, TaskRecord
+from runtime.loop_monitor import LoopStall, get_loop_monitor
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.SOCKETIO)
@@ -7,10 +13,34 @@ log = get_logger().for_category(LogCategory.SOCKETIO)
 def register_tasks(sio):
     """
     Registers Socket.IO handlers for task inspection.
-    Provides endpoints for querying task state, statistics, and hierarchy.
+    Provides endpoints for querying task state, statistics, and hierarchy,
+    and pushes task changes to the tasks room in batches ("tasks:batch")
+    and event loop stalls ("tasks:stall").
     """
 
     registry = TaskRegistry.instance()
+    loop_monitor = get_loop_monitor()
+
+    async def broadcast_batch(batch: List[Tuple[str, TaskRecord]]) -> None:
+        if not room_has_members(sio, TASKS_ROOM):
+            return
+        try:
+            events = [{"type": event_type, "task": record.to_dict()} for event_type, record in batch]
+            await sio.emit("tasks:batch", {"events": events}, room=TASKS_ROOM)
+        except Exception:
+            log.error("Failed to broadcast task batch", exc_info=True)
+
+    registry.set_broadcast_sink(broadcast_batch)
+
+    async def broadcast_stall(stall: LoopStall) -> None:
+        if not room_has_members(sio, TASKS_ROOM):
+            return
+        try:
+            await sio.emit("tasks:stall", {"stall": asdict(stall)}, room=TASKS_ROOM)
+        except Exception:
+            log.error("Failed to broadcast loop stall", exc_info=True)
+
+    loop_monitor.set_stall_sink(broadcast_stall)
 
     @sio.event
     async def task_get_all(sid: str):
@@ -18,7 +48,7 @@ def register_tasks(sio):
         try:
             tasks = registry.get_all_as_dicts()
             await sio.emit("tasks:all", {'tasks': tasks}, room=sid)
-            log.debug(f"Sent {len(tasks)} tasks to {sid}")
+            log.debug("Sent %s tasks to %s", len(tasks), sid)
         except Exception as e:
             log.error("Failed to send all tasks", exc_info=True)
             await sio.emit('error', {'message': str(e)}, room=sid)
@@ -29,7 +59,7 @@ def register_tasks(sio):
         try:
             tasks = registry.get_active_as_dicts()
             await sio.emit("tasks:active", {'tasks': tasks}, room=sid)
-            log.debug(f"Sent {len(tasks)} active tasks to {sid}")
+            log.debug("Sent %s active tasks to %s", len(tasks), sid)
         except Exception as e:
             log.error("Failed to send active tasks", exc_info=True)
             await sio.emit('error', {'message': str(e)}, room=sid)
@@ -40,7 +70,7 @@ def register_tasks(sio):
         try:
             stats = registry.get_stats()
             await sio.emit("tasks:stats", {'stats': stats}, room=sid)
-            log.debug(f"Sent task stats to {sid}")
+            log.debug("Sent task stats to %s", sid)
         except Exception as e:
             log.error("Failed to send task stats", exc_info=True)
             await sio.emit('error', {'message': str(e)}, room=sid)
@@ -51,7 +81,18 @@ def register_tasks(sio):
         try:
             tree = registry.get_task_tree()
             await sio.emit("tasks:tree", {'tree': tree}, room=sid)
-            log.debug(f"Sent task tree to {sid}")
+            log.debug("Sent task tree to %s", sid)
         except Exception as e:
             log.error("Failed to send task tree", exc_info=True)
+            await sio.emit('error', {'message': str(e)}, room=sid)
+
+    @sio.event
+    async def task_get_loop_lag(sid: str):
+        """Client command: Get event loop lag statistics and recent stalls"""
+        try:
+            stats = loop_monitor.get_stats()
+            await sio.emit("tasks:loop_lag", {'loop': stats}, room=sid)
+            log.debug("Sent loop lag stats to %s", sid)
+        except Exception as e:
+            log.error("Failed to send loop lag stats", exc_info=True)
             await sio.emit('error', {'message': str(e)}, room=sid)
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dataclasses import asdict
 from models.events import EventType
 from models.events.zone_snapshot_events import ZoneSnapshotUpdatedEvent
+from api.socketio.subscriptions import ZONES_ROOM, room_has_members
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.SOCKETIO)
@@ -9,12 +10,15 @@ log = get_logger().for_category(LogCategory.SOCKETIO)
 def register_zone_broadcaster(sio, services):
     """
     Registers EventBus subscription for zone snapshot updates.
-    Broadcasts zone state changes to all connected clients.
+    Broadcasts zone state changes to clients subscribed to "zones".
     """
 
     async def on_zone_snapshot_updated(event: ZoneSnapshotUpdatedEvent) -> None:
-        """Broadcast zone snapshot to all connected clients"""
-        await sio.emit("zone:snapshot", asdict(event.snapshot))
+        """Broadcast zone snapshot to the zones room (skipped entirely when empty)"""
+        if not room_has_members(sio, ZONES_ROOM):
+            return
+        payload = event.payload if event.payload is not None else asdict(event.snapshot)
+        await sio.emit("zone:snapshot", payload, room=ZONES_ROOM)
 
     services.event_bus.subscribe(
         EventType.ZONE_SNAPSHOT_UPDATED,
@@ -0,0 +1,27 @@
+from pydantic import ValidationError
+
+from api.schemas.zone import ZoneBatchRequest
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.SOCKETIO)
+
+
+def register_zone_commands(sio, services):
+    """
+    Registers Socket.IO zone commands.
+    zones_batch applies many zone changes in one transaction (same payload as
+    POST /api/v1/zones/batch) and acknowledges with {"ok": bool, ...}.
+    """
+
+    @sio.event
+    async def zones_batch(sid: str, data):
+        """Client command: Apply a batch of zone changes ({"zones": [...]})"""
+        try:
+            request = ZoneBatchRequest.model_validate(data)
+            zones = services.zone_service.apply_static_batch(request.to_changes(services.color_manager))
+            log.debug("Applied zone batch from %s (%s zones)", sid, len(zones))
+            return {"ok": True, "zones": len(zones)}
+
+        except (ValidationError, TypeError, ValueError) as e:
+            await sio.emit("error", {"message": f"Invalid zones_batch request: {e}"}, room=sid)
+            return {"ok": False, "error": str(e)}
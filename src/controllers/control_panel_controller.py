@@ -1,4 +1,5 @@
 import asyncio
+from typing import Dict, Optional
 from models.events import EncoderRotateEvent, EncoderClickEvent, ButtonPressEvent
 from models.enums import ButtonID, LogCategory
 from models.events.sources import EncoderSource
@@ -12,20 +13,90 @@ class ControlPanelController:
     """
     Controller for the hardware Control Panel
 
-    Polls hardware inputs and publishes events to the EventBus.
+    Publishes hardware input events to the EventBus, either from GPIO edge
+    callbacks (enable_edge_callbacks) or by polling (poll).
+
+    Encoder rotation is coalesced: detents are summed per encoder and at most
+    one EncoderRotateEvent per UI frame is published with the total delta.
     """
 
-    def __init__(self, control_panel: ControlPanel, event_bus: EventBus):
+    BUTTON_IDS = (ButtonID.BTN1, ButtonID.BTN2, ButtonID.BTN3, ButtonID.BTN4)
+
+    def __init__(self, control_panel: ControlPanel, event_bus: EventBus, rotate_interval: float = 1 / 60):
         """
         Initialize ControlPanelController
 
         Args:
             control_panel: ControlPanel instance for hardware interaction
             event_bus: EventBus for publishing hardware events
+            rotate_interval: Coalescing window for rotation events (one UI frame)
         """
         self.control_panel = control_panel
         self.event_bus = event_bus
+        self.rotate_interval = rotate_interval
         self._running = False
+        self.edge_mode = False
+
+        self._pending_rotation: Dict[EncoderSource, int] = {}
+        self._rotation_flush: Optional[asyncio.TimerHandle] = None
+
+        # Metrics
+        self.detents_received = 0
+        self.rotate_events_published = 0
+
+    def enable_edge_callbacks(self) -> bool:
+        """
+        Switch to interrupt-driven input (no polling loop needed).
+
+        Returns:
+            True if edge detection is active on all inputs, False if the GPIO
+            backend refused it (caller should fall back to poll())
+        """
+        panel = self.control_panel
+        try:
+            for src, encoder in (
+                (EncoderSource.SELECTOR, panel.selector),
+                (EncoderSource.MODULATOR, panel.modulator)
+            ):
+                encoder.enable_edge_callbacks(
+                    on_rotate=lambda delta, src=src: self._queue_rotation(src, delta),
+                    on_press=lambda src=src: self._publish(EncoderClickEvent(src)),
+                )
+            for button_id, btn in zip(self.BUTTON_IDS, panel.buttons):
+                btn.enable_edge_callbacks(lambda button_id=button_id: self._publish(ButtonPressEvent(button_id)))
+        except (RuntimeError, ValueError) as e:
+            log.warn(f"GPIO edge detection unavailable, falling back to polling: {e}")
+            self.disable_edge_callbacks()
+            return False
+
+        self.edge_mode = True
+        log.info("ControlPanelController using GPIO edge callbacks")
+        return True
+
+    def disable_edge_callbacks(self) -> None:
+        panel = self.control_panel
+        for device in (panel.selector, panel.modulator, *panel.buttons):
+            device.disable_edge_callbacks()
+        self.edge_mode = False
+
+    def _publish(self, event) -> None:
+        self.event_bus.publish_nowait(event)
+
+    def _queue_rotation(self, source: EncoderSource, delta: int) -> None:
+        """Accumulate detents; publish once per rotate_interval"""
+        self.detents_received += abs(delta)
+        self._pending_rotation[source] = self._pending_rotation.get(source, 0) + delta
+        if self._rotation_flush is None:
+            loop = asyncio.get_running_loop()
+            self._rotation_flush = loop.call_later(self.rotate_interval, self._flush_rotation)
+
+    def _flush_rotation(self) -> None:
+        self._rotation_flush = None
+        pending, self._pending_rotation = self._pending_rotation, {}
+        for source, delta in pending.items():
+            if delta:
+                self.rotate_events_published += 1
+                self._publish(EncoderRotateEvent(source, delta))
         
     async def poll(self, interval: float = 0.02):
         """
@@ -54,29 +125,29 @@ class ControlPanelController:
             # Rotation
             delta = encoder.read()
             if delta:
-                event = EncoderRotateEvent(src, delta)
-                asyncio.create_task(self.event_bus.publish(event))
+                self._queue_rotation(src, delta)
             
             # Button press
             if encoder.is_pressed():
                 event = EncoderClickEvent(src)
-                asyncio.create_task(self.event_bus.publish(event))
+                self.event_bus.publish_nowait(event)
                 
     def _poll_buttons(self):
         """
         Poll buttons and publish events on changes
         """
         # Buttons (map index to ButtonID enum)
-        button_ids = [ButtonID.BTN1, ButtonID.BTN2, ButtonID.BTN3, ButtonID.BTN4]
-        
         for i, btn in enumerate(self.control_panel.buttons):
             if btn.is_pressed():
-                event = ButtonPressEvent(button_ids[i])
-                asyncio.create_task(self.event_bus.publish(event))
+                event = ButtonPressEvent(self.BUTTON_IDS[i])
+                self.event_bus.publish_nowait(event)
                 
     def stop(self):
         """
         Stop the control panel polling loop
         """
         self._running = False
+        if self._rotation_flush:
+            self._rotation_flush.cancel()
+            self._rotation_flush = None
         log.info("ControlPanelController stopped polling loop")
\ No newline at end of file
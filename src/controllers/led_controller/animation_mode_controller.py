@@ -174,7 +174,7 @@ class AnimationModeController:
         # Get available parameters from the animation's PARAMS definitions
         param_ids = list(anim.PARAMS.keys())
         if not param_ids:
-            log.debug(f"Animation {type(anim).__name__} has no parameters")
+            log.debug("Animation %s has no parameters", type(anim).__name__)
             return
 
         state = self.app_state_service.get_state()
@@ -218,7 +218,7 @@ class AnimationModeController:
         # Use animation's adjust_param method which properly handles adjustment logic
         new_value = anim.adjust_param(param_id, delta)
         if new_value is None:
-            log.debug(f"Parameter {param_id.name} not adjustable")
+            log.debug("Parameter %s not adjustable", param_id.name)
             return
 
         # Use zone_service to persist and emit event
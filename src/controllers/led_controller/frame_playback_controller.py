@@ -199,11 +199,11 @@ class FramePlaybackController:
                 
                 # Progress logging
                 if len(self._frames) % 100 == 0:
-                    log.debug(f"  Captured {len(self._frames)} full frames...")
+                    log.debug("  Captured %s full frames...", len(self._frames))
 
                 # Limit
                 if len(self._frames) >= MAX_FRAMES:
-                    log.debug(f"Reached frame limit ({MAX_FRAMES})")
+                    log.debug("Reached frame limit (%s)", MAX_FRAMES)
                     break
                 
         except Exception as e:
@@ -295,7 +295,7 @@ class LightingController:
 
             # Only handle if zone is in ANIMATION mode
             if zone.state.mode != ZoneRenderMode.ANIMATION:
-                log.debug(f"Zone {event.zone_id.name} not in ANIMATION mode, skipping animation restart")
+                log.debug("Zone %s not in ANIMATION mode, skipping animation restart", event.zone_id.name)
                 return
 
             # Get current animation state
@@ -7,10 +7,12 @@ Renders zone states to FrameManager as ZoneFrames (one color per zone).
 from __future__ import annotations
 
 import asyncio
+from typing import List
+
 from models.enums import FramePriority, FrameSource, ZoneEditTarget, ZoneRenderMode
 from models.domain import ZoneCombined
 from models.frame import MultiZoneFrame, SingleZoneFrame
-from models.events import ZoneStaticStateChangedEvent, EventType
+from models.events import ZoneStaticBatchChangedEvent, ZoneStaticStateChangedEvent, EventType
 from services import ServiceContainer
 from utils.logger import get_logger, LogCategory
 
@@ -87,6 +89,10 @@ class StaticModeController:
             event_type=EventType.ZONE_STATIC_STATE_CHANGED,
             handler=self._on_zone_static_state_changed  # type: ignore
         )
+        self.event_bus.subscribe(
+            event_type=EventType.ZONE_STATIC_BATCH_CHANGED,
+            handler=self._on_zone_static_batch_changed  # type: ignore
+        )
 
         log.info(f"Rendered {len(zones_colors)} STATIC zones")
 
@@ -167,23 +173,34 @@ class StaticModeController:
             target=target.name,
         )
 
-    def publish_zone_frame(self, zone: ZoneCombined):
-        """Submit single zone update to FrameManager"""
+    @staticmethod
+    def _zone_color(zone: ZoneCombined):
         # Respect is_on state: show black when powered off
         if not zone.state.is_on:
-            color = zone.state.color.black()
-        else:
-            color = zone.state.color.with_brightness(zone.brightness)
+            return zone.state.color.black()
+        return zone.state.color.with_brightness(zone.brightness)
 
+    def publish_zone_frame(self, zone: ZoneCombined):
+        """Submit single zone update to FrameManager"""
         frame = SingleZoneFrame(
             zone_id=zone.config.id,
-            color=color,
+            color=self._zone_color(zone),
             priority=FramePriority.MANUAL,
             source=FrameSource.STATIC,
             ttl=10.0,  # Match initialize() TTL to keep static zones persistent
         )
         asyncio.create_task(self.frame_manager.push_frame(frame))
 
+    def publish_zones_frame(self, zones: List[ZoneCombined]):
+        """Submit several zone updates to FrameManager as one MultiZoneFrame (one render tick)"""
+        frame = MultiZoneFrame(
+            zone_colors={zone.config.id: self._zone_color(zone) for zone in zones},
+            priority=FramePriority.MANUAL,
+            source=FrameSource.STATIC,
+            ttl=10.0,
+        )
+        asyncio.create_task(self.frame_manager.push_frame(frame))
+
     # ------------------------------------------------------------------
     # Event Handling
     # ------------------------------------------------------------------
@@ -205,9 +222,19 @@ class StaticModeController:
             return
 
         log.debug(
-            f"Zone state changed, re-submitting frame",
+            "Zone state changed, re-submitting frame",
             zone=zone.config.display_name,
             brightness=zone.brightness,
         )
 
         self.publish_zone_frame(zone)
+
+    def _on_zone_static_batch_changed(self, event: ZoneStaticBatchChangedEvent) -> None:
+        """Re-submit all changed STATIC zones of a batch update in one frame"""
+        zones = [self.zone_service.get_zone(change.zone_id) for change in event.changes]
+        zones = [zone for zone in zones if zone.state.mode == ZoneRenderMode.STATIC]
+        if not zones:
+            return
+
+        log.debug("Zone batch changed, re-submitting %s zones in one frame", len(zones))
+        self.publish_zones_frame(zones)
@@ -9,7 +9,7 @@ Architecture:
   - Supports pause/step/FPS control for debugging
 
 Priority System:
-  IDLE (0) < MANUAL (10) < PULSE (20) < ANIMATION (30) < TRANSITION (40) < DEBUG (50)
+  IDLE (0) < MANUAL (10) < ANIMATION (20) < NETWORK (25) < PULSE (30) < TRANSITION (40) < DEBUG (50)
 
 Only the highest-priority frame is rendered. When high-priority sources stop,
 rendering automatically falls back to lower priorities.
@@ -24,6 +24,7 @@ from collections import deque
 # from concurrent.futures import ThreadPoolExecutor  # TODO: Re-enable for async rendering
 
 from utils.logger import get_logger
+from utils.metrics import Histogram
 from models.enums import FrameSource, LogCategory, FramePriority, ZoneID
 from models.color import Color
 from models.frame import SingleZoneFrame, MultiZoneFrame, PixelFrame, MainStripFrame, ZoneUpdateValue
@@ -109,6 +110,10 @@ class FrameManager:
         self.dropped_frames = 0
         self.frames_rendered = 0
         self.dma_skipped = 0  # Count of DMA transfers skipped due to frame match
+        # Per-stage render latency (seconds), exported by GET /metrics
+        self.stage_latency: Dict[str, Histogram] = {
+            stage: Histogram() for stage in ("drain", "merge", "dedupe", "output", "frame")
+        }
 
         self.last_rendered_frame: Optional[MainStripFrame] = None
 
@@ -149,7 +154,7 @@ class FrameManager:
                     zone_id=zone_id,
                     pixels=[Color.black()] * zone_length,
                 )
-                log.debug(f"Initialized black render state for zone {zone_id.name} ({zone_length} pixels)")
+                log.debug("Initialized black render state for zone %s (%s pixels)", zone_id.name, zone_length)
 
         log.info(f"Added led_channel: {led_channel} (total zone_render_states now has {len(self.zone_render_states)} zones)")
         
@@ -158,7 +163,7 @@ class FrameManager:
         
         if led_channel in self.led_channels:
             self.led_channels.remove(led_channel)
-            log.debug(f"Removed main led_channel: {led_channel}")
+            log.debug("Removed main led_channel: %s", led_channel)
 
     # === Frame Submission API (Type-Specific) ===
 
@@ -169,6 +174,15 @@ class FrameManager:
         Accepts SingleZoneFrame / MultiZoneFrame / PixelFrame
         and wraps them into MainStripFrame for the queue system.
         """
+        self.submit_frame(frame)
+
+    def submit_frame(self, frame):
+        """
+        Synchronous variant of push_frame().
+
+        For callers that run as plain loop callbacks (e.g. datagram_received)
+        and cannot await. Queue append is atomic on the event loop thread.
+        """
 
         # log.debug(f"FrameManager.push_frame: received {type(frame).__name__} from {getattr(frame, 'source', '?')} "
         #    f"priority={getattr(frame, 'priority', '?')} zone={getattr(frame, 'zone_id', '?')}")
@@ -308,7 +322,9 @@ class FrameManager:
             # Select and render frames
             try:
                 # frame = await self._select_frame_by_priority()
+                started = time.perf_counter()
                 frame = await self._drain_frames()
+                self.stage_latency["drain"].observe(time.perf_counter() - started)
 
                 # Render atomically, but skip DMA if main frame hasn't changed
                 # (Phase 2 optimization: 95% DMA reduction in static-only mode)
@@ -317,6 +333,7 @@ class FrameManager:
                         # Frame changed (different object) → do full render with hardware DMA
                         # TODO: Replace with async wrapper after debugging executor issues
                         self._render_atomic(frame)
+                        self.stage_latency["frame"].observe(time.perf_counter() - started)
                         self.last_rendered_frame = frame
                         self.frames_rendered += 1
                         self.frame_times.append(time.perf_counter())
@@ -491,13 +508,21 @@ class FrameManager:
 
     def _render_frame(self, frame: MainStripFrame) -> None:
         """High-level render pipeline."""
+        stages = self.stage_latency
+        started = time.perf_counter()
         updates = frame.as_zone_update()
         merged = self._merge_updates(frame, updates)
+        merged_at = time.perf_counter()
+        stages["merge"].observe(merged_at - started)
 
-        if self._should_skip_dma(merged):
+        skip = self._should_skip_dma(merged)
+        hashed_at = time.perf_counter()
+        stages["dedupe"].observe(hashed_at - merged_at)
+        if skip:
             return
 
         self._render_to_all_led_channels(merged)
+        stages["output"].observe(time.perf_counter() - hashed_at)
 
         self.frames_rendered += 1
         self.frame_times.append(time.perf_counter())
@@ -591,7 +616,7 @@ class FrameManager:
             if len(hw) != pixel_count:
                 log.warn(f"hardware.get_frame(): {len(hw)} != {pixel_count}")
         except Exception as ex:
-            log.debug(f"hardware.get_frame() failed: {ex}", exc_info=True)
+            log.debug("hardware.get_frame() failed: %s", ex, exc_info=True)
     
     def _apply_led_channel_frame(self, led_channel: LedChannel, led_channel_frame: Dict[ZoneID, List[Color]]):
         """Send pixel data to hardware."""
@@ -721,7 +746,7 @@ class FrameManager:
 
 
         if cleared_count > 0:
-            log.debug(f"Cleared {cleared_count} frames below priority {min_priority.name}")
+            log.debug("Cleared %s frames below priority %s", cleared_count, min_priority.name)
 
     def __repr__(self) -> str:
         metrics = self.get_metrics()
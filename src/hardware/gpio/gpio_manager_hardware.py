@@ -10,9 +10,10 @@ Architecture: Infrastructure Layer (Layer 1.5)
 - Centralizes GPIO.setup() and cleanup() operations
 """
 
-from typing import Dict
-from hardware.gpio import IGPIOManager
-from models.enums import GPIOPullMode, GPIOInitialState
+import asyncio
+from typing import Dict, Optional, Set
+from hardware.gpio.gpio_manager_interface import IGPIOManager, EdgeCallback
+from models.enums import GPIOEdge, GPIOPullMode, GPIOInitialState
 from utils.logger import get_logger, LogCategory
  
 log = get_logger().for_category(LogCategory.HARDWARE)
@@ -39,6 +40,7 @@ class HardwareGPIOManager(IGPIOManager):
   
         self._gpio = GPIO
         self._registry: Dict[int, str] = {}  # pin -> component_name
+        self._edge_pins: Set[int] = set()
 
         self._gpio.setmode(self._gpio.BCM)
         self._gpio.setwarnings(False)
@@ -162,6 +164,55 @@ class HardwareGPIOManager(IGPIOManager):
 
     def write(self, pin: int, value) -> None:
         self._gpio.output(pin, value)
+
+    # -------------------------------
+    # Edge detection (interrupts)
+    # -------------------------------
+
+    def add_edge_callback(
+        self,
+        pin: int,
+        callback: EdgeCallback,
+        edge: GPIOEdge = GPIOEdge.BOTH,
+        bouncetime_ms: int = 0,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        """
+        Enable RPi.GPIO edge detection on an input pin.
+
+        RPi.GPIO runs callbacks on its own event thread; the pin level is
+        sampled there and handed to the asyncio loop via call_soon_threadsafe.
+
+        Raises:
+            ValueError: If pin is not registered
+            RuntimeError: If RPi.GPIO fails to add edge detection
+        """
+        if pin not in self._registry:
+            raise ValueError(f"GPIO pin {pin} must be registered before adding edge detection")
+
+        target_loop = loop or asyncio.get_running_loop()
+        gpio_edge = {
+            GPIOEdge.RISING: self._gpio.RISING,
+            GPIOEdge.FALLING: self._gpio.FALLING,
+            GPIOEdge.BOTH: self._gpio.BOTH,
+        }[edge]
+        read = self._gpio.input
+
+        def _on_interrupt(channel: int) -> None:
+            # Runs on RPi.GPIO thread - keep minimal
+            target_loop.call_soon_threadsafe(callback, channel, read(channel))
+
+        kwargs = {"bouncetime": bouncetime_ms} if bouncetime_ms > 0 else {}
+        self._gpio.add_event_detect(pin, gpio_edge, callback=_on_interrupt, **kwargs)
+        self._edge_pins.add(pin)
+
+        log.debug("GPIO edge detection enabled", pin=pin, edge=edge.name, bouncetime_ms=bouncetime_ms)
+
+    def remove_edge_callback(self, pin: int) -> None:
+        if pin not in self._edge_pins:
+            return
+        self._gpio.remove_event_detect(pin)
+        self._edge_pins.discard(pin)
    
    
     # -------------------------------
@@ -177,6 +228,9 @@ class HardwareGPIOManager(IGPIOManager):
         pin_count = len(self._registry)
         log.info(f"Cleaning up {pin_count} GPIO pins")
 
+        for pin in list(self._edge_pins):
+            self.remove_edge_callback(pin)
+
         self._gpio.cleanup()
         self._registry.clear()
 
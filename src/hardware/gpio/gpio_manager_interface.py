@@ -1,5 +1,9 @@
-from typing import Protocol, Dict
-from models.enums import GPIOPullMode, GPIOInitialState
+import asyncio
+from typing import Callable, Optional, Protocol, Dict
+from models.enums import GPIOEdge, GPIOPullMode, GPIOInitialState
+
+# Edge callback: (pin, level) - always invoked on the asyncio event loop thread
+EdgeCallback = Callable[[int, int], None]
 
 class IGPIOManager(Protocol):
     """
@@ -54,6 +58,34 @@ class IGPIOManager(Protocol):
     def write(self, pin: int, value: int) -> None:
         """Write value to GPIO pin (0 or 1)"""
         ...
+
+    # -------------------------------
+    # Edge detection (interrupts)
+    # -------------------------------
+
+    def add_edge_callback(
+        self,
+        pin: int,
+        callback: EdgeCallback,
+        edge: GPIOEdge = GPIOEdge.BOTH,
+        bouncetime_ms: int = 0,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        """
+        Call callback(pin, level) on the event loop whenever pin changes.
+
+        The level is sampled in the interrupt thread, then marshalled into
+        the loop with call_soon_threadsafe (loop defaults to the running loop).
+
+        Raises:
+            ValueError: If pin is not registered as input
+            RuntimeError: If the backend cannot detect edges on this pin
+        """
+        ...
+
+    def remove_edge_callback(self, pin: int) -> None:
+        """Stop edge detection on pin (no-op if not enabled)"""
+        ...
         
         
     # -------------------------------
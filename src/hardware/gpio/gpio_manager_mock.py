@@ -1,6 +1,7 @@
-from typing import Dict
-from hardware.gpio import IGPIOManager
-from models.enums import GPIOPullMode, GPIOInitialState
+import asyncio
+from typing import Dict, Optional, Tuple
+from hardware.gpio.gpio_manager_interface import IGPIOManager, EdgeCallback
+from models.enums import GPIOEdge, GPIOPullMode, GPIOInitialState
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.HARDWARE)
@@ -10,6 +11,7 @@ class MockGPIOManager(IGPIOManager):
     def __init__(self):
         self._registry: Dict[int, str] = {}  # pin -> component_name
         self._values: Dict[int, int] = {}
+        self._edge_callbacks: Dict[int, Tuple[EdgeCallback, GPIOEdge, asyncio.AbstractEventLoop]] = {}
         log.info("Mock GPIO manager initialized")
 
     # -------------------------------
@@ -64,11 +66,52 @@ class MockGPIOManager(IGPIOManager):
     def write(self, pin: int, value: int) -> None:
         self._values[pin] = int(value)
 
+    # -------------------------------
+    # Edge detection
+    # -------------------------------
+
+    def add_edge_callback(
+        self,
+        pin: int,
+        callback: EdgeCallback,
+        edge: GPIOEdge = GPIOEdge.BOTH,
+        bouncetime_ms: int = 0,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        if pin not in self._registry:
+            raise ValueError(f"GPIO {pin} must be registered before adding edge detection")
+        self._edge_callbacks[pin] = (callback, edge, loop or asyncio.get_running_loop())
+
+    def remove_edge_callback(self, pin: int) -> None:
+        self._edge_callbacks.pop(pin, None)
+
+    def inject_edge(self, pin: int, level: int) -> None:
+        """
+        Simulate an input pin change (tests / simulators).
+
+        Safe to call from any thread; matching callbacks are scheduled on
+        their loop exactly like hardware interrupts.
+        """
+        level = int(level)
+        previous = self._values.get(pin)
+        self._values[pin] = level
+        if previous == level:
+            return
+
+        entry = self._edge_callbacks.get(pin)
+        if entry is None:
+            return
+
+        callback, edge, loop = entry
+        if edge == GPIOEdge.BOTH or (edge == GPIOEdge.RISING) == bool(level):
+            loop.call_soon_threadsafe(callback, pin, level)
+
     # -------------------------------
     # Lifecycle
     # -------------------------------
 
     def cleanup(self) -> None:
+        self._edge_callbacks.clear()
         self._registry.clear()
         self._values.clear()
         log.info(f"Mock GPIO Manager cleanup finished ({len(self._registry)} pins)")
@@ -5,7 +5,9 @@ Simple button with debouncing.
 """
 
 import time
+from typing import Callable, Optional
 from hardware.gpio import IGPIOManager
+from models.enums import GPIOEdge
 
 class Button:
     """
@@ -36,6 +38,7 @@ class Button:
         # State tracking
         self._last_state = gpio_manager.read(pin)
         self._last_press_time = 0.0
+        self._on_press: Optional[Callable[[], None]] = None
 
     # ---------------------------------------------------------------
     # Public API
@@ -64,6 +67,37 @@ class Button:
         return pressed
 
 
+    # ---------------------------------------------------------------
+    # Edge-callback mode
+    # ---------------------------------------------------------------
+
+    def enable_edge_callbacks(self, on_press: Callable[[], None]) -> None:
+        """
+        Switch to interrupt-driven mode: on_press() is called on the event
+        loop once per debounced press; is_pressed() polling is not needed.
+
+        Raises:
+            RuntimeError: If the GPIO backend cannot detect edges
+        """
+        self._on_press = on_press
+        self.gpio_manager.add_edge_callback(self.pin, self._on_edge, GPIOEdge.BOTH)
+
+    def disable_edge_callbacks(self) -> None:
+        self.gpio_manager.remove_edge_callback(self.pin)
+        self._on_press = None
+
+    def _on_edge(self, pin: int, level: int) -> None:
+        previous = self._last_state
+        self._last_state = level
+
+        # FALLING EDGE: HIGH → LOW
+        if previous == self.gpio_manager.HIGH and level == self.gpio_manager.LOW:
+            now = time.time()
+            if (now - self._last_press_time) >= self.debounce_time:
+                self._last_press_time = now
+                if self._on_press:
+                    self._on_press()
+
     # ---------------------------------------------------------------
     # Utilities 
     # ---------------------------------------------------------------
@@ -1,6 +1,6 @@
 
 import asyncio
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from evdev import InputDevice, list_devices, ecodes
 from models.events import KeyboardKeyPressEvent
 from services.event_bus import EventBus
@@ -9,13 +9,47 @@ from .base import IKeyboardAdapter
 
 log = get_logger().for_category(LogCategory.HARDWARE)
 
+# Pure modifier keys are tracked but never published
+_PURE_MODIFIERS = {
+    "LEFTCTRL", "RIGHTCTRL", "LEFTSHIFT", "RIGHTSHIFT",
+    "LEFTALT", "RIGHTALT", "LEFTMETA", "RIGHTMETA"
+}
+
+_KEY_DOWN = 1
+
+
+def _build_key_table() -> Dict[int, Tuple[str, Optional[str]]]:
+    """
+    Precompute keycode → (normalized key name, modifier group).
+
+    Normalized name is "" for pure modifiers; modifier group is
+    "CTRL" / "SHIFT" / "ALT" for modifier keys, otherwise None.
+    """
+    table: Dict[int, Tuple[str, Optional[str]]] = {}
+    for code, names in ecodes.bytype[ecodes.EV_KEY].items():
+        # evdev reports aliases as a list/tuple, e.g. ['KEY_COFFEE', 'KEY_SCREENLOCK']
+        name = names[0] if isinstance(names, (list, tuple)) else names
+        if not isinstance(name, str):
+            continue
+
+        bare = name.replace("KEY_", "")
+        modifier = next((m for m in ("CTRL", "SHIFT", "ALT") if m in bare), None)
+        normalized = "" if bare in _PURE_MODIFIERS else bare.replace("LEFT", "").replace("RIGHT", "")
+        table[code] = (normalized, modifier)
+    return table
+
+
+_KEY_TABLE = _build_key_table()
+
+
 class EvdevKeyboardAdapter(IKeyboardAdapter):
     """
     Physical keyboard input via Linux evdev (/dev/input/event*)
 
-    Robust implementation:
-    - Uses blocking device.read() executed in executor (thread) to avoid EAGAIN races
-    - Maps keycodes via ecodes.bytype
+    Implementation:
+    - Device fd registered with loop.add_reader; events read without blocking
+      directly on the event loop (no executor round trip)
+    - Keycodes mapped via a table precomputed at import (no per-event lookups)
     - Tracks modifiers (CTRL/SHIFT/ALT)
     - Publishes KeyboardKeyPressEvent(normalized_key, modifiers) to EventBus
     """
@@ -24,6 +58,7 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
         self.event_bus = event_bus
         self.device_path = device_path
         self.device: Optional[InputDevice] = None
+        self._closed: Optional[asyncio.Future] = None
 
         # Track modifier key states
         self._modifiers: Dict[str, bool] = {
@@ -33,7 +68,7 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
         }
 
     async def run(self) -> None:
-        """Main async loop reading keyboard events with retry and resilience."""
+        """Register the device with the event loop and wait until cancelled or the device fails."""
         
         log.info("Starting evdev keyboard adapter")
     
@@ -60,37 +95,44 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
             raise RuntimeError(f"Cannot open evdev keyboard device: {e}") from e
             
         loop = asyncio.get_running_loop()
+        fd = self.device.fd
+        self._closed = loop.create_future()
+        loop.add_reader(fd, self._on_readable)
         log.info("Physical keyboard active (evdev mode)")
 
         try:
-            while True:
-                try:
-                    # Read blocking in executor
-                    events = await loop.run_in_executor(None, self.device.read)
-                    for event in events:
-                        if event.type == ecodes.EV_KEY:
-                            await self._handle_key_event(event)
-
-                except OSError as e:
-                    log.warn(f"Temporary read error: {e}")
-                    await asyncio.sleep(0.1)
-                    continue  # retry after short delay
-                except Exception as e:
-                    log.error(f"Unexpected error in keyboard loop: {e}")
-                    await asyncio.sleep(0.1)
-                    continue
+            await self._closed
 
         except asyncio.CancelledError:
             log.debug("Evdev keyboard cancelled (task stopped)")
             raise
         
         finally:
+            loop.remove_reader(fd)
             try:
                 if self.device:
                     self.device.close()
             except Exception:
                 pass
 
+    def _on_readable(self) -> None:
+        """Reader callback: drain all pending events from the non-blocking fd."""
+        device = self.device
+        if device is None:
+            return
+
+        try:
+            for event in device.read():
+                if event.type == ecodes.EV_KEY:
+                    self._handle_key_event(event.code, event.value)
+        except BlockingIOError:
+            return  # spurious wakeup / drained
+        except OSError as e:
+            # Device unplugged or revoked - stop and let start_keyboard fall back
+            log.warn(f"Evdev keyboard read failed: {e}")
+            if self._closed and not self._closed.done():
+                self._closed.set_exception(RuntimeError(f"Evdev keyboard device lost: {e}"))
+
     async def _find_keyboard_device(self) -> Optional[str]:
         """
         Detect and select the correct keyboard input device.
@@ -121,7 +163,7 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
                     candidates.append((path, name, len(key_codes)))
 
                 log.debug(
-                    f"Keyboard candidate",
+                    "Keyboard candidate",
                     name=name,
                     path=path,
                     has_letters=has_letters,
@@ -149,44 +191,22 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
 
         return best_path
 
-    def _coerce_key_name(self, key_name: str | tuple[str]) -> str:
-        if isinstance(key_name, tuple):
-            # evdev sometimes reports aliases like ('LEFTSHIFT',)
-            return key_name[0]
-        return key_name
-
-    async def _handle_key_event(self, event) -> None:
-        log.info(
-            "Keyboard key event",
-            LogCategory=LogCategory.EVENT
-        )
-        
-        """Handle keyboard event from evdev"""
-        if event.type != ecodes.EV_KEY:
+    def _handle_key_event(self, code: int, value: int) -> None:
+        """Map keycode via table, update modifiers, publish on key down"""
+        entry = _KEY_TABLE.get(code)
+        if entry is None:
+            log.debug("Unknown key code: %s", code)
             return
 
-        # Map keycode to readable name
-        try:
-            key_name = ecodes.bytype[event.type][event.code]
-        except KeyError:
-            log.debug(f"Unknown key code: {event.code}")
-            return
-
-        pressed = event.value == 1
-        released = event.value == 0
-
-        raw_key_name = key_name
-        key_name = self._coerce_key_name(raw_key_name)
+        normalized, modifier = entry
+        pressed = value == _KEY_DOWN
 
-        # update modifier states
-        self._update_modifier_state(key_name, pressed=pressed)
+        # update modifier states (key up clears, repeat keeps)
+        if modifier is not None and value != 2:
+            self._modifiers[modifier] = pressed
 
         # only publish on key down (ignore key up/repeat)
-        if not pressed:
-            return
-
-        normalized = self._normalize_key_name(key_name)
-        if not normalized:
+        if not pressed or not normalized:
             return
 
         modifiers = [k for k, v in self._modifiers.items() if v]
@@ -197,34 +217,6 @@ class EvdevKeyboardAdapter(IKeyboardAdapter):
             modifiers=modifiers if modifiers else None
         )
 
-        await self.event_bus.publish(
+        self.event_bus.publish_nowait(
             KeyboardKeyPressEvent(normalized, modifiers)
         )
-
-    def _update_modifier_state(self, key_name: str, pressed: bool) -> None:
-        k = (key_name or "").upper()
-        if "CTRL" in k:
-            self._modifiers["CTRL"] = pressed
-        elif "SHIFT" in k:
-            self._modifiers["SHIFT"] = pressed
-        elif "ALT" in k:
-            self._modifiers["ALT"] = pressed
-
-    def _normalize_key_name(self, key_name: str) -> str:
-        """
-        Normalize key names: drop KEY_ prefix and left/right qualifiers.
-        Return empty string for modifier-only keys.
-        """
-        if not key_name:
-            return ""
-        nk = key_name.replace("KEY_", "")
-        # don't publish pure modifiers
-        pure_mods = {
-            "LEFTCTRL", "RIGHTCTRL", "LEFTSHIFT", "RIGHTSHIFT",
-            "LEFTALT", "RIGHTALT", "LEFTMETA", "RIGHTMETA"
-        }
-        if nk in pure_mods:
-            return ""
-        nk = nk.replace("LEFT", "").replace("RIGHT", "")
-        return nk
-
@@ -0,0 +1,19 @@
+from .packets import (
+    DmxPacket, DmxHeader, parse_sacn, parse_artnet, parse_sacn_into, parse_artnet_into,
+    build_sacn, build_artnet, SACN_PORT, ARTNET_PORT,
+)
+from .receiver import NetworkPixelReceiver
+
+__all__ = [
+    "DmxPacket",
+    "DmxHeader",
+    "parse_sacn",
+    "parse_artnet",
+    "parse_sacn_into",
+    "parse_artnet_into",
+    "build_sacn",
+    "build_artnet",
+    "SACN_PORT",
+    "ARTNET_PORT",
+    "NetworkPixelReceiver",
+]
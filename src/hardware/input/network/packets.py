@@ -0,0 +1,207 @@
+"""
+sACN (E1.31) and Art-Net (ArtDmx) packet header parsing.
+
+Only the header is decoded; DMX slot data is returned as an offset/length
+into the original datagram so the receiver can copy it with a memoryview
+slice instead of materializing intermediate bytes objects.
+
+parse_sacn_into / parse_artnet_into fill a reused DmxHeader with a single
+struct unpack and no slicing (receiver hot path); parse_sacn / parse_artnet
+return an immutable DmxPacket for everything else.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import NamedTuple, Optional
+
+
+class DmxPacket(NamedTuple):
+    """Decoded header of a DMX data packet"""
+    universe: int
+    sequence: int
+    data_offset: int      # Offset of DMX slot 1 in the datagram
+    data_length: int      # Number of DMX slots (0-512)
+    priority: int = 100   # sACN source priority (Art-Net has none)
+    terminated: bool = False
+
+
+class DmxHeader:
+    """Mutable DmxPacket fields, filled in place by parse_*_into (one instance per receiver)"""
+
+    __slots__ = ("universe", "sequence", "data_offset", "data_length", "priority", "terminated")
+
+    def __init__(self) -> None:
+        self.universe = 0
+        self.sequence = 0
+        self.data_offset = 0
+        self.data_length = 0
+        self.priority = 100
+        self.terminated = False
+
+    def to_packet(self) -> DmxPacket:
+        return DmxPacket(
+            universe=self.universe,
+            sequence=self.sequence,
+            data_offset=self.data_offset,
+            data_length=self.data_length,
+            priority=self.priority,
+            terminated=self.terminated,
+        )
+
+
+# ---------------------------------------------------------------------------
+# E1.31 (ANSI E1.31-2018, Streaming ACN)
+# ---------------------------------------------------------------------------
+
+SACN_PORT = 5568
+
+_ACN_IDENTIFIER = b"ASC-E1.17\x00\x00\x00"
+_VECTOR_ROOT_E131_DATA = 0x00000004
+_VECTOR_E131_DATA_PACKET = 0x00000002
+_VECTOR_DMP_SET_PROPERTY = 0x02
+
+_SACN_OPT_PREVIEW = 0x80
+_SACN_OPT_TERMINATED = 0x40
+
+_SACN_MIN_LENGTH = 126
+_SACN_DATA_OFFSET = 126         # DMX slot 1 (after start code at 125)
+
+# root vector @18, framing vector @40, priority @108, seq @111, options @112,
+# universe @113, DMP vector @117, property count @123, start code @125
+_sacn_header = struct.Struct("!18xI18xI64xBxxBBHxxBxxxxxHB")
+
+
+def parse_sacn_into(packet: bytes, header: DmxHeader) -> bool:
+    """
+    Parse an E1.31 data packet header into header.
+
+    Returns:
+        False for non-data / preview / non-zero start code packets
+    """
+    if len(packet) < _SACN_MIN_LENGTH or not packet.startswith(_ACN_IDENTIFIER, 4):
+        return False
+
+    (root_vector, framing_vector, priority, sequence, options, universe,
+     dmp_vector, property_count, start_code) = _sacn_header.unpack_from(packet)
+    if (root_vector != _VECTOR_ROOT_E131_DATA or framing_vector != _VECTOR_E131_DATA_PACKET
+            or options & _SACN_OPT_PREVIEW or dmp_vector != _VECTOR_DMP_SET_PROPERTY or start_code):
+        return False
+
+    # property_count includes the start code
+    length = min(property_count - 1, len(packet) - _SACN_DATA_OFFSET, 512)
+    if length < 0:
+        return False
+
+    header.universe = universe
+    header.sequence = sequence
+    header.data_offset = _SACN_DATA_OFFSET
+    header.data_length = length
+    header.priority = priority
+    header.terminated = bool(options & _SACN_OPT_TERMINATED)
+    return True
+
+
+def parse_sacn(packet: bytes) -> Optional[DmxPacket]:
+    """
+    Parse an E1.31 data packet header.
+
+    Returns:
+        DmxPacket, or None for non-data / preview / non-zero start code packets
+    """
+    header = DmxHeader()
+    return header.to_packet() if parse_sacn_into(packet, header) else None
+
+
+# ---------------------------------------------------------------------------
+# Art-Net 4 (ArtDmx)
+# ---------------------------------------------------------------------------
+
+ARTNET_PORT = 6454
+
+_ARTNET_ID = b"Art-Net\x00"
+_OP_DMX = 0x5000
+
+_ARTNET_MIN_LENGTH = 18
+_ARTNET_DATA_OFFSET = 18
+
+# opcode @8 (little-endian, read big-endian here), seq @12, SubUni @14, Net @15, length @16
+_artnet_header = struct.Struct("!8xHxxBxBBH")
+_OP_DMX_SWAPPED = ((_OP_DMX & 0xFF) << 8) | (_OP_DMX >> 8)
+
+
+def parse_artnet_into(packet: bytes, header: DmxHeader) -> bool:
+    """
+    Parse an ArtDmx packet header into header.
+
+    Returns:
+        False for other opcodes
+    """
+    if len(packet) < _ARTNET_MIN_LENGTH or not packet.startswith(_ARTNET_ID):
+        return False
+
+    opcode, sequence, sub_uni, net, length = _artnet_header.unpack_from(packet)
+    if opcode != _OP_DMX_SWAPPED:
+        return False
+
+    header.universe = ((net & 0x7F) << 8) | sub_uni
+    header.sequence = sequence
+    header.data_offset = _ARTNET_DATA_OFFSET
+    header.data_length = min(length, len(packet) - _ARTNET_DATA_OFFSET, 512)
+    header.priority = 100
+    header.terminated = False
+    return True
+
+
+def parse_artnet(packet: bytes) -> Optional[DmxPacket]:
+    """
+    Parse an ArtDmx packet header.
+
+    Returns:
+        DmxPacket, or None for other opcodes
+    """
+    header = DmxHeader()
+    return header.to_packet() if parse_artnet_into(packet, header) else None
+
+
+# ---------------------------------------------------------------------------
+# Builders (used by tools/sacn_sender.py and tests)
+# ---------------------------------------------------------------------------
+
+def build_sacn(universe: int, data: bytes, sequence: int = 0, priority: int = 100,
+               source_name: str = "Diuna", cid: bytes = b"\x00" * 16) -> bytes:
+    """Build an E1.31 data packet carrying up to 512 DMX slots"""
+    data = bytes(data[:512])
+    slots = len(data) + 1                          # + start code
+    name = source_name.encode("utf-8")[:63].ljust(64, b"\x00")
+
+    dmp_len = 10 + slots
+    framing_len = 77 + dmp_len
+    root_len = 22 + framing_len
+
+    return b"".join((
+        struct.pack("!HH", 0x0010, 0x0000),
+        _ACN_IDENTIFIER,
+        struct.pack("!HI", 0x7000 | root_len, _VECTOR_ROOT_E131_DATA),
+        cid,
+        struct.pack("!HI", 0x7000 | framing_len, _VECTOR_E131_DATA_PACKET),
+        name,
+        struct.pack("!BHBBH", priority, 0, sequence & 0xFF, 0, universe),
+        struct.pack("!HBBHHH", 0x7000 | dmp_len, _VECTOR_DMP_SET_PROPERTY, 0xA1, 0, 1, slots),
+        b"\x00",
+        data,
+    ))
+
+
+def build_artnet(universe: int, data: bytes, sequence: int = 0) -> bytes:
+    """Build an ArtDmx packet carrying up to 512 DMX slots"""
+    data = bytes(data[:512])
+    if len(data) % 2:
+        data += b"\x00"                            # ArtDmx length must be even
+    return b"".join((
+        _ARTNET_ID,
+        struct.pack("<H", _OP_DMX),
+        struct.pack("!H", 14),                     # protocol version
+        struct.pack("!BBBBH", sequence & 0xFF, 0, universe & 0xFF, (universe >> 8) & 0x7F, len(data)),
+        data,
+    ))
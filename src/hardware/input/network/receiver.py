@@ -0,0 +1,255 @@
+"""
+NetworkPixelReceiver — sACN / Art-Net pixel input as a FrameManager source.
+
+Receives DMX universes over UDP (asyncio DatagramProtocol), copies the slot
+data straight into preallocated per-zone RGB buffers and pushes PixelFrames
+at NETWORK priority, so external software (xLights, QLC+, ...) overrides
+animations while it is streaming and the system falls back automatically
+once it stops.
+
+Hot path (datagram_received):
+  - Header parsed with one struct.unpack_from into a reused DmxHeader
+    (no slicing, no per-packet header object)
+  - Universe → slot table lookup precomputed at startup
+  - memoryview slice assignment into zone buffers (no intermediate bytes);
+    the only per-packet objects are the datagram asyncio hands over, one
+    memoryview over it and one slice per mapped slot
+  - Frame emission coalesced: universes arriving within a few ms of each
+    other produce a single PixelFrame
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from models.color import Color
+from models.enums import FrameSource, LogCategory, NetworkInputProtocol, ZoneID
+from models.frame import PixelFrame
+from models.zone_mapping import NetworkInputConfig
+from hardware.input.network.packets import DmxHeader, parse_artnet_into, parse_sacn_into
+from utils.logger import get_logger
+
+log = get_logger().for_category(LogCategory.NETWORK)
+
+# (zone_id, destination offset in zone buffer, source offset in universe data, length)
+UniverseSlot = Tuple[ZoneID, int, int, int]
+
+
+class NetworkPixelReceiver(asyncio.DatagramProtocol):
+    """
+    UDP receiver mapping sACN / Art-Net universes onto zones.
+
+    Example:
+        receiver = NetworkPixelReceiver(config, {ZoneID.FLOOR: 45}, frame_manager)
+        await receiver.start()
+        ...
+        receiver.close()
+    """
+
+    COALESCE_DELAY = 0.002      # Wait for remaining universes of the same frame
+    COLOR_CACHE_SIZE = 4096     # Distinct RGB values kept as shared Color objects
+
+    def __init__(self, config: NetworkInputConfig, zone_pixel_counts: Dict[ZoneID, int], frame_manager, fps: int = 60):
+        """
+        Args:
+            config: Parsed network_input section
+            zone_pixel_counts: Pixel count per zone (zones not listed are ignored)
+            frame_manager: FrameManager (only submit_frame() is used)
+            fps: Refresh rate used to hold the last frame while within ttl
+        """
+        self.config = config
+        self.frame_manager = frame_manager
+        self.refresh_interval = 1.0 / fps
+
+        self._parse_into: Callable[[bytes, DmxHeader], bool] = (
+            parse_sacn_into if config.protocol == NetworkInputProtocol.SACN else parse_artnet_into
+        )
+        self._header = DmxHeader()
+
+        self._sequence_zero_valid = config.protocol == NetworkInputProtocol.SACN
+
+        # Preallocated RGB buffers, one per mapped zone
+        self.buffers: Dict[ZoneID, bytearray] = {}
+        self._slots: Dict[int, List[UniverseSlot]] = self._build_slot_table(zone_pixel_counts)
+
+        self._last_sequence: Dict[int, int] = {}
+        self._dirty: Set[ZoneID] = set()
+        self._color_cache: Dict[int, Color] = {}
+        self._zone_colors: Dict[ZoneID, List[Color]] = {}
+
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._last_packet_time = 0.0
+
+        # Metrics
+        self.packets_received = 0
+        self.packets_ignored = 0
+        self.packets_out_of_order = 0
+        self.frames_submitted = 0
+
+    # === Setup ===
+
+    def _build_slot_table(self, zone_pixel_counts: Dict[ZoneID, int]) -> Dict[int, List[UniverseSlot]]:
+        """Precompute which byte ranges of each universe land in which zone buffer"""
+        per_universe = self.config.channels_per_universe
+        table: Dict[int, List[UniverseSlot]] = {}
+
+        for mapping in self.config.universes:
+            pixel_count = zone_pixel_counts.get(mapping.zone_id)
+            if not pixel_count:
+                log.warn(f"Network input: zone {mapping.zone_id.name} has no pixels, skipping")
+                continue
+
+            size = pixel_count * 3
+            self.buffers[mapping.zone_id] = bytearray(size)
+
+            universe = mapping.universe
+            src = mapping.start_channel - 1
+            dst = 0
+            while dst < size:
+                length = min(per_universe - src, size - dst)
+                if length <= 0:
+                    raise ValueError(
+                        f"Zone {mapping.zone_id.name} start_channel exceeds channels_per_universe"
+                    )
+                table.setdefault(universe, []).append((mapping.zone_id, dst, src, length))
+                dst += length
+                universe += 1
+                src = 0
+
+        return table
+
+    async def start(self) -> None:
+        """Bind the UDP endpoint on the running loop"""
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(
+            lambda: self,
+            local_addr=(self.config.bind_host, self.config.port),
+        )
+        log.info(
+            "Network input listening",
+            protocol=self.config.protocol.name,
+            bind=f"{self.config.bind_host}:{self.config.port}",
+            universes=sorted(self._slots),
+        )
+
+    def close(self) -> None:
+        """Stop receiving and cancel pending flush"""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
+    # === DatagramProtocol ===
+
+    def connection_made(self, transport) -> None:
+        self._transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        header = self._header
+        if not self._parse_into(data, header):
+            self.packets_ignored += 1
+            return
+
+        universe = header.universe
+        slots = self._slots.get(universe)
+        if slots is None:
+            self.packets_ignored += 1
+            return
+
+        # Drop stale packets (E1.31 6.7.2: 8-bit sequence, window of -20..0).
+        # Art-Net sequence 0 means "sequencing disabled".
+        sequence = header.sequence
+        last = self._last_sequence.get(universe)
+        if last is not None and (sequence or self._sequence_zero_valid):
+            diff = (sequence - last) & 0xFF
+            if diff == 0 or diff > 0xEC:
+                self.packets_out_of_order += 1
+                return
+        self._last_sequence[universe] = sequence
+
+        self.packets_received += 1
+        self._last_packet_time = time.monotonic()
+
+        if header.terminated:
+            return
+
+        src_view = memoryview(data)
+        data_start = header.data_offset
+        data_length = header.data_length
+        buffers = self.buffers
+
+        for zone_id, dst, src, length in slots:
+            n = min(length, data_length - src)
+            if n <= 0:
+                continue
+            start = data_start + src
+            buffers[zone_id][dst:dst + n] = src_view[start:start + n]
+            self._dirty.add(zone_id)
+
+        if self._dirty and self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.COALESCE_DELAY, self._flush)
+
+    def error_received(self, exc: Exception) -> None:
+        log.warn(f"Network input socket error: {exc}")
+
+    # === Frame emission ===
+
+    def _flush(self) -> None:
+        """Convert dirty zone buffers to colors and submit a PixelFrame"""
+        self._flush_handle = None
+
+        for zone_id in self._dirty:
+            self._zone_colors[zone_id] = self._decode_zone(zone_id)
+        self._dirty.clear()
+
+        if not self._zone_colors:
+            return
+
+        self.frame_manager.submit_frame(PixelFrame(
+            priority=self.config.priority,
+            source=FrameSource.NETWORK,
+            ttl=self.refresh_interval * 2,
+            partial=True,
+            zone_pixels=dict(self._zone_colors),
+        ))
+        self.frames_submitted += 1
+
+        # FrameManager drains its queues every tick; keep re-submitting the
+        # last frame while the sender is alive (senders often run below 60fps)
+        if time.monotonic() - self._last_packet_time < self.config.ttl:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.refresh_interval, self._flush)
+        else:
+            self._zone_colors.clear()
+
+    def _decode_zone(self, zone_id: ZoneID) -> List[Color]:
+        """RGB buffer → List[Color], sharing Color objects for repeated values"""
+        buf = self.buffers[zone_id]
+        cache = self._color_cache
+        if len(cache) > self.COLOR_CACHE_SIZE:
+            cache.clear()
+
+        colors: List[Color] = []
+        append = colors.append
+        it = iter(buf)
+        for r, g, b in zip(it, it, it):
+            key = (r << 16) | (g << 8) | b
+            color = cache.get(key)
+            if color is None:
+                color = cache[key] = Color.from_rgb(r, g, b)
+            append(color)
+        return colors
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "packets_received": self.packets_received,
+            "packets_ignored": self.packets_ignored,
+            "packets_out_of_order": self.packets_out_of_order,
+            "frames_submitted": self.frames_submitted,
+        }
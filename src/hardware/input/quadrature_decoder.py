@@ -0,0 +1,91 @@
+"""
+Quadrature Decoder - Hardware Abstraction Layer (Layer 1)
+
+Table-driven state machine for incremental rotary encoders (CLK=A, DT=B).
+
+Every valid Gray-code transition moves a signed quarter-step counter by ±1;
+a detent is reported once steps_per_detent transitions accumulate in the
+same direction. Contact bounce (A→B→A) cancels itself out and illegal
+double transitions (both pins changed between samples) are counted as
+errors instead of producing a wrong direction.
+
+Pure logic - no GPIO access, usable from edge callbacks, polling or tests.
+"""
+
+from typing import Tuple
+
+# Index: (previous_state << 2) | current_state, state = (A << 1) | B
+# CW sequence: 00 → 10 → 11 → 01 → 00  (CLK leads DT, same as RotaryEncoder.read)
+_TRANSITIONS: Tuple[int, ...] = (
+    #  cur: 00  01  10  11
+    0, -1, +1,  0,   # prev 00
+    +1, 0,  0, -1,   # prev 01
+    -1, 0,  0, +1,   # prev 10
+    0, +1, -1,  0,   # prev 11
+)
+
+# Transitions where both pins changed at once (direction unknown)
+_ILLEGAL = frozenset({0b0011, 0b0110, 0b1001, 0b1100})
+
+
+class QuadratureDecoder:
+    """
+    Quadrature state machine with signed detent accumulation.
+
+    Example:
+        decoder = QuadratureDecoder(initial_a=1, initial_b=1)
+        detents = decoder.update(a, b)   # call on every pin change / sample
+    """
+
+    __slots__ = ("steps_per_detent", "_state", "_steps", "errors", "transitions")
+
+    def __init__(self, initial_a: int = 1, initial_b: int = 1, steps_per_detent: int = 4):
+        """
+        Args:
+            initial_a: Current CLK level
+            initial_b: Current DT level
+            steps_per_detent: Gray-code transitions per mechanical detent
+                              (4 for full-cycle encoders such as KY-040, 2 or 1 for half/quarter)
+        """
+        if steps_per_detent not in (1, 2, 4):
+            raise ValueError(f"steps_per_detent must be 1, 2 or 4, got {steps_per_detent}")
+        self.steps_per_detent = steps_per_detent
+        self._state = ((initial_a & 1) << 1) | (initial_b & 1)
+        self._steps = 0
+        self.errors = 0
+        self.transitions = 0
+
+    def update(self, a: int, b: int) -> int:
+        """
+        Feed the current pin levels.
+
+        Returns:
+            Signed number of completed detents (usually -1, 0 or 1)
+        """
+        state = ((a & 1) << 1) | (b & 1)
+        index = (self._state << 2) | state
+        if state == self._state:
+            return 0
+        self._state = state
+
+        step = _TRANSITIONS[index]
+        if step == 0:
+            if index in _ILLEGAL:
+                self.errors += 1
+            return 0
+
+        self.transitions += 1
+        self._steps += step
+
+        # Emit whole detents, keep the remainder (sign-aware)
+        per = self.steps_per_detent
+        if self._steps >= per or self._steps <= -per:
+            detents = int(self._steps / per)
+            self._steps -= detents * per
+            return detents
+        return 0
+
+    def reset(self, a: int, b: int) -> None:
+        """Resynchronize to current levels and drop partial steps"""
+        self._state = ((a & 1) << 1) | (b & 1)
+        self._steps = 0
@@ -3,13 +3,19 @@
 Rotary Encoder Component - Hardware Abstraction Layer (Layer 1)
 
 Handles reading rotary encoder (CLK/DT pins) and button (SW pin).
-Provides simple interface: read() returns -1/0/1, is_pressed() returns bool.
+Provides simple interface: read() returns signed detents, is_pressed() returns bool.
+
+Rotation is decoded by QuadratureDecoder from both pins, so bounce cancels
+out and no steps are lost as long as every pin change is observed (edge mode).
 
 Registers all GPIO pins via GPIOManager.
 """
 
 import time
+from typing import Callable, Optional
 from hardware.gpio import IGPIOManager
+from hardware.input.quadrature_decoder import QuadratureDecoder
+from models.enums import GPIOEdge
 
 class RotaryEncoder:
     
@@ -19,7 +25,8 @@ class RotaryEncoder:
         dt: int,
         sw: int,
         gpio_manager: IGPIOManager,
-        debounce_time: float = 0.3
+        debounce_time: float = 0.3,
+        steps_per_detent: int = 2
     ):
         self.gpio_manager = gpio_manager
         
@@ -32,33 +39,30 @@ class RotaryEncoder:
         # This component receives already-registered pins, just uses them for input reading
         # Do NOT register pins here to avoid conflicts
 
-        # State tracking for rotation
-        self._last_clk = self.gpio_manager.read(clk)
+        # State tracking for rotation (steps_per_detent=2 keeps the previous
+        # "one step per CLK edge" sensitivity)
+        self._clk_level = self.gpio_manager.read(clk)
+        self._dt_level = self.gpio_manager.read(dt)
+        self.decoder = QuadratureDecoder(self._clk_level, self._dt_level, steps_per_detent)
 
         # State tracking for button press
         self._last_state = self.gpio_manager.read(sw)
         self._last_press_time = 0.0
 
+        # Edge-callback mode handlers
+        self._on_rotate: Optional[Callable[[int], None]] = None
+        self._on_press: Optional[Callable[[], None]] = None
+
     def read(self) -> int:
         """
-        Read encoder rotation
+        Sample encoder pins (polling mode)
 
         Returns:
-            1: Clockwise rotation
-            -1: Counter-clockwise rotation
-            0: No rotation
+            Signed number of detents since last call (>0 clockwise, <0 counter-clockwise)
         """
-        clk_state = self.gpio_manager.read(self.clk_pin)
-        dt_state = self.gpio_manager.read(self.dt_pin)
-
-        if clk_state != self._last_clk:
-            self._last_clk = clk_state
-            if dt_state != clk_state:
-                return 1  # Clockwise
-            else:
-                return -1  # Counter-clockwise
-
-        return 0
+        self._clk_level = self.gpio_manager.read(self.clk_pin)
+        self._dt_level = self.gpio_manager.read(self.dt_pin)
+        return self.decoder.update(self._clk_level, self._dt_level)
 
     def is_pressed(self) -> bool:
         """
@@ -81,3 +85,64 @@ class RotaryEncoder:
         # Update state AFTER detection
         self._last_state = current_state
         return pressed
+
+    # ---------------------------------------------------------------
+    # Edge-callback mode
+    # ---------------------------------------------------------------
+
+    def enable_edge_callbacks(
+        self,
+        on_rotate: Callable[[int], None],
+        on_press: Callable[[], None]
+    ) -> None:
+        """
+        Switch to interrupt-driven mode.
+
+        on_rotate(delta) is called on every completed detent and on_press() once
+        per debounced click, both on the event loop thread.
+
+        Raises:
+            RuntimeError: If the GPIO backend cannot detect edges
+        """
+        self._on_rotate = on_rotate
+        self._on_press = on_press
+        self._clk_level = self.gpio_manager.read(self.clk_pin)
+        self._dt_level = self.gpio_manager.read(self.dt_pin)
+        self.decoder.reset(self._clk_level, self._dt_level)
+
+        self.gpio_manager.add_edge_callback(self.clk_pin, self._on_clk_edge, GPIOEdge.BOTH)
+        self.gpio_manager.add_edge_callback(self.dt_pin, self._on_dt_edge, GPIOEdge.BOTH)
+        self.gpio_manager.add_edge_callback(self.sw_pin, self._on_sw_edge, GPIOEdge.BOTH)
+
+    def disable_edge_callbacks(self) -> None:
+        for pin in (self.clk_pin, self.dt_pin, self.sw_pin):
+            self.gpio_manager.remove_edge_callback(pin)
+        self._on_rotate = None
+        self._on_press = None
+
+    # Each callback carries the level sampled at interrupt time; the other
+    # pin's level is the last one delivered, so the decoder sees edges in order.
+
+    def _on_clk_edge(self, pin: int, level: int) -> None:
+        self._clk_level = level
+        self._emit_rotation(self.decoder.update(level, self._dt_level))
+
+    def _on_dt_edge(self, pin: int, level: int) -> None:
+        self._dt_level = level
+        self._emit_rotation(self.decoder.update(self._clk_level, level))
+
+    def _emit_rotation(self, delta: int) -> None:
+        if delta and self._on_rotate:
+            self._on_rotate(delta)
+
+    def _on_sw_edge(self, pin: int, level: int) -> None:
+        previous = self._last_state
+        self._last_state = level
+
+        # FALLING EDGE: HIGH → LOW
+        if previous == self.gpio_manager.HIGH and level == self.gpio_manager.LOW:
+            now = time.time()
+            if (now - self._last_press_time) >= self.debounce_time:
+                self._last_press_time = now
+                if self._on_press:
+                    self._on_press()
@@ -1,9 +1,12 @@
 from .strip_interface import IPhysicalStrip
 from .virtual_strip import VirtualStrip
+from .shared_memory_strip import SharedMemoryStrip, SharedMemoryFrameReader
 from .led_channel_factory import LedChannelFactory
 
 __all__ = [
     "IPhysicalStrip",
     "VirtualStrip",
+    "SharedMemoryStrip",
+    "SharedMemoryFrameReader",
     "LedChannelFactory",
 ]
\ No newline at end of file
@@ -8,6 +8,8 @@ from hardware.led.led_channel import LedChannel
 from hardware.led import VirtualStrip
 from hardware.led import IPhysicalStrip
 from hardware.led.ws281x_strip import WS281xStrip
+from hardware.led.shared_memory_strip import SharedMemoryStrip
+from models.hardware import VirtualStripConfig
 from runtime.runtime_info import RuntimeInfo
 from utils.logger import get_logger, LogCategory
 
@@ -61,6 +63,7 @@ class LedChannelFactory:
         # ------------------------------
         
         gpio_mappings = hardware_manager.get_gpio_to_zones_mapping()
+        virtual_config = hardware_manager.config.virtual_strips if hardware_manager.config else VirtualStripConfig()
         
         channels: Dict[int, LedChannel] = {}
 
@@ -82,7 +85,8 @@ class LedChannelFactory:
             hardware_led_strip = cls._create_physical_strip(
                 gpio_pin=gpio_pin,
                 pixel_count=pixel_count,
-                mapping=mapping
+                mapping=mapping,
+                virtual_config=virtual_config,
             )
             
             channel = LedChannel(
@@ -145,9 +149,13 @@ class LedChannelFactory:
         gpio_pin: int,
         pixel_count: int,
         mapping: dict,
+        virtual_config: VirtualStripConfig = VirtualStripConfig(),
     ) -> IPhysicalStrip:
         """
         Create WS281xStrip or VirtualStrip depending on runtime.
+
+        Without WS281x, virtual_config.shared_memory selects SharedMemoryStrip
+        so frames can be read by external processes.
         """
 
         color_order = mapping.get("color_order", "GRB")
@@ -184,6 +192,15 @@ class LedChannelFactory:
             pixels=pixel_count,
         )
 
+        if virtual_config.shared_memory:
+            name = f"{virtual_config.name_prefix}_{gpio_pin}"
+            try:
+                strip = SharedMemoryStrip(pixel_count=pixel_count, name=name, slots=virtual_config.slots)
+                log.info("Publishing VirtualStrip frames to shared memory", gpio=gpio_pin, name=name)
+                return strip
+            except OSError as ex:
+                log.warn("Shared memory unavailable – using plain VirtualStrip", gpio=gpio_pin, error=str(ex))
+
         return VirtualStrip(pixel_count=pixel_count)
 
     @staticmethod
@@ -0,0 +1,220 @@
+"""
+SharedMemoryStrip — VirtualStrip that publishes frames to shared memory.
+
+Every show() copies the current frame as packed RGB into a ring buffer in a
+multiprocessing.shared_memory block, so visualizers, test harnesses and
+benchmarks in other processes can read frames at full rate without
+Socket.IO or JSON.
+
+Memory layout (little-endian):
+
+    Header (32 bytes)
+      0   4s   magic "DLED"
+      4   H    layout version
+      6   H    slot count
+      8   I    pixel count
+      12  I    slot size (bytes)
+      16  Q    sequence of the latest complete frame (0 = none yet)
+      24  d    reserved
+
+    Slot i (at 32 + i * slot_size)
+      0   Q    frame sequence (seqlock: 0 while being written)
+      8   d    time.monotonic() when published
+      16  ...  pixel_count * 3 bytes RGB
+
+Frame n is stored in slot (n - 1) % slot_count. Readers check the slot
+sequence before and after copying to detect a torn read (writer lapped them).
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Tuple
+
+from models.color import Color
+from hardware.led.virtual_strip import VirtualStrip
+
+MAGIC = b"DLED"
+LAYOUT_VERSION = 1
+
+_header = struct.Struct("<4sHHIIQd")
+_slot_header = struct.Struct("<Qd")
+_sequence = struct.Struct("<Q")
+
+HEADER_SIZE = _header.size
+SLOT_HEADER_SIZE = _slot_header.size
+_SEQUENCE_OFFSET = 16
+
+# Blocks created by this process (their resource tracker entry must be kept)
+_owned_names = set()
+
+
+def _slot_offset(index: int, slot_size: int) -> int:
+    return HEADER_SIZE + index * slot_size
+
+
+class SharedMemoryStrip(VirtualStrip):
+    """
+    VirtualStrip writer side of the shared-memory frame ring.
+
+    Example:
+        strip = SharedMemoryStrip(pixel_count=51, name="diuna_strip_18")
+        strip.apply_frame(colors)     # publishes frame
+        strip.shutdown()              # at shutdown (unlinks the block)
+    """
+
+    def __init__(self, pixel_count: int, name: str, slots: int = 8, brightness: int = 255):
+        super().__init__(pixel_count=pixel_count, brightness=brightness)
+        self.name = name
+        self.slots = max(2, slots)
+        self.slot_size = SLOT_HEADER_SIZE + pixel_count * 3
+        self.sequence = 0
+
+        size = HEADER_SIZE + self.slots * self.slot_size
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Stale block left by a crashed run - reclaim it
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        _owned_names.add(name)
+        self._buf = self._shm.buf
+        self._rgb = bytearray(pixel_count * 3)
+        _header.pack_into(self._buf, 0, MAGIC, LAYOUT_VERSION, self.slots, pixel_count, self.slot_size, 0, 0.0)
+
+    def apply_frame(self, pixels: List[Color]) -> None:
+        super().apply_frame(pixels)
+        self.show()
+
+    def clear(self) -> None:
+        super().clear()
+        self.show()
+
+    def show(self) -> None:
+        """Publish the current frame into the next ring slot"""
+        if self._buf is None:
+            return
+
+        rgb = self._rgb
+        i = 0
+        for color in self._buffer:
+            rgb[i], rgb[i + 1], rgb[i + 2] = color.to_rgb()
+            i += 3
+
+        seq = self.sequence + 1
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_size)
+        buf = self._buf
+
+        _sequence.pack_into(buf, offset, 0)                  # mark slot as being written
+        start = offset + SLOT_HEADER_SIZE
+        buf[start:start + len(rgb)] = rgb
+        _slot_header.pack_into(buf, offset, seq, time.monotonic())
+        _sequence.pack_into(buf, _SEQUENCE_OFFSET, seq)
+
+        self.sequence = seq
+
+    def shutdown(self) -> None:
+        """Release and unlink the shared memory block"""
+        if self._buf is None:
+            return
+        self._buf = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        _owned_names.discard(self.name)
+
+
+class SharedMemoryFrameReader:
+    """
+    Reader side of the shared-memory frame ring (any process).
+
+    Example:
+        reader = SharedMemoryFrameReader("diuna_strip_18")
+        seq, ts, rgb = reader.read_latest()
+        for seq, ts, rgb in reader.read_since(last_seq):
+            ...
+    """
+
+    def __init__(self, name: str):
+        self._shm = shared_memory.SharedMemory(name=name)
+        # Before Python 3.13 attaching registers the block with this process'
+        # resource tracker, which would unlink it when the reader exits.
+        if name not in _owned_names:
+            try:
+                resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+            except Exception:
+                pass
+
+        magic, version, slots, pixel_count, slot_size, _, _ = _header.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory '{name}' is not a frame ring (magic={magic!r}, version={version})")
+
+        self.slots = slots
+        self.pixel_count = pixel_count
+        self.slot_size = slot_size
+
+    @property
+    def sequence(self) -> int:
+        """Sequence of the latest complete frame"""
+        return _sequence.unpack_from(self._shm.buf, _SEQUENCE_OFFSET)[0]
+
+    def view(self, seq: int) -> Optional[memoryview]:
+        """
+        Zero-copy view of frame `seq` RGB bytes.
+
+        The view aliases the ring; call is_valid(seq) after using it to make
+        sure the writer did not overwrite the slot meanwhile.
+        """
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_size)
+        if _sequence.unpack_from(self._shm.buf, offset)[0] != seq:
+            return None
+        start = offset + SLOT_HEADER_SIZE
+        return self._shm.buf[start:start + self.pixel_count * 3]
+
+    def is_valid(self, seq: int) -> bool:
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_size)
+        return _sequence.unpack_from(self._shm.buf, offset)[0] == seq
+
+    def read(self, seq: int) -> Optional[Tuple[int, float, bytes]]:
+        """Copy frame `seq` out of the ring, or None if it was overwritten"""
+        if seq <= 0:
+            return None
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_size)
+        buf = self._shm.buf
+        slot_seq, timestamp = _slot_header.unpack_from(buf, offset)
+        if slot_seq != seq:
+            return None
+        start = offset + SLOT_HEADER_SIZE
+        data = bytes(buf[start:start + self.pixel_count * 3])
+        if _sequence.unpack_from(buf, offset)[0] != seq:
+            return None                                     # torn read
+        return seq, timestamp, data
+
+    def read_latest(self) -> Optional[Tuple[int, float, bytes]]:
+        return self.read(self.sequence)
+
+    def read_since(self, last_seq: int) -> List[Tuple[int, float, bytes]]:
+        """All frames newer than last_seq still present in the ring (oldest first)"""
+        latest = self.sequence
+        first = max(last_seq + 1, latest - self.slots + 1, 1)
+        frames = []
+        for seq in range(first, latest + 1):
+            frame = self.read(seq)
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def colors(self, rgb: bytes) -> List[Color]:
+        it = iter(rgb)
+        return [Color.from_rgb(r, g, b) for r, g, b in zip(it, it, it)]
+
+    def close(self) -> None:
+        self._shm.close()
@@ -108,7 +108,12 @@ class WS281xStrip(IPhysicalStrip):
         self._order_map = COLOR_ORDER_MAP[config.color_order.upper()]
         strip_type_const = self._decode_color_order(config.color_order)
 
-        log.debug(f"WS281xStrip init: color_order={config.color_order}, strip_type_const={hex(strip_type_const) if strip_type_const else None}, order_map={self._order_map}")
+        log.debug(
+            "WS281xStrip init: color_order=%s, strip_type_const=%s, order_map=%s",
+            config.color_order,
+            hex(strip_type_const) if strip_type_const else None,
+            self._order_map,
+        )
 
         from rpi_ws281x import PixelStrip, Color as WSColor, ws # type: ignore
         
@@ -119,7 +124,7 @@ class WS281xStrip(IPhysicalStrip):
         self._strip_type_handled_by_library = False
         
         try:
-            log.debug(f"Creating PixelStrip with strip_type_const={hex(strip_type_const) if strip_type_const else None}")
+            log.debug("Creating PixelStrip with strip_type_const=%s", hex(strip_type_const) if strip_type_const else None)
             self._pixel_strip: 'PixelStrip' = PixelStrip(
                 config.pixel_count,
                 config.gpio_pin,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import socket
 import uvicorn
 from typing import Optional
 from starlette.types import ASGIApp
@@ -46,6 +47,8 @@ class APIServerWrapper:
         app: ASGI application (FastAPI/Starlette)
         host: Bind host (default: "0.0.0.0")
         port: Bind port (default: 8000)
+        sock: Already listening socket to serve on instead of binding host:port
+              (e.g. from PortManager.open_listen_socket); closed by stop()
     """
 
     def __init__(
@@ -53,10 +56,12 @@ class APIServerWrapper:
         app: ASGIApp,
         host: str = "0.0.0.0",
         port: int = 8000,
+        sock: Optional[socket.socket] = None,
     ):
         self.app = app
         self.host = host
         self.port = port
+        self.sock = sock
         
         # Internal state
         self._server: Optional[uvicorn.Server] = None
@@ -126,8 +131,9 @@ class APIServerWrapper:
         log.info(f"🌐 Launching API server on http://{self.host}:{self.port}")
 
         # Start uvicorn serve() as background task and keep reference
+        sockets = [self.sock] if self.sock is not None else None
         self._serve_task = asyncio.create_task(
-            self._server.serve(), name="UvicornServeInternal"
+            self._server.serve(sockets=sockets), name="UvicornServeInternal"
         )
 
         # Wait until uvicorn reports it's started (or timeout)
@@ -224,7 +230,7 @@ class APIServerWrapper:
                     except Exception:
                         log.debug("🌐 Exception while closing socket", exc_info=True)
         except Exception as e:
-            log.debug(f"Error closing sockets: {e}", exc_info=True)
+            log.debug("Error closing sockets: %s", e, exc_info=True)
 
         # Cancel the serve task if it didn't finish
         if self._serve_task and not self._serve_task.done():
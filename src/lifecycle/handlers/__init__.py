@@ -1,19 +1,27 @@
 from .all_tasks_cancellation_handler import AllTasksCancellationHandler
 from .animation_shutdown_handler import AnimationShutdownHandler
 from .api_server_shutdown_handler import APIServerShutdownHandler
+from .event_bus_shutdown_handler import EventBusShutdownHandler
 from .frame_manager_shutdown_handler import FrameManagerShutdownHandler
 from .gpio_shutdown_handler import GPIOShutdownHandler
 from .indicator_shutdown_handler import IndicatorShutdownHandler
 from .led_shutdown_handler import LEDShutdownHandler
+from .log_store_shutdown_handler import LogStoreShutdownHandler
+from .network_input_shutdown_handler import NetworkInputShutdownHandler
+from .state_save_shutdown_handler import StateSaveShutdownHandler
 from .task_cancellation_handler import TaskCancellationHandler
 
 __all__ = [
     "AllTasksCancellationHandler",
     "AnimationShutdownHandler",
     "APIServerShutdownHandler",
+    "EventBusShutdownHandler",
     "FrameManagerShutdownHandler",
     "GPIOShutdownHandler",
     "IndicatorShutdownHandler",
     "LEDShutdownHandler",
+    "LogStoreShutdownHandler",
+    "NetworkInputShutdownHandler",
+    "StateSaveShutdownHandler",
     "TaskCancellationHandler",
 ]
\ No newline at end of file
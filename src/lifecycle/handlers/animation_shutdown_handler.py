@@ -31,7 +31,7 @@ class AnimationShutdownHandler(IShutdownHandler):
 
             if engine:
                 if engine.tasks:
-                    log.debug(f"Found {len(engine.tasks)} active animation task(s)")
+                    log.debug("Found %s active animation task(s)", len(engine.tasks))
                     await engine.stop_all()
                     log.info("All animations stopped successfully")
                 else:
@@ -0,0 +1,50 @@
+"""
+EventBus shutdown handler.
+
+Drains the EventBus dispatch queue and stops its worker tasks.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lifecycle.shutdown_protocol import IShutdownHandler
+from utils.logger import get_logger, LogCategory
+
+if TYPE_CHECKING:
+    from services.event_bus import EventBus
+
+log = get_logger().for_category(LogCategory.SHUTDOWN)
+
+
+class EventBusShutdownHandler(IShutdownHandler):
+    """
+    Shutdown handler for EventBus queue mode.
+
+    Runs after animations and the zone indicator have stopped (so their
+    last events are dispatched) and before LEDs and tasks are torn down.
+    """
+
+    def __init__(self, event_bus: EventBus, timeout: float = 1.0):
+        self.event_bus = event_bus
+        self.timeout = timeout
+
+    @property
+    def shutdown_priority(self) -> int:
+        return 110  # After IndicatorShutdownHandler (115), before LEDs (100)
+
+    async def shutdown(self) -> None:
+        """Dispatch queued events (bounded by timeout) and stop workers."""
+        log.info("Shutting down EventBus queue...")
+
+        try:
+            await self.event_bus.stop_queue(timeout=self.timeout)
+            metrics = self.event_bus.get_queue_metrics()
+            log.debug(
+                "EventBus queue stopped",
+                dispatched=metrics["dispatched"],
+                dropped=metrics["dropped"],
+                high_water=metrics["high_water"]
+            )
+        except Exception as e:
+            log.error(f"Error shutting down EventBus queue: {e}", exc_info=True)
@@ -46,7 +46,12 @@ class LEDShutdownHandler(IShutdownHandler):
             for gpio_pin, led_channel in self.hardware.led_channels.items():
                 try:
                     led_channel.clear()
-                    log.debug(f"Cleared GPIO {gpio_pin}")
+                    log.debug("Cleared GPIO %s", gpio_pin)
+
+                    # Release driver resources (WS281x, shared memory ring)
+                    shutdown = getattr(led_channel.hardware, "shutdown", None)
+                    if callable(shutdown):
+                        shutdown()
                 except Exception as e:
                     log.error(f"Error clearing led channel on GPIO: {gpio_pin}: {e}")
 
@@ -0,0 +1,47 @@
+"""
+Log store shutdown handler.
+
+Flushes the persistent log ring to disk and closes it.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lifecycle.shutdown_protocol import IShutdownHandler
+from services.log_store import set_log_store
+from utils.logger import get_logger, LogCategory
+
+if TYPE_CHECKING:
+    from services.log_broadcaster import LogBroadcaster
+
+log = get_logger().for_category(LogCategory.SHUTDOWN)
+
+
+class LogStoreShutdownHandler(IShutdownHandler):
+    """
+    Shutdown handler for the persistent LogStore.
+
+    Runs last so the log messages of every other shutdown step are persisted.
+    """
+
+    def __init__(self, broadcaster: LogBroadcaster):
+        self.broadcaster = broadcaster
+
+    @property
+    def shutdown_priority(self) -> int:
+        return 5  # After GPIOShutdownHandler (10)
+
+    async def shutdown(self) -> None:
+        """Detach the store from the broadcaster, msync and close it."""
+        store = self.broadcaster.store
+        if store is None:
+            return
+
+        log.info("Closing log store...", records=len(store))
+        self.broadcaster.set_store(None)
+        set_log_store(None)
+        try:
+            store.close()
+        except Exception as e:
+            log.error(f"Error closing log store: {e}")
@@ -0,0 +1,39 @@
+"""
+Network input shutdown handler.
+
+Closes the sACN / Art-Net UDP receiver before rendering stops.
+"""
+
+from __future__ import annotations
+
+from hardware.input.network import NetworkPixelReceiver
+from lifecycle.shutdown_protocol import IShutdownHandler
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.SHUTDOWN)
+
+
+class NetworkInputShutdownHandler(IShutdownHandler):
+    """
+    Shutdown handler for NetworkPixelReceiver.
+
+    Stops accepting datagrams so no new frames are submitted
+    while FrameManager is shutting down.
+    """
+
+    def __init__(self, receiver: NetworkPixelReceiver):
+        self.receiver = receiver
+
+    @property
+    def shutdown_priority(self) -> int:
+        return 125  # Before FrameManager (120)
+
+    async def shutdown(self) -> None:
+        """Close UDP transport and cancel pending flushes."""
+        log.info("Shutting down network input...")
+
+        try:
+            self.receiver.close()
+            log.debug("Network input closed", **self.receiver.get_metrics())
+        except Exception as e:
+            log.error(f"Error shutting down network input: {e}", exc_info=True)
@@ -0,0 +1,56 @@
+"""
+State save shutdown handler.
+
+Writes pending zone / application state to state.json before tasks are cancelled.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from lifecycle.shutdown_protocol import IShutdownHandler
+from utils.logger import get_logger, LogCategory
+
+if TYPE_CHECKING:
+    from services.application_state_service import ApplicationStateService
+    from services.data_assembler import DataAssembler
+    from services.zone_service import ZoneService
+
+log = get_logger().for_category(LogCategory.SHUTDOWN)
+
+
+class StateSaveShutdownHandler(IShutdownHandler):
+    """
+    Shutdown handler for DataAssembler persistence.
+
+    Debounced saves (and saves deferred by continuous controls) may still be
+    pending at shutdown; this re-syncs both state sections and flushes them.
+    Sections that did not change are not written.
+    """
+
+    def __init__(
+        self,
+        assembler: DataAssembler,
+        zone_service: Optional[ZoneService] = None,
+        app_state_service: Optional[ApplicationStateService] = None,
+    ):
+        self.assembler = assembler
+        self.zone_service = zone_service
+        self.app_state_service = app_state_service
+
+    @property
+    def shutdown_priority(self) -> int:
+        return 45  # After EventBusShutdownHandler (110), before TaskCancellationHandler (40)
+
+    async def shutdown(self) -> None:
+        """Queue current state and write it synchronously with the shutdown sequence."""
+        try:
+            if self.zone_service is not None:
+                self.zone_service.save_state()
+            if self.app_state_service is not None:
+                self.assembler.save_application_state(self.app_state_service.get_state())
+
+            if await self.assembler.flush():
+                log.info("State saved", path=str(self.assembler.state_path))
+        except Exception as e:
+            log.error(f"Error saving state on shutdown: {e}")
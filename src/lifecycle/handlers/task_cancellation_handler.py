@@ -38,7 +38,7 @@ class TaskCancellationHandler(IShutdownHandler):
         for task in self.tasks:
             if not task.done():
                 task.cancel()
-                log.debug(f"Cancelled task: {task.get_name()}")
+                log.debug("Cancelled task: %s", task.get_name())
 
         # Wait for all tasks to finish (either complete or raise CancelledError)
         if self.tasks:
@@ -79,7 +79,7 @@ class ShutdownCoordinator:
             raise ValueError(f"Handler {handler} missing shutdown() method")
 
         self._handlers.append(handler)
-        log.debug(f"Registered shutdown handler: {handler.__class__.__name__}")
+        log.debug("Registered shutdown handler: %s", handler.__class__.__name__)
 
     def setup_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
         """
@@ -258,7 +258,7 @@ class ShutdownCoordinator:
         if TR is None:
             task_name = completed_task.get_name()
             # No registry access, can't determine if it failed
-            log.debug(f"ℹ️  Critical task completed: {task_name}")
+            log.debug("ℹ️  Critical task completed: %s", task_name)
             return False  # Assume it's fine without error info
 
         registry = TR.instance()
@@ -276,7 +276,7 @@ class ShutdownCoordinator:
             return True  # Task failed, should trigger shutdown
 
         # Task completed cleanly - that's fine
-        log.debug(f"ℹ️  Critical task completed cleanly: {task_name}")
+        log.debug("ℹ️  Critical task completed cleanly: %s", task_name)
         return False  # Don't trigger shutdown
 
     async def wait_for_shutdown(self) -> None:
@@ -355,12 +355,12 @@ class ShutdownCoordinator:
                     break
 
                 try:
-                    log.debug(f"Executing {handler_name} (priority={priority})...")
+                    log.debug("Executing %s (priority=%s)...", handler_name, priority)
 
                     # Call shutdown with timeout
                     await asyncio.wait_for(handler.shutdown(), timeout=self._timeout_per_handler)
 
-                    log.debug(f"{handler_name} completed")
+                    log.debug("%s completed", handler_name)
 
                 except asyncio.TimeoutError:
                     log.error(
@@ -369,7 +369,7 @@ class ShutdownCoordinator:
                     )
 
                 except asyncio.CancelledError:
-                    log.debug(f"{handler_name} shutdown was cancelled")
+                    log.debug("%s shutdown was cancelled", handler_name)
                     raise
 
                 except Exception as e:
@@ -11,15 +11,22 @@ Features:
 - Track creation time, completion state, cancellation, errors
 - Introspection API for debugging & frontend panels
 - Optional automatic cleanup hooks during shutdown
+
+Bounded for long uptimes: running tasks are tracked individually, finished
+ones are kept in bounded rings (failures in their own ring so they are not
+pushed out by routine completions) and otherwise only counted per category.
+Origin stacks are captured for a sample of tasks only, and task changes are
+broadcast in batches (at most one flush per broadcast interval).
 """
 
 from __future__ import annotations
 
 import asyncio
 import traceback
+from collections import deque
 from dataclasses import dataclass, field, asdict
 from enum import Enum, auto
-from typing import Dict, Optional, List, Callable, Any
+from typing import Awaitable, Deque, Dict, Optional, List, Callable, Any, Tuple
 from datetime import datetime, timezone
 
 from utils.logger import get_logger, LogCategory
@@ -57,7 +64,7 @@ class TaskInfo:
     description: str
     created_at: str  # ISO UTC string
     created_timestamp: float  # monotonic or epoch for sorting
-    origin_stack: str  # short stack trace where create_tracked_task was called
+    origin_stack: str  # short stack trace where create_tracked_task was called ("" unless sampled)
     created_by: Optional[str] = None  # optional hint (module / function)
 
     def to_dict(self) -> dict[str, Any]:
@@ -137,11 +144,40 @@ class TaskRegistry:
     
     _instance: Optional["TaskRegistry"] = None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_finished: int = 500,
+        max_failed: int = 100,
+        stack_sample_every: int = 0,
+        broadcast_interval: float = 0.25,
+    ) -> None:
+        """
+        Args:
+            max_finished: Completed / cancelled records kept for introspection
+            max_failed: Failed records kept (separate ring)
+            stack_sample_every: Capture the origin stack of every Nth task
+                (0 = never, 1 = every task; costly on the task creation path)
+            broadcast_interval: Seconds between batched task broadcasts
+        """
         self._lock = asyncio.Lock()
-        self._records: Dict[int, TaskRecord] = {}
+        self._active: Dict[asyncio.Task, TaskRecord] = {}
+        self._finished: Deque[TaskRecord] = deque(maxlen=max_finished)
+        self._failed: Deque[TaskRecord] = deque(maxlen=max_failed)
         self._next_id: int = 1
 
+        self.stack_sample_every = stack_sample_every
+
+        # Lifetime counters: category name -> {"created", "completed", "failed", "cancelled"}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._durations = {"completed_total": 0.0, "completed_count": 0}
+
+        # Batched broadcasts: task id -> (event type, record), flushed once per interval
+        self.broadcast_interval = broadcast_interval
+        self._broadcast_sink: Optional[Callable[[List[Tuple[str, TaskRecord]]], Awaitable[None]]] = None
+        self._pending_broadcasts: Dict[int, Tuple[str, TaskRecord]] = {}
+        self._broadcast_handle: Optional[asyncio.TimerHandle] = None
+        self.broadcast_batches = 0
+
     # -----------------------------
     # Singleton accessor
     # -----------------------------
@@ -166,10 +202,12 @@ class TaskRegistry:
         task_id = self._next_id
         self._next_id += 1
 
-        # Capture short stack (exclude internal frames)
-        stack_lines = traceback.format_stack(limit=8)
-        # Drop the last frame which will be inside this module
-        origin_stack = "".join(stack_lines[:-1])
+        # Capture short stack (exclude internal frames) for sampled tasks only
+        origin_stack = ""
+        if self.stack_sample_every and task_id % self.stack_sample_every == 0:
+            stack_lines = traceback.format_stack(limit=8)
+            # Drop the last frame which will be inside this module
+            origin_stack = "".join(stack_lines[:-1])
 
         now = datetime.now(timezone.utc)
         ts = now.timestamp()
@@ -185,35 +223,33 @@ class TaskRegistry:
         )
 
         record = TaskRecord(task=task, info=info)
-        self._records[task_id] = record
+        self._active[task] = record
+        self._count(category, "created")
 
-        log.debug(
-            f"[Task {task_id}] Registered ({category.name}) - {description}"
-        )
+        log.debug("[Task %s] Registered (%s) - %s", task_id, category.name, description)
 
         # Auto-attach callback to track completion
         task.add_done_callback(self._on_task_done)
 
-        # Broadcast task creation event (non-blocking)
-        try:
-            asyncio.create_task(self._broadcast_task_event("task:created", record.to_dict()))
-        except RuntimeError:
-            # No event loop running (e.g., during app shutdown)
-            pass
+        self._queue_broadcast("task:created", record)
 
         return task_id
 
+    def _count(self, category: TaskCategory, key: str) -> None:
+        counters = self._counters.get(category.name)
+        if counters is None:
+            counters = self._counters[category.name] = {"created": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        counters[key] += 1
+
     # -----------------------------
     # Internal completion handler
     # -----------------------------
     def _on_task_done(self, task: asyncio.Task) -> None:
         """Internal callback whenever a task finishes."""
-        record = self._get_record_by_task(task)
+        record = self._active.pop(task, None)
         if record is None:
             return
 
-        task_label = f"[Task {record.info.id}] {record.info.description}"
-
         # Record finish time
         now = datetime.now(timezone.utc)
         record.finished_at = now.isoformat()
@@ -221,109 +257,150 @@ class TaskRegistry:
 
         if task.cancelled():
             record.cancelled = True
-            log.debug(f"{task_label} - Cancelled")
-            # Broadcast cancellation event
-            try:
-                asyncio.create_task(self._broadcast_task_event("task:cancelled", record.to_dict()))
-            except RuntimeError:
-                pass
+            log.debug("[Task %s] %s - Cancelled", record.info.id, record.info.description)
+            self._count(record.info.category, "cancelled")
+            self._finished.append(record)
+            self._queue_broadcast("task:cancelled", record)
         else:
             exc = task.exception()
             if exc:
                 record.finished_with_error = exc
                 log.error(
-                    f"{task_label} - FAILED: {exc}",
+                    "[Task %s] %s - FAILED: %s",
+                    record.info.id,
+                    record.info.description,
+                    exc,
                     exc_info=True
                 )
-                # Broadcast failure event
-                try:
-                    asyncio.create_task(self._broadcast_task_event("task:failed", record.to_dict()))
-                except RuntimeError:
-                    pass
+                self._count(record.info.category, "failed")
+                self._failed.append(record)
+                self._queue_broadcast("task:failed", record)
             else:
                 record.finished_return = task.result()
-                log.info(
-                    f"{task_label} - Completed successfully"
-                )
-                # Broadcast completion event
-                try:
-                    asyncio.create_task(self._broadcast_task_event("task:completed", record.to_dict()))
-                except RuntimeError:
-                    pass
+                log.info("[Task %s] %s - Completed successfully", record.info.id, record.info.description)
+                self._count(record.info.category, "completed")
+                self._durations["completed_total"] += record.get_duration() or 0.0
+                self._durations["completed_count"] += 1
+                self._finished.append(record)
+                self._queue_broadcast("task:completed", record)
 
+    def _get_record_by_task(self, task: asyncio.Task) -> Optional[TaskRecord]:
+        """Record of a running task, or of a finished one still retained (newest first)."""
+        record = self._active.get(task)
+        if record is not None:
+            return record
+        for ring in (self._failed, self._finished):
+            for record in reversed(ring):
+                if record.task is task:
+                    return record
+        return None
+
+    # -----------------------------
+    # Batched broadcasts
     # -----------------------------
-    # Internal broadcast helper
-    # Note: Broadcasting is now primarily handled through Socket.IO
-    # See: src/api/socketio/tasks/broadcaster.py
-    # This method is kept for backwards compatibility but does nothing
-    async def _broadcast_task_event(self, event_type: str, task_data: dict[str, Any]) -> None:
+
+    def set_broadcast_sink(
+        self,
+        sink: Optional[Callable[[List[Tuple[str, TaskRecord]]], Awaitable[None]]]
+    ) -> None:
         """
-        Broadcast a task event (no-op, for backwards compatibility).
+        Set the coroutine function receiving task changes in batches
+        (Socket.IO: see src/api/socketio/tasks/broadcaster.py). None disables.
 
-        Broadcasting is now handled through Socket.IO:
-        - src/api/socketio/tasks/broadcaster.py (server-side)
-        - Frontend listens on Socket.IO events: tasks:all, tasks:active, tasks:stats
+        Each batch holds one (event type, record) per changed task; a task
+        created within the batch window is reported as "task:created" with
+        its current status.
         """
-        # Socket.IO handles broadcasting - clients request data on-demand
-        pass
+        self._broadcast_sink = sink
 
-    # -----------------------------
-    # Utility: find record by task instance
-    # -----------------------------
-    def _get_record_by_task(self, task: asyncio.Task) -> Optional[TaskRecord]:
-        for record in self._records.values():
-            if record.task is task:
-                return record
-        return None
+    def _queue_broadcast(self, event_type: str, record: TaskRecord) -> None:
+        if self._broadcast_sink is None or not self.broadcasting_enabled:
+            return
+
+        pending = self._pending_broadcasts.get(record.info.id)
+        if pending is not None and pending[0] == "task:created":
+            event_type = "task:created"
+        self._pending_broadcasts[record.info.id] = (event_type, record)
+
+        if self._broadcast_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No event loop running (e.g., during app shutdown)
+                self._pending_broadcasts.clear()
+                return
+            self._broadcast_handle = loop.call_later(self.broadcast_interval, self._flush_broadcasts)
+
+    def _flush_broadcasts(self) -> None:
+        self._broadcast_handle = None
+        batch = list(self._pending_broadcasts.values())
+        self._pending_broadcasts.clear()
+        if not batch or self._broadcast_sink is None:
+            return
+        self.broadcast_batches += 1
+        # Deliberately untracked: tracking the broadcast would queue another broadcast
+        asyncio.ensure_future(self._broadcast_sink(batch))
 
     # -----------------------------
     # Public API
     # -----------------------------
 
     def list_all(self) -> List[TaskRecord]:
-        """Return a list of all tracked task records."""
-        return list(self._records.values())
+        """Return running tasks plus the retained finished records, oldest first."""
+        records = [*self._active.values(), *self._finished, *self._failed]
+        records.sort(key=lambda r: r.info.id)
+        return records
 
     def active(self) -> List[TaskRecord]:
         """Return only tasks that are still running."""
         return [
-            r for r in self._records.values()
+            r for r in self._active.values()
             if not r.task.done()
         ]
 
     def failed(self) -> List[TaskRecord]:
-        """Return tasks that ended with an exception."""
-        return [
-            r for r in self._records.values()
-            if r.finished_with_error is not None
-        ]
+        """Return retained tasks that ended with an exception."""
+        return list(self._failed)
 
     def cancelled(self) -> List[TaskRecord]:
-        """Return cancelled tasks."""
+        """Return retained cancelled tasks."""
         return [
-            r for r in self._records.values()
+            r for r in self._finished
             if r.cancelled
         ]
 
+    def get_counters(self) -> Dict[str, Dict[str, int]]:
+        """Lifetime per-category counters (created / completed / failed / cancelled)."""
+        return {category: dict(counters) for category, counters in self._counters.items()}
+
+    def active_by_category(self) -> Dict[str, int]:
+        """Running task count per category."""
+        counts: Dict[str, int] = {}
+        for record in self._active.values():
+            category = record.info.category.name
+            counts[category] = counts.get(category, 0) + 1
+        return counts
+
+    def _totals(self) -> Dict[str, int]:
+        totals = {"created": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        for counters in self._counters.values():
+            for key, value in counters.items():
+                totals[key] += value
+        return totals
+
     def summary(self) -> str:
         """Return human-readable summary for logs."""
-        total = len(self._records)
-        running = len(self.active())
-        failed = len(self.failed())
-        cancelled = len(self.cancelled())
+        totals = self._totals()
 
         return (
-            f"Tasks: total={total}, running={running}, "
-            f"failed={failed}, cancelled={cancelled}"
+            f"Tasks: total={totals['created']}, running={len(self._active)}, "
+            f"failed={totals['failed']}, cancelled={totals['cancelled']}"
         )
 
     def get_stats(self) -> dict[str, Any]:
-        """Return task statistics for frontend dashboard."""
-        all_tasks = self.list_all()
+        """Return task statistics for frontend dashboard (counts are lifetime totals)."""
+        totals = self._totals()
         active_tasks = self.active()
-        failed_tasks = self.failed()
-        cancelled_tasks = self.cancelled()
-        completed_tasks = [t for t in all_tasks if t.task.done() and not t.finished_with_error]
 
         # Durations for running tasks (estimated)
         now = datetime.now(timezone.utc).timestamp()
@@ -333,33 +410,24 @@ class TaskRegistry:
         avg_running_duration = sum(running_durations) / len(running_durations) if running_durations else 0
 
         # Durations for completed tasks
-        completed_durations = [
-            t.get_duration() for t in completed_tasks
-            if t.get_duration() is not None
-        ]
-        
-        avg_completed_duration = sum(completed_durations) / len(completed_durations) if completed_durations else 0
-
-        # Category breakdown
-        category_counts: Dict[str, int] = {}
-        for task in all_tasks:
-            cat_name = task.info.category.name
-            category_counts[cat_name] = category_counts.get(cat_name, 0) + 1
+        completed_count = self._durations["completed_count"]
+        avg_completed_duration = self._durations["completed_total"] / completed_count if completed_count else 0
 
         return {
-            "total": len(all_tasks),
+            "total": totals["created"],
             "running": len(active_tasks),
-            "completed": len(completed_tasks),
-            "failed": len(failed_tasks),
-            "cancelled": len(cancelled_tasks),
+            "completed": totals["completed"],
+            "failed": totals["failed"],
+            "cancelled": totals["cancelled"],
             "avg_running_duration": round(avg_running_duration, 2),
             "avg_completed_duration": round(avg_completed_duration, 2),
-            "categories": category_counts,
+            "categories": {category: counters["created"] for category, counters in self._counters.items()},
+            "retained": len(self._active) + len(self._finished) + len(self._failed),
         }
 
     def get_all_as_dicts(self) -> list[dict[str, Any]]:
         """Return all tasks as JSON-serializable dictionaries."""
-        return [record.to_dict() for record in self._records.values()]
+        return [record.to_dict() for record in self.list_all()]
 
     def get_active_as_dicts(self) -> list[dict[str, Any]]:
         """Return active tasks as JSON-serializable dictionaries."""
@@ -367,7 +435,7 @@ class TaskRegistry:
 
     def get_task_tree(self) -> dict[str, Any]:
         """Return tasks organized by hierarchy (parent-child relationships)."""
-        all_records = self._records
+        all_records = {record.info.id: record for record in self.list_all()}
         tree_nodes: Dict[int, dict[str, Any]] = {}
 
         # Convert all records to dicts and organize by parent
@@ -401,11 +469,11 @@ class TaskRegistry:
         """Return all tasks that should be cancelled during shutdown."""
         exclude = exclude or []
         tasks = [
-            r.task for r in self._records.values()
-            if not r.task.done() and r.task not in exclude
+            task for task in self._active
+            if not task.done() and task not in exclude
         ]
 
-        log.debug(f"Shutdown: {len(tasks)} tasks to cancel")
+        log.debug("Shutdown: %s tasks to cancel", len(tasks))
         return tasks
 
 
@@ -7,11 +7,20 @@ Responsible for:
 - wiring dependencies (Dependency Injection)
 - starting the async main loop
 - graceful shutdown on Ctrl +C or fatal errors
+
+Startup order: the LED path (config, services, hardware, FrameManager,
+static frame) comes up first; the API stack (FastAPI, Socket.IO, uvicorn)
+and keyboard input are imported in a worker thread after first light.
+Timings are recorded by the StartupTracer (GET /system/startup).
 """
 
 import sys
 import asyncio
 
+# Startup tracer first - its clock covers every import below
+from runtime.startup_tracer import get_startup_tracer
+tracer = get_startup_tracer()
+
 # Set UTF-8 encoding for output BEFORE any imports (fixes Unicode symbol rendering)
 if hasattr(sys.stdout, 'reconfigure') and sys.stdout.encoding != 'UTF-8':
     sys.stdout.reconfigure(encoding='utf-8')  # type: ignore
@@ -22,10 +31,10 @@ from pathlib import Path
 
 # === Lifecycle Management ===
 from lifecycle.handlers import (
-    AllTasksCancellationHandler, AnimationShutdownHandler, APIServerShutdownHandler, FrameManagerShutdownHandler,
-    GPIOShutdownHandler, IndicatorShutdownHandler, LEDShutdownHandler, TaskCancellationHandler
+    AllTasksCancellationHandler, AnimationShutdownHandler, APIServerShutdownHandler, EventBusShutdownHandler,
+    FrameManagerShutdownHandler, GPIOShutdownHandler, IndicatorShutdownHandler, LEDShutdownHandler, LogStoreShutdownHandler,
+    NetworkInputShutdownHandler, StateSaveShutdownHandler, TaskCancellationHandler
 )
-from lifecycle.api_server_wrapper import APIServerWrapper
 from lifecycle import ShutdownCoordinator
 from lifecycle.task_registry import (
     create_tracked_task,
@@ -35,29 +44,24 @@ from lifecycle.task_registry import (
 
 # === Logger Setup ===
 from utils.logger import get_logger, configure_logger
-from models.enums import LogCategory, LogLevel
-
-# === API ===
-from api.main import create_app
-from api.dependencies import set_service_container
-from api.socketio.server import create_socketio_server, wrap_app_with_socketio
-from api.socketio.registry import register_socketio
+from models.enums import EventOverflowPolicy, LogCategory, LogLevel
 
 # === Infrastructure ===
 from hardware.gpio.gpio_manager_factory import create_gpio_manager
 from hardware.hardware_coordinator import HardwareCoordinator
-from hardware.input.keyboard import start_keyboard
+from hardware.input.network import NetworkPixelReceiver
 
 # === Services ===
-from services.port_manager import PortManager
 from services.service_container import ServiceContainer
 from services.snapshot_publisher import SnapshotPublisher
 from services.log_broadcaster import get_broadcaster
+from services.log_store import LogStore, set_log_store
 from services import (
     EventBus, DataAssembler, ZoneService, AnimationService,
     ApplicationStateService, ServiceContainer
 )
 from services.middleware import log_middleware
+from services.event_coalescing import DEFAULT_COALESCE_RULES
 from services.transition_service import TransitionService
 
 # === Managers ===
@@ -71,51 +75,71 @@ from controllers import ControlPanelController
 from engine.frame_manager import FrameManager
 
 # === Runtime ===
+from runtime.loop_monitor import get_loop_monitor
 from runtime.runtime_info import RuntimeInfo
 
+tracer.mark("led_imports")
+
+# Not needed for first light: imported in a worker thread once the LEDs are on
+DEFERRED_IMPORTS = [
+    "api.main",
+    "api.dependencies",
+    "api.socketio.server",
+    "api.socketio.registry",
+    "lifecycle.api_server_wrapper",
+    "services.port_manager",
+    "hardware.input.keyboard",
+]
+
 # ---------------------------------------------------------------------------
 # LOGGER SETUP
 # ---------------------------------------------------------------------------
 
 log = get_logger().for_category(LogCategory.SYSTEM)
-configure_logger(LogLevel.DEBUG)
+configure_logger(
+    LogLevel.DEBUG,
+    # Per-frame / per-event debug output would flood the terminal from the render loop
+    category_levels={
+        LogCategory.FRAME_MANAGER: LogLevel.INFO,
+        LogCategory.RENDER_ENGINE: LogLevel.INFO,
+        LogCategory.EVENT: LogLevel.INFO,
+    },
+    threaded_output=True,
+)
 
 # ---------------------------------------------------------------------------
 # Application Entry
 # ---------------------------------------------------------------------------
 
+async def wait_for_first_frame(frame_manager: FrameManager, timeout: float = 2.0) -> bool:
+    """Wait until the render loop has put a frame on the strips"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while frame_manager.frames_rendered == 0:
+        if loop.time() >= deadline:
+            return False
+        await asyncio.sleep(1.0 / frame_manager.fps)
+    return True
+
+
 async def main():
     """Main async entry point (dependency injection and event loop startup)."""
 
     log.info("Initializing Diuna application...")
 
-    # Create Socket.IO server
-    log.info("Creating Socket.IO server...")
-    
-    cors_origins = []
-    if cors_origins is None:
-        cors_origins = [
-            "http://192.168.137.139:3000",
-            "http://192.168.137.139:8000",
-            "http://192.168.137.139:5173",
-            "http://localhost:3000",
-            "http://localhost:8000",
-            "http://localhost:5173",
-            "http://127.0.0.1:3000",
-            "http://127.0.0.1:8000",
-            "http://127.0.0.1:5173",
-        ]
-        
-    socketio_server = create_socketio_server(cors_origins=["*"])
-    
-    # Initialize broadcaster early so all logs can be transmitted
+    # Initialize broadcaster early so all logs are kept (the Socket.IO server is attached after first light)
     broadcaster = get_broadcaster()
-    broadcaster.set_socketio_server(socketio_server)
     broadcaster.start()
-    
     get_logger().set_broadcaster(broadcaster)
     
-    log.info("Socket.IO + LogBroadcaster initialized (early)")
+    log.info("LogBroadcaster initialized (early)")
+
+    # Event loop lag monitor (GET /system/loop) - started first so startup stalls are caught too
+    create_tracked_task(
+        get_loop_monitor().run(),
+        category=TaskCategory.SYSTEM,
+        description="Event Loop Lag Monitor"
+    )
     
     # ========================================================================
     # 1. INFRASTRUCTURE
@@ -133,41 +157,52 @@ async def main():
     )
 
     log.info("Initializing GPIO manager (singleton)...")
-    gpio_manager = create_gpio_manager()
+    with tracer.phase("gpio"):
+        gpio_manager = create_gpio_manager()
 
     log.info("Loading configuration...")
-    config_manager = ConfigManager(gpio_manager)
-    config_manager.load()
+    with tracer.phase("config"):
+        # Compiled config cache: YAML is only parsed when a config file changed
+        config_cache = Path(__file__).resolve().parent / "state" / "config.cache"
+        config_manager = ConfigManager(gpio_manager, cache_path=config_cache)
+        config_manager.load()
 
     log.info("Initializing event bus...")
-    event_bus = EventBus().instance()
+    event_bus = EventBus.instance()
     event_bus.add_middleware(log_middleware)
+    # Rules first: their keys make state-change events coalesce instead of being evicted on overflow
+    for rule in DEFAULT_COALESCE_RULES:
+        event_bus.add_coalesce_rule(rule)
+    event_bus.start_queue(maxsize=256, workers=2, overflow=EventOverflowPolicy.COALESCE)
 
     log.info("Loading application state...")
-    state_file = Path(__file__).resolve().parent / "state" / "state.json"
-    assembler = DataAssembler(config_manager, state_file)
+    with tracer.phase("services"):
+        state_file = Path(__file__).resolve().parent / "state" / "state.json"
+        # Journal backend: saves append small per-zone deltas instead of rewriting state.json
+        assembler = DataAssembler(config_manager, state_file, persistence="journal")
 
-    log.info("Initializing services...")
-    animation_service = AnimationService(assembler)
-    app_state_service = ApplicationStateService(assembler)
-    zone_service = ZoneService(assembler, app_state_service, event_bus)
+        log.info("Initializing services...")
+        animation_service = AnimationService(assembler)
+        app_state_service = ApplicationStateService(assembler)
+        zone_service = ZoneService(assembler, app_state_service, event_bus)
 
     # ========================================================================
     # 2. HARDWARE COORDINATOR
     # ========================================================================
 
     log.info("Initializing hardware stack...")
-    hardware = HardwareCoordinator(
-        hardware_manager=config_manager.hardware_manager,
-        gpio_manager=gpio_manager
-    ).initialize(
-        all_zones = zone_service.get_all()
-    )
+    with tracer.phase("hardware"):
+        hardware = HardwareCoordinator(
+            hardware_manager=config_manager.hardware_manager,
+            gpio_manager=gpio_manager
+        ).initialize(
+            all_zones = zone_service.get_all()
+        )
 
-    control_panel_controller = ControlPanelController(
-        control_panel=hardware.control_panel,
-        event_bus=event_bus
-    )
+        control_panel_controller = ControlPanelController(
+            control_panel=hardware.control_panel,
+            event_bus=event_bus
+        )
         
         
     # ========================================================================
@@ -175,25 +210,30 @@ async def main():
     # ========================================================================
 
     log.info("Initializing FrameManager...")
-    frame_manager = FrameManager(fps=60)
-    frame_manager_task = create_tracked_task(
-        frame_manager.start(),
-        category=TaskCategory.RENDER,
-        description="Frame Manager render loop"
-    )
+    with tracer.phase("frame_manager"):
+        frame_manager = FrameManager(fps=60)
+        frame_manager_task = create_tracked_task(
+            frame_manager.start(),
+            category=TaskCategory.RENDER,
+            description="Frame Manager render loop"
+        )
 
-    # Register all LED strips with FrameManager
-    for gpio_pin, strip in hardware.led_channels.items():
-        frame_manager.add_led_channel(strip)
-        # Create TransitionService for this strip (used by FrameManager internally)
-        transition_service = TransitionService(strip, frame_manager)
-        log.info(f"Zone strip registered on GPIO {gpio_pin}", category=LogCategory.FRAME_MANAGER)
+        # Register all LED strips with FrameManager
+        for gpio_pin, strip in hardware.led_channels.items():
+            frame_manager.add_led_channel(strip)
+            # Create TransitionService for this strip (used by FrameManager internally)
+            transition_service = TransitionService(strip, frame_manager)
+            log.info(f"Zone strip registered on GPIO {gpio_pin}", category=LogCategory.FRAME_MANAGER)
 
-    
     # ========================================================================
     # 4. SERVICE CONTAINER
     # ========================================================================
 
+    snapshot_publisher = SnapshotPublisher(
+        zone_service=zone_service,
+        event_bus=event_bus,
+    )
+
     services = ServiceContainer(
         event_bus=event_bus,
         zone_service=zone_service,
@@ -202,24 +242,93 @@ async def main():
         frame_manager=frame_manager,
         color_manager=config_manager.color_manager,
         config_manager=config_manager,
-        data_assembler=assembler
-    )
-    
-    snapshot_publisher = SnapshotPublisher(
-        zone_service=zone_service,
-        event_bus=event_bus,
+        data_assembler=assembler,
+        snapshot_publisher=snapshot_publisher,
     )
 
+    log.info("Initializing LED controller...")
+    with tracer.phase("lighting_controller"):
+        lighting_controller = LightingController(
+            service_container=services
+        )
+    log.info("Finished initializing LED controller...")
+
+    # ========================================================================
+    # 5. FIRST LIGHT
+    # ========================================================================
+
+    with tracer.phase("first_frame"):
+        if await wait_for_first_frame(frame_manager):
+            tracer.mark("first_light")
+            log.info("First light", ms=tracer.milestones["first_light"])
+        else:
+            log.warn("No frame rendered yet, continuing startup")
+
+    # Persistent log ring (survives restarts / crashes, served by /logger/recent).
+    # Opened after first light: the index rebuild scans the whole file. Startup
+    # entries wait in the broadcaster history and are written when it is set.
+    log_store_file = Path(__file__).resolve().parent / "state" / "log_store.bin"
+    with tracer.phase("log_store"):
+        try:
+            log_store = await asyncio.to_thread(LogStore, log_store_file, capacity=65_536)
+            set_log_store(log_store)
+            broadcaster.set_store(log_store)
+        except OSError as e:
+            log.warn(f"Persistent log store disabled: {e}")
+
+    # API stack + keyboard: imported off the event loop, so rendering keeps going meanwhile
+    log.info("Importing API modules...")
+    with tracer.phase("deferred_imports"):
+        await asyncio.to_thread(tracer.import_modules, DEFERRED_IMPORTS)
+
+    from api.main import create_app
+    from api.dependencies import set_service_container
+    from api.socketio.server import create_socketio_server, wrap_app_with_socketio
+    from api.socketio.registry import register_socketio
+    from lifecycle.api_server_wrapper import APIServerWrapper
+    from services.port_manager import PortManager
+    from hardware.input.keyboard import start_keyboard
+
+    # Create Socket.IO server
+    log.info("Creating Socket.IO server...")
+    
+    cors_origins = []
+    if cors_origins is None:
+        cors_origins = [
+            "http://192.168.137.139:3000",
+            "http://192.168.137.139:8000",
+            "http://192.168.137.139:5173",
+            "http://localhost:3000",
+            "http://localhost:8000",
+            "http://localhost:5173",
+            "http://127.0.0.1:3000",
+            "http://127.0.0.1:8000",
+            "http://127.0.0.1:5173",
+        ]
+        
+    socketio_server = create_socketio_server(cors_origins=["*"])
+    broadcaster.set_socketio_server(socketio_server)
 
     # Register service container with API for dependency injection
     set_service_container(services)
     log.info("Service container registered")
 
-    log.info("Initializing LED controller...")
-    lighting_controller = LightingController(
-        service_container=services
-    )
-    log.info("Finished initializing LED controller...")
+    # Network pixel input (sACN / Art-Net) - optional FrameManager source
+    network_receiver = None
+    network_config = config_manager.network_input
+    if network_config and network_config.enabled:
+        log.info("Starting network pixel input...")
+        network_receiver = NetworkPixelReceiver(
+            config=network_config,
+            zone_pixel_counts={zone.config.id: zone.config.pixel_count for zone in zone_service.get_all()},
+            frame_manager=frame_manager,
+            fps=frame_manager.fps,
+        )
+        try:
+            await network_receiver.start()
+        except OSError as e:
+            log.error(f"Network input disabled, cannot bind port {network_config.port}: {e}")
+            network_receiver = None
 
 
     # ========================================================================
@@ -234,7 +343,7 @@ async def main():
     )
 
     # ========================================================================
-    # 7. HARDWARE POLLING LOOP
+    # 7. HARDWARE INPUT (edge callbacks, polling fallback)
     # ========================================================================
 
     async def hardware_polling_loop():
@@ -255,14 +364,14 @@ async def main():
             log.debug("Hardware polling loop cancelled", category=LogCategory.HARDWARE)
             raise
         
-    if control_panel_controller:
-        polling_task =  create_tracked_task(
+    # Prefer GPIO edge callbacks (idle cost zero); poll only if unsupported
+    polling_task = None
+    if control_panel_controller and not control_panel_controller.enable_edge_callbacks():
+        polling_task = create_tracked_task(
             hardware_polling_loop(),
             category=TaskCategory.HARDWARE,
             description="ControlPanel Polling Loop"
         )
-    else:
-        polling_task = None
 
     
     log.info("Registering Socket.IO modules...")
@@ -272,11 +381,12 @@ async def main():
     # 8. API SERVER
     # ========================================================================
 
-    # Ensure port is free before starting API server
-    # (recovery from previous crashes that left port orphaned)
-    log.info("Checking API port availability...")
-    port_mgr = PortManager.instance()
-    await port_mgr.ensure_available(port=8000)
+    # Get the API listening socket: inherited from systemd socket activation,
+    # or bound here (recovery from previous crashes that left port orphaned)
+    log.info("Opening API listening socket...")
+    with tracer.phase("port_check"):
+        port_mgr = PortManager.instance()
+        api_socket = await port_mgr.open_listen_socket(port=8000)
 
     log.info("Creating FastAPI app...")
     fastapi_app = create_app(
@@ -289,7 +399,7 @@ async def main():
     log.info("Wrapping FastAPI app with Socket.IO...")
     app = wrap_app_with_socketio(fastapi_app, socketio_server)
     
-    api_wrapper = APIServerWrapper(app, host="0.0.0.0", port=8000)
+    api_wrapper = APIServerWrapper(app, host="0.0.0.0", port=8000, sock=api_socket)
 
     log.info("Starting FastAPI app...")
     api_task = create_tracked_task(
@@ -310,20 +420,32 @@ async def main():
     coordinator.register(APIServerShutdownHandler(api_wrapper))  # ← Pass wrapper, not task
     coordinator.register(AnimationShutdownHandler(lighting_controller))
     coordinator.register(IndicatorShutdownHandler(lighting_controller.selected_zone_indicator))
+    if network_receiver:
+        coordinator.register(NetworkInputShutdownHandler(network_receiver))
+    coordinator.register(EventBusShutdownHandler(event_bus))
     coordinator.register(FrameManagerShutdownHandler(frame_manager))  # ← Frame manager cleanup (includes executor shutdown)
     coordinator.register(LEDShutdownHandler(hardware))
+    coordinator.register(StateSaveShutdownHandler(assembler, zone_service, app_state_service))
     
+    input_tasks = [frame_manager_task, keyboard_task]
     if polling_task:
-        coordinator.register(TaskCancellationHandler([frame_manager_task, keyboard_task, polling_task]))  # ← Add frame manager task
+        input_tasks.append(polling_task)
+    coordinator.register(TaskCancellationHandler(input_tasks))  # ← Add frame manager task
     
     coordinator.register(AllTasksCancellationHandler([api_task]))  # ← Catch any remaining tasks (safety net)
     coordinator.register(GPIOShutdownHandler(gpio_manager))
+    coordinator.register(LogStoreShutdownHandler(broadcaster))
 
     # Setup signal handlers via coordinator
     loop = asyncio.get_running_loop()
     coordinator.setup_signal_handlers(loop)
 
-    log.info("🏁 Application initialized. Waiting for exit signal...")
+    tracer.mark("ready")
+    log.info(
+        "🏁 Application initialized. Waiting for exit signal...",
+        first_light_ms=tracer.milestones.get("first_light"),
+        ready_ms=tracer.milestones["ready"],
+    )
 
     # Wait for shutdown signal (Ctrl+C, SIGTERM, etc.)
     await coordinator.wait_for_shutdown()
@@ -79,7 +79,7 @@ class AnimationManager:
                     parameters=params
                 )
 
-                log.debug(f"Loaded animation: {animation_id.name}")
+                log.debug("Loaded animation: %s", animation_id.name)
 
             except ValueError:
                 log.warn(f"Invalid animation ID in config: {anim_id_str}")
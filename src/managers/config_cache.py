@@ -0,0 +1,127 @@
+"""
+Config Cache
+
+Binary snapshot of the resolved configuration (config.yaml merged with its
+includes), so startup skips YAML parsing when no source file changed.
+
+Validity is checked per source file:
+1. size + mtime unchanged for every file → cache hit without reading sources
+2. otherwise the files are hashed; same content (e.g. touched, or copied
+   with new mtimes) → cache hit, stats refreshed
+3. content changed → miss, caller parses YAML and stores a new snapshot
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.CONFIG)
+
+# Bump when the cached structure changes
+CACHE_VERSION = 1
+
+# (path, size, mtime_ns, sha256)
+SourceStamp = Tuple[str, int, int, str]
+
+
+class ConfigCache:
+    """Pickle snapshot of merged config data, keyed by source file stats and hashes"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, root: Path) -> Optional[Dict]:
+        """
+        Return cached config data, or None if missing, stale or unreadable.
+
+        Args:
+            root: Main config file the cache must have been built from
+        """
+        try:
+            with open(self.path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("version") != CACHE_VERSION:
+                raise ValueError(f"cache version {cached.get('version')} != {CACHE_VERSION}")
+            sources: List[SourceStamp] = cached["sources"]
+            data = cached["data"]
+            if not sources or sources[0][0] != str(Path(root).resolve()):
+                raise ValueError("cache was built from a different config file")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as ex:
+            log.warn("Ignoring unreadable config cache", path=str(self.path), error=str(ex))
+            self.misses += 1
+            return None
+
+        if not self._stats_match(sources):
+            refreshed = self._rehash(sources)
+            if refreshed is None:
+                self.misses += 1
+                return None
+            # Same content, new mtimes: refresh stats so the next start takes the fast path
+            try:
+                self._write(refreshed, data)
+            except OSError as ex:
+                log.warn("Failed to refresh config cache", path=str(self.path), error=str(ex))
+
+        self.hits += 1
+        return data
+
+    def put(self, source_paths: List[Path], data: Dict) -> None:
+        """Store data resolved from source_paths, main config first (failures are logged, never raised)"""
+        try:
+            stamps = [self._stamp(Path(path)) for path in source_paths]
+            self._write(stamps, data)
+        except Exception as ex:
+            log.warn("Failed to write config cache", path=str(self.path), error=str(ex))
+
+    @staticmethod
+    def _stats_match(sources: List[SourceStamp]) -> bool:
+        for path, size, mtime_ns, _ in sources:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return False
+            if st.st_size != size or st.st_mtime_ns != mtime_ns:
+                return False
+        return True
+
+    @classmethod
+    def _rehash(cls, sources: List[SourceStamp]) -> Optional[List[SourceStamp]]:
+        """New stamps if every source still has the cached content, else None"""
+        refreshed = []
+        for path, _, _, digest in sources:
+            try:
+                stamp = cls._stamp(Path(path))
+            except OSError:
+                return None
+            if stamp[3] != digest:
+                return None
+            refreshed.append(stamp)
+        return refreshed
+
+    @staticmethod
+    def _stamp(path: Path) -> SourceStamp:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            digest = hashlib.sha256(f.read()).hexdigest()
+        return str(path.resolve()), st.st_size, st.st_mtime_ns, digest
+
+    def _write(self, sources: List[SourceStamp], data: Dict) -> None:
+        """Atomic replace (temp file + rename); a torn cache is never read back"""
+        payload = pickle.dumps(
+            {"version": CACHE_VERSION, "sources": sources, "data": data},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.path)
@@ -10,9 +10,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict, TYPE_CHECKING
 from utils.logger import get_logger, get_category_logger, LogLevel, LogCategory
-from models.enums import ZoneID, LEDStripID
+from models.enums import ZoneID, LEDStripID, FramePriority, NetworkInputProtocol
 from models.domain.zone import ZoneConfig
-from models.zone_mapping import ZoneHardwareMapping, ZoneMappingConfig
+from models.zone_mapping import (
+    ZoneHardwareMapping, ZoneMappingConfig, UniverseZoneMapping, NetworkInputConfig
+)
+from managers.config_cache import ConfigCache
 from utils.enum_helper import EnumHelper
 from utils.serialization import Serializer
 
@@ -46,7 +49,13 @@ class ConfigManager:
         anim = config.animation_manager.get_animation("breathe")
     """
 
-    def __init__(self, gpio_manager, config_path="config/config.yaml", defaults_path="config/factory_defaults.yaml"):
+    def __init__(
+        self,
+        gpio_manager,
+        config_path="config/config.yaml",
+        defaults_path="config/factory_defaults.yaml",
+        cache_path: Optional[Path] = None,
+    ):
         """
         Initialize ConfigManager
 
@@ -54,10 +63,12 @@ class ConfigManager:
             gpio_manager: Singleton GPIOManager instance for hardware registration
             config_path: Path to main config.yaml (relative to src/)
             defaults_path: Path to factory defaults fallback
+            cache_path: Compiled config cache (see ConfigCache); None = always parse YAML
         """
         self.gpio_manager_singleton = gpio_manager
         self.config_path = Path(config_path)
         self.factory_defaults_path = Path(defaults_path)
+        self.cache = ConfigCache(cache_path) if cache_path is not None else None
         self.data = {}
 
         # Sub-managers (initialized in load() with guaranteed non-None values)
@@ -76,13 +87,25 @@ class ConfigManager:
         4. Fallback to factory defaults.yaml on failure
         5. Initialize sub-managers
 
+        With a cache_path, steps 1-3 are skipped while config.yaml and its
+        includes are unchanged (the merged data comes from ConfigCache).
+
         Returns:
             Merged config data dict
         """
+        # Resolve path relative to src/ directory
+        src_dir = Path(__file__).parent.parent
+        full_path = src_dir / self.config_path
+
+        cached = self.cache.get(full_path) if self.cache is not None else None
+        if cached is not None:
+            log.info("Using cached configuration", cache=str(self.cache.path))
+            self.data = cached
+            self._initialize_managers()
+            return self.data
+
         try:
-            # Resolve path relative to src/ directory
-            src_dir = Path(__file__).parent.parent
-            full_path = src_dir / self.config_path
+            sources = [full_path]
 
             with open(full_path, "r", encoding="utf-8") as f:
                 main_config = yaml.safe_load(f)
@@ -90,18 +113,22 @@ class ConfigManager:
             # Check for include system
             if 'include' in main_config:
                 log.info("Using include-based configuration")
-                self.data = self._load_with_includes(main_config['include'], src_dir / self.config_path.parent)
+                config_dir = src_dir / self.config_path.parent
+                self.data = self._load_with_includes(main_config['include'], config_dir)
+                sources += [config_dir / filename for filename in main_config['include']]
             else:
                 # Monolithic config (backward compatibility)
                 log.info("Using monolithic configuration")
                 self.data = main_config
 
+            if self.cache is not None:
+                self.cache.put(sources, self.data)
+
         except Exception as ex:
             log.error("Failed to load config.yaml", error=str(ex), error_type=type(ex).__name__)
             log.warn("Falling back to factory defaults")
 
             # Load factory defaults
-            src_dir = Path(__file__).parent.parent
             defaults_path = src_dir / self.factory_defaults_path
             with open(defaults_path, "r", encoding="utf-8") as f:
                 self.data = yaml.safe_load(f)
@@ -192,6 +219,9 @@ class ConfigManager:
         # Build zone-to-hardware mapping
         self.zone_mapping = self._parse_zone_mapping()
 
+        # Network pixel input (sACN / Art-Net universe → zone mapping)
+        self.network_input = self._parse_network_input()
+
     # ===== Zone Mapping =====
 
     def _parse_zone_mapping(self) -> ZoneMappingConfig:
@@ -238,6 +268,62 @@ class ConfigManager:
             log.error(f"Failed to parse zone mappings: {ex}")
             return ZoneMappingConfig(mappings=[])
 
+    # ===== Network Input =====
+
+    DEFAULT_NETWORK_PORTS = {
+        NetworkInputProtocol.SACN: 5568,
+        NetworkInputProtocol.ARTNET: 6454,
+    }
+
+    def _parse_network_input(self) -> Optional[NetworkInputConfig]:
+        """
+        Parse network_input section from zone_mapping.yaml
+
+        Returns:
+            NetworkInputConfig, or None if the section is missing or invalid
+        """
+        raw = self.data.get("network_input")
+        if not raw:
+            return None
+
+        try:
+            protocol = Serializer.str_to_enum(str(raw.get("protocol", "SACN")).upper(), NetworkInputProtocol)
+            priority = FramePriority[str(raw.get("priority", "NETWORK")).upper()]
+
+            universes = []
+            for entry in raw.get("universes", []):
+                try:
+                    universes.append(UniverseZoneMapping(
+                        zone_id=Serializer.str_to_enum(entry["zone"], ZoneID),
+                        universe=int(entry["universe"]),
+                        start_channel=int(entry.get("start_channel", 1)),
+                    ))
+                except (KeyError, ValueError) as e:
+                    log.error(f"Invalid network universe entry: {entry}, error: {e}")
+
+            config = NetworkInputConfig(
+                enabled=bool(raw.get("enabled", False)),
+                protocol=protocol,
+                bind_host=raw.get("bind", "0.0.0.0"),
+                port=int(raw.get("port", self.DEFAULT_NETWORK_PORTS[protocol])),
+                priority=priority,
+                ttl=float(raw.get("ttl", 1.0)),
+                channels_per_universe=int(raw.get("channels_per_universe", 510)),
+                universes=universes,
+            )
+            log.info(
+                "Network input configured",
+                enabled=config.enabled,
+                protocol=protocol.name,
+                port=config.port,
+                universes=len(universes),
+            )
+            return config
+
+        except Exception as ex:
+            log.error(f"Failed to parse network_input: {ex}")
+            return None
+
     # ===== Zone Access API =====
 
     def get_all_zones(self) -> List[ZoneConfig]:
@@ -25,6 +25,7 @@ from models.hardware import (
     ButtonsConfig,
     LEDStripsConfig,
     LEDStripConfig,
+    VirtualStripConfig,
 )
 from models.enums import BuzzerID, LEDStripID, LEDStripType, ButtonID, EncoderID
 
@@ -152,11 +153,20 @@ class HardwareManager:
 
         led_cfg = LEDStripsConfig(strips=strip_list)
 
+        # Parse virtual strip fallback (optional section)
+        raw_virtual = self.data.get("virtual_strips") or {}
+        virtual_cfg = VirtualStripConfig(
+            shared_memory=bool(raw_virtual.get("shared_memory", False)),
+            slots=int(raw_virtual.get("slots", 8)),
+            name_prefix=raw_virtual.get("name_prefix", "diuna_strip"),
+        )
+
         return HardwareConfig(
             buzzers=buzz_cfg,
             encoders=enc_cfg,
             buttons=button_cfg,
             led_strips=led_cfg,
+            virtual_strips=virtual_cfg,
         )
         
     def _parse_encoder(self, entry: Optional[Dict[str, Any]], encoder_id: EncoderID) -> Optional[EncoderConfig]:
@@ -1,7 +1,7 @@
 """Domain models - Config and state objects"""
 
 from models.domain.animation import AnimationConfig, AnimationState
-from models.domain.zone import ZoneConfig, ZoneState, ZoneCombined
+from models.domain.zone import ZoneConfig, ZoneState, ZoneCombined, ZoneStaticChange
 from models.domain.application import ApplicationState
 
 __all__ = [
@@ -10,5 +10,6 @@ __all__ = [
     "ZoneConfig",
     "ZoneState",
     "ZoneCombined",
+    "ZoneStaticChange",
     "ApplicationState",
 ]
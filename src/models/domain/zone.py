@@ -21,6 +21,9 @@ class ZoneConfig:
     end_index: int
     gpio: int = 18       # GPIO pin for this zone's LED strip (default: 18)
 
+_VERSIONED_FIELDS = frozenset({"color", "brightness", "is_on", "mode", "animation"})
+
+
 @dataclass
 class ZoneState:
     """
@@ -36,6 +39,10 @@ class ZoneState:
     - mode: STATIC or ANIMATION
     - color: valid Color instance
     - animation: valid AnimationState or None
+
+    Every assignment to a state field bumps `version`, so readers (snapshot
+    cache, ETags) can tell whether anything changed without comparing values.
+    In-place changes (animation parameters) must call touch().
     """
     id: ZoneID
     color: Color
@@ -66,6 +73,17 @@ class ZoneState:
             self._validate_animation(value)
 
         super().__setattr__(name, value)
+        if name in _VERSIONED_FIELDS:
+            self.touch()
+
+    @property
+    def version(self) -> int:
+        """Monotonic change counter (not persisted, not part of equality)"""
+        return self.__dict__.get("_version", 0)
+
+    def touch(self) -> None:
+        """Mark state as changed after an in-place mutation"""
+        object.__setattr__(self, "_version", self.version + 1)
 
     @staticmethod
     def _validate_brightness(value: Any) -> None:
@@ -100,6 +118,15 @@ class ZoneState:
             raise TypeError(f"animation must be None or AnimationState, got {type(value).__name__}")
 
 
+@dataclass(frozen=True)
+class ZoneStaticChange:
+    """One zone's part of a batch update (None = leave unchanged)"""
+    zone_id: ZoneID
+    color: Optional[Color] = None
+    brightness: Optional[int] = None
+    is_on: Optional[bool] = None
+
+
 @dataclass
 class ZoneCombined:
     """Zone with config and state"""
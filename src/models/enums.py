@@ -112,6 +112,19 @@ class LogLevel(Enum):
     ERROR = auto()
 
 
+class NetworkInputProtocol(Enum):
+    """UDP lighting protocols accepted as pixel input"""
+    SACN = auto()        # E1.31 streaming ACN (port 5568)
+    ARTNET = auto()      # Art-Net ArtDmx (port 6454)
+
+
+class EventOverflowPolicy(Enum):
+    """What EventBus does when its dispatch queue is full"""
+    DROP_OLDEST = auto()  # Evict the oldest queued event
+    COALESCE = auto()     # Replace the queued event with the same coalesce key, else drop the oldest unkeyed event
+    BLOCK = auto()        # Awaiting publishers wait for space (publish_nowait drops the new event)
+
+
 class GPIOPullMode(Enum):
     """GPIO pull-up/down resistor configuration"""
     PULL_UP = auto()     # Internal pull-up resistor (pin reads HIGH when open)
@@ -119,6 +132,13 @@ class GPIOPullMode(Enum):
     NO_PULL = auto()     # No pull resistor (floating)
 
 
+class GPIOEdge(Enum):
+    """GPIO edge detection mode for interrupt callbacks"""
+    RISING = auto()      # LOW → HIGH
+    FALLING = auto()     # HIGH → LOW
+    BOTH = auto()        # Any change
+
+
 class GPIOInitialState(Enum):
     """GPIO output pin initial state"""
     LOW = auto()         # Start LOW (0V)
@@ -154,6 +174,7 @@ class LogCategory(Enum):
     TASK = auto()
 
     SNAPSHOT = auto()
+    NETWORK = auto()     # sACN / Art-Net pixel input
     
     GENERAL = auto()    # Default general category
     
@@ -168,6 +189,7 @@ class FramePriority(Enum):
     MANUAL = 10        # Manual static color settings
     PULSE = 30         # Edit mode pulsing indicator
     ANIMATION = 20     # Running animations
+    NETWORK = 25       # External pixel data (sACN / Art-Net), overrides animations
     TRANSITION = 40    # Crossfades, mode switches (highest)
     DEBUG = 50         # Debug overlays (for future use)
 
@@ -185,4 +207,5 @@ class FrameSource(Enum):
     ANIMATION = auto()      # AnimationEngine
     TRANSITION = auto()     # TransitionService
     PREVIEW = auto()        # Preview panel controller
+    NETWORK = auto()        # sACN / Art-Net network input
     DEBUG = auto()          # Debug overlay
\ No newline at end of file
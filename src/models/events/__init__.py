@@ -18,7 +18,7 @@ from models.events.hardware import (
 )
 
 # Zone state events (specific, backend)
-from models.events.zone_static_events import ZoneStaticStateChangedEvent
+from models.events.zone_static_events import ZoneStaticStateChangedEvent, ZoneStaticBatchChangedEvent
 from models.events.zone_runtime_events import (
     ZoneRenderModeChangedEvent,
     ZoneAnimationChangedEvent,
@@ -46,6 +46,7 @@ __all__ = [
     
     # Zone state
     "ZoneStaticStateChangedEvent",
+    "ZoneStaticBatchChangedEvent",
     "ZoneRenderModeChangedEvent",
     "ZoneAnimationChangedEvent",
     "AnimationStartedEvent",
@@ -18,7 +18,7 @@ class EncoderRotateEvent(Event[EncoderSource]):
         """
         Args:
             source: EncoderSource.SELECTOR or EncoderSource.MODULATOR
-            delta: -1 (CCW) or +1 (CW)
+            delta: Signed detent count (>0 CW, <0 CCW), summed over one UI frame
         """
         super().__init__(
             type=EventType.ENCODER_ROTATE,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
 from api.socketio.zones.dto import ZoneSnapshotDTO
 from models.events.base import Event
@@ -12,15 +13,28 @@ class ZoneSnapshotUpdatedEvent(Event):
     """
     UI-facing snapshot event.
     Emitted AFTER state persistence.
+
+    payload is the snapshot already converted to a dict (shared, read-only);
+    None when the publisher did not pre-serialize it.
     """
 
     zone_id: ZoneID
     snapshot: ZoneSnapshotDTO
+    version: int
+    payload: Optional[Dict[str, Any]]
 
-    def __init__(self, zone_id: ZoneID, snapshot: ZoneSnapshotDTO):
+    def __init__(
+        self,
+        zone_id: ZoneID,
+        snapshot: ZoneSnapshotDTO,
+        version: int = 0,
+        payload: Optional[Dict[str, Any]] = None,
+    ):
         super().__init__(
             type=EventType.ZONE_SNAPSHOT_UPDATED,
             source=EventSource.SNAPSHOT_PUBLISHER,
         )
         self.zone_id = zone_id
         self.snapshot = snapshot
+        self.version = version
+        self.payload = payload
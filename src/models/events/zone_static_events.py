@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 from models.events.base import Event
 from models.events.types import EventType
@@ -38,3 +38,22 @@ class ZoneStaticStateChangedEvent(Event):
         self.color = color
         self.brightness = brightness
         self.is_on = is_on
+
+
+@dataclass(init=False)
+class ZoneStaticBatchChangedEvent(Event):
+    """
+    Fired once for a batch of STATIC state changes applied together
+    (scene-style updates), instead of one ZoneStaticStateChangedEvent per zone.
+
+    changes holds the per-zone changes in the same shape as the single-zone event.
+    """
+
+    changes: Tuple[ZoneStaticStateChangedEvent, ...]
+
+    def __init__(self, *, changes: Tuple[ZoneStaticStateChangedEvent, ...]):
+        super().__init__(
+            type=EventType.ZONE_STATIC_BATCH_CHANGED,
+            source=EventSource.ZONE_SERVICE,
+        )
+        self.changes = tuple(changes)
@@ -123,6 +123,17 @@ class LEDStripsConfig:
     """Container for multiple strips (list, not dict)."""
     strips: List[LEDStripConfig]
 
+@dataclass(frozen=True)
+class VirtualStripConfig:
+    """
+    Dev / CI fallback used when WS281x is not available.
+    shared_memory=True publishes frames to a multiprocessing.shared_memory
+    ring named "<name_prefix>_<gpio>" for external visualizers.
+    """
+    shared_memory: bool = False
+    slots: int = 8
+    name_prefix: str = "diuna_strip"
+
 # ============================================================
 #  Root Hardware Model
 # ============================================================
@@ -137,4 +148,5 @@ class HardwareConfig:
     buzzers: BuzzersConfig
     encoders: EncodersConfig
     buttons: ButtonsConfig
-    led_strips: LEDStripsConfig
\ No newline at end of file
+    led_strips: LEDStripsConfig
+    virtual_strips: VirtualStripConfig = field(default_factory=VirtualStripConfig)
\ No newline at end of file
@@ -5,9 +5,9 @@ No domain logic - pure data models.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
-from models.enums import ZoneID, LEDStripID
+from models.enums import ZoneID, LEDStripID, FramePriority, NetworkInputProtocol
 
 
 @dataclass(frozen=True)
@@ -61,4 +61,42 @@ class ZoneMappingConfig:
         for mapping in self.mappings:
             if mapping.hardware_id == hardware_id:
                 return list(mapping.zones)
-        raise KeyError(f"Hardware {hardware_id.name} not found in mappings")
\ No newline at end of file
+        raise KeyError(f"Hardware {hardware_id.name} not found in mappings")
+
+@dataclass(frozen=True)
+class UniverseZoneMapping:
+    """
+    Maps a zone onto DMX channels of a network universe (sACN / Art-Net).
+
+    The zone's pixels are laid out as consecutive RGB triplets starting at
+    start_channel of the given universe. Zones longer than one universe
+    continue at channel 1 of the next universe (xLights "spanning" layout).
+    """
+    zone_id: ZoneID
+    universe: int
+    start_channel: int = 1     # 1-based DMX channel
+
+    def __post_init__(self):
+        if not 1 <= self.start_channel <= 512:
+            raise ValueError(f"start_channel for {self.zone_id.name} must be 1-512, got {self.start_channel}")
+
+
+@dataclass(frozen=True)
+class NetworkInputConfig:
+    """Network pixel input settings (network_input section of zone_mapping.yaml)"""
+    enabled: bool
+    protocol: NetworkInputProtocol
+    bind_host: str
+    port: int
+    priority: FramePriority
+    ttl: float
+    channels_per_universe: int
+    universes: List[UniverseZoneMapping] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.priority.value <= FramePriority.ANIMATION.value:
+            raise ValueError(
+                f"Network input priority must be above ANIMATION, got {self.priority.name}"
+            )
+        if not 3 <= self.channels_per_universe <= 512:
+            raise ValueError(f"channels_per_universe must be 3-512, got {self.channels_per_universe}")
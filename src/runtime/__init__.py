@@ -1,5 +1,12 @@
 from .runtime_info import RuntimeInfo
+from .loop_monitor import LoopLagMonitor, LoopStall, get_loop_monitor
+from .startup_tracer import StartupTracer, get_startup_tracer
 
 __all__ = [
-    'RuntimeInfo'
+    'LoopLagMonitor',
+    'LoopStall',
+    'get_loop_monitor',
+    'RuntimeInfo',
+    'StartupTracer',
+    'get_startup_tracer',
 ]
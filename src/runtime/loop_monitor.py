@@ -0,0 +1,219 @@
+"""
+Event loop lag monitor - measures how late the asyncio loop wakes up and
+identifies the code responsible for stalls.
+
+A heartbeat coroutine sleeps for a fixed interval; the difference between
+the requested and the actual wake-up is the loop lag, recorded in a
+histogram. A watchdog thread checks the heartbeat: when it is overdue by
+more than the stall threshold, the loop is still blocked, so the watchdog
+samples the loop thread's stack and current task right then (no per-callback
+instrumentation, no asyncio debug mode). When the heartbeat resumes, the
+stall is recorded with its measured lag, the blocking location and - for
+tracked tasks - the TaskRegistry description.
+
+Served by GET /system/loop and the task_get_loop_lag Socket.IO command;
+stalls are pushed to the tasks room as "tasks:stall".
+
+Heavy imports (logger, TaskRegistry) are local: runtime is imported before
+anything else by main_asyncio (see startup_tracer).
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+
+# Histogram bucket upper bounds (ms); the last bucket is +Inf
+LAG_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+
+@dataclass
+class LoopStall:
+    at: str                                 # ISO timestamp of the end of the stall
+    lag_ms: float
+    task_id: Optional[int] = None           # TaskRegistry id, if the blocked task is tracked
+    task_description: Optional[str] = None  # TaskRegistry description, or the task name
+    task_category: Optional[str] = None
+    location: Optional[str] = None          # innermost frame while blocked: "file:line in func"
+    stack: List[str] = field(default_factory=list)
+
+
+class LoopLagMonitor:
+    """Continuous loop lag measurement with stall capture"""
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        stall_threshold_ms: float = 100.0,
+        max_stalls: int = 50,
+        stack_limit: int = 12,
+    ):
+        """
+        Args:
+            interval: Heartbeat period in seconds
+            stall_threshold_ms: Lag above which a stall is captured and recorded
+            max_stalls: Recent stalls kept for introspection
+            stack_limit: Frames kept from the blocked stack
+        """
+        self.interval = interval
+        self.stall_threshold_ms = stall_threshold_ms
+        self.stack_limit = stack_limit
+
+        self.samples = 0
+        self.lag_sum_ms = 0.0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.bucket_counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.stalls_total = 0
+        self.stalls: Deque[LoopStall] = deque(maxlen=max_stalls)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._deadline = 0.0                                # perf_counter() by which the heartbeat is due
+        self._captured: Optional[LoopStall] = None          # filled by the watchdog during a stall
+        self._beats = 0                                     # heartbeats recorded, guards stale captures
+        self._capture_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self._stall_sink: Optional[Callable[[LoopStall], Awaitable[None]]] = None
+
+    def set_stall_sink(self, sink: Optional[Callable[[LoopStall], Awaitable[None]]]) -> None:
+        """Coroutine function called (on the loop) for every recorded stall; None disables"""
+        self._stall_sink = sink
+
+    # -----------------------------
+    # Heartbeat (event loop)
+    # -----------------------------
+
+    async def run(self) -> None:
+        """Heartbeat loop; run as a tracked task, cancel to stop (also stops the watchdog)"""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._deadline = time.perf_counter() + self.interval
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        try:
+            while True:
+                started = time.perf_counter()
+                self._deadline = started + self.interval
+                await asyncio.sleep(self.interval)
+                lag_ms = max(0.0, (time.perf_counter() - started - self.interval) * 1000)
+                self.record(lag_ms)
+        finally:
+            self._stop.set()
+
+    def record(self, lag_ms: float) -> Optional[LoopStall]:
+        """Account one heartbeat; returns the stall if lag_ms crossed the threshold"""
+        self.samples += 1
+        self.lag_sum_ms += lag_ms
+        self.last_lag_ms = lag_ms
+        if lag_ms > self.max_lag_ms:
+            self.max_lag_ms = lag_ms
+        self.bucket_counts[self._bucket(lag_ms)] += 1
+
+        with self._capture_lock:
+            self._beats += 1
+            captured, self._captured = self._captured, None
+        if lag_ms < self.stall_threshold_ms:
+            return None
+
+        stall = captured or LoopStall(at="", lag_ms=0.0)
+        stall.at = datetime.now(timezone.utc).isoformat()
+        stall.lag_ms = round(lag_ms, 2)
+        self.stalls_total += 1
+        self.stalls.append(stall)
+        self._report(stall)
+        return stall
+
+    @staticmethod
+    def _bucket(lag_ms: float) -> int:
+        for index, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                return index
+        return len(LAG_BUCKETS_MS)
+
+    def _report(self, stall: LoopStall) -> None:
+        from utils.logger import get_logger, LogCategory
+        get_logger().for_category(LogCategory.SYSTEM).warn(
+            "Event loop stalled",
+            lag_ms=stall.lag_ms,
+            task=stall.task_description,
+            location=stall.location,
+        )
+        if self._stall_sink is not None:
+            # Deliberately untracked: a stall report is not application work
+            asyncio.ensure_future(self._stall_sink(stall))
+
+    # -----------------------------
+    # Watchdog (thread)
+    # -----------------------------
+
+    def _watch(self) -> None:
+        poll = max(self.stall_threshold_ms / 2000, 0.005)
+        while not self._stop.wait(poll):
+            overdue_ms = (time.perf_counter() - self._deadline) * 1000
+            if overdue_ms >= self.stall_threshold_ms and self._captured is None:
+                beats = self._beats
+                stall = self.capture()
+                with self._capture_lock:
+                    # Drop the sample if the heartbeat resumed meanwhile (it may show unrelated code)
+                    if self._captured is None and self._beats == beats:
+                        self._captured = stall
+
+    def capture(self) -> LoopStall:
+        """Sample the loop thread's stack and current task (called while the loop is blocked)"""
+        stall = LoopStall(at="", lag_ms=0.0)
+
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is not None:
+            summary = traceback.extract_stack(frame, limit=self.stack_limit)
+            stall.stack = [f"{f.filename}:{f.lineno} in {f.name}" for f in summary]
+            if summary:
+                stall.location = stall.stack[-1]
+
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        if task is not None:
+            from lifecycle.task_registry import TaskRegistry
+            record = TaskRegistry.instance()._get_record_by_task(task)
+            if record is not None:
+                stall.task_id = record.info.id
+                stall.task_description = record.info.description
+                stall.task_category = record.info.category.name
+            else:
+                stall.task_description = task.get_name()
+        return stall
+
+    # -----------------------------
+    # Introspection
+    # -----------------------------
+
+    def get_stats(self) -> Dict:
+        return {
+            "interval_ms": round(self.interval * 1000, 2),
+            "stall_threshold_ms": self.stall_threshold_ms,
+            "samples": self.samples,
+            "last_lag_ms": round(self.last_lag_ms, 2),
+            "avg_lag_ms": round(self.lag_sum_ms / self.samples, 2) if self.samples else 0.0,
+            "max_lag_ms": round(self.max_lag_ms, 2),
+            "stalls_total": self.stalls_total,
+            "histogram": [
+                {"le_ms": bound, "count": count}
+                for bound, count in zip((*LAG_BUCKETS_MS, None), self.bucket_counts)
+            ],
+            "recent_stalls": [asdict(stall) for stall in self.stalls],
+        }
+
+
+# Global instance
+_monitor = LoopLagMonitor()
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """Get the process-wide LoopLagMonitor"""
+    return _monitor
@@ -0,0 +1,108 @@
+"""
+Startup tracer - per-phase and per-import timings of application startup.
+
+main_asyncio imports this module first, so its clock starts before the
+heavy imports. Phases may nest or overlap (an import running in a worker
+thread while the LED path comes up); each records its own start offset and
+duration. Milestones such as "first_light" (first frame on the strips) mark
+points on the same clock.
+
+Served by GET /system/startup.
+"""
+
+import importlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class StartupPhase:
+    name: str
+    kind: str               # "phase" | "import"
+    start_ms: float         # offset from tracer start
+    duration_ms: float
+    thread: str
+
+
+class StartupTracer:
+    """Collects startup phases and milestones on one monotonic clock"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[StartupPhase] = []
+        self.milestones: Dict[str, float] = {}
+        self._lock = threading.Lock()   # imports may be traced from a worker thread
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def phase(self, name: str, kind: str = "phase") -> Iterator[None]:
+        """Time the enclosed block (recorded even if it raises)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            record = StartupPhase(
+                name=name,
+                kind=kind,
+                start_ms=round((start - self.started) * 1000, 2),
+                duration_ms=round((end - start) * 1000, 2),
+                thread=threading.current_thread().name,
+            )
+            with self._lock:
+                self.phases.append(record)
+
+    def import_modules(self, names: List[str]) -> None:
+        """Import modules one by one, recording each as an "import" phase"""
+        for name in names:
+            with self.phase(name, kind="import"):
+                importlib.import_module(name)
+
+    def mark(self, name: str) -> None:
+        """Record a milestone (first call wins)"""
+        with self._lock:
+            self.milestones.setdefault(name, round(self.elapsed_ms(), 2))
+
+    def get_summary(self) -> Dict:
+        with self._lock:
+            phases = [asdict(phase) for phase in sorted(self.phases, key=lambda p: p.start_ms)]
+            milestones = dict(self.milestones)
+        return {
+            "time_to_first_light_ms": milestones.get("first_light"),
+            "ready_ms": milestones.get("ready"),
+            "process_age_at_start_ms": _process_age_ms(self.started),
+            "milestones": milestones,
+            "phases": phases,
+            "imports_ms": round(sum(p["duration_ms"] for p in phases if p["kind"] == "import"), 2),
+        }
+
+
+def _process_age_ms(at: float) -> Optional[float]:
+    """
+    How long the process had been running when the tracer started
+    (interpreter startup + imports before this module), Linux only.
+    """
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            start_ticks = int(f.read().rsplit(b")", 1)[1].split()[19])
+        with open("/proc/uptime", "rb") as f:
+            uptime = float(f.read().split()[0])
+        age_now = uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+        return round((age_now - (time.perf_counter() - at)) * 1000, 1)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Global instance (created on first import - main_asyncio imports this module first)
+_tracer = StartupTracer()
+
+
+def get_startup_tracer() -> StartupTracer:
+    """Get the process-wide StartupTracer"""
+    return _tracer
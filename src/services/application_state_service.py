@@ -84,7 +84,7 @@ class ApplicationStateService:
 
         # Schedule new save with debounce delay
         self._save_task = asyncio.create_task(self._debounced_save())
-        log.debug(f"Queued state save (debounce: {self._save_delay*1000:.0f}ms)")
+        log.debug("Queued state save (debounce: %.0fms)", self._save_delay*1000)
 
     # === Public API ===
 
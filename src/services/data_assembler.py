@@ -2,8 +2,11 @@
 
 import asyncio
 import json
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from models.animation_params.animation_param_id import AnimationParamID
 from models.enums import AnimationID, ZoneEditTarget, ZoneID, ZoneRenderMode
 from models.domain import (
@@ -17,33 +20,85 @@ from utils.serialization import Serializer
 from models.enums import LogLevel
 from utils.logger import get_logger, LogCategory
 from lifecycle.task_registry import create_tracked_task, TaskCategory
+from services.state_journal import StateJournal
 
 log = get_logger().for_category(LogCategory.CONFIG)
 
 
 class DataAssembler:
-    """Assembles domain objects from existing managers + state"""
-
-    def __init__(self, config_manager: ConfigManager, state_path: Path, debounce_ms: int = 500):
+    """
+    Assembles domain objects from existing managers + state.
+
+    Owns the state document: state.json is read once, kept in memory as the
+    authoritative copy, and written back (debounced) when a section changes.
+    Writes run in a worker thread, only re-serialize dirty sections, skip
+    the disk when nothing actually changed, and replace the file atomically
+    (temp file + fsync + rename), so a power cut leaves either the old or the
+    new state, never a torn file.
+
+    Persistence backends:
+        "snapshot"  rewrite state.json on every save
+        "journal"   append only the changed zones / sections to state.journal
+                    (see StateJournal); state.json is rewritten when the
+                    journal passes journal_compact_bytes
+    A journal left next to state.json is replayed at load in either mode.
+    """
+
+    PERSISTENCE_MODES = ("snapshot", "journal")
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        state_path: Path,
+        debounce_ms: int = 500,
+        persistence: str = "snapshot",
+        journal_compact_bytes: int = 256 * 1024,
+    ):
+        if persistence not in self.PERSISTENCE_MODES:
+            raise ValueError(f"Unknown persistence mode: {persistence!r} (expected one of {self.PERSISTENCE_MODES})")
         self.config_manager = config_manager
-        self.state_path = state_path
+        self.state_path = Path(state_path)
         self.color_manager = config_manager.color_manager
         self.animation_manager = config_manager.animation_manager
 
+        # In-memory state document (loaded on first use) and entries changed since the last write:
+        # (section, zone key) for one zone, (section, None) for a whole section.
+        # Section entries are replaced, never mutated in place, so a shallow copy is a consistent snapshot.
+        self._state: Optional[dict] = None
+        self._dirty: Set[Tuple[str, Optional[str]]] = set()
+        self._written: Dict[str, str] = {}      # section -> JSON last written to state.json
+
+        self.persistence = persistence
+        self._journal = StateJournal(self.state_path.with_suffix(".journal"), journal_compact_bytes)
+        self._entry_written: Dict[Tuple[str, Optional[str]], str] = {}  # entry -> JSON last journaled
+
         # Debouncing: prevent IO thrashing on rapid state changes (all saves go through here)
         self._save_task: Optional[asyncio.Task] = None
-        self._pending_state: Optional[dict] = None  # Latest state waiting to be saved
+        self._save_due = 0.0
         self._save_delay = debounce_ms / 1000  # Convert to seconds
+        self._write_lock = asyncio.Lock()        # keeps snapshots and writes in order
+        self._disk_lock = threading.RLock()      # one writer thread at a time (even if a flush was cancelled)
+        self.writes = 0
+        self.compactions = 0
 
         log.info("DataAssembler initialized")
 
     def load_state(self) -> dict:
-        """Load state from JSON file"""
+        """
+        The state document (read from state.json on first call, then served from memory).
+
+        Callers must treat it as read-only; changes go through save_zone_state /
+        save_application_state so the affected section is marked dirty.
+        """
+        if self._state is not None:
+            return self._state
         try:
             with open(self.state_path, "r") as f:
-                state = json.load(f)
-                # log.debug(f"Loaded state from {self.state_path}")
-                return state
+                self._state = json.load(f)
+            # Cache what is on disk so unchanged sections are never rewritten
+            self._written = {key: self._dump(value) for key, value in self._state.items()}
+            self._replay_journal()
+            return self._state
         except FileNotFoundError:
             log.error(f"State file not found: {self.state_path}")
             raise
@@ -51,42 +106,214 @@ class DataAssembler:
             log.warn(f"Invalid JSON in state file: {e}")
             raise
 
-    def _write_state_to_disk(self, state: dict) -> None:
+    def _replay_journal(self) -> None:
+        """Internal: apply state.journal over the snapshot just loaded"""
+        started = time.perf_counter()
+        replayed = self._journal.replay(self._state)
+        if replayed:
+            log.info(
+                "State journal replayed",
+                entries=replayed,
+                bytes=self._journal.size,
+                ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            if self.persistence == "snapshot":
+                # Journal left by the other backend: the next write folds it into state.json
+                self._dirty.update((key, None) for key in self._state)
+
+        if self.persistence == "journal":
+            self._seed_journaled(self._state)
+
+    def _seed_journaled(self, state: dict) -> None:
+        """Internal: record what snapshot + journal hold, so unchanged entries are never appended"""
+        self._entry_written = {}
+        for key, value in state.items():
+            if key == "zones" and isinstance(value, dict):
+                for zone_key, zone_data in value.items():
+                    self._entry_written[(key, zone_key)] = self._dump(zone_data)
+            else:
+                self._entry_written[(key, None)] = self._dump(value)
+
+    @staticmethod
+    def _dump(value) -> str:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+    def _mark_dirty(self, section: str, key: Optional[str] = None) -> None:
+        self._dirty.add((section, key))
+        self.save_state()
+
+    @staticmethod
+    def _copy(value):
+        return dict(value) if isinstance(value, dict) else value
+
+    def _snapshot(self) -> Tuple[List[str], Optional[Dict[str, object]], Optional[Dict[Tuple[str, Optional[str]], object]]]:
         """
-        Internal: Actually write state to disk.
+        Copy what the next write needs (taken on the event loop).
 
-        Called after debounce delay. Uses latest pending state (not the
-        state passed to save_state() call), ensuring we save final state.
+        Returns:
+            (section order, sections for a state.json write or None,
+             journal entries or None) - exactly one of the last two is set
         """
-        try:
-            with open(self.state_path, "w") as f:
-                json.dump(state, f, indent=2)
-                log.debug(f"State saved {self.state_path}")
-        except Exception as e:
-            log.error(f"Failed to save state: {e}")
-            raise
+        state = self.load_state()
+        dirty, self._dirty = self._dirty, set()
+
+        if self.persistence == "journal" and not self._journal.needs_compaction():
+            entries = {}
+            for section, key in dirty:
+                if section not in state:
+                    continue
+                if key is None:
+                    entries[(section, None)] = self._copy(state[section])
+                elif key in state[section]:
+                    entries[(section, key)] = state[section][key]
+            return list(state), None, entries
+
+        # Snapshot write; compaction folds the whole document into state.json
+        keys = set(state) if self.persistence == "journal" else {section for section, _ in dirty}
+        sections = {key: self._copy(state[key]) for key in keys if key in state}
+        return list(state), sections, None
+
+    def _write_state_to_disk(self, order: List[str], sections: Dict[str, object]) -> int:
+        """
+        Internal: serialize dirty sections and atomically replace state.json.
 
-    async def _debounced_save(self) -> None:
+        Runs in a worker thread (no logging here - flush() logs on the loop).
+        Returns the bytes written, 0 when every dirty section serialized to
+        what is already on disk (no write).
         """
-        Internal: Debounced save implementation.
+        with self._disk_lock:
+            changed = False
+            for key, value in sections.items():
+                text = self._dump(value)
+                if self._written.get(key) != text:
+                    self._written[key] = text
+                    changed = True
+            if not changed:
+                self._reset_journal()
+                return 0
+
+            body = "{" + ",".join(f"{self._dump(key)}:{self._written[key]}" for key in order if key in self._written) + "}"
+            tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(body)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.state_path)
+
+                # Persist the rename itself
+                dir_fd = os.open(self.state_path.parent, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+            except Exception:
+                # Force a full rewrite next time - the disk may not match _written
+                self._written.clear()
+                raise
+            self.writes += 1
+            self._reset_journal()
+            return len(body)
+
+    def _reset_journal(self) -> None:
+        """Internal: state.json now holds everything - drop the journal (caller holds _disk_lock)"""
+        if self._journal.size:
+            self._journal.reset()
+            self.compactions += 1
+
+    def _append_to_journal(self, entries: Dict[Tuple[str, Optional[str]], object]) -> Tuple[int, int]:
+        """
+        Internal: append changed entries to state.journal.
 
-        Waits for debounce delay, then saves to disk ONLY IF _pending_state is not None.
-        This ensures we skip intermediate saves and only write final state.
+        Runs in a worker thread (no logging here - flush() logs on the loop).
+        Returns (entries appended, journal size); (0, 0) when every entry
+        serialized to what was last journaled (no write).
         """
-        try:
-            await asyncio.sleep(self._save_delay)
+        with self._disk_lock:
+            changed = []
+            for (section, key), value in entries.items():
+                text = self._dump(value)
+                if self._entry_written.get((section, key)) != text:
+                    changed.append((section, key, text))
+            if not changed:
+                return 0, 0
+
+            size = self._journal.append(changed)
+
+            for section, key, text in changed:
+                if key is None:
+                    # A whole-section entry supersedes the per-key ones (and vice versa)
+                    for entry in [entry for entry in self._entry_written if entry[0] == section]:
+                        del self._entry_written[entry]
+                else:
+                    self._entry_written.pop((section, None), None)
+                self._entry_written[(section, key)] = text
 
-            # Only save if still pending (timer wasn't cancelled)
-            if self._pending_state is None:
-                return
+            self.writes += 1
+            return len(changed), size
 
-            self._write_state_to_disk(self._pending_state)
-            self._pending_state = None
+    def _compact_journal(self, order: List[str], sections: Dict[str, object]) -> int:
+        """Internal: fold the journal into state.json (worker thread, whole document)"""
+        with self._disk_lock:
+            written = self._write_state_to_disk(order, sections)
+            self._seed_journaled(sections)
+            return written
 
+    async def flush(self) -> bool:
+        """
+        Write dirty entries now (a pending debounced save then finds nothing to do).
+
+        Returns:
+            True if state.json was rewritten or the journal appended to
+        """
+        async with self._write_lock:
+            if not self._dirty:
+                return False
+            order, sections, entries = self._snapshot()
+            compactions = self.compactions
+            try:
+                if entries is not None:
+                    count, size = await asyncio.to_thread(self._append_to_journal, entries)
+                    if count:
+                        log.debug("State journaled %s (%s entries, %s bytes)", self._journal.path, count, size)
+                    return count > 0
+                if self.persistence == "journal":
+                    size = await asyncio.to_thread(self._compact_journal, order, sections)
+                else:
+                    size = await asyncio.to_thread(self._write_state_to_disk, order, sections)
+            except Exception as e:
+                log.error(f"Failed to save state: {e}")
+                self._dirty.update((key, None) for key in order)   # retry every section on the next save
+                raise
+
+            if size:
+                log.debug("State saved %s (%s bytes)", self.state_path, size)
+            if self.compactions != compactions:
+                log.debug("State journal compacted into snapshot")
+            return size > 0
+
+    async def _debounced_save(self) -> None:
+        """
+        Internal: Debounced save implementation.
+
+        Waits for debounce delay, then writes the sections that changed.
+        Rapid changes keep postponing the write, so only the final state hits the disk.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                # Each save_state() moves the deadline; never cancelled mid-write
+                while (delay := self._save_due - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                await self.flush()
+                if not self._dirty:
+                    return
         except asyncio.CancelledError:
-            pass  # Timer was cancelled, don't save
+            pass  # Shutdown - StateSaveShutdownHandler flushes what is left
+        except Exception as e:
+            log.error(f"Debounced state save failed: {e}")
 
-    def save_state(self, state: dict) -> None:
+    def save_state(self, state: Optional[dict] = None) -> None:
         """
         Queue a debounced save of state to disk.
 
@@ -98,16 +325,20 @@ class DataAssembler:
         - Rapid changes (10 encoder rotations in 100ms) → 1 disk write (not 10)
         - State is always up-to-date in memory
         - Disk write waits 500ms after LAST change, saves final state once
-        """
-        # Store latest state (will be saved after debounce delay)
-        self._pending_state = state
+        - Unchanged sections are neither re-serialized nor written
 
-        # Cancel previous pending save if any
-        if self._save_task and not self._save_task.done():
-            self._save_task.cancel()
+        Args:
+            state: Replacement document (all sections dirty); None = keep the
+                in-memory document and write its dirty sections
+        """
+        if state is not None and state is not self._state:
+            self._state = state
+            self._dirty.update((key, None) for key in state)
 
-        # Schedule new save with debounce delay using normal asyncio task
-        self._save_task = asyncio.create_task(self._debounced_save())
+        # Push the deadline back; start the save task if none is pending
+        self._save_due = asyncio.get_running_loop().time() + self._save_delay
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._debounced_save())
 
     def build_animations(self) -> List[AnimationConfig]:
         """Build animation config objects from YAML"""
@@ -216,9 +447,7 @@ class DataAssembler:
         """
         try:
             state_json = self.load_state()
-
-            if "zones" not in state_json:
-                state_json["zones"] = {}
+            zones_section = state_json.setdefault("zones", {})
 
             for zone in zones:
                 zone_key = zone.config.id.name.lower()
@@ -237,10 +466,11 @@ class DataAssembler:
                         "parameters": Serializer.animation_params_enum_to_str(zone.state.animation.parameters)
                     }
 
-                state_json["zones"][zone_key] = zone_data
+                zones_section[zone_key] = zone_data
+                self._dirty.add(("zones", zone_key))
 
-            self.save_state(state_json)
-            log.info(f"Successfully saved {len(zones)} zone states")
+            self.save_state()
+            log.debug("Queued save of %s zone states", len(zones))
 
         except Exception as e:
             log.error(f"Failed to save zone state: {e}")
@@ -312,8 +542,8 @@ class DataAssembler:
                 "save_on_change": app_state.save_on_change,
             }
 
-            self.save_state(state_json)
-            log.debug(f"Application state saved")
+            self._mark_dirty("application")
+            log.debug("Application state save queued")
 
         except Exception as e:
             log.error(f"Failed to save application state: {e}")
@@ -5,19 +5,38 @@ Implements pub-sub pattern:
 - Publishers: publish(event)
 - Subscribers: subscribe(event_type, handler, priority, filter_fn)
 - Middleware: add_middleware(middleware_fn)
+
+Optional queue mode (start_queue): publish_nowait(event) enqueues into a
+bounded queue drained by worker tasks instead of spawning one task per event.
+
+Coalescing rules (add_coalesce_rule): publish_nowait() holds events of a
+declared type for a short window and collapses bursts with the same key into
+one (latest or merged) event before any handler runs.
 """
 
 import asyncio
-from typing import Callable, List, Dict, Optional, TypeVar, Any, Deque
+import time
+from typing import Callable, List, Dict, Hashable, Optional, Tuple, TypeVar, Any, Deque
 from dataclasses import dataclass
 from collections import deque
+from lifecycle.task_registry import create_tracked_task, TaskCategory
+from models.enums import EventOverflowPolicy
 from models.events import Event, EventType
+from services.event_history import EventHistory
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.EVENT)
 
 TEvent = TypeVar('TEvent', bound=Event)
 
+# Compiled dispatch entry: (is_async, filter_fn, handler)
+DispatchEntry = Tuple[bool, Optional[Callable[[Any], bool]], Callable[[Any], Any]]
+
+Middleware = Callable[[Event], Optional[Event]]
+
+CoalesceKey = Callable[[Any], Hashable]
+CoalesceMerge = Callable[[Any, Any], Any]
+
 
 @dataclass
 class EventHandler:
@@ -27,6 +46,21 @@ class EventHandler:
     filter_fn: Optional[Callable[[Any], bool]]  # Type erasure necessary here too
 
 
+@dataclass(frozen=True)
+class CoalesceRule:
+    """
+    Declarative coalescing for one event type.
+
+    Events published with publish_nowait() are held for window_ms; events
+    with the same (event_type, key(event)) arriving meanwhile are collapsed
+    into one - the latest, or merge(held, new) when merge is given.
+    """
+    event_type: EventType
+    key: CoalesceKey
+    window_ms: float
+    merge: Optional[CoalesceMerge] = None
+
+
 class EventBus:
     """
     Central event bus for pub-sub event handling
@@ -35,8 +69,13 @@ class EventBus:
     - Priority-based handler execution (high priority first)
     - Per-handler filtering (fine-grained control)
     - Middleware pipeline (logging, blocking, rate limiting)
-    - Async/sync handler support (auto-detected)
+    - Async/sync handler support (auto-detected once, at subscribe time)
     - Fault tolerance (one handler crash doesn't stop others)
+    - Optional bounded dispatch queue with worker tasks (start_queue)
+
+    Dispatch is precompiled: subscribe() rebuilds a per-EventType tuple of
+    (is_async, filter_fn, handler) in priority order, so publish() does a
+    single dict lookup and no per-event introspection.
 
     Example:
         bus = EventBus()
@@ -52,6 +91,20 @@ class EventBus:
         # Publish
         event = EncoderRotateEvent("selector", 1)
         await bus.publish(event)
+
+    Queue mode:
+        bus.start_queue(maxsize=256, workers=2, overflow=EventOverflowPolicy.DROP_OLDEST)
+        bus.publish_nowait(event)        # from sync code, never blocks
+        await bus.enqueue(event)         # waits for space with BLOCK policy
+        await bus.stop_queue()           # drain and stop workers
+
+    Each EventType is pinned to one worker, so events of the same type are
+    dispatched in publish order; different types may interleave.
+
+    Coalescing:
+        bus.add_coalesce_rule(CoalesceRule(EventType.ZONE_STATIC_STATE_CHANGED,
+                                           key=lambda e: e.zone_id, window_ms=16))
+        # publish_nowait() bursts per zone → one event per 16 ms window
     """
 
     _instance: Optional["EventBus"] = None
@@ -62,16 +115,51 @@ class EventBus:
             cls._instance = cls()
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, history_size: int = 100_000):
         # Handlers organized by event type
         self._handlers: Dict[EventType, List[EventHandler]] = {}
 
-        # Middleware pipeline (applied in registration order)
-        self._middleware: List[Callable[[Event], Optional[Event]]] = []
+        # Compiled dispatch tables (rebuilt on subscribe)
+        self._dispatch: Dict[EventType, Tuple[DispatchEntry, ...]] = {}
 
-        # Event history (circular buffer for debugging/undo)
-        # Using deque with maxlen for O(1) auto-eviction of old events
-        self._event_history: Deque[Event] = deque(maxlen=100)
+        # Middleware pipeline (applied in registration order)
+        # Stored as (middleware, is_active) - is_active None means always active
+        self._middleware: List[Tuple[Middleware, Optional[Callable[[], bool]]]] = []
+
+        # Event history (compact indexed ring, see EventHistory)
+        self.history = EventHistory(capacity=history_size)
+
+        # Dispatch queue (see start_queue); one deque per worker.
+        # Queued slot: [event, enqueued_at, coalesce_key]
+        self._queues: List[Deque[list]] = []
+        self._pending_keys: List[Dict[Hashable, list]] = []
+        self._wakeups: List[asyncio.Event] = []
+        self._space: List[asyncio.Event] = []
+        self._workers: List[asyncio.Task] = []
+        self._worker_of: Dict[EventType, int] = {}
+        self._coalesce_keys: Dict[EventType, CoalesceKey] = {}
+        self._coalesce_rules: Dict[EventType, CoalesceRule] = {}
+        # (event_type, key) -> [event, TimerHandle]
+        self._held: Dict[Hashable, list] = {}
+        # EventType -> [received, emitted]
+        self._coalesce_counts: Dict[EventType, List[int]] = {}
+        self._queue_maxsize = 0
+        self._overflow = EventOverflowPolicy.DROP_OLDEST
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+        # Queue metrics
+        self._enqueued = 0
+        self._dispatched = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked = 0
+        self._high_water = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        # EventType -> [count, total_seconds, max_seconds]
+        self._latency: Dict[EventType, List[float]] = {}
 
     def subscribe(
         self,
@@ -111,6 +199,7 @@ class EventBus:
 
         # Sort by priority (descending - highest first)
         self._handlers[event_type].sort(key=lambda h: h.priority, reverse=True)
+        self._compile(event_type)
 
         log.info(
             "Event handler subscribed",
@@ -119,7 +208,14 @@ class EventBus:
             priority=priority
         )
 
-    def add_middleware(self, middleware: Callable[[Event], Optional[Event]]) -> None:
+    def _compile(self, event_type: EventType) -> None:
+        """Rebuild the dispatch tuple for one event type"""
+        self._dispatch[event_type] = tuple(
+            (asyncio.iscoroutinefunction(h.handler), h.filter_fn, h.handler)
+            for h in self._handlers[event_type]
+        )
+
+    def add_middleware(self, middleware: Middleware) -> None:
         """
         Add middleware to event processing pipeline
 
@@ -130,6 +226,9 @@ class EventBus:
 
         Middleware runs in registration order (FIFO).
 
+        A middleware can declare itself inactive via an `is_active` callable
+        attribute; it is skipped (not called) while is_active() is False.
+
         Args:
             middleware: Function that takes Event, returns Event or None
 
@@ -140,7 +239,7 @@ class EventBus:
 
             bus.add_middleware(log_middleware)
         """
-        self._middleware.append(middleware)
+        self._middleware.append((middleware, getattr(middleware, "is_active", None)))
         log.info(
             "Middleware registered",
             middleware=middleware.__name__
@@ -166,48 +265,394 @@ class EventBus:
             event = EncoderRotateEvent("selector", 1)
             await bus.publish(event)
         """
-        log.debug("Event: ", event_type=event.type.name)
-        
         # Apply middleware pipeline
-        for middleware in self._middleware:
+        for middleware, is_active in self._middleware:
+            if is_active is not None and not is_active():
+                continue
             processed_event = middleware(event)
             if processed_event is None:
                 # Event blocked by middleware
                 return
             event = processed_event
 
-        # Save to history (auto-evicts oldest event when full via deque maxlen)
-        self._event_history.append(event)
+        # Save to history (auto-evicts oldest record when full)
+        self.history.record(event)
 
-        # Get handlers for this event type
-        handlers = self._handlers.get(event.type, [])
-        if not handlers:
-            log.info(
-                f"No event handlers registered for event {event.type.name}")
-            return
-
-        # Execute handlers by priority
-        for handler_entry in handlers:
+        # Execute compiled handlers by priority
+        for is_async, filter_fn, handler in self._dispatch.get(event.type, ()):
             # Apply per-handler filter
-            if handler_entry.filter_fn and not handler_entry.filter_fn(event):
+            if filter_fn is not None and not filter_fn(event):
                 continue
 
             try:
-                # Handle async/sync transparently
-                if asyncio.iscoroutinefunction(handler_entry.handler):
-                    await handler_entry.handler(event)
+                if is_async:
+                    await handler(event)
                 else:
-                    handler_entry.handler(event)
-            except Exception as e:
+                    handler(event)
+            except Exception:
+                handler_name = getattr(handler, "__name__", repr(handler))
                 log.error(
-                    f"Event handler failed: {handler_entry.handler.__name__} for {event.type.name}",
+                    f"Event handler failed: {handler_name} for {event.type.name}",
                     exc_info=True,
-                    handler=handler_entry.handler.__name__,
+                    handler=handler_name,
                     event_type=event.type.name
                 )
                 # Continue to next handler (fault tolerance)
 
-    def get_event_history(self, limit: int = 10) -> List[Event]:
+    # ------------------------------------------------------------------
+    # Queue mode
+    # ------------------------------------------------------------------
+
+    @property
+    def queue_running(self) -> bool:
+        return bool(self._workers)
+
+    def start_queue(
+        self,
+        maxsize: int = 256,
+        workers: int = 1,
+        overflow: EventOverflowPolicy = EventOverflowPolicy.DROP_OLDEST
+    ) -> None:
+        """
+        Start bounded queue dispatch (must be called from the event loop)
+
+        Args:
+            maxsize: Queue capacity per worker
+            workers: Number of worker tasks; each EventType is pinned to one
+            overflow: Policy when a worker queue is full
+        """
+        if self._workers:
+            return
+        if maxsize < 1 or workers < 1:
+            raise ValueError(f"maxsize and workers must be >= 1, got {maxsize}, {workers}")
+
+        self._queue_maxsize = maxsize
+        self._overflow = overflow
+        self._queues = [deque() for _ in range(workers)]
+        self._pending_keys = [{} for _ in range(workers)]
+        self._wakeups = [asyncio.Event() for _ in range(workers)]
+        self._space = [asyncio.Event() for _ in range(workers)]
+        self._worker_of = {event_type: i % workers for i, event_type in enumerate(EventType)}
+        self._workers = [
+            create_tracked_task(
+                self._worker(i),
+                category=TaskCategory.EVENTBUS,
+                description=f"EventBus worker {i}"
+            )
+            for i in range(workers)
+        ]
+
+        log.info(
+            "Event queue started",
+            workers=workers,
+            maxsize=maxsize,
+            overflow=overflow.name
+        )
+
+    async def stop_queue(self, timeout: float = 1.0) -> None:
+        """Dispatch what is queued (up to timeout), then stop the workers"""
+        if not self._workers:
+            return
+
+        self.flush_coalesced()
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            log.warn("Event queue not drained before stop", depth=self.queue_depth)
+
+        workers, self._workers = self._workers, []
+        for space in self._space:
+            space.set()                           # release blocked enqueue() callers
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for queue in self._queues:
+            queue.clear()
+        for keys in self._pending_keys:
+            keys.clear()
+        self._in_flight = 0
+        self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until every queued event has been dispatched"""
+        await self._idle.wait()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self._queues)
+
+    def set_coalesce_key(self, event_type: EventType, key_fn: CoalesceKey) -> None:
+        """
+        Declare how queued events of this type are coalesced (COALESCE policy)
+
+        When the queue is full, a new event replaces the queued event of the
+        same type with an equal key_fn(event). Keyed events are never evicted
+        to make room: the oldest queued event without a key is dropped instead.
+        """
+        self._coalesce_keys[event_type] = key_fn
+
+    def add_coalesce_rule(self, rule: CoalesceRule) -> None:
+        """
+        Register a coalescing rule (replaces any rule for the same type)
+
+        The rule key also becomes the overflow coalesce key for that type,
+        unless one was set with set_coalesce_key().
+
+        Example:
+            bus.add_coalesce_rule(CoalesceRule(
+                EventType.ZONE_ANIMATION_PARAM_CHANGED,
+                key=lambda e: (e.zone_id, e.param_id),
+                window_ms=16,
+            ))
+        """
+        if rule.window_ms <= 0:
+            raise ValueError(f"window_ms must be > 0, got {rule.window_ms}")
+        self._coalesce_rules[rule.event_type] = rule
+        self._coalesce_keys.setdefault(rule.event_type, rule.key)
+        self._coalesce_counts.setdefault(rule.event_type, [0, 0])
+
+    def flush_coalesced(self) -> None:
+        """Release every held event now (e.g. before shutdown)"""
+        for key in list(self._held):
+            self._release(key)
+
+    def publish_nowait(self, event: Event) -> None:
+        """
+        Publish without waiting for handlers (call from the event loop)
+
+        Events with a coalescing rule are held for the rule window first.
+        With the queue running the event is enqueued (overflow policy applies,
+        BLOCK drops the new event since this call cannot wait). Without the
+        queue (tests, early startup) it falls back to one tracked task per
+        event, visible in the TaskRegistry.
+        """
+        rule = self._coalesce_rules.get(event.type)
+        if rule is not None:
+            self._hold(rule, event)
+            return
+        self._submit(event)
+
+    def _hold(self, rule: CoalesceRule, event: Event) -> None:
+        counts = self._coalesce_counts[event.type]
+        counts[0] += 1
+
+        key = (event.type, rule.key(event))
+        held = self._held.get(key)
+        if held is not None:
+            held[0] = rule.merge(held[0], event) if rule.merge else event
+            return
+
+        loop = asyncio.get_running_loop()
+        self._held[key] = [event, loop.call_later(rule.window_ms / 1000, self._release, key)]
+
+    def _release(self, key: Hashable) -> None:
+        held = self._held.pop(key, None)
+        if held is None:
+            return
+        event, timer = held
+        timer.cancel()
+        self._coalesce_counts[event.type][1] += 1
+        self._submit(event)
+
+    def _submit(self, event: Event) -> None:
+        if not self._workers:
+            create_tracked_task(
+                self.publish(event),
+                category=TaskCategory.EVENTBUS,
+                description=f"Publish {event.type.name} (no queue)"
+            )
+            return
+
+        shard = self._worker_of[event.type]
+        if len(self._queues[shard]) >= self._queue_maxsize and not self._make_room(shard, event):
+            return
+        self._put(shard, event)
+
+    async def enqueue(self, event: Event) -> None:
+        """Enqueue an event, waiting for space when the policy is BLOCK"""
+        rule = self._coalesce_rules.get(event.type)
+        if rule is not None:
+            self._hold(rule, event)
+            return
+        if not self._workers:
+            await self.publish(event)
+            return
+
+        shard = self._worker_of[event.type]
+        if self._overflow is EventOverflowPolicy.BLOCK:
+            queue, space = self._queues[shard], self._space[shard]
+            if len(queue) >= self._queue_maxsize:
+                self._blocked += 1
+            while len(queue) >= self._queue_maxsize:
+                space.clear()
+                await space.wait()
+                if not self._workers:
+                    await self.publish(event)
+                    return
+        elif len(self._queues[shard]) >= self._queue_maxsize and not self._make_room(shard, event):
+            return
+        self._put(shard, event)
+
+    def _put(self, shard: int, event: Event) -> None:
+        key = None
+        key_fn = self._coalesce_keys.get(event.type)
+        if key_fn is not None:
+            key = (event.type, key_fn(event))
+
+        slot = [event, time.perf_counter(), key]
+        queue = self._queues[shard]
+        queue.append(slot)
+        if key is not None:
+            self._pending_keys[shard][key] = slot
+
+        self._enqueued += 1
+        self._in_flight += 1
+        self._idle.clear()
+        depth = len(queue)
+        if depth > self._high_water:
+            self._high_water = depth
+        self._wakeups[shard].set()
+
+    def _make_room(self, shard: int, event: Event) -> bool:
+        """
+        Apply the overflow policy to a full worker queue.
+
+        Returns:
+            True if the new event should still be queued
+        """
+        queue = self._queues[shard]
+        keys = self._pending_keys[shard]
+
+        if self._overflow is EventOverflowPolicy.COALESCE:
+            key_fn = self._coalesce_keys.get(event.type)
+            if key_fn is not None:
+                slot = keys.get((event.type, key_fn(event)))
+                if slot is not None:
+                    # keep queue position, newest (or merged) payload
+                    rule = self._coalesce_rules.get(event.type)
+                    slot[0] = rule.merge(slot[0], event) if rule and rule.merge else event
+                    self._coalesced += 1
+                    return False
+
+            # Keyed (state) events are never evicted: drop the oldest lossy event instead
+            for index, slot in enumerate(queue):
+                if slot[2] is None:
+                    del queue[index]
+                    self._in_flight -= 1
+                    self._note_drop(slot[0])
+                    return True
+            if event.type not in self._coalesce_keys:
+                self._note_drop(event)
+                return False
+            return True                           # only keyed events queued: bounded by distinct keys
+
+        if self._overflow is EventOverflowPolicy.BLOCK:
+            self._note_drop(event)                # publish_nowait cannot wait
+            return False
+
+        oldest = queue.popleft()
+        if oldest[2] is not None and keys.get(oldest[2]) is oldest:
+            del keys[oldest[2]]
+        self._in_flight -= 1
+        self._note_drop(oldest[0])
+        return True
+
+    def _note_drop(self, event: Event) -> None:
+        self._dropped += 1
+        if self._dropped == 1 or self._dropped % 100 == 0:
+            log.warn(
+                "Event queue full, event dropped",
+                event_type=event.type.name,
+                dropped=self._dropped,
+                policy=self._overflow.name
+            )
+
+    async def _worker(self, shard: int) -> None:
+        queue = self._queues[shard]
+        keys = self._pending_keys[shard]
+        wakeup = self._wakeups[shard]
+        space = self._space[shard]
+
+        while True:
+            if not queue:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            event, enqueued_at, key = slot = queue.popleft()
+            if key is not None and keys.get(key) is slot:
+                del keys[key]
+            space.set()
+
+            started = time.perf_counter()
+            wait = started - enqueued_at
+            self._queue_wait_total += wait
+            if wait > self._queue_wait_max:
+                self._queue_wait_max = wait
+
+            try:
+                await self.publish(event)
+            finally:
+                elapsed = time.perf_counter() - started
+                stats = self._latency.get(event.type)
+                if stats is None:
+                    stats = self._latency[event.type] = [0, 0.0, 0.0]
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+
+                self._dispatched += 1
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._idle.set()
+
+    def get_queue_metrics(self) -> Dict[str, Any]:
+        """Queue depth, drop/coalesce counters and per-EventType handler latency"""
+        dispatched = self._dispatched
+        return {
+            "running": self.queue_running,
+            "workers": len(self._workers),
+            "maxsize": self._queue_maxsize,
+            "overflow": self._overflow.name,
+            "depth": self.queue_depth,
+            "depth_per_worker": [len(queue) for queue in self._queues],
+            "high_water": self._high_water,
+            "enqueued": self._enqueued,
+            "dispatched": dispatched,
+            "dropped": self._dropped,
+            "coalesced": self._coalesced,
+            "blocked": self._blocked,
+            "queue_wait_avg_ms": round(self._queue_wait_total / dispatched * 1000, 3) if dispatched else 0.0,
+            "queue_wait_max_ms": round(self._queue_wait_max * 1000, 3),
+            "coalescing": {
+                event_type.name: {
+                    "window_ms": self._coalesce_rules[event_type].window_ms,
+                    "received": received,
+                    "emitted": emitted,
+                    "held": sum(1 for key in self._held if key[0] is event_type),
+                }
+                for event_type, (received, emitted) in self._coalesce_counts.items()
+            },
+            "handler_latency_ms": {
+                event_type.name: {
+                    "count": int(count),
+                    "avg": round(total / count * 1000, 3),
+                    "max": round(worst * 1000, 3),
+                }
+                for event_type, (count, total, worst) in self._latency.items()
+            },
+        }
+
+    def get_handler_latency(self) -> Dict[EventType, Tuple[int, float, float]]:
+        """Raw per-EventType handler latency: (count, total seconds, max seconds)"""
+        return {
+            event_type: (int(count), total, worst)
+            for event_type, (count, total, worst) in self._latency.items()
+        }
+
+    def get_event_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get recent events from history
 
@@ -215,10 +660,10 @@ class EventBus:
             limit: Number of recent events to return
 
         Returns:
-            List of recent events (newest last)
+            Compact event records (newest last), see EventHistory.query
         """
-        return list(self._event_history)[-limit:]
+        return self.history.query(limit=limit)
 
     def clear_history(self) -> None:
         """Clear event history"""
-        self._event_history.clear()
+        self.history.clear()
@@ -0,0 +1,47 @@
+"""
+Event coalescing rules - declarative burst collapsing for EventBus
+
+While a knob is turned or a UI slider dragged, zone state events fire many
+times per second and every one makes SnapshotPublisher rebuild a snapshot,
+Socket.IO broadcast it and StaticModeController push a frame. These rules
+collapse such bursts per zone (per parameter) into one event per UI frame.
+"""
+
+from typing import Tuple
+
+from models.events import EventType
+from models.events.zone_static_events import ZoneStaticStateChangedEvent
+from services.event_bus import CoalesceRule
+
+# One UI frame at 60 fps
+UI_FRAME_MS = 1000 / 60
+
+
+def merge_zone_static(held: ZoneStaticStateChangedEvent, new: ZoneStaticStateChangedEvent) -> ZoneStaticStateChangedEvent:
+    """Accumulate changed fields; newer values win (events carry only what changed)"""
+    return ZoneStaticStateChangedEvent(
+        zone_id=new.zone_id,
+        color=new.color if new.color is not None else held.color,
+        brightness=new.brightness if new.brightness is not None else held.brightness,
+        is_on=new.is_on if new.is_on is not None else held.is_on,
+    )
+
+
+DEFAULT_COALESCE_RULES: Tuple[CoalesceRule, ...] = (
+    CoalesceRule(
+        EventType.ZONE_STATIC_STATE_CHANGED,
+        key=lambda e: e.zone_id,
+        window_ms=UI_FRAME_MS,
+        merge=merge_zone_static,
+    ),
+    CoalesceRule(
+        EventType.ZONE_ANIMATION_PARAM_CHANGED,
+        key=lambda e: (e.zone_id, e.param_id),
+        window_ms=UI_FRAME_MS,
+    ),
+    CoalesceRule(
+        EventType.ANIMATION_PARAMETER_CHANGED,
+        key=lambda e: (getattr(e, "zone_id", None), getattr(e, "param_id", None)),
+        window_ms=UI_FRAME_MS,
+    ),
+)
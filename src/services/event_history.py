@@ -0,0 +1,239 @@
+"""
+Event History - compact, indexed ring buffer of published events
+
+Stores each event as a fixed-size record in parallel arrays (type id,
+monotonic timestamp, zone id) plus a small payload tuple of scalar fields.
+Every record links to the previous record of the same type and of the same
+zone, so "last N events of type T (for zone Z)" walks only matching records
+instead of scanning or copying the whole buffer.
+"""
+
+import time
+from array import array
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.color import Color
+from models.enums import ZoneID
+from models.events import Event, EventType
+
+_EVENT_TYPES: Tuple[EventType, ...] = tuple(EventType)
+_TYPE_IDS: Dict[EventType, int] = {t: i for i, t in enumerate(_EVENT_TYPES)}
+
+_ZONES: Tuple[ZoneID, ...] = tuple(ZoneID)
+_ZONE_IDS: Dict[ZoneID, int] = {z: i for i, z in enumerate(_ZONES)}
+
+_META_FIELDS = frozenset({"type", "source", "timestamp"})
+_SKIPPED_FIELDS = _META_FIELDS | {"zone_id"}
+
+# (field names, values) - both tuples; equal payloads share one interned object
+Payload = Tuple[Tuple[str, ...], Tuple[Any, ...]]
+
+_INTERN_LIMIT = 4096
+# (event class, source, raw field values) -> Payload, for hashable events
+_interned: Dict[Tuple[Any, ...], Payload] = {}
+# event class -> non-meta field names (instance __dict__ order)
+_fields: Dict[type, Tuple[str, ...]] = {}
+
+
+def _build_payload(event: Event) -> Payload:
+    keys = []
+    values = []
+    source = event.source
+    if source is not None:
+        keys.append("source")
+        values.append(source.name if isinstance(source, Enum) else str(source))
+
+    for key, value in event.__dict__.items():
+        if key in _SKIPPED_FIELDS or value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.name
+        elif isinstance(value, Color):
+            value = value.to_rgb()
+        elif not isinstance(value, (bool, int, float, str)):
+            continue
+        keys.append(key)
+        values.append(value)
+    return tuple(keys), tuple(values)
+
+
+def compact_payload(event: Event) -> Payload:
+    """
+    Small, immutable payload: scalar fields only.
+
+    Enums become their name, Colors an (r, g, b) tuple; containers and
+    objects (snapshots, parameter dicts) are left out. Repeated payloads
+    (e.g. encoder steps) are interned, so the ring stores one shared object
+    and skips the conversion.
+    """
+    attrs = event.__dict__
+    cls = type(event)
+    names = _fields.get(cls)
+    if names is None or len(names) + len(_META_FIELDS) != len(attrs):
+        names = _fields[cls] = tuple(k for k in attrs if k not in _META_FIELDS)
+
+    try:
+        raw = (cls, event.source, *[attrs.get(k) for k in names])
+        shared = _interned.get(raw)
+    except TypeError:                       # unhashable field (Color, dict, ...)
+        return _build_payload(event)
+    if shared is not None:
+        return shared
+
+    payload = _build_payload(event)
+    if len(_interned) >= _INTERN_LIMIT:
+        _interned.clear()
+    _interned[raw] = payload
+    return payload
+
+
+class EventHistory:
+    """
+    Fixed-capacity event ring with per-type and per-zone indexes.
+
+    Example:
+        history = EventHistory(capacity=100_000)
+        history.record(event)
+        history.query(event_type=EventType.ENCODER_ROTATE, zone_id=ZoneID.FLOOR, limit=20)
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+
+        self._seq = array("q", bytes(8 * capacity))           # sequence stored in slot (0 = empty)
+        self._type = array("B", bytes(capacity))
+        self._zone = array("b", bytes(capacity))              # -1 = no zone
+        self._time = array("d", bytes(8 * capacity))          # time.monotonic()
+        self._prev_type = array("q", bytes(8 * capacity))     # previous seq with same type
+        self._prev_zone = array("q", bytes(8 * capacity))     # previous seq with same zone
+        self._payload: List[Optional[Payload]] = [None] * capacity
+
+        self._last_by_type = [0] * len(_EVENT_TYPES)
+        self._last_by_zone = [0] * len(_ZONES)
+        self._totals = [0] * len(_EVENT_TYPES)
+        self._last_seq = 0
+        self._first_seq = 1                                    # raised by clear()
+
+        # Offset to turn monotonic timestamps into wall-clock time for display
+        self._wall_offset = time.time() - time.monotonic()
+
+    def __len__(self) -> int:
+        return self._last_seq - self._oldest + 1
+
+    @property
+    def total_recorded(self) -> int:
+        return self._last_seq
+
+    def record(self, event: Event) -> int:
+        """Append an event, evicting the oldest when full. Returns its sequence."""
+        seq = self._last_seq + 1
+        self._last_seq = seq
+        slot = seq % self.capacity
+
+        type_id = _TYPE_IDS[event.type]
+        zone = getattr(event, "zone_id", None)
+        zone_id = _ZONE_IDS.get(zone, -1) if zone is not None else -1
+
+        self._seq[slot] = seq
+        self._type[slot] = type_id
+        self._zone[slot] = zone_id
+        self._time[slot] = time.monotonic()
+        self._payload[slot] = compact_payload(event)
+
+        self._prev_type[slot] = self._last_by_type[type_id]
+        self._last_by_type[type_id] = seq
+        self._totals[type_id] += 1
+
+        if zone_id >= 0:
+            self._prev_zone[slot] = self._last_by_zone[zone_id]
+            self._last_by_zone[zone_id] = seq
+        else:
+            self._prev_zone[slot] = 0
+
+        return seq
+
+    def clear(self) -> None:
+        """Forget recorded events and restart per-type totals (sequence numbers keep counting)"""
+        for i in range(len(self._last_by_type)):
+            self._last_by_type[i] = 0
+        for i in range(len(self._last_by_zone)):
+            self._last_by_zone[i] = 0
+        for i in range(len(self._totals)):
+            self._totals[i] = 0
+        self._first_seq = self._last_seq + 1
+
+    @property
+    def _oldest(self) -> int:
+        """Oldest sequence still in the ring"""
+        return max(self._last_seq - self.capacity + 1, self._first_seq)
+
+    def query(
+        self,
+        event_type: Optional[EventType] = None,
+        zone_id: Optional[ZoneID] = None,
+        limit: int = 100,
+        since_seconds: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Most recent matching events, oldest first.
+
+        Args:
+            event_type: Only this type (walks the per-type chain)
+            zone_id: Only events carrying this zone_id (walks the per-zone chain)
+            limit: Maximum number of records
+            since_seconds: Only events from the last N seconds
+        """
+        oldest = self._oldest
+        min_time = time.monotonic() - since_seconds if since_seconds is not None else None
+        type_id = _TYPE_IDS[event_type] if event_type is not None else -1
+
+        if zone_id is not None:
+            seq = self._last_by_zone[_ZONE_IDS[zone_id]]
+            links = self._prev_zone
+        elif event_type is not None:
+            seq = self._last_by_type[type_id]
+            links = self._prev_type
+        else:
+            seq = self._last_seq
+            links = None
+
+        capacity = self.capacity
+        found = []
+        while seq >= oldest and len(found) < limit:
+            slot = seq % capacity
+            if self._seq[slot] != seq:
+                break
+            if min_time is not None and self._time[slot] < min_time:
+                break
+            if type_id < 0 or self._type[slot] == type_id:
+                found.append(seq)
+            seq = links[slot] if links is not None else seq - 1
+
+        found.reverse()
+        return [self._to_dict(seq) for seq in found]
+
+    def _to_dict(self, seq: int) -> Dict[str, Any]:
+        slot = seq % self.capacity
+        zone_id = self._zone[slot]
+        monotonic = self._time[slot]
+        return {
+            "seq": seq,
+            "type": _EVENT_TYPES[self._type[slot]].name,
+            "zone_id": _ZONES[zone_id].name if zone_id >= 0 else None,
+            "monotonic": round(monotonic, 6),
+            "time": round(monotonic + self._wall_offset, 6),
+            "payload": dict(zip(*self._payload[slot])) if self._payload[slot] else {},
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "size": len(self),
+            "total_recorded": self._last_seq,
+            "totals_by_type": {
+                _EVENT_TYPES[i].name: count for i, count in enumerate(self._totals) if count
+            },
+        }
@@ -7,39 +7,128 @@ remains fast and non-blocking while logs are streamed asynchronously.
 """
 
 import asyncio
+import threading
 from collections import deque
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass
 from datetime import datetime
-from utils.logger import get_logger, LogCategory
+from typing import Deque, Dict, FrozenSet, List, Optional, TYPE_CHECKING
+from utils.logger import get_logger, LogCategory, LEVEL_PRIORITY
+from models.enums import LogLevel
 from api.schemas.logger import LogMessage
 from lifecycle.task_registry import create_tracked_task, TaskCategory
 
 if TYPE_CHECKING:
     from socketio import AsyncServer
+    from services.log_store import LogStore
 
 log = get_logger().for_category(LogCategory.SYSTEM)
 
+_LEVEL_PRIORITY_BY_NAME = {level.name: priority for level, priority in LEVEL_PRIORITY.items()}
+
+
+@dataclass(frozen=True)
+class LogClientFilter:
+    """Server-side log filter of one Socket.IO client"""
+    min_level: int = 0                                   # LEVEL_PRIORITY value
+    categories: Optional[FrozenSet[str]] = None          # None = all categories
+
+    @property
+    def room(self) -> str:
+        """Clients with equal filters share a room, so a batch is emitted once per filter"""
+        cats = ",".join(sorted(self.categories)) if self.categories is not None else "*"
+        return f"logs:{self.min_level}:{cats}"
+
+    @property
+    def level_name(self) -> str:
+        return next(name for name, priority in _LEVEL_PRIORITY_BY_NAME.items() if priority == self.min_level)
+
+    def matches(self, entry: dict) -> bool:
+        if _LEVEL_PRIORITY_BY_NAME.get(entry["level"], 0) < self.min_level:
+            return False
+        return self.categories is None or entry["category"] in self.categories
+
+    @classmethod
+    def from_request(cls, data: dict) -> "LogClientFilter":
+        """
+        Build from a client request: {"level": "INFO", "categories": ["ZONE", ...]}
+
+        Raises:
+            ValueError: On unknown level or category names
+        """
+        level_name = (data.get("level") or LogLevel.DEBUG.name).upper()
+        if level_name not in _LEVEL_PRIORITY_BY_NAME:
+            raise ValueError(f"Unknown log level: {level_name}")
+
+        categories = data.get("categories")
+        if categories is not None:
+            categories = frozenset(c.upper() for c in categories)
+            unknown = categories - set(LogCategory.__members__)
+            if unknown:
+                raise ValueError(f"Unknown log categories: {sorted(unknown)}")
+
+        return cls(min_level=_LEVEL_PRIORITY_BY_NAME[level_name], categories=categories)
+
 
 class LogBroadcaster:
     """
     Service for broadcasting logs to Socket.IO clients.
 
-    Decouples the logger from transport by using an asyncio queue.
+    Decouples the logger from transport by using an in-memory buffer.
     This allows the logger to remain fast and non-blocking while logs are
     streamed asynchronously to connected clients via Socket.IO.
+
+    Entries are sent in batches ('log:batch' with {'logs': [...]}) every
+    flush_interval seconds or batch_size entries, whichever comes first,
+    only to subscribed clients (set_client_filter - minimum level and
+    categories). Lines a client filters out are never sent to it, and
+    without subscribers batches are discarded without serialization.
+
+    log() may be called from any thread: once started, calls from other
+    threads are handed to the event loop with call_soon_threadsafe, so the
+    buffers, the asyncio events and the store are only touched on the loop.
     """
 
-    def __init__(self, queue_size: int = 1000) -> None:
+    def __init__(self, queue_size: int = 1000, batch_size: int = 200, flush_interval: float = 0.1) -> None:
         """
         Initialize the log broadcaster.
 
         Args:
-            queue_size: Maximum size of the log queue
+            queue_size: Maximum number of pending (and historical) log entries
+            batch_size: Maximum entries per 'log:batch' emit
+            flush_interval: Maximum time (seconds) an entry waits before being sent
         """
-        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
-        self.log_history: deque = deque(maxlen=queue_size)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.log_history: Deque[dict] = deque(maxlen=queue_size)
+        self._pending: Deque[dict] = deque(maxlen=queue_size)      # oldest dropped when full
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
         self._broadcast_task: asyncio.Task | None = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
         self.socketio_server: Optional["AsyncServer"] = None
+        self._client_filters: Dict[str, LogClientFilter] = {}
+        self.batches_sent = 0
+        self.store: Optional["LogStore"] = None
+
+    def set_store(self, store: Optional["LogStore"]) -> None:
+        """
+        Persist every entry to a LogStore (on-disk ring, survives restarts).
+
+        Entries already in the history buffer (logged before the store was
+        opened, e.g. during startup) are written first, with their timestamps.
+
+        Args:
+            store: LogStore instance, or None to stop persisting
+        """
+        if store is not None and self.store is None:
+            try:
+                for e in self.log_history:
+                    store.append(e["level"], e["category"], e["message"],
+                                 timestamp=datetime.fromisoformat(e["timestamp"]).timestamp())
+            except (OSError, ValueError):
+                return                                  # disk full / file closed - don't persist
+        self.store = store
 
     def set_socketio_server(self, socketio_server: "AsyncServer") -> None:
         """
@@ -54,6 +143,8 @@ class LogBroadcaster:
     def start(self) -> None:
         """Start the background broadcasting task."""
         if self._broadcast_task is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread = threading.get_ident()
             self._broadcast_task = create_tracked_task(
                 self._broadcast_worker(),
                 category=TaskCategory.SYSTEM,
@@ -69,13 +160,47 @@ class LogBroadcaster:
             except asyncio.CancelledError:
                 pass
             self._broadcast_task = None
-
-    def get_recent_logs(self, limit: int = 100) -> list[LogMessage]:
+        self._loop = None
+        self._loop_thread = None
+
+    # === Client filters ===
+
+    async def set_client_filter(self, sid: str, client_filter: LogClientFilter) -> None:
+        """Apply a server-side filter for one client (moves it to the filter's room)"""
+        previous = self._client_filters.get(sid)
+        if previous == client_filter:
+            return
+        if self.socketio_server:
+            if previous is not None:
+                await self.socketio_server.leave_room(sid, previous.room)
+            await self.socketio_server.enter_room(sid, client_filter.room)
+        self._client_filters[sid] = client_filter
+
+    async def clear_client_filter(self, sid: str) -> None:
+        """Back to receiving all entries (if subscribed)"""
+        if sid in self._client_filters:
+            await self.set_client_filter(sid, LogClientFilter())
+
+    async def remove_client_filter(self, sid: str) -> None:
+        """Stop streaming logs to a client"""
+        previous = self._client_filters.pop(sid, None)
+        if previous is not None and self.socketio_server:
+            await self.socketio_server.leave_room(sid, previous.room)
+
+    def remove_client(self, sid: str) -> None:
+        """Forget a disconnected client (Socket.IO drops its rooms itself)"""
+        self._client_filters.pop(sid, None)
+
+    def get_client_filter(self, sid: str) -> Optional[LogClientFilter]:
+        return self._client_filters.get(sid)
+
+    def get_recent_logs(self, limit: int = 100, client_filter: Optional[LogClientFilter] = None) -> list[LogMessage]:
         """
         Get recent log messages from history buffer.
 
         Args:
             limit: Maximum number of logs to return (max 1000)
+            client_filter: Only entries matching this filter
 
         Returns:
             List of LogMessage objects (oldest to newest)
@@ -83,8 +208,12 @@ class LogBroadcaster:
         # Limit to max 1000 to prevent excessive data transfer
         requested_limit = min(limit, 1000)
 
-        # Return last N entries from deque (oldest to newest order)
-        return list(self.log_history)[-requested_limit:]
+        entries = self.log_history
+        if client_filter is not None:
+            entries = [e for e in entries if client_filter.matches(e)]
+
+        # Return last N entries (oldest to newest order)
+        return [LogMessage.model_construct(**e) for e in list(entries)[-requested_limit:]]
 
     def log(
         self,
@@ -96,7 +225,8 @@ class LogBroadcaster:
         """
         Queue a log message for broadcasting.
 
-        Non-blocking: logs dropped if queue is full rather than blocking.
+        Non-blocking: the oldest pending entry is dropped if the buffer is full.
+        Thread-safe: off-loop calls are re-scheduled onto the event loop.
 
         Args:
             timestamp: ISO 8601 timestamp
@@ -104,52 +234,85 @@ class LogBroadcaster:
             category: Log category
             message: Log message text
         """
-        log_msg = LogMessage(
-            timestamp=timestamp,
-            level=level,
-            category=category,
-            message=message
-        )
+        loop = self._loop
+        if loop is not None and threading.get_ident() != self._loop_thread:
+            try:
+                loop.call_soon_threadsafe(self.log, timestamp, level, category, message)
+            except RuntimeError:
+                pass                                    # loop closed (shutdown) - drop the entry
+            return
+
+        # Plain dict in LogMessage shape - sent as-is, no per-line model dump
+        entry = {"timestamp": timestamp, "level": level, "category": category, "message": message}
 
         # Store in history buffer (automatically evicts oldest when full)
-        self.log_history.append(log_msg)
+        self.log_history.append(entry)
+        self._pending.append(entry)
 
-        try:
-            # Non-blocking put - drop oldest message if queue full
-            self.queue.put_nowait(log_msg)
-        except asyncio.QueueFull:
-            # Queue full, try to remove oldest and add new
+        if self.store is not None:
             try:
-                self.queue.get_nowait()
-                self.queue.put_nowait(log_msg)
-            except asyncio.QueueEmpty:
-                pass
+                self.store.append(level, category, message)
+            except (OSError, ValueError):
+                self.store = None                       # disk full / file closed - stop persisting
+
+        self._has_pending.set()
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+
+    def _take_batch(self) -> List[dict]:
+        pending = self._pending
+        count = min(len(pending), self.batch_size)
+        batch = [pending.popleft() for _ in range(count)]
+        if len(pending) < self.batch_size:
+            self._batch_full.clear()
+        if not pending:
+            self._has_pending.clear()
+        return batch
+
+    async def _emit_batch(self, batch: List[dict]) -> None:
+        """One emit per distinct client filter (room); nothing to do without subscribers"""
+        sio = self.socketio_server
+        if not sio or not self._client_filters:
+            return
+
+        for client_filter in set(self._client_filters.values()):
+            entries = [e for e in batch if client_filter.matches(e)]
+            if entries:
+                await sio.emit("log:batch", {"logs": entries}, room=client_filter.room)
+        self.batches_sent += 1
 
     async def _broadcast_worker(self) -> None:
         """
         Background task that consumes logs and broadcasts to clients.
 
-        Runs continuously and broadcasts each log to all connected clients
-        via Socket.IO.
+        Waits for the first pending entry, then gives the batch up to
+        flush_interval to fill before sending it as one 'log:batch' emit.
         """
         while True:
             try:
-                message = await self.queue.get()
-                
-                # Broadcast via Socket.IO (primary method)
-                if self.socketio_server:
+                await self._has_pending.wait()
+
+                if len(self._pending) < self.batch_size:
                     try:
-                        # Convert LogMessage to dict for Socket.IO emission
-                        log_data = message.model_dump()
-                        await self.socketio_server.emit('log:entry', log_data)
-                    except Exception as sio_err:
-                        log.error(f"Error broadcasting log via Socket.IO: {sio_err}")
-                        # Continue processing even if Socket.IO fails
+                        await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+
+                batch = self._take_batch()
+                if not batch:
+                    continue
+
+                # Broadcast via Socket.IO (primary method)
+                try:
+                    await self._emit_batch(batch)
+                except Exception as sio_err:
+                    log.error(f"Error broadcasting logs via Socket.IO: {sio_err}")
+                    # Continue processing even if Socket.IO fails
 
             except asyncio.CancelledError:
                 break
             except Exception as ex:
-                log.error(f"Error when broadcasting log message: {ex}")
+                log.error(f"Error when broadcasting log messages: {ex}")
                 # Log error internally (avoid infinite recursion)
                 # Just continue processing
                 pass
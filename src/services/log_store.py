@@ -0,0 +1,342 @@
+"""
+Log Store - persistent, memory-mapped ring of log records
+
+A single fixed-size file holds a small header followed by `capacity`
+fixed-size records (sequence, wall-clock time, level, category, message).
+Appends overwrite the oldest slot, so the file never grows, and writes go
+straight into the page cache - they survive a crash of the process.
+
+On open the record headers are scanned once to rebuild a per-category
+index (sequence numbers in time order), so queries by time range, level
+and category only touch matching records.
+
+Appends and queries hold a lock: the logger can be called from any thread
+(terminal writer, asyncio.to_thread workers).
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from models.enums import LogCategory, LogLevel
+from utils.logger import LEVEL_PRIORITY
+
+_MAGIC = b"DLOG"
+_VERSION = 1
+
+# magic, version, record size, capacity
+_FILE_HEADER = struct.Struct("<4sHHI")
+_DATA_OFFSET = 64
+
+# seq, timestamp, level priority, category id, message length (message bytes follow)
+_RECORD_HEADER = struct.Struct("<QdBBH")
+_SEQ = struct.Struct("<Q")
+_TIMESTAMP = struct.Struct("<d")
+
+_CATEGORIES: Tuple[LogCategory, ...] = tuple(LogCategory)
+_CATEGORY_IDS: Dict[str, int] = {c.name: i for i, c in enumerate(_CATEGORIES)}
+_LEVEL_NAMES: Dict[int, str] = {priority: level.name for level, priority in LEVEL_PRIORITY.items()}
+_LEVEL_IDS: Dict[str, int] = {level.name: priority for level, priority in LEVEL_PRIORITY.items()}
+
+
+class _SeqIndex:
+    """Ascending sequence numbers with O(1) amortized popleft and bisect support"""
+
+    __slots__ = ("seqs", "head")
+
+    def __init__(self):
+        self.seqs: List[int] = []
+        self.head = 0
+
+    def append(self, seq: int) -> None:
+        self.seqs.append(seq)
+
+    def popleft(self) -> None:
+        self.head += 1
+        if self.head > 4096 and self.head * 2 > len(self.seqs):
+            del self.seqs[:self.head]
+            self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.head
+
+
+class LogStore:
+    """
+    Fixed-size on-disk log ring with per-category index.
+
+    Example:
+        store = LogStore(Path("state/log_store.bin"), capacity=65_536)
+        store.append("INFO", "ZONE", "Zone FLOOR selected")
+        entries, next_before = store.query(min_level=LogLevel.WARN, categories=[LogCategory.ZONE])
+    """
+
+    def __init__(self, path: Path, capacity: int = 65_536, record_size: int = 256):
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        if record_size <= _RECORD_HEADER.size:
+            raise ValueError(f"record_size must be > {_RECORD_HEADER.size}, got {record_size}")
+
+        self.path = Path(path)
+        self.capacity = capacity
+        self.record_size = record_size
+        self.max_message_bytes = record_size - _RECORD_HEADER.size
+
+        self._lock = threading.Lock()
+        self._mm = self._open()
+        self._by_category = [_SeqIndex() for _ in _CATEGORIES]
+        self._first_seq = 1
+        self._last_seq = 0
+        self._rebuild_index()
+
+    # === File handling ===
+
+    def _open(self) -> mmap.mmap:
+        size = _DATA_OFFSET + self.capacity * self.record_size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            header = os.pread(fd, _FILE_HEADER.size, 0)
+            expected = _FILE_HEADER.pack(_MAGIC, _VERSION, self.record_size, self.capacity)
+            if header != expected or os.fstat(fd).st_size != size:
+                # New file or different layout - start empty
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+                os.pwrite(fd, expected, 0)
+            return mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def _offset(self, seq: int) -> int:
+        return _DATA_OFFSET + ((seq - 1) % self.capacity) * self.record_size
+
+    def _rebuild_index(self) -> None:
+        """Scan record headers once to restore sequence range and category index"""
+        records = []
+        unpack = _RECORD_HEADER.unpack_from
+        mm = self._mm
+        for slot in range(self.capacity):
+            seq, _, _, category_id, _ = unpack(mm, _DATA_OFFSET + slot * self.record_size)
+            if seq and category_id < len(_CATEGORIES):
+                records.append((seq, category_id))
+
+        if not records:
+            return
+        records.sort()
+
+        # Keep the newest contiguous run (a torn write or layout change leaves gaps)
+        start = len(records) - 1
+        while start > 0 and records[start - 1][0] == records[start][0] - 1:
+            start -= 1
+        records = records[start:]
+
+        self._first_seq = records[0][0]
+        self._last_seq = records[-1][0]
+        for seq, category_id in records:
+            self._by_category[category_id].append(seq)
+
+    def flush(self) -> None:
+        """Force dirty pages to disk (survives power loss, not just process crash)"""
+        self._mm.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._mm.closed:
+                self._mm.flush()
+                self._mm.close()
+
+    # === Writing ===
+
+    def append(self, level: str, category: str, message: str, timestamp: Optional[float] = None) -> int:
+        """
+        Append a record, overwriting the oldest when full. Returns its sequence.
+
+        Args:
+            level: LogLevel name
+            category: LogCategory name
+            message: Text, truncated to max_message_bytes of UTF-8
+            timestamp: Epoch seconds (default: now)
+        """
+        category_id = _CATEGORY_IDS.get(category, _CATEGORY_IDS[LogCategory.GENERAL.name])
+        data = message.encode("utf-8", "replace")[:self.max_message_bytes]
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            return self._append(_LEVEL_IDS.get(level, 0), category_id, data, timestamp)
+
+    def _append(self, level_id: int, category_id: int, data: bytes, timestamp: float) -> int:
+        seq = self._last_seq + 1
+        offset = self._offset(seq)
+        mm = self._mm
+
+        if seq - self._first_seq >= self.capacity:
+            evicted_category = mm[offset + 17]
+            self._by_category[evicted_category].popleft()
+            self._first_seq += 1
+
+        # Body first, sequence last: a torn write leaves the slot's old/zero seq
+        end = offset + _RECORD_HEADER.size
+        mm[end:end + len(data)] = data
+        _RECORD_HEADER.pack_into(mm, offset, 0, timestamp, level_id, category_id, len(data))
+        _SEQ.pack_into(mm, offset, seq)
+
+        self._last_seq = seq
+        self._by_category[category_id].append(seq)
+        return seq
+
+    # === Reading ===
+
+    def __len__(self) -> int:
+        return self._last_seq - self._first_seq + 1
+
+    def _timestamp(self, seq: int) -> float:
+        return _TIMESTAMP.unpack_from(self._mm, self._offset(seq) + 8)[0]
+
+    def _read(self, seq: int) -> Dict[str, Any]:
+        offset = self._offset(seq)
+        _, timestamp, level, category_id, length = _RECORD_HEADER.unpack_from(self._mm, offset)
+        start = offset + _RECORD_HEADER.size
+        return {
+            "seq": seq,
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "level": _LEVEL_NAMES.get(level, LogLevel.INFO.name),
+            "category": _CATEGORIES[category_id].name,
+            "message": self._mm[start:start + length].decode("utf-8", "replace"),
+        }
+
+    def _walk_all(self, upper: int) -> Iterable[int]:
+        return range(upper, self._first_seq - 1, -1)
+
+    def _walk_category(self, index: _SeqIndex, upper: int) -> Iterable[int]:
+        seqs = index.seqs
+        pos = bisect_right(seqs, upper, lo=index.head)
+        return (seqs[i] for i in range(pos - 1, index.head - 1, -1))
+
+    def _upper_bound(self, until: Optional[float], before_seq: Optional[int]) -> int:
+        upper = self._last_seq
+        if before_seq is not None:
+            upper = min(upper, before_seq - 1)
+        if until is not None and upper >= self._first_seq:
+            # Timestamps are appended in (wall-clock) order - bisect over the ring
+            seqs = range(self._first_seq, upper + 1)
+            upper = self._first_seq + bisect_right(seqs, until, key=self._timestamp) - 1
+        return upper
+
+    def query(
+        self,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        min_level: Optional[LogLevel] = None,
+        categories: Optional[Iterable[LogCategory]] = None,
+        limit: int = 100,
+        before_seq: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Newest matching records (returned oldest first) plus a paging cursor.
+
+        Args:
+            since: Only records at/after this epoch time
+            until: Only records at/before this epoch time
+            min_level: Only records at or above this level
+            categories: Only these categories (walks their index chains)
+            limit: Maximum number of records
+            before_seq: Only records older than this sequence (paging cursor)
+
+        Returns:
+            (records, next_before_seq) - pass next_before_seq back to get the
+            previous page; None when there are no more matching records.
+        """
+        with self._lock:
+            return self._query(since, until, min_level, categories, limit, before_seq)
+
+    def _query(
+        self,
+        since: Optional[float],
+        until: Optional[float],
+        min_level: Optional[LogLevel],
+        categories: Optional[Iterable[LogCategory]],
+        limit: int,
+        before_seq: Optional[int],
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        upper = self._upper_bound(until, before_seq)
+        min_priority = LEVEL_PRIORITY[min_level] if min_level is not None else 0
+        mm = self._mm
+
+        if categories is None:
+            walks = [self._walk_all(upper)]
+        else:
+            walks = [self._walk_category(self._by_category[_CATEGORY_IDS[c.name]], upper) for c in categories]
+
+        found: List[int] = []
+        for walk in walks:
+            taken = 0
+            for seq in walk:
+                if seq < self._first_seq:
+                    break
+                offset = self._offset(seq)
+                if since is not None and _TIMESTAMP.unpack_from(mm, offset + 8)[0] < since:
+                    break
+                if mm[offset + 16] < min_priority:
+                    continue
+                found.append(seq)
+                taken += 1
+                if taken > limit:
+                    break
+
+        found.sort(reverse=True)
+        more = len(found) > limit
+        page = found[:limit]
+        page.reverse()
+        next_before = page[0] if more and page else None
+        return [self._read(seq) for seq in page], next_before
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._stats()
+
+    def _stats(self) -> Dict[str, Any]:
+        size = len(self)
+        return {
+            "path": str(self.path),
+            "capacity": self.capacity,
+            "record_size": self.record_size,
+            "size": size,
+            "first_seq": self._first_seq if size else None,
+            "last_seq": self._last_seq if size else None,
+            "oldest": datetime.fromtimestamp(self._timestamp(self._first_seq)).isoformat() if size else None,
+            "by_category": {
+                _CATEGORIES[i].name: len(index) for i, index in enumerate(self._by_category) if len(index)
+            },
+        }
+
+
+# Global instance (set by main_asyncio when persistent logging is enabled)
+_store: Optional[LogStore] = None
+
+
+def get_log_store() -> Optional[LogStore]:
+    """
+    Get the global LogStore instance.
+
+    Returns:
+        The LogStore, or None if persistent logging is not enabled
+    """
+    return _store
+
+
+def set_log_store(store: Optional[LogStore]) -> None:
+    """
+    Set the global LogStore instance.
+
+    Args:
+        store: The LogStore instance (None to disable)
+    """
+    global _store
+    _store = store
@@ -0,0 +1,192 @@
+"""
+Metrics Exporter - OpenMetrics text exposition for GET /metrics.
+
+Nothing is collected here: FrameManager, EventBus, TaskRegistry and the
+loop lag monitor keep their counters and histograms in place on the hot
+path, and this module only reads and formats them when a scraper asks.
+
+Exported families (all prefixed "diuna_"):
+- frame_*        FrameManager fps, rendered / skipped / dropped frames,
+                 pending frames, per-stage render latency histograms
+- event_*        EventBus published events per type, queue depth and
+                 counters, handler latency per event type
+- tasks_*        TaskRegistry running tasks per category, lifetime counts
+- loop_*         Event loop lag histogram and stalls
+"""
+
+from typing import Dict, List, Optional, Sequence, Union
+
+from lifecycle.task_registry import TaskRegistry
+from runtime.loop_monitor import LAG_BUCKETS_MS, LoopLagMonitor
+from services.service_container import ServiceContainer
+from utils.metrics import Histogram
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+PREFIX = "diuna_"
+
+Number = Union[int, float]
+Labels = Optional[Dict[str, str]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: Number) -> str:
+    if isinstance(value, float):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value)
+    return str(value)
+
+
+class _Writer:
+    """Accumulates exposition lines; one family (TYPE/HELP header) at a time"""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> str:
+        name = PREFIX + name
+        self.lines.append(f"# TYPE {name} {kind}")
+        self.lines.append(f"# HELP {name} {help_text}")
+        return name
+
+    def sample(self, name: str, value: Number, labels: Labels = None) -> None:
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            self.lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+        else:
+            self.lines.append(f"{name} {_format_value(value)}")
+
+    def gauge(self, name: str, help_text: str, value: Number) -> None:
+        self.sample(self.family(name, "gauge", help_text), value)
+
+    def counter(self, name: str, help_text: str, value: Number) -> None:
+        self.sample(self.family(name, "counter", help_text) + "_total", value)
+
+    def histogram_samples(
+        self,
+        name: str,
+        bounds: Sequence[float],
+        counts: Sequence[int],
+        total: float,
+        labels: Labels = None,
+    ) -> None:
+        """Samples of one histogram; counts are per bucket (last = +Inf) and made cumulative here"""
+        cumulative = 0
+        for bound, count in zip((*bounds, float("inf")), counts):
+            cumulative += count
+            self.sample(f"{name}_bucket", cumulative, {**(labels or {}), "le": _format_value(float(bound))})
+        self.sample(f"{name}_count", cumulative, labels)
+        self.sample(f"{name}_sum", total, labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n# EOF\n"
+
+
+class MetricsExporter:
+    """Formats the current state of the render, event, task and loop metrics"""
+
+    def __init__(
+        self,
+        services: ServiceContainer,
+        task_registry: Optional[TaskRegistry] = None,
+        loop_monitor: Optional[LoopLagMonitor] = None,
+    ):
+        self.services = services
+        self.task_registry = task_registry
+        self.loop_monitor = loop_monitor
+
+    def render(self) -> str:
+        out = _Writer()
+        self._frame_metrics(out)
+        self._event_metrics(out)
+        if self.task_registry is not None:
+            self._task_metrics(out)
+        if self.loop_monitor is not None:
+            self._loop_metrics(out)
+        return out.text()
+
+    # === FrameManager ===
+
+    def _frame_metrics(self, out: _Writer) -> None:
+        fm = self.services.frame_manager
+        out.gauge("frame_fps_target", "Target render rate", fm.fps)
+        out.gauge("frame_fps_actual", "Measured render rate over recent frames", round(fm.get_actual_fps(), 3))
+        out.counter("frame_rendered", "Frames rendered to the LED channels", fm.frames_rendered)
+        out.counter("frame_dma_skipped", "Frames skipped because the output did not change", fm.dma_skipped)
+        out.counter("frame_dropped", "Frames dropped by the render loop", fm.dropped_frames)
+        out.gauge("frame_pending", "Frames waiting in the priority queues", sum(len(q) for q in fm.main_queues.values()))
+
+        name = out.family("frame_stage_seconds", "histogram", "Render pipeline stage latency")
+        for stage, histogram in fm.stage_latency.items():
+            self._histogram(out, name, histogram, {"stage": stage})
+
+    @staticmethod
+    def _histogram(out: _Writer, name: str, histogram: Histogram, labels: Labels) -> None:
+        out.histogram_samples(name, histogram.bounds, histogram.counts, histogram.sum, labels)
+
+    # === EventBus ===
+
+    def _event_metrics(self, out: _Writer) -> None:
+        bus = self.services.event_bus
+        queue = bus.get_queue_metrics()
+
+        name = out.family("event_published", "counter", "Events published, by event type")
+        for event_type, count in bus.history.stats()["totals_by_type"].items():
+            out.sample(name + "_total", count, {"type": event_type})
+
+        name = out.family("event_queue_depth", "gauge", "Events waiting in the dispatch queue, by worker")
+        for worker, depth in enumerate(queue["depth_per_worker"]):
+            out.sample(name, depth, {"worker": str(worker)})
+        out.gauge("event_queue_high_water", "Highest dispatch queue depth seen", queue["high_water"])
+
+        for key, help_text in (
+            ("enqueued", "Events accepted by the dispatch queue"),
+            ("dispatched", "Events dispatched by queue workers"),
+            ("dropped", "Events dropped by the overflow policy"),
+            ("coalesced", "Events merged into an already queued event"),
+            ("blocked", "Enqueues that waited for queue space"),
+        ):
+            out.counter(f"event_queue_{key}", help_text, queue[key])
+
+        name = out.family("event_handler_seconds", "summary", "Handler time per dispatched event, by event type")
+        for event_type, (count, total, _) in bus.get_handler_latency().items():
+            labels = {"type": event_type.name}
+            out.sample(name + "_count", count, labels)
+            out.sample(name + "_sum", total, labels)
+
+    # === TaskRegistry ===
+
+    def _task_metrics(self, out: _Writer) -> None:
+        registry = self.task_registry
+
+        name = out.family("tasks_active", "gauge", "Running tracked tasks, by category")
+        for category, count in sorted(registry.active_by_category().items()):
+            out.sample(name, count, {"category": category})
+
+        name = out.family("tasks_finished", "counter", "Tracked tasks finished, by category and outcome")
+        counters = registry.get_counters()
+        for category, counts in sorted(counters.items()):
+            for status in ("completed", "failed", "cancelled"):
+                out.sample(name + "_total", counts[status], {"category": category, "status": status})
+
+        name = out.family("tasks_created", "counter", "Tracked tasks created, by category")
+        for category, counts in sorted(counters.items()):
+            out.sample(name + "_total", counts["created"], {"category": category})
+
+    # === Event loop ===
+
+    def _loop_metrics(self, out: _Writer) -> None:
+        monitor = self.loop_monitor
+        name = out.family("loop_lag_seconds", "histogram", "Event loop wake-up lag")
+        out.histogram_samples(
+            name,
+            [bound / 1000 for bound in LAG_BUCKETS_MS],
+            monitor.bucket_counts,
+            monitor.lag_sum_ms / 1000,
+        )
+        out.gauge("loop_lag_max_seconds", "Largest event loop lag seen", monitor.max_lag_ms / 1000)
+        out.counter("loop_stalls", "Event loop lags above the stall threshold", monitor.stalls_total)
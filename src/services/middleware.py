@@ -3,8 +3,12 @@ Middleware for EventBus
 
 Middleware = pipeline functions that process events before handlers.
 Can modify events, block events, or log/validate events.
+
+A middleware may declare an `is_active` callable attribute; EventBus skips
+it while is_active() returns False (e.g. logging when DEBUG is off).
 """
 
+from models.enums import LogLevel
 from models.events import Event
 from utils.logger import get_logger, LogCategory
 from utils.serialization import Serializer
@@ -33,3 +37,7 @@ def log_middleware(event: Event) -> Event:
         f"Event: {event.type.name} from {source_str} | {data_str}"
     )
     return event
+
+
+# Only format events when DEBUG output is actually enabled
+log_middleware.is_active = lambda: log.is_enabled_for(LogLevel.DEBUG)  # type: ignore[attr-defined]
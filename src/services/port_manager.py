@@ -2,48 +2,85 @@
 Port management service for ensuring clean port binding.
 
 Provides PortManager singleton for:
-1. Port availability checking
-2. Finding processes using specific ports
-3. Force-freeing orphaned ports (recovery from crashes)
-4. Pre-startup port cleanup with automatic retry logic
+1. Listening sockets for the API server - inherited from systemd socket
+   activation, or bound with SO_REUSEADDR (+ SO_REUSEPORT)
+2. Port availability checking
+3. Finding processes using specific ports
+4. Force-freeing orphaned ports (recovery from crashes)
 
 Used to prevent "Address already in use" crashes when previous
 application instance left port orphaned due to Starlette lifespan bug
 or was suspended with Ctrl+Z.
 
+Everything is native (no lsof / fuser / kill subprocesses): listening
+sockets are read from /proc/net/tcp and /proc/net/tcp6, matched to their
+owners through the socket inodes in /proc/[pid]/fd, and signalled with
+os.kill. Connections left in TIME_WAIT by a previous run never block the
+bind (SO_REUSEADDR), so there is nothing to wait for.
+
 Note: This application runs with sudo privileges due to ws281x library
-requirements. Port cleanup commands also run with sudo context.
+requirements, so /proc/[pid]/fd of other users' processes is readable.
 
 Usage:
     port_mgr = PortManager.instance()
-    await port_mgr.ensure_available(port=8000)
+    sock = await port_mgr.open_listen_socket(port=8000)
+    APIServerWrapper(app, host="0.0.0.0", port=8000, sock=sock)
 """
 
-import socket
-import subprocess
 import asyncio
-from typing import Optional
+import errno
+import os
+import signal
+import socket
+from typing import Iterable, List, MutableMapping, Optional, Set
 from utils.logger import get_logger, LogCategory
 
 log = get_logger().for_category(LogCategory.SHUTDOWN)
 
+# systemd socket activation: inherited fds start at 3 (sd_listen_fds(3))
+SD_LISTEN_FDS_START = 3
+
+PROC_NET_TCP = ("/proc/net/tcp", "/proc/net/tcp6")
+TCP_LISTEN = "0A"
+
+
+def parse_listening_inodes(lines: Iterable[str], port: int) -> Set[int]:
+    """
+    Socket inodes listening on port, from /proc/net/tcp{,6} lines.
+
+    Line format (header skipped by the caller):
+        sl local_address rem_address st tx:rx tr:when retrnsmt uid timeout inode ...
+        0: 00000000:1F40 00000000:0000 0A ...
+    """
+    inodes = set()
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 10 or fields[3] != TCP_LISTEN:
+            continue
+        try:
+            if int(fields[1].rsplit(":", 1)[1], 16) == port:
+                inodes.add(int(fields[9]))
+        except (IndexError, ValueError):
+            continue
+    return inodes
+
 
 class PortManager:
     """
     Singleton service for managing port availability and cleanup.
 
     Handles:
-    - Port availability checking with timeout protection
+    - Listening socket creation (systemd-inherited or SO_REUSEADDR/SO_REUSEPORT)
+    - Port availability checking without bind attempts
     - Process detection (handles suspended processes)
-    - Force-freeing orphaned ports with retry logic
-    - Automatic recovery from crashes/orphaned sockets
+    - Force-freeing orphaned ports
     """
 
     _instance: Optional["PortManager"] = None
 
     def __init__(self):
         """Initialize port manager singleton."""
-        pass
+        self._inherited: Optional[List[socket.socket]] = None
 
     @classmethod
     def instance(cls) -> "PortManager":
@@ -56,12 +93,104 @@ class PortManager:
     # PUBLIC API
     # ==========================================================================
 
+    async def open_listen_socket(
+        self,
+        port: int,
+        host: str = "0.0.0.0",
+        reuse_port: bool = True,
+        backlog: int = 2048,
+    ) -> socket.socket:
+        """
+        Get a listening socket for the API server.
+
+        1. A socket passed by systemd socket activation for this port is used as is
+           (the port was never released, restarts need no cleanup at all)
+        2. Otherwise bind with SO_REUSEADDR (TIME_WAIT connections do not block)
+           and SO_REUSEPORT (an orphan of a previous run that also set it does not
+           block either; it is left running and reported, as it may be another
+           service sharing the port on purpose)
+        3. If the port is held by a process without SO_REUSEPORT, free it and bind again
+
+        Args:
+            port: Port to listen on
+            host: Host address to bind (default: any interface)
+            reuse_port: Set SO_REUSEPORT where supported
+            backlog: listen() backlog (uvicorn default)
+
+        Raises:
+            RuntimeError: If the port is held and could not be freed
+        """
+        inherited = self.get_inherited_socket(port)
+        if inherited is not None:
+            log.info(f"Using listening socket for port {port} passed by systemd (fd {inherited.fileno()})")
+            return inherited
+
+        try:
+            sock = self._bind(host, port, reuse_port, backlog)
+        except OSError as e:
+            if e.errno != errno.EADDRINUSE:
+                raise
+            await self.ensure_available(port, host)
+            sock = self._bind(host, port, reuse_port, backlog)
+            return sock
+
+        # Bound next to another listener (SO_REUSEPORT): it shares our connections
+        own_inode = os.fstat(sock.fileno()).st_ino
+        if self._listening_inodes(port) - {own_inode}:
+            pids = [pid for pid in self.find_processes_on_port(port) if pid != os.getpid()]
+            log.warn(f"Port {port} is shared with another SO_REUSEPORT listener (PIDs: {pids or 'unknown'})")
+        return sock
+
+    def listen_fds(self, environ: Optional[MutableMapping[str, str]] = None, start: int = SD_LISTEN_FDS_START) -> List[socket.socket]:
+        """
+        Sockets passed by systemd socket activation (LISTEN_PID / LISTEN_FDS).
+
+        Adopted once per process; the variables are removed from the
+        environment afterwards so child processes do not claim the fds.
+
+        Args:
+            environ: Environment to read (default: os.environ)
+            start: First inherited fd (SD_LISTEN_FDS_START)
+        """
+        if self._inherited is not None:
+            return self._inherited
+
+        env = os.environ if environ is None else environ
+        self._inherited = []
+        if env.get("LISTEN_PID") != str(os.getpid()):
+            return self._inherited
+
+        try:
+            count = int(env.get("LISTEN_FDS", "0"))
+        except ValueError:
+            count = 0
+        for fd in range(start, start + count):
+            try:
+                self._inherited.append(socket.socket(fileno=fd))
+            except OSError as e:
+                log.warn(f"Ignoring inherited fd {fd}: {e}")
+
+        for key in ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"):
+            env.pop(key, None)
+        return self._inherited
+
+    def get_inherited_socket(self, port: int) -> Optional[socket.socket]:
+        """Inherited listening TCP socket bound to port, if any."""
+        for sock in self.listen_fds():
+            try:
+                if sock.type == socket.SOCK_STREAM and sock.getsockname()[1] == port:
+                    return sock
+            except (OSError, IndexError):
+                continue
+        return None
+
     async def is_port_in_use(self, port: int, host: str = "0.0.0.0") -> bool:
         """
-        Check if a port is currently in use.
+        Check if a port is currently in use (something is listening on it).
 
-        Uses an async executor with timeout to prevent hanging on suspended
-        processes (e.g., from Ctrl+Z).
+        Reads /proc/net/tcp{,6}: no bind attempt, so it cannot hang on
+        suspended processes and ignores TIME_WAIT leftovers. Falls back to a
+        SO_REUSEADDR bind test where /proc is unavailable.
 
         Args:
             port: Port number to check (0-65535)
@@ -70,41 +199,56 @@ class PortManager:
         Returns:
             True if port is in use, False if available
         """
-        def _check_port():
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.settimeout(0.5)  # Quick timeout
-                    s.bind((host, port))
-                    return False  # Successfully bound = port is free
-            except socket.timeout:
-                return True  # Timeout = port in use (likely suspended)
-            except OSError:
-                return True  # OSError = port in use
+        if os.path.exists(PROC_NET_TCP[0]):
+            return bool(self._listening_inodes(port))
 
         try:
-            # Run socket check in executor with overall timeout
-            loop = asyncio.get_event_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(None, _check_port),
-                timeout=2.0  # 2-second overall timeout
-            )
-            return result
-        except asyncio.TimeoutError:
-            log.warn(f"Port {port} check timed out - assuming in use")
-            return True
-        except Exception as e:
-            log.error(f"Error checking port {port}: {e}")
-            return True
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                s.bind((host, port))
+                return False  # Successfully bound = port is free
+        except OSError:
+            return True  # OSError = port in use
+
+    def find_processes_on_port(self, port: int) -> List[int]:
+        """
+        Find the PIDs holding a listening socket on port.
 
-    def find_process_on_port(self, port: int) -> Optional[int]:
+        Matches the listening socket inodes from /proc/net/tcp{,6} against
+        the fds in /proc/[pid]/fd (processes whose fds cannot be read are
+        skipped). Works for running and suspended processes alike.
+
+        Args:
+            port: Port number to check
+
+        Returns:
+            PIDs (may include this process)
         """
-        Find process ID (PID) using a specific port.
+        inodes = self._listening_inodes(port)
+        if not inodes:
+            return []
+        targets = {f"socket:[{inode}]" for inode in inodes}
 
-        Tries multiple detection methods:
-        1. `lsof` - standard approach
-        2. `fuser` - fallback if lsof fails or hangs
+        pids = []
+        try:
+            entries = os.scandir("/proc")
+        except OSError:
+            return []
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with os.scandir(f"/proc/{entry.name}/fd") as fds:
+                        if any(os.readlink(fd.path) in targets for fd in fds):
+                            pids.append(int(entry.name))
+                except OSError:
+                    continue  # exited meanwhile, or not ours to inspect
+        return pids
 
-        Handles both active and suspended processes (from Ctrl+Z).
+    def find_process_on_port(self, port: int) -> Optional[int]:
+        """
+        Find process ID (PID) using a specific port (other than this process).
 
         Args:
             port: Port number to check
@@ -112,126 +256,88 @@ class PortManager:
         Returns:
             PID if found, None otherwise
         """
-        # Try method 1: lsof
-        pid = self._try_lsof_detection(port)
-        if pid is not None:
-            return pid
-
-        # Fallback: Try method 2: fuser
-        pid = self._try_fuser_detection(port)
-        if pid is not None:
-            return pid
-
+        own_pid = os.getpid()
+        for pid in self.find_processes_on_port(port):
+            if pid != own_pid:
+                return pid
         return None
 
-    async def ensure_available(self, port: int, host: str = "0.0.0.0") -> None:
+    async def ensure_available(self, port: int, host: str = "0.0.0.0", timeout: float = 2.0) -> None:
         """
         Ensure port is available for binding, force-freeing if necessary.
 
-        Multi-stage cleanup process:
-        1. Force-free any process holding the port
-        2. Wait for OS cleanup (if port in TIME_WAIT state)
-        3. Retry with delays
-        4. Final fallback: fuser -k
-
-        Handles:
-        - Active processes (SIGKILL)
-        - Suspended processes (SIGCONT then SIGKILL)
-        - Ports in TIME_WAIT state (graceful waiting)
-        - Uvicorn/Starlette lifespan task leaks (forced cleanup)
+        Every other process listening on the port is killed (SIGCONT first
+        if suspended, then SIGKILL); the listening socket disappears as soon
+        as the process exits, which is polled for instead of fixed sleeps.
 
         Args:
             port: Port to ensure availability (0-65535)
             host: Host address to bind (default: any interface)
+            timeout: Seconds to wait for killed processes to release the port
 
         Raises:
-            RuntimeError: If port cannot be freed after all cleanup attempts
+            RuntimeError: If port cannot be freed
         """
         if not await self.is_port_in_use(port, host):
-            log.debug(f"Port {port} is available")
+            log.debug("Port %s is available", port)
             return
 
-        log.warn(f"Port {port} is occupied, attempting cleanup...")
+        own_pid = os.getpid()
+        pids = [pid for pid in self.find_processes_on_port(port) if pid != own_pid]
+        if not pids:
+            raise RuntimeError(
+                f"Port {port} is in use but its owner could not be found "
+                f"(another user's process without root, another network namespace, or this process). "
+                f"Try: ss -ltnp 'sport = :{port}'"
+            )
 
-        # Stage 1: Try to force-free any active process
-        if await self._attempt_force_free_port(port, host):
-            return
+        log.warn(f"Port {port} is occupied by PID(s) {pids}, force-freeing...")
+        for pid in pids:
+            self._kill_process(pid, port)
 
-        # Stage 2: Wait for OS cleanup (TIME_WAIT state)
-        if await self._attempt_wait_for_cleanup(port, host):
+        if await self._wait_until_free(port, host, timeout):
+            log.info(f"✓ Port {port} successfully freed")
             return
 
-        # Stage 3: Final fallback with fuser
-        if await self._attempt_fuser_final(port, host):
-            return
-        
-        log.warn(
-            "Port still in use after shutdown (likely TIME_WAIT). "
-            "This is safe on Linux."
-        )
-        
-        # Failed - port still in use
         raise RuntimeError(
-            f"Port {port} is in use and could not be freed after all cleanup attempts. "
+            f"Port {port} is in use and could not be freed within {timeout:.1f}s. "
             f"A previous application instance may still be running or in an orphaned state. "
-            f"Try: sudo fuser -k {port}/tcp  or  lsof -i :{port}"
+            f"Try: ss -ltnp 'sport = :{port}'"
         )
 
     # ==========================================================================
-    # PRIVATE HELPERS - Process Detection
+    # PRIVATE HELPERS - Socket Inspection
     # ==========================================================================
 
-    def _try_lsof_detection(self, port: int) -> Optional[int]:
-        """
-        Try to find process PID using lsof command.
-
-        Args:
-            port: Port number to check
-
-        Returns:
-            PID if found, None otherwise
-        """
-        try:
-            result = subprocess.run(
-                ["lsof", "-ti", f":{port}"],
-                capture_output=True,
-                text=True,
-                timeout=1  # Shorter timeout to avoid hanging on suspended process
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    return int(result.stdout.strip().split()[0])
-                except (ValueError, IndexError):
-                    pass
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        return None
-
-    def _try_fuser_detection(self, port: int) -> Optional[int]:
-        """
-        Try to find process PID using fuser command (fallback).
-
-        Args:
-            port: Port number to check
-
-        Returns:
-            PID if found, None otherwise
-        """
+    @staticmethod
+    def _listening_inodes(port: int) -> Set[int]:
+        """Inodes of sockets listening on port (IPv4 and IPv6)."""
+        inodes: Set[int] = set()
+        for path in PROC_NET_TCP:
+            try:
+                with open(path, "r") as f:
+                    next(f, None)  # header
+                    inodes |= parse_listening_inodes(f, port)
+            except OSError:
+                continue
+        return inodes
+
+    @staticmethod
+    def _bind(host: str, port: int, reuse_port: bool, backlog: int) -> socket.socket:
+        """Create, bind and listen; closes the socket on failure."""
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
         try:
-            result = subprocess.run(
-                ["fuser", f"{port}/tcp"],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    return int(result.stdout.strip().split()[0])
-                except (ValueError, IndexError):
-                    pass
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        return None
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port and hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind((host, port))
+            sock.listen(backlog)
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+        return sock
 
     # ==========================================================================
     # PRIVATE HELPERS - Process State Management
@@ -255,128 +361,13 @@ class PortManager:
         """
         try:
             with open(f"/proc/{pid}/stat", "r") as f:
-                # Format: pid (comm) state ...
-                parts = f.read().split()
-                if len(parts) > 2:
-                    return parts[2]  # 3rd field is state
-        except (FileNotFoundError, OSError):
+                # Format: pid (comm) state ... (comm may contain spaces)
+                return f.read().rsplit(")", 1)[1].split()[0]
+        except (OSError, IndexError):
             pass
         return None
 
-    async def _send_signal_to_process(self, pid: int, signal: str) -> bool:
-        """
-        Send a signal to a process.
-
-        Args:
-            pid: Process ID
-            signal: Signal name (e.g., "-CONT", "-9")
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            subprocess.run(["kill", signal, str(pid)], timeout=1)
-            await asyncio.sleep(0.1)
-            return True
-        except Exception as e:
-            log.debug(f"Failed to send signal {signal} to {pid}: {e}")
-            return False
-
-    # ==========================================================================
-    # PRIVATE HELPERS - Port Cleanup Stages
-    # ==========================================================================
-
-    async def _attempt_force_free_port(self, port: int, host: str) -> bool:
-        """
-        Stage 1: Try to force-free any active process holding the port.
-
-        Handles:
-        - Active processes (SIGKILL)
-        - Suspended processes (SIGCONT then SIGKILL)
-
-        Args:
-            port: Port to free
-            host: Host address
-
-        Returns:
-            True if port was successfully freed, False if still in use
-        """
-        if not await self.is_port_in_use(port, host):
-            return True
-
-        log.warn(f"Port {port} is in use, attempting to force-free...")
-
-        # Try to find and kill the process
-        pid = self.find_process_on_port(port)
-        if pid:
-            await self._kill_process(pid, port)
-            # Verify port is free (with quick retries)
-            return await self._verify_port_free(port, host, attempts=3)
-
-        # Process not found - maybe already exited but port not released yet
-        log.warn(f"Port {port} in use but process not found, trying direct fuser...")
-        try:
-            subprocess.run(["fuser", "-k", f"{port}/tcp"], timeout=1)
-            await asyncio.sleep(0.5)
-            return not await self.is_port_in_use(port, host)
-        except Exception as e:
-            log.debug(f"fuser attempt failed: {e}")
-            return False
-
-    async def _attempt_wait_for_cleanup(self, port: int, host: str) -> bool:
-        """
-        Stage 2: Wait for OS cleanup (if port in TIME_WAIT state).
-
-        This handles the case where the process has exited but the OS
-        hasn't released the port from TIME_WAIT state yet.
-
-        Args:
-            port: Port to check
-            host: Host address
-
-        Returns:
-            True if port became available, False if still in use
-        """
-        log.warn(f"Port {port} still in use (possibly TIME_WAIT), waiting for OS cleanup...")
-
-        for attempt in range(3):
-            await asyncio.sleep(1.0)  # Wait 1 second between retries
-            if not await self.is_port_in_use(port, host):
-                log.info(f"✓ Port {port} is now available")
-                return True
-            log.debug(f"Port {port} still in use, retrying... (attempt {attempt + 1}/3)")
-
-        return False
-
-    async def _attempt_fuser_final(self, port: int, host: str) -> bool:
-        """
-        Stage 3: Final fallback with fuser -k as absolute last resort.
-
-        Args:
-            port: Port to free
-            host: Host address
-
-        Returns:
-            True if port became available, False if still in use
-        """
-        log.error(f"Port {port} still in use, using fuser -k as final attempt...")
-
-        try:
-            subprocess.run(["fuser", "-k", f"{port}/tcp"], timeout=2)
-            await asyncio.sleep(1.0)
-            if not await self.is_port_in_use(port, host):
-                log.info(f"✓ Port {port} finally freed")
-                return True
-        except Exception as e:
-            log.debug(f"Final fuser attempt failed: {e}")
-
-        return False
-
-    # ==========================================================================
-    # PRIVATE HELPERS - Process Killing
-    # ==========================================================================
-
-    async def _kill_process(self, pid: int, port: int) -> None:
+    def _kill_process(self, pid: int, port: int) -> None:
         """
         Kill a process holding a port.
 
@@ -388,42 +379,24 @@ class PortManager:
             pid: Process ID to kill
             port: Port number (for logging)
         """
-        # Check if process is suspended
-        state = self._get_process_state(pid)
-        if state == 'T':
-            log.warn(f"Process {pid} is suspended (Ctrl+Z detected), resuming with SIGCONT...")
-            await self._send_signal_to_process(pid, "-CONT")
-
-        # Send SIGKILL
-        log.warn(f"Found process {pid} using port {port}, sending SIGKILL...")
         try:
-            subprocess.run(["kill", "-9", str(pid)], timeout=1)
-            await asyncio.sleep(0.5)  # Wait for OS cleanup
-            log.debug(f"Process {pid} killed")
-        except Exception as e:
+            if self._get_process_state(pid) == "T":
+                log.warn(f"Process {pid} is suspended (Ctrl+Z detected), resuming with SIGCONT...")
+                os.kill(pid, signal.SIGCONT)
+
+            log.warn(f"Found process {pid} using port {port}, sending SIGKILL...")
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            log.debug("Process %s already exited", pid)
+        except PermissionError as e:
             log.error(f"Failed to kill process {pid}: {e}")
 
-    async def _verify_port_free(
-        self, port: int, host: str, attempts: int = 3
-    ) -> bool:
-        """
-        Verify that a port is free (with retries).
-
-        Args:
-            port: Port to verify
-            host: Host address
-            attempts: Number of retry attempts
-
-        Returns:
-            True if port is free, False if still in use
-        """
-        for attempt in range(attempts):
-            await asyncio.sleep(0.2)
-            if not await self.is_port_in_use(port, host):
-                log.info(f"✓ Port {port} successfully freed")
-                return True
-            if attempt < attempts - 1:
-                log.debug(f"Port {port} still in use, verifying... (attempt {attempt + 1}/{attempts})")
-
-        log.error(f"Port {port} still in use after cleanup attempts")
-        return False
+    async def _wait_until_free(self, port: int, host: str, timeout: float, poll: float = 0.01) -> bool:
+        """Poll until nothing listens on port (True) or timeout expires (False)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while await self.is_port_in_use(port, host):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(poll)
+        return True
@@ -1,6 +1,7 @@
 """Service Container - Dependency injection container for all core services"""
 
 from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
 from managers.config_manager import ConfigManager
 from services.zone_service import ZoneService
 from services.animation_service import AnimationService
@@ -10,6 +11,9 @@ from engine.frame_manager import FrameManager
 from managers.color_manager import ColorManager
 from services.data_assembler import DataAssembler
 
+if TYPE_CHECKING:
+    from services.snapshot_publisher import SnapshotPublisher
+
 @dataclass
 class ServiceContainer:
     """
@@ -25,6 +29,7 @@ class ServiceContainer:
     - app_state_service: Application-level state and mode management
     - frame_manager: Centralized rendering system with priority queues
     - event_bus: Pub-sub event routing for decoupling components
+    - snapshot_publisher: Cached UI zone snapshots (optional)
 
     Managers included:
     - color_manager: Color preset lookup and management
@@ -65,3 +70,5 @@ class ServiceContainer:
     config_manager: ConfigManager
     
     data_assembler: DataAssembler
+
+    snapshot_publisher: Optional["SnapshotPublisher"] = None
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
 from api.socketio.zones.dto import ZoneSnapshotDTO
+from models.domain.zone import ZoneCombined, ZoneState
 from services.zone_service import ZoneService
 from services.event_bus import EventBus
+from services.event_coalescing import UI_FRAME_MS
 from models.events.types import EventType
 from models.events.zone_snapshot_events import ZoneSnapshotUpdatedEvent
 from models.enums import ZoneID
@@ -11,6 +19,23 @@ from utils.logger import get_logger, LogCategory
 log = get_logger().for_category(LogCategory.SNAPSHOT)
 
 
+@dataclass
+class CachedSnapshot:
+    """One zone snapshot, built and serialized once per state version"""
+    state: ZoneState                 # state object the snapshot was built from
+    version: int
+    snapshot: ZoneSnapshotDTO
+    payload: Dict[str, Any]          # asdict(snapshot), shared by every emit
+    etag: str
+    _json: Optional[bytes] = field(default=None, repr=False)
+
+    @property
+    def json(self) -> bytes:
+        if self._json is None:
+            self._json = json.dumps(self.payload, separators=(",", ":")).encode()
+        return self._json
+
+
 class SnapshotPublisher:
     """
     Publishes UI-facing ZoneSnapshotUpdatedEvent
@@ -18,8 +43,9 @@ class SnapshotPublisher:
 
     Responsibilities:
     - listen to zone-related domain events
-    - build ZoneSnapshot from current ZoneService state
-    - publish snapshot event for frontend / websocket layer
+    - keep one cached snapshot per zone, rebuilt only when ZoneState.version changes
+    - publish changed snapshots at most once per UI frame per zone
+    - serve the same cache to the connect-time zones:snapshot and REST (ETags)
     """
 
     def __init__(
@@ -27,9 +53,22 @@ class SnapshotPublisher:
         *,
         zone_service: ZoneService,
         event_bus: EventBus,
+        flush_interval_ms: float = UI_FRAME_MS,
     ):
         self.zone_service = zone_service
         self.event_bus = event_bus
+        self.flush_interval = flush_interval_ms / 1000
+
+        # ETags must not repeat across restarts (versions start over)
+        self._epoch = format(time.time_ns() // 1_000_000, "x")
+        self._cache: Dict[ZoneID, CachedSnapshot] = {}
+        self._published: Dict[ZoneID, CachedSnapshot] = {}
+        self._dirty: Set[ZoneID] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._last_flush = 0.0
+
+        self.snapshots_built = 0
+        self.snapshots_published = 0
 
         self._subscribe()
 
@@ -48,52 +87,95 @@ class SnapshotPublisher:
             EventType.ANIMATION_PARAMETER_CHANGED,
         ):
             self.event_bus.subscribe(event_type, self._on_zone_changed)
-            
-            
-    async def _on_zone_changed(self, event) -> None:
-        zone_id: ZoneID | None = getattr(event, "zone_id", None)
-        if not zone_id:
-            return
+        self.event_bus.subscribe(EventType.ZONE_STATIC_BATCH_CHANGED, self._on_zone_batch_changed)
 
-        zone = self.zone_service.get_zone(zone_id)
-        if not zone:
-            return
+    # ------------------------------------------------------------------
+    # Snapshot cache
+    # ------------------------------------------------------------------
 
-        snapshot = ZoneSnapshotDTO.from_zone(zone)
+    def _entry(self, zone: ZoneCombined) -> CachedSnapshot:
+        entry = self._cache.get(zone.config.id)
+        state = zone.state
+        if entry is not None and entry.state is state and entry.version == state.version:
+            return entry
 
-        await self.event_bus.publish(
-            ZoneSnapshotUpdatedEvent(
-                zone_id=zone_id,
-                snapshot=snapshot,
-            )
+        snapshot = ZoneSnapshotDTO.from_zone(zone)
+        entry = CachedSnapshot(
+            state=state,
+            version=state.version,
+            snapshot=snapshot,
+            payload=asdict(snapshot),
+            etag=f'"{self._epoch}-{zone.config.id.name}-{state.version}"',
         )
+        self._cache[zone.config.id] = entry
+        self.snapshots_built += 1
+        return entry
+
+    def get_snapshot(self, zone_id: ZoneID) -> Optional[CachedSnapshot]:
+        """Current snapshot of one zone (cached while its state is unchanged)"""
+        try:
+            zone = self.zone_service.get_zone(zone_id)
+        except KeyError:
+            return None
+        return self._entry(zone)
+
+    def get_all_snapshots(self) -> List[CachedSnapshot]:
+        """Current snapshots of all zones, in ZoneService order"""
+        return [self._entry(zone) for zone in self.zone_service.get_all()]
+
+    def collection_etag(self, entries: List[CachedSnapshot]) -> str:
+        """ETag of a zone list: changes when any zone's version changes"""
+        versions = ".".join(str(entry.version) for entry in entries)
+        return f'"{self._epoch}-all-{versions}"'
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "cached_zones": len(self._cache),
+            "snapshots_built": self.snapshots_built,
+            "snapshots_published": self.snapshots_published,
+            "pending": len(self._dirty),
+        }
+
     # ------------------------------------------------------------------
     # Event handling
     # ------------------------------------------------------------------
-            
-    # async def _on_zone_changed(self, event) -> None:
-    #     """
-    #     Handle ANY zone-related change and emit fresh snapshot.
-    #     """
-
-    #     zone_id: ZoneID | None = getattr(event, "zone_id", None)
-    #     if not zone_id:
-    #         log.warn("Zone change event without zone_id", event=event)
-    #         return
-
-    #     zone = self.zone_service.get_zone(zone_id)
-    #     if not zone:
-    #         log.warn("Snapshot requested for missing zone", zone_id=zone_id)
-    #         return
-
-    #     snapshot_event = ZoneSnapshotUpdatedEvent(
-    #         zone_id=zone_id,
-    #         snapshot=snapshot,
-    #     )
-
-    #     self.event_bus.publish(snapshot_event)
-
-    #     log.debug(
-    #         "Published zone snapshot",
-    #         zone=zone_id.name,
-    #     )
+
+    async def _on_zone_changed(self, event) -> None:
+        """Mark the zone dirty; changed snapshots go out on the next frame flush"""
+        zone_id: ZoneID | None = getattr(event, "zone_id", None)
+        if not zone_id:
+            return
+
+        self._mark_dirty(zone_id)
+
+    async def _on_zone_batch_changed(self, event) -> None:
+        """Batch update: all zones go out together on the next frame flush"""
+        for change in event.changes:
+            self._mark_dirty(change.zone_id)
+
+    def _mark_dirty(self, zone_id: ZoneID) -> None:
+        self._dirty.add(zone_id)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            delay = max(0.0, self._last_flush + self.flush_interval - loop.time())
+            self._flush_handle = loop.call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        self._last_flush = asyncio.get_running_loop().time()
+        dirty, self._dirty = self._dirty, set()
+
+        for zone_id in dirty:
+            entry = self.get_snapshot(zone_id)
+            if entry is None or self._published.get(zone_id) is entry:
+                continue
+            self._published[zone_id] = entry
+            self.snapshots_published += 1
+            self.event_bus.publish_nowait(
+                ZoneSnapshotUpdatedEvent(
+                    zone_id=zone_id,
+                    snapshot=entry.snapshot,
+                    version=entry.version,
+                    payload=entry.payload,
+                )
+            )
@@ -0,0 +1,168 @@
+"""
+State journal - append-only log of state deltas next to state.json.
+
+Each line is one compact JSON entry:
+
+    ["zones","floor",{"color":{...},"brightness":40,...}]   one zone
+    ["application",null,{"edit_mode_on":false,...}]         a whole section
+
+A save appends only the entries that changed (tens of bytes instead of the
+whole document) with one O_APPEND write + fdatasync. At startup the journal
+is replayed over the state.json snapshot; once it grows past a threshold
+the owner writes a fresh snapshot and resets the journal.
+
+Entries are full values (set semantics), so replaying an entry twice is
+harmless and a torn last line (power cut mid-append) is simply dropped.
+Only the newest line per (section, key) matters, so replay decodes just
+those - a 100k-line journal still holds only a handful of live entries.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from utils.logger import get_logger, LogCategory
+
+log = get_logger().for_category(LogCategory.CONFIG)
+
+# (section, key or None for the whole section, value as compact JSON)
+JournalEntry = Tuple[str, Optional[str], str]
+
+
+class StateJournal:
+    """Append-only delta log; not thread-safe (the owner serializes access)"""
+
+    def __init__(self, path: Path, compact_bytes: int = 256 * 1024):
+        """
+        Args:
+            path: Journal file (created on first append)
+            compact_bytes: Size after which needs_compaction() returns True
+        """
+        self.path = Path(path)
+        self.compact_bytes = compact_bytes
+        self.size = 0
+        self.entries = 0       # entries in the file (replayed + appended)
+        self.appends = 0
+
+    def replay(self, state: dict) -> int:
+        """
+        Apply every journal entry to state (in place).
+
+        Truncates a torn trailing line so later appends start on a clean line.
+
+        Returns:
+            Number of journal entries replayed
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.size = self.entries = 0
+            return 0
+
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            log.warn(f"Dropping torn journal tail ({len(data) - end} bytes)")
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+        self.size = end
+
+        entries, self.entries = self._parse(data[:end])
+        for section, key, value in entries:
+            if key is None:
+                state[section] = value
+            else:
+                bucket = state.get(section)
+                if not isinstance(bucket, dict):
+                    bucket = state[section] = {}
+                bucket[key] = value
+
+        return self.entries
+
+    @classmethod
+    def _parse(cls, data: bytes) -> Tuple[list, int]:
+        """
+        Decode the newest line per (section, key), in journal order.
+
+        Lines are grouped by their '["section","key"' prefix (as written by
+        append) without decoding the value; anything unexpected falls back to
+        decoding every line.
+
+        Returns:
+            (entries to apply, number of valid entries in the journal)
+        """
+        lines = data.splitlines()
+        latest = {}
+        for index, line in enumerate(lines):
+            cut = line.find(b",", line.find(b",") + 1)
+            latest[line[:cut]] = index
+        try:
+            entries = []
+            for header, index in sorted(latest.items(), key=lambda item: item[1]):
+                section, key, value = json.loads(lines[index])
+                if f"[{json.dumps(section)},{json.dumps(key)}".encode() != header:
+                    raise ValueError("journal line prefix does not match its entry")
+                entries.append((section, key, value))
+            return entries, len(lines)
+        except (TypeError, ValueError):
+            entries = cls._parse_each(lines)
+            return entries, len(entries)
+
+    @staticmethod
+    def _parse_each(lines: List[bytes]) -> list:
+        """Decode every line, skipping corrupt ones"""
+        entries = []
+        for number, line in enumerate(lines, 1):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                log.warn(f"Skipping corrupt journal entry at line {number}")
+                continue
+            if isinstance(entry, list) and len(entry) == 3:
+                entries.append(entry)
+        return entries
+
+    def append(self, entries: Iterable[JournalEntry]) -> int:
+        """
+        Append entries durably (one write + fdatasync).
+
+        Returns:
+            Bytes appended
+        """
+        lines: List[str] = [
+            f"[{json.dumps(section)},{json.dumps(key)},{value}]\n" for section, key, value in entries
+        ]
+        if not lines:
+            return 0
+        body = "".join(lines).encode("utf-8")
+
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            view = memoryview(body)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fdatasync(fd)
+        finally:
+            os.close(fd)
+
+        self.size += len(body)
+        self.entries += len(lines)
+        self.appends += 1
+        return len(body)
+
+    def needs_compaction(self) -> bool:
+        return self.size >= self.compact_bytes
+
+    def reset(self) -> None:
+        """Empty the journal (call only after a snapshot with its contents is durable)"""
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_TRUNC)
+        except FileNotFoundError:
+            pass
+        else:
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        self.size = self.entries = 0
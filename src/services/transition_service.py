@@ -199,7 +199,7 @@ class TransitionService:
         else:
             safe_steps = config.steps
 
-        log.debug(f"Fade out: {config.duration_ms}ms, {safe_steps} steps, {step_delay*1000:.2f}ms per step")
+        log.debug("Fade out: %sms, %s steps, %.2fms per step", config.duration_ms, safe_steps, step_delay*1000)
 
         # Gradually reduce brightness
         for step in range(safe_steps, -1, -1):
@@ -311,7 +311,7 @@ class TransitionService:
             else:
                 safe_steps = config.steps
 
-            log.debug(f"Fade in: {config.duration_ms}ms, {safe_steps} steps, {step_delay*1000:.2f}ms per step")
+            log.debug("Fade in: %sms, %s steps, %.2fms per step", config.duration_ms, safe_steps, step_delay*1000)
 
             # Gradually increase brightness - submit each step to FrameManager
             for step in range(safe_steps + 1):
@@ -557,7 +557,7 @@ class TransitionService:
         """
         config = config or TransitionConfig(TransitionType.CUT, duration_ms=100)
         async with self._transition_lock:
-            log.debug(f"Cut transition: {config.duration_ms}ms black")
+            log.debug("Cut transition: %sms black", config.duration_ms)
             if isinstance(self.strip, LedChannel) and self.frame_manager:
                 # Submit black frame via FrameManager (as Color objects)
                 black_frame = [Color.black()] * self.strip.pixel_count
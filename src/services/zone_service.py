@@ -1,13 +1,12 @@
 """Zone service - Business logic for zones"""
 
-import asyncio
 from typing import Any, Dict, List, Optional
 from models.animation_params.animation_param_id import AnimationParamID
 from models.domain.animation import AnimationState
 from models.enums import AnimationID, ZoneID, ZoneRenderMode
-from models.domain import ZoneCombined
+from models.domain import ZoneCombined, ZoneStaticChange
 from models.color import Color
-from models.events import ZoneStaticStateChangedEvent
+from models.events import ZoneStaticBatchChangedEvent, ZoneStaticStateChangedEvent
 from models.events.zone_runtime_events import ZoneAnimationChangedEvent, ZoneRenderModeChangedEvent, ZoneAnimationParamChangedEvent
 from services.data_assembler import DataAssembler
 from services.application_state_service import ApplicationStateService
@@ -81,12 +80,12 @@ class ZoneService:
             color=color
         )
 
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneStaticStateChangedEvent(
                 zone_id=zone_id,
                 color=color,
             )
-        ))
+        )
 
     def set_brightness(self, zone_id: ZoneID, brightness: int) -> None:
         zone = self.get_zone(zone_id)
@@ -100,12 +99,12 @@ class ZoneService:
             brightness=zone.state.brightness,
         )
 
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneStaticStateChangedEvent(
                 zone_id=zone_id,
                 brightness=zone.state.brightness,
             )
-        ))
+        )
 
     def adjust_brightness(self, zone_id: ZoneID, delta: int) -> None:
         zone = self.get_zone(zone_id)
@@ -119,12 +118,12 @@ class ZoneService:
             brightness=zone.state.brightness,
         )
 
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneStaticStateChangedEvent(
                 zone_id=zone_id,
                 brightness=zone.state.brightness,
             )
-        ))
+        )
         
     def set_is_on(self, zone_id: ZoneID, is_on: bool) -> None:
         zone = self.get_zone(zone_id)
@@ -138,12 +137,79 @@ class ZoneService:
             is_on=is_on,
         )
 
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneStaticStateChangedEvent(
                 zone_id=zone_id,
                 is_on=is_on,
             )
-        ))
+        )
+
+    def apply_static_batch(self, changes: List[ZoneStaticChange], save: bool = True) -> List[ZoneCombined]:
+        """
+        Apply color / brightness / is_on changes to many zones as one transaction.
+
+        All changes are applied or none (state is rolled back on a validation
+        error), then persisted with one save and announced with one
+        ZoneStaticBatchChangedEvent - one frame push and one snapshot flush
+        instead of one per zone.
+
+        Args:
+            changes: Per-zone changes (each zone at most once)
+            save: Persist now; continuous controls pass False and call
+                save_state() once the gesture ends
+
+        Returns:
+            Zones that were changed
+
+        Raises:
+            ValueError: Unknown zone, or a zone listed more than once
+            TypeError: Invalid value type (from ZoneState validation)
+        """
+        seen = set()
+        for change in changes:
+            if change.zone_id not in self._by_id:
+                raise ValueError(f"Zone not found: {change.zone_id}")
+            if change.zone_id in seen:
+                raise ValueError(f"Zone listed more than once: {change.zone_id.name}")
+            seen.add(change.zone_id)
+
+        applied: List[ZoneStaticStateChangedEvent] = []
+        previous = []
+        try:
+            for change in changes:
+                zone = self._by_id[change.zone_id]
+                state = zone.state
+                previous.append((state, state.color, state.brightness, state.is_on))
+
+                if change.color is not None:
+                    state.color = change.color
+                if change.brightness is not None:
+                    state.brightness = max(0, min(100, change.brightness))
+                if change.is_on is not None:
+                    state.is_on = change.is_on
+
+                applied.append(ZoneStaticStateChangedEvent(
+                    zone_id=change.zone_id,
+                    color=change.color,
+                    brightness=state.brightness if change.brightness is not None else None,
+                    is_on=change.is_on,
+                ))
+        except (TypeError, ValueError):
+            for state, color, brightness, is_on in reversed(previous):
+                state.color, state.brightness, state.is_on = color, brightness, is_on
+            raise
+
+        zones = [self._by_id[change.zone_id] for change in changes]
+        if not zones:
+            return zones
+
+        if save:
+            self.assembler.save_zone_state(zones)
+
+        log.debug("Zone batch applied", zones=len(zones))
+
+        self.event_bus.publish_nowait(ZoneStaticBatchChangedEvent(changes=tuple(applied)))
+        return zones
 
     def set_animation(
         self,
@@ -187,22 +253,22 @@ class ZoneService:
         )
 
         # 3. Publish domain events 
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneAnimationChangedEvent(
                 zone_id=zone_id,
                 animation_id=animation_id,
                 params={}
             )
-        ))
+        )
         
         if old_mode != ZoneRenderMode.ANIMATION:
-            asyncio.create_task(self.event_bus.publish(
+            self.event_bus.publish_nowait(
                 ZoneRenderModeChangedEvent(
                     zone_id=zone_id,
                     old=old_mode,
                     new=ZoneRenderMode.ANIMATION
                 )
-            ))
+            )
 
     def set_animation_param(self, zone_id: ZoneID, param_id: AnimationParamID, value: Any) -> None:
         """
@@ -217,6 +283,7 @@ class ZoneService:
             raise ValueError("Zone has no active animation")
 
         zone.state.animation.parameters[param_id] = value
+        zone.state.touch()
 
         self._save_zone(zone_id)
 
@@ -227,13 +294,13 @@ class ZoneService:
         )
 
         # Publish event so AnimationModeController and SnapshotPublisher are notified
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneAnimationParamChangedEvent(
                 zone_id=zone_id,
                 param_id=param_id,
                 value=value
             )
-        ))
+        )
 
     
     def set_render_mode(
@@ -262,13 +329,13 @@ class ZoneService:
         )
 
         # 3. Publish domain event
-        asyncio.create_task(self.event_bus.publish(
+        self.event_bus.publish_nowait(
             ZoneRenderModeChangedEvent(
                 zone_id=zone_id,
                 old=old_mode,
                 new=render_mode
             )
-        ))
+        )
 
     # ------------------------------------------------------------------
     # Persistence
@@ -1,5 +1,8 @@
+from collections import deque
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Deque, Dict, Optional, Union, TYPE_CHECKING
+import atexit
+import threading
 import traceback
 import sys
 from models.enums import LogLevel, LogCategory
@@ -76,6 +79,91 @@ LEVEL_COLORS = {
 }
 
 
+LEVEL_PRIORITY = {
+    LogLevel.DEBUG: 0,
+    LogLevel.INFO: 1,
+    LogLevel.WARN: 2,
+    LogLevel.ERROR: 3,
+}
+
+# Message may be a string (optionally with %-style args) or a zero-arg callable
+Message = Union[str, Callable[[], str]]
+
+
+# === TERMINAL WRITER ===
+class TerminalWriter:
+    """
+    Writes formatted log lines to stdout from a daemon thread.
+
+    write() only appends to a bounded buffer, so a slow terminal (SSH, serial
+    console) can never block the caller. When the buffer is full the oldest
+    lines are dropped and a notice is written instead.
+    """
+
+    def __init__(self, max_pending: int = 10_000):
+        self._pending: Deque[str] = deque()
+        self._max_pending = max_pending
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._busy = False
+        self.dropped = 0
+
+    def write(self, text: str) -> None:
+        with self._cond:
+            if len(self._pending) >= self._max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(text)
+            self._cond.notify()
+        if self._thread is None:
+            self._start()
+
+    def _start(self) -> None:
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        reported = 0
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._busy = False
+                    self._cond.notify_all()
+                    self._cond.wait()
+                self._busy = True
+                lines = list(self._pending)
+                self._pending.clear()
+                dropped = self.dropped
+
+            if dropped != reported:
+                lines.insert(0, f"[logger] {dropped - reported} log line(s) dropped (terminal too slow)")
+                reported = dropped
+            self._emit("\n".join(lines) + "\n")
+
+    @staticmethod
+    def _emit(text: str) -> None:
+        stream = sys.stdout
+        try:
+            stream.write(text)
+            stream.flush()
+        except UnicodeEncodeError:
+            encoding = getattr(stream, "encoding", None) or "ascii"
+            stream.write(text.encode(encoding, "replace").decode(encoding))
+            stream.flush()
+        except (ValueError, OSError):
+            pass                                            # stdout closed
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Block until every pending line has been written (or timeout)"""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+
 # === CORE LOGGER ===
 class Logger:
     """
@@ -99,19 +187,61 @@ class Logger:
             min_level: Minimum log level to display
             use_colors: Enable ANSI color codes (disable for file output)
         """
-        self.min_level = min_level
         self.use_colors = use_colors
-        self._level_priority = {
-            LogLevel.DEBUG: 0,
-            LogLevel.INFO: 1,
-            LogLevel.WARN: 2,
-            LogLevel.ERROR: 3,
-        }
+        self._level_priority = LEVEL_PRIORITY
+        self._min_level = min_level
+        self._category_levels: Dict[LogCategory, LogLevel] = {}
+        # Effective threshold per category (priority int), checked before any formatting
+        self._thresholds: Dict[LogCategory, int] = {}
+        self._rebuild_thresholds()
         self._broadcaster: Optional['LogBroadcaster'] = None
+        self._writer: Optional[TerminalWriter] = None
+
+    @property
+    def min_level(self) -> LogLevel:
+        return self._min_level
+
+    @min_level.setter
+    def min_level(self, level: LogLevel) -> None:
+        self._min_level = level
+        self._rebuild_thresholds()
+
+    def set_category_level(self, category: LogCategory, level: Optional[LogLevel]) -> None:
+        """Override the threshold for one category (None = follow min_level)"""
+        if level is None:
+            self._category_levels.pop(category, None)
+        else:
+            self._category_levels[category] = level
+        self._rebuild_thresholds()
+
+    def _rebuild_thresholds(self) -> None:
+        default = LEVEL_PRIORITY[self._min_level]
+        self._thresholds = {
+            category: LEVEL_PRIORITY[self._category_levels[category]] if category in self._category_levels else default
+            for category in LogCategory
+        }
+
+    def set_threaded_output(self, enabled: bool) -> None:
+        """Write terminal output from a background thread (True) or inline (False)"""
+        if enabled and self._writer is None:
+            self._writer = TerminalWriter()
+            atexit.register(self._writer.flush)
+        elif not enabled and self._writer is not None:
+            self._writer.flush()
+            self._writer = None
 
-    def _should_log(self, level: LogLevel) -> bool:
-        """Check if message should be logged based on level"""
-        return self._level_priority[level] >= self._level_priority[self.min_level]
+    def flush(self) -> None:
+        """Wait until queued terminal output has been written"""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _should_log(self, level: LogLevel, category: LogCategory = LogCategory.GENERAL) -> bool:
+        """Check if message should be logged based on level and category threshold"""
+        return LEVEL_PRIORITY[level] >= self._thresholds[category]
+
+    def is_enabled_for(self, level: LogLevel, category: LogCategory = LogCategory.GENERAL) -> bool:
+        """Guard for expensive log arguments (e.g. `if log.is_enabled_for(LogLevel.DEBUG): ...`)"""
+        return LEVEL_PRIORITY[level] >= self._thresholds[category]
 
     def _colorize(self, text: str, color: str) -> str:
         """Apply color to text if colors enabled"""
@@ -177,10 +307,11 @@ class Logger:
     def log(
         self,
         category: LogCategory,
-        message: str,
+        message: Message,
         level: LogLevel = LogLevel.INFO,
         details: Optional[list] = None,
         exc_info: bool = False,
+        args: tuple = (),
         **kwargs
     ):
         """
@@ -188,10 +319,12 @@ class Logger:
 
         Args:
             category: Log category (HARDWARE, STATE, etc.)
-            message: Main message text
+            message: Main message text, %-style template (with args) or a
+                     zero-arg callable; only evaluated if the level is enabled
             level: Log level (DEBUG, INFO, WARN, ERROR)
             details: List of detail strings to show below message
             exc_info: If True, print full exception traceback (requires active exception)
+            args: Values for a %-style message template
             **kwargs: Additional key-value pairs to show as details
 
         Example:
@@ -218,47 +351,39 @@ class Logger:
                        Exception: error message
                        ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
         """
-        if not self._should_log(level):
+        if LEVEL_PRIORITY[level] < self._thresholds[category]:
             return
 
+        message = self._render_message(message, args)
+
         # Build main line
         timestamp = self._format_timestamp()
-        timestamp_str = timestamp[1:-1]  # Remove brackets for ISO format
         cat = self._format_category(category)
         sym = self._format_level_symbol(level)
         msg = self._colorize(message, LEVEL_COLORS.get(level, Colors.WHITE))
-
-        # Print main line
-        try:
-            print(f"{timestamp} {cat} {sym} {msg}")
-        except UnicodeEncodeError:
-            safe_sym = sym.encode("ascii", "replace").decode()
-            safe_msg = msg.encode("ascii", "replace").decode()
-            print(f"{timestamp} {cat} {safe_sym} {safe_msg}")
+        lines = [f"{timestamp} {cat} {sym} {msg}"]
 
         # Add kwargs as details
         all_details = list(details or [])
         for k, v in kwargs.items():
             all_details.append(f"{k}: {v}")
 
-        # Print details with tree structure
+        # Details with tree structure
         if all_details:
             indent = " " * 11
             for i, d in enumerate(all_details):
                 # Last item gets different tree character (unless traceback follows)
                 is_last = i == len(all_details) - 1 and not exc_info
                 tree = "└─" if is_last else "├─"
-                try:
-                    print(f"{indent}{self._colorize(tree, Colors.DIM)} {d}")
-                except UnicodeEncodeError:
-                    safe_tree = tree.encode("ascii", "replace").decode()
-                    print(f"{indent}{self._colorize(safe_tree, Colors.DIM)} {d}")
+                lines.append(f"{indent}{self._colorize(tree, Colors.DIM)} {d}")
 
-        # Print exception traceback if requested
+        # Exception traceback if requested
         if exc_info:
             traceback_str = self._format_traceback()
             if traceback_str:
-                print(traceback_str)
+                lines.append(traceback_str)
+
+        self._write("\n".join(lines))
 
         # Broadcast to WebSocket clients if broadcaster is set
         if self._broadcaster:
@@ -274,11 +399,31 @@ class Logger:
                 message=full_message
             )
 
+    @staticmethod
+    def _render_message(message: Message, args: tuple) -> str:
+        if callable(message):
+            return str(message())
+        if args:
+            try:
+                return message % args
+            except (TypeError, ValueError):
+                return f"{message} {args!r}"
+        return message
+
+    def _write(self, text: str) -> None:
+        if self._writer is not None:
+            self._writer.write(text)
+            return
+        try:
+            print(text)
+        except UnicodeEncodeError:
+            print(text.encode("ascii", "replace").decode())
+
     # === Level helpers (backward-compatible) ===
-    def debug(self, category: LogCategory, message: str, **kw): self.log(category, message, LogLevel.DEBUG, **kw)
-    def info(self, category: LogCategory, message: str, **kw): self.log(category, message, LogLevel.INFO, **kw)
-    def warn(self, category: LogCategory, message: str, **kw): self.log(category, message, LogLevel.WARN, **kw)
-    def error(self, category: LogCategory, message: str, **kw): self.log(category, message, LogLevel.ERROR, **kw)
+    def debug(self, category: LogCategory, message: Message, *args, **kw): self.log(category, message, LogLevel.DEBUG, args=args, **kw)
+    def info(self, category: LogCategory, message: Message, *args, **kw): self.log(category, message, LogLevel.INFO, args=args, **kw)
+    def warn(self, category: LogCategory, message: Message, *args, **kw): self.log(category, message, LogLevel.WARN, args=args, **kw)
+    def error(self, category: LogCategory, message: Message, *args, **kw): self.log(category, message, LogLevel.ERROR, args=args, **kw)
 
     # === Contextual logger creation ===
     def for_category(self, category: LogCategory) -> 'BoundLogger':
@@ -295,40 +440,53 @@ class BoundLogger:
 
     def log(
         self,
-        message: str,
+        message: Message,
         level: LogLevel = LogLevel.INFO,
         category: Optional[LogCategory] = None,
         details: Optional[list] = None,
         exc_info: bool = False,
+        args: tuple = (),
         **kw
     ):
         """
         Log a message with optional exception traceback.
 
         Args:
-            message: Main message text
+            message: Main message text, %-style template or zero-arg callable
             level: Log level (DEBUG, INFO, WARN, ERROR)
             category: Override default category if needed
             details: List of detail strings
             exc_info: If True, print full exception traceback
+            args: Values for a %-style message template
             **kw: Additional key-value pairs as details
         """
-        self._base.log(category or self._category, message, level, details, exc_info, **kw)
+        category = category or self._category
+        base = self._base
+        if LEVEL_PRIORITY[level] < base._thresholds[category]:
+            return
+        base.log(category, message, level, details, exc_info, args, **kw)
 
-    # Shortcut methods
-    def debug(self, message: str, **kw): self.log(message, LogLevel.DEBUG, **kw)
-    def info(self, message: str, **kw): self.log(message, LogLevel.INFO, **kw)
-    def warn(self, message: str, **kw): self.log(message, LogLevel.WARN, **kw)
-    def error(self, message: str, exc_info: bool = False, **kw):
+    # Shortcut methods - threshold checked before anything is formatted
+    def debug(self, message: Message, *args, **kw):
+        if LEVEL_PRIORITY[LogLevel.DEBUG] >= self._base._thresholds[kw.get("category") or self._category]:
+            self.log(message, LogLevel.DEBUG, args=args, **kw)
+
+    def info(self, message: Message, *args, **kw): self.log(message, LogLevel.INFO, args=args, **kw)
+    def warn(self, message: Message, *args, **kw): self.log(message, LogLevel.WARN, args=args, **kw)
+    def error(self, message: Message, *args, exc_info: bool = False, **kw):
         """
         Log an error message with optional exception traceback.
 
         Args:
-            message: Error message
+            message: Error message (or %-style template with args)
             exc_info: If True, print full exception traceback (default: False)
             **kw: Additional key-value pairs as details
         """
-        self.log(message, LogLevel.ERROR, exc_info=exc_info, **kw)
+        self.log(message, LogLevel.ERROR, exc_info=exc_info, args=args, **kw)
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Return True if a message at this level would be emitted for this category."""
+        return LEVEL_PRIORITY[level] >= self._base._thresholds[self._category]
 
     def with_category(self, category: LogCategory) -> 'BoundLogger':
         """Create another bound logger from this one."""
@@ -345,14 +503,28 @@ def get_category_logger(category: LogCategory) -> BoundLogger:
     """Compatibility function: returns a logger bound to a specific category"""
     return _logger.for_category(category)
 
-def configure_logger(min_level: LogLevel = LogLevel.INFO, use_colors: bool = True):
+def configure_logger(
+    min_level: LogLevel = LogLevel.INFO,
+    use_colors: bool = True,
+    category_levels: Optional[Dict[LogCategory, LogLevel]] = None,
+    threaded_output: Optional[bool] = None,
+):
     """
     Configure the logger singleton (modify in-place, don't create new instance).
 
     This respects the singleton pattern - updates properties on the existing instance
     rather than replacing it. This ensures any broadcasters or references remain valid.
+
+    Args:
+        min_level: Default threshold for all categories
+        use_colors: Enable ANSI color codes
+        category_levels: Per-category thresholds overriding min_level (replaces previous overrides)
+        threaded_output: Write terminal output from a background thread (None = unchanged)
     """
     global _logger
     # Modify existing logger instead of creating new one (preserves singleton + broadcaster)
+    _logger._category_levels = dict(category_levels or {})
     _logger.min_level = min_level
-    _logger.use_colors = use_colors
\ No newline at end of file
+    _logger.use_colors = use_colors
+    if threaded_output is not None:
+        _logger.set_threaded_output(threaded_output)
\ No newline at end of file
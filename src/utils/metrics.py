@@ -0,0 +1,29 @@
+"""
+Metrics primitives for hot paths.
+
+Values are updated in place (no locks, no allocation per observation);
+formatting happens only when metrics are scraped (services/metrics_exporter.py).
+"""
+
+from bisect import bisect_left
+from typing import List, Sequence
+
+# Seconds; suits per-frame render stages (budget ~16 ms at 60 FPS)
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class Histogram:
+    """Fixed-bucket histogram (non-cumulative counts; the last bucket is +Inf)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float] = STAGE_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
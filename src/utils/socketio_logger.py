@@ -56,7 +56,7 @@ class SocketIOLogHandler(logging.Handler):
             elif record.levelno >= logging.INFO:
                 self.diuna_logger.info(f"[{record.name}] {msg}")
             else:
-                self.diuna_logger.debug(f"[{record.name}] {msg}")
+                self.diuna_logger.debug("[%s] %s", record.name, msg)
         except Exception as e:
             # Never crash the logging system
             try:
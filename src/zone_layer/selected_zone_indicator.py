@@ -7,7 +7,7 @@ from typing import Optional
 from models.enums import ZoneID, ZoneRenderMode, FramePriority, FrameSource
 from models.color import Color
 from models.events import EventType
-from models.events.zone_static_events import ZoneStaticStateChangedEvent
+from models.events.zone_static_events import ZoneStaticBatchChangedEvent, ZoneStaticStateChangedEvent
 from models.frame import SingleZoneFrame
 from engine.frame_manager import FrameManager
 from services.event_bus import EventBus
@@ -70,6 +70,10 @@ class SelectedZoneIndicator:
             EventType.ZONE_STATIC_STATE_CHANGED,
             self._on_zone_state_changed
         )
+        event_bus.subscribe(
+            EventType.ZONE_STATIC_BATCH_CHANGED,
+            self._on_zone_batch_changed
+        )
 
     # ------------------------------------------------------------------
     # Context update API (called by LightingController)
@@ -116,8 +120,13 @@ class SelectedZoneIndicator:
 
         # Restart indicator to use updated values
         if changed:
-            log.debug(f"Zone {e.zone_id.name} state changed, restarting indicator")
+            log.debug("Zone %s state changed, restarting indicator", e.zone_id.name)
             self._restart_if_active()
+
+    def _on_zone_batch_changed(self, e: ZoneStaticBatchChangedEvent) -> None:
+        """Batch updates carry per-zone changes in the single-zone event shape"""
+        for change in e.changes:
+            self._on_zone_state_changed(change)
         
     # ------------------------------------------------------------------
     # Task lifecycle
@@ -173,7 +182,11 @@ class SelectedZoneIndicator:
     def _restart_if_active(self) -> None:
         if not self._edit_mode:
             return
-        log.debug(f"Indicator restarting for {self._selected_zone_id.name if self._selected_zone_id else '?'} (mode={self._render_mode.name if self._render_mode else '?'})")
+        log.debug(
+            "Indicator restarting for %s (mode=%s)",
+            self._selected_zone_id.name if self._selected_zone_id else '?',
+            self._render_mode.name if self._render_mode else '?',
+        )
         self._stop()
         self._start()
 
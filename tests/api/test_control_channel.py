@@ -0,0 +1,116 @@
+"""
+Tests for the continuous-control channel ('/control' namespace).
+
+Verifies:
+- Compact updates are parsed and validated
+- Only the latest value per (zone, field) is applied per tick
+- Static fields of all zones are applied as one unsaved batch
+- Animation parameters go through set_animation_param
+- State is saved once after the controls go idle
+"""
+
+import asyncio
+
+import pytest
+
+from api.socketio.control.channel import ControlChannel, parse_update, parse_updates
+from models.animation_params.animation_param_id import AnimationParamID
+from models.enums import ZoneID
+
+
+class FakeZoneService:
+    def __init__(self):
+        self.batches = []
+        self.params = []
+        self.saves = 0
+
+    def apply_static_batch(self, changes, save=True):
+        self.batches.append((list(changes), save))
+        return []
+
+    def set_animation_param(self, zone_id, param_id, value):
+        self.params.append((zone_id, param_id, value))
+
+    def save_state(self):
+        self.saves += 1
+
+
+class TestParse:
+    def test_fields(self):
+        assert parse_update(["floor", "h", 400]) == (ZoneID.FLOOR, "h", 40)
+        assert parse_update(["LAMP", "b", 150]) == (ZoneID.LAMP, "b", 100)
+        assert parse_update(["LAMP", "o", 0]) == (ZoneID.LAMP, "o", False)
+        assert parse_update(["PIXEL", "p:SPEED", 5]) == (ZoneID.PIXEL, "p:speed", 5)
+
+    def test_single_or_list(self):
+        assert len(parse_updates(["FLOOR", "b", 1])) == 1
+        assert len(parse_updates([["FLOOR", "b", 1], ["LAMP", "b", 2]])) == 2
+
+    @pytest.mark.parametrize("raw", [
+        ["NOWHERE", "b", 1],
+        ["FLOOR", "x", 1],
+        ["FLOOR", "p:nope", 1],
+        ["FLOOR", "h", "red"],
+        ["FLOOR", "b"],
+    ])
+    def test_invalid(self, raw):
+        with pytest.raises(ValueError):
+            parse_update(raw)
+
+
+class TestControlChannel:
+    async def test_latest_value_per_tick(self):
+        zones = FakeZoneService()
+        channel = ControlChannel(zones, tick=0.01, idle_save=10)
+
+        for hue in range(0, 100, 10):
+            channel.submit([(ZoneID.FLOOR, "h", hue)])
+        channel.submit([(ZoneID.LAMP, "b", 30), (ZoneID.FLOOR, "b", 70)])
+        await asyncio.sleep(0.005)
+
+        assert len(zones.batches) == 1
+        changes, save = zones.batches[0]
+        assert save is False
+        by_zone = {change.zone_id: change for change in changes}
+        assert by_zone[ZoneID.FLOOR].color.to_hue() == 90
+        assert by_zone[ZoneID.FLOOR].brightness == 70
+        assert by_zone[ZoneID.LAMP].brightness == 30 and by_zone[ZoneID.LAMP].color is None
+
+        stats = channel.get_stats()
+        assert (stats["received"], stats["applied"], stats["dropped"]) == (12, 3, 9)
+
+    async def test_at_most_one_apply_per_tick(self):
+        zones = FakeZoneService()
+        channel = ControlChannel(zones, tick=0.02, idle_save=10)
+
+        channel.submit([(ZoneID.FLOOR, "b", 1)])
+        await asyncio.sleep(0.005)
+        channel.submit([(ZoneID.FLOOR, "b", 2)])
+        channel.submit([(ZoneID.FLOOR, "b", 3)])
+        await asyncio.sleep(0.005)
+        assert len(zones.batches) == 1
+
+        await asyncio.sleep(0.03)
+        assert [changes[0].brightness for changes, _ in zones.batches] == [1, 3]
+
+    async def test_animation_params(self):
+        zones = FakeZoneService()
+        channel = ControlChannel(zones, tick=0.01, idle_save=10)
+
+        channel.submit([(ZoneID.PIXEL, "p:speed", 10), (ZoneID.PIXEL, "p:speed", 20)])
+        await asyncio.sleep(0.005)
+
+        assert zones.params == [(ZoneID.PIXEL, AnimationParamID.SPEED, 20)]
+        assert zones.batches == []
+
+    async def test_saved_once_when_idle(self):
+        zones = FakeZoneService()
+        channel = ControlChannel(zones, tick=0.005, idle_save=0.03)
+
+        for value in range(5):
+            channel.submit([(ZoneID.FLOOR, "b", value)])
+            await asyncio.sleep(0.01)
+        assert zones.saves == 0
+
+        await asyncio.sleep(0.05)
+        assert zones.saves == 1
@@ -0,0 +1,128 @@
+"""
+Tests for binary frame streaming ('frame:update').
+
+Verifies:
+- Keyframes and deltas round-trip through the codec
+- Changed-pixel runs merge single-pixel gaps
+- Each frame is encoded once for many clients at the same base
+- Unacknowledged clients skip frames and get a keyframe after the ack timeout
+- Negotiated rates are capped
+"""
+
+import pytest
+
+from api.socketio.frames.broadcaster import FrameClient, FrameStreamer
+from api.socketio.frames.codec import FLAG_KEYFRAME, changed_runs, decode_frame, encode_delta, encode_keyframe
+from models.color import Color
+
+
+class FakeChannel:
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.pixel_count = len(pixels)
+
+    def get_frame(self):
+        return list(self.pixels)
+
+
+class FakeFrameManager:
+    def __init__(self, *channels):
+        self.led_channels = list(channels)
+        self.frames_rendered = 0
+
+    def set_pixel(self, channel, index, color):
+        self.led_channels[channel].pixels[index] = color
+        self.frames_rendered += 1
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.sent = []
+
+    async def emit(self, event, data=None, to=None, callback=None, **kw):
+        self.sent.append((to, data, callback))
+
+
+def rgb(pixels):
+    return bytes(v for p in pixels for v in p)
+
+
+class TestCodec:
+    def test_keyframe_round_trip(self):
+        channels = [rgb([(1, 2, 3)] * 4), rgb([(9, 9, 9)] * 2)]
+        seq, base, decoded = decode_frame(encode_keyframe(7, channels))
+        assert (seq, base, decoded) == (7, 0, channels)
+
+    def test_delta_round_trip(self):
+        old = [rgb([(0, 0, 0)] * 10)]
+        new = [rgb([(0, 0, 0)] * 2 + [(255, 0, 0)] * 3 + [(0, 0, 0)] * 5)]
+
+        payload = encode_delta(2, new, 1, old)
+        assert not payload[1] & FLAG_KEYFRAME
+        assert len(payload) < len(encode_keyframe(2, new))
+        assert decode_frame(payload, old)[2] == new
+
+    def test_unchanged_delta_is_none(self):
+        frame = [rgb([(5, 5, 5)] * 3)]
+        assert encode_delta(2, frame, 1, frame) is None
+
+    def test_runs_merge_single_gaps(self):
+        old = rgb([(0, 0, 0)] * 10)
+        new = rgb([(1, 1, 1), (0, 0, 0), (1, 1, 1), (0, 0, 0), (0, 0, 0), (1, 1, 1)] + [(0, 0, 0)] * 4)
+        assert changed_runs(old, new) == [(0, 3), (5, 1)]
+
+
+class TestFrameStreamer:
+    @pytest.fixture
+    def setup(self):
+        frame_manager = FakeFrameManager(FakeChannel([Color.black()] * 8))
+        sio = FakeSocketIO()
+        return FrameStreamer(sio, frame_manager, max_fps=30), frame_manager, sio
+
+    async def test_encoded_once_for_many_clients(self, setup):
+        streamer, frame_manager, sio = setup
+        for i in range(5):
+            streamer.clients[f"sid-{i}"] = FrameClient(interval=1 / 30)
+
+        streamer._capture()
+        for sid, client in streamer.clients.items():
+            await streamer._send(sid, client, now=0.0)
+        for _, _, ack in sio.sent:
+            ack()
+
+        frame_manager.set_pixel(0, 3, Color.from_rgb(255, 0, 0))
+        streamer._capture()
+        for sid, client in streamer.clients.items():
+            await streamer._send(sid, client, now=0.1)
+
+        assert streamer.payloads_encoded == 2                  # one keyframe + one delta
+        deltas = {data for _, data, _ in sio.sent[5:]}
+        assert len(deltas) == 1
+
+    async def test_unacked_client_skips_then_gets_keyframe(self, setup):
+        streamer, frame_manager, sio = setup
+        client = streamer.clients["slow"] = FrameClient(interval=1 / 30)
+
+        streamer._capture()
+        await streamer._send("slow", client, now=0.0)
+        frame_manager.set_pixel(0, 0, Color.from_rgb(0, 255, 0))
+        streamer._capture()
+        await streamer._send("slow", client, now=0.1)          # first frame still unacknowledged
+
+        assert client.skipped == 1
+        assert len(sio.sent) == 1
+
+        await streamer._send("slow", client, now=0.0 + streamer.ack_timeout + 0.1)
+        payload = sio.sent[-1][1]
+        assert payload[1] & FLAG_KEYFRAME
+        assert decode_frame(payload)[2] == [rgb([(0, 255, 0)] + [(0, 0, 0)] * 7)]
+
+    async def test_rate_capped(self, setup):
+        streamer, _, _ = setup
+        assert streamer.subscribe("a", 500) == 30
+        assert streamer.subscribe("b", 0) == 1
+        assert streamer.clients["a"].interval == pytest.approx(1 / 30)
+
+        streamer.unsubscribe("a")
+        streamer.unsubscribe("b")
+        streamer._task.cancel()
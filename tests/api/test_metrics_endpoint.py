@@ -0,0 +1,100 @@
+"""
+Tests for the OpenMetrics exporter and GET /metrics.
+
+Verifies:
+- Hot-path counters and histograms appear with OpenMetrics naming
+  (counters end in _total, histogram buckets are cumulative, # EOF last)
+- Task and loop lag families are exported
+- The endpoint serves the exposition over HTTP with the OpenMetrics content type
+"""
+
+import asyncio
+import socket
+import threading
+import time
+import urllib.request
+from types import SimpleNamespace
+
+import uvicorn
+from fastapi import FastAPI
+
+from api.dependencies import get_service_container
+from api.routes import metrics
+from engine.frame_manager import FrameManager
+from lifecycle.task_registry import TaskCategory, TaskRegistry
+from runtime.loop_monitor import LoopLagMonitor
+from services.event_bus import EventBus
+from services.metrics_exporter import CONTENT_TYPE, MetricsExporter
+
+
+def make_services():
+    frame_manager = FrameManager(fps=60)
+    frame_manager.frames_rendered = 42
+    frame_manager.dma_skipped = 7
+    for seconds in (0.0002, 0.0002, 0.003):
+        frame_manager.stage_latency["output"].observe(seconds)
+    return SimpleNamespace(frame_manager=frame_manager, event_bus=EventBus())
+
+
+def samples(text):
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if line and not line.startswith("#"))
+
+
+class TestMetricsExporter:
+    async def test_exposition(self):
+        registry = TaskRegistry()
+        blocker = asyncio.Event()
+        task = asyncio.create_task(blocker.wait())
+        registry.register(task, TaskCategory.RENDER, "render loop")
+        monitor = LoopLagMonitor()
+        monitor.record(3.0)
+
+        text = MetricsExporter(make_services(), registry, monitor).render()
+        values = samples(text)
+
+        assert text.endswith("# EOF\n")
+        assert values["diuna_frame_rendered_total"] == "42"
+        assert values["diuna_frame_dma_skipped_total"] == "7"
+        assert values['diuna_frame_stage_seconds_bucket{stage="output",le="0.00025"}'] == "2"
+        assert values['diuna_frame_stage_seconds_bucket{stage="output",le="0.005"}'] == "3"
+        assert values['diuna_frame_stage_seconds_bucket{stage="output",le="+Inf"}'] == "3"
+        assert values['diuna_frame_stage_seconds_count{stage="output"}'] == "3"
+        assert values['diuna_tasks_active{category="RENDER"}'] == "1"
+        assert values['diuna_tasks_created_total{category="RENDER"}'] == "1"
+        assert values['diuna_loop_lag_seconds_bucket{le="0.005"}'] == "1"
+        assert values["diuna_loop_stalls_total"] == "0"
+        assert "# TYPE diuna_event_queue_depth gauge" in text
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+class TestMetricsEndpoint:
+    def test_scrape_over_http(self):
+        app = FastAPI()
+        app.include_router(metrics.router)
+        services = make_services()
+        app.dependency_overrides[get_service_container] = lambda: services
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        # Pure-Python protocol implementations: only plain HTTP is needed here
+        config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error", lifespan="off", http="h11", ws="none")
+        server = uvicorn.Server(config)
+        serving = threading.Thread(target=server.run, daemon=True)
+        serving.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not server.started and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+                content_type, body = response.headers["content-type"], response.read().decode()
+        finally:
+            server.should_exit = True
+            serving.join(timeout=5)
+
+        assert content_type == CONTENT_TYPE
+        assert samples(body)["diuna_frame_rendered_total"] == "42"
+        assert body.endswith("# EOF\n")
@@ -0,0 +1,128 @@
+"""
+Tests for the Socket.IO subscription protocol.
+
+Verifies:
+- Topic specs are parsed and validated
+- Connecting with auth={"subscribe": [...]} sends initial state for those topics only
+- Clients without a subscription list get the default topics
+- Zone broadcasts go to the zones room and are skipped when it is empty
+- Unsubscribing leaves the topic
+"""
+
+import pytest
+
+from api.socketio.on_connect import register_on_connect
+from api.socketio.subscriptions import (
+    DEFAULT_SUBSCRIPTIONS, SocketSubscriptions, ZONES_ROOM, parse_topic, register_subscriptions, room_has_members,
+)
+from api.socketio.zones.broadcaster import register_zone_broadcaster
+import services.log_broadcaster as log_broadcaster
+from services.log_broadcaster import LogBroadcaster, set_broadcaster
+
+
+class FakeManager:
+    def __init__(self):
+        self.rooms = {}
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.manager = FakeManager()
+        self.handlers = {}
+        self.emits = []
+
+    def event(self, fn):
+        self.handlers[fn.__name__] = fn
+        return fn
+
+    def rooms(self, sid):
+        return [room for room, members in self.manager.rooms.get("/", {}).items() if sid in members]
+
+    async def enter_room(self, sid, room):
+        self.manager.rooms.setdefault("/", {}).setdefault(room, set()).add(sid)
+
+    async def leave_room(self, sid, room):
+        members = self.manager.rooms.get("/", {}).get(room, set())
+        members.discard(sid)
+        if not members:
+            self.manager.rooms.get("/", {}).pop(room, None)
+
+    async def emit(self, event, data=None, room=None, **kw):
+        self.emits.append((event, room))
+
+
+class FakeEventBus:
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, event_type, handler, **kw):
+        self.handlers[event_type] = handler
+
+
+class FakeServices:
+    def __init__(self):
+        self.zone_service = type("ZoneService", (), {"get_all": lambda self: []})()
+        self.event_bus = FakeEventBus()
+        self.snapshot_publisher = None
+
+
+@pytest.fixture
+def sio():
+    previous = log_broadcaster._broadcaster
+    sio = FakeSocketIO()
+    broadcaster = LogBroadcaster()
+    broadcaster.set_socketio_server(sio)
+    set_broadcaster(broadcaster)
+    services = FakeServices()
+    register_on_connect(sio, services, register_subscriptions(sio, services))
+    register_zone_broadcaster(sio, services)
+    sio.services = services
+    yield sio
+    log_broadcaster._broadcaster = previous
+
+
+class TestParseTopic:
+    def test_topic_with_argument(self):
+        assert parse_topic("logs:WARN") == ("logs", "WARN")
+        assert parse_topic("Zones") == ("zones", None)
+
+    @pytest.mark.parametrize("spec", ["weather", "", 5])
+    def test_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_topic(spec)
+
+
+class TestSubscriptions:
+    async def test_kiosk_gets_zones_only(self, sio):
+        await sio.handlers["connect"]("kiosk", {}, {"subscribe": ["zones"]})
+
+        assert sio.emits == [("zones:snapshot", "kiosk")]
+        assert sio.rooms("kiosk") == [ZONES_ROOM]
+
+    async def test_default_subscriptions(self, sio):
+        await sio.handlers["connect"]("dash", {}, None)
+
+        events = [event for event, _ in sio.emits]
+        assert events == ["zones:snapshot", "tasks:all", "tasks:stats", "logs:history"]
+        subscriptions = SocketSubscriptions(sio, sio.services).list("dash")
+        assert [s.split(":")[0] for s in subscriptions] == list(DEFAULT_SUBSCRIPTIONS)
+
+    async def test_zone_broadcast_skipped_without_members(self, sio):
+        broadcast = next(iter(sio.services.event_bus.handlers.values()))
+
+        class Event:
+            snapshot = None                         # asdict(None) would raise if serialized
+
+        await broadcast(Event())
+        assert sio.emits == []
+        assert not room_has_members(sio, ZONES_ROOM)
+
+    async def test_unsubscribe_and_resubscribe(self, sio):
+        await sio.handlers["connect"]("dash", {}, {"subscribe": ["zones", "logs:ERROR"]})
+        await sio.handlers["unsubscribe"]("dash", ["zones", "logs"])
+
+        assert sio.rooms("dash") == []
+        assert sio.emits[-1] == ("subscriptions", "dash")
+
+        await sio.handlers["subscribe"]("dash", {"topics": ["logs:warn"]})
+        assert SocketSubscriptions(sio, sio.services).list("dash") == ["logs:WARN"]
@@ -0,0 +1,9 @@
+"""
+Shared test setup.
+
+Imports lifecycle.handlers before any test module, in the same order as
+main_asyncio: importing services or hardware modules first runs into a
+circular import through lifecycle.
+"""
+
+import lifecycle.handlers  # noqa: F401
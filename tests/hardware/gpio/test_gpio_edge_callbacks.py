@@ -0,0 +1,109 @@
+"""
+Tests for interrupt-driven GPIO input (edge callbacks).
+
+Verifies:
+- MockGPIOManager.inject_edge() dispatches callbacks on the event loop
+- Edge filter (RISING / FALLING / BOTH) and unchanged levels are respected
+- Edges injected from another thread are marshalled into the loop
+- Button / RotaryEncoder edge mode fire their handlers
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from hardware.gpio import MockGPIOManager
+from hardware.input.button import Button
+from hardware.input.rotary_encoder import RotaryEncoder
+from models.enums import GPIOEdge
+
+
+@pytest.fixture
+def gpio():
+    manager = MockGPIOManager()
+    for pin in (5, 6, 13, 22):
+        manager.register_input(pin, f"Test({pin})")
+    return manager
+
+
+async def drain():
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestMockEdgeCallbacks:
+    async def test_both_edges_dispatched_with_level(self, gpio):
+        calls = []
+        gpio.add_edge_callback(22, lambda pin, level: calls.append((pin, level)))
+
+        gpio.inject_edge(22, 0)
+        gpio.inject_edge(22, 0)   # no change → no callback
+        gpio.inject_edge(22, 1)
+        await drain()
+
+        assert calls == [(22, 0), (22, 1)]
+
+    async def test_falling_filter(self, gpio):
+        calls = []
+        gpio.add_edge_callback(22, lambda pin, level: calls.append(level), edge=GPIOEdge.FALLING)
+
+        gpio.inject_edge(22, 0)
+        gpio.inject_edge(22, 1)
+        await drain()
+
+        assert calls == [0]
+
+    async def test_injected_from_thread_runs_on_loop(self, gpio):
+        loop_thread = threading.get_ident()
+        seen = []
+        gpio.add_edge_callback(22, lambda pin, level: seen.append(threading.get_ident()))
+
+        thread = threading.Thread(target=gpio.inject_edge, args=(22, 0))
+        thread.start()
+        thread.join()
+        await drain()
+
+        assert seen == [loop_thread]
+
+    def test_unregistered_pin_rejected(self, gpio):
+        with pytest.raises(ValueError):
+            gpio.add_edge_callback(99, lambda pin, level: None)
+
+    async def test_remove_edge_callback(self, gpio):
+        calls = []
+        gpio.add_edge_callback(22, lambda pin, level: calls.append(level))
+        gpio.remove_edge_callback(22)
+
+        gpio.inject_edge(22, 0)
+        await drain()
+
+        assert calls == []
+
+
+class TestInputDevicesEdgeMode:
+    async def test_button_press_debounced(self, gpio):
+        presses = []
+        button = Button(pin=22, gpio_manager=gpio, debounce_time=10.0)
+        button.enable_edge_callbacks(lambda: presses.append(1))
+
+        gpio.inject_edge(22, 0)
+        gpio.inject_edge(22, 1)
+        gpio.inject_edge(22, 0)   # within debounce window
+        await drain()
+
+        assert presses == [1]
+
+    async def test_encoder_rotation_and_click(self, gpio):
+        deltas, clicks = [], []
+        encoder = RotaryEncoder(clk=5, dt=6, sw=13, gpio_manager=gpio)
+        encoder.enable_edge_callbacks(on_rotate=deltas.append, on_press=lambda: clicks.append(1))
+
+        gpio.inject_edge(5, 0)    # CLK leads DT → clockwise (2 transitions = 1 detent)
+        gpio.inject_edge(6, 0)
+        await drain()
+        gpio.inject_edge(13, 0)
+        await drain()
+
+        assert deltas == [1]
+        assert clicks == [1]
@@ -0,0 +1,161 @@
+"""
+Tests for the evdev keyboard adapter.
+
+Verifies:
+- Keycode table: normalized names and modifier groups
+- Modifier down / up / repeat handling, publishing on key down only
+- Reader callback drains the device and ignores BlockingIOError
+- A read OSError ends run() with RuntimeError so start_keyboard falls back
+"""
+
+import asyncio
+import socket
+from collections import deque
+
+import pytest
+
+pytest.importorskip("evdev")
+
+from evdev import InputEvent, ecodes
+
+from hardware.input.keyboard import factory
+from hardware.input.keyboard.adapters import evdev as evdev_adapter
+from hardware.input.keyboard.adapters.dummy import DummyKeyboardAdapter
+from hardware.input.keyboard.adapters.stdin import StdinKeyboardAdapter
+from hardware.input.keyboard.adapters.evdev import EvdevKeyboardAdapter, _KEY_TABLE
+
+DOWN, UP, REPEAT = 1, 0, 2
+
+
+def key(code: int, value: int) -> InputEvent:
+    return InputEvent(0, 0, ecodes.EV_KEY, code, value)
+
+
+class FakeBus:
+    def __init__(self):
+        self.published = []
+
+    def publish_nowait(self, event):
+        self.published.append((event.key, event.modifiers))
+
+
+class FakeDevice:
+    """Stands in for evdev.InputDevice; a socketpair provides the readable fd"""
+
+    name = "Fake keyboard"
+
+    def __init__(self):
+        self._sock, self._peer = socket.socketpair()
+        self._sock.setblocking(False)
+        self.fd = self._sock.fileno()
+        self._pending = deque()
+        self.closed = False
+
+    def feed(self, result) -> None:
+        """Queue the result of the next read(): a list of events or an exception"""
+        self._pending.append(result)
+        self._peer.send(b"x")
+
+    def read(self):
+        try:
+            self._sock.recv(64)
+        except BlockingIOError:
+            pass
+        if not self._pending:
+            raise BlockingIOError()
+        result = self._pending.popleft()
+        if isinstance(result, Exception):
+            raise result
+        return iter(result)
+
+    def close(self) -> None:
+        self.closed = True
+        self._sock.close()
+        self._peer.close()
+
+
+class TestKeyTable:
+    def test_normalized_names_and_modifiers(self):
+        assert _KEY_TABLE[ecodes.KEY_A] == ("A", None)
+        assert _KEY_TABLE[ecodes.KEY_ENTER] == ("ENTER", None)
+        assert _KEY_TABLE[ecodes.KEY_LEFTCTRL] == ("", "CTRL")
+        assert _KEY_TABLE[ecodes.KEY_RIGHTSHIFT] == ("", "SHIFT")
+        assert _KEY_TABLE[ecodes.KEY_LEFTALT] == ("", "ALT")
+
+
+class TestKeyHandling:
+    def test_modifier_down_up_repeat(self):
+        bus = FakeBus()
+        adapter = EvdevKeyboardAdapter(bus)
+
+        adapter._handle_key_event(ecodes.KEY_LEFTCTRL, DOWN)
+        adapter._handle_key_event(ecodes.KEY_A, DOWN)
+        adapter._handle_key_event(ecodes.KEY_LEFTCTRL, REPEAT)   # repeat keeps the modifier
+        adapter._handle_key_event(ecodes.KEY_A, REPEAT)          # not published
+        adapter._handle_key_event(ecodes.KEY_A, UP)              # not published
+        adapter._handle_key_event(ecodes.KEY_LEFTCTRL, UP)
+        adapter._handle_key_event(ecodes.KEY_A, DOWN)
+        adapter._handle_key_event(0xFFFF, DOWN)                  # unknown code ignored
+
+        assert bus.published == [("A", ["CTRL"]), ("A", [])]
+
+    def test_on_readable_drains_and_ignores_blocking_io(self):
+        bus = FakeBus()
+        adapter = EvdevKeyboardAdapter(bus)
+        adapter.device = FakeDevice()
+
+        adapter.device.feed([
+            key(ecodes.KEY_LEFTSHIFT, DOWN),
+            InputEvent(0, 0, ecodes.EV_SYN, 0, 0),
+            key(ecodes.KEY_B, DOWN),
+            key(ecodes.KEY_B, UP),
+        ])
+        adapter._on_readable()
+        adapter._on_readable()          # nothing pending → BlockingIOError swallowed
+
+        assert bus.published == [("B", ["SHIFT"])]
+        adapter.device.close()
+
+
+class TestRun:
+    async def test_read_error_ends_run(self, monkeypatch):
+        device = FakeDevice()
+        monkeypatch.setattr(evdev_adapter, "InputDevice", lambda path: device)
+        bus = FakeBus()
+        adapter = EvdevKeyboardAdapter(bus, device_path="/dev/input/event-fake")
+
+        task = asyncio.create_task(adapter.run())
+        device.feed([key(ecodes.KEY_C, DOWN)])
+        await asyncio.sleep(0.01)
+        assert bus.published == [("C", [])]
+
+        device.feed(OSError(19, "No such device"))
+        with pytest.raises(RuntimeError, match="device lost"):
+            await asyncio.wait_for(task, 1.0)
+        assert device.closed
+
+    async def test_start_keyboard_falls_back(self, monkeypatch):
+        device = FakeDevice()
+        started = []
+
+        async def find_device(self):
+            return "/dev/input/event-fake"
+
+        async def stdin_run(self):
+            raise RuntimeError("STDIN is not a TTY")
+
+        async def dummy_run(self):
+            started.append(type(self).__name__)
+
+        monkeypatch.setattr(evdev_adapter, "InputDevice", lambda path: device)
+        monkeypatch.setattr(EvdevKeyboardAdapter, "_find_keyboard_device", find_device)
+        monkeypatch.setattr(StdinKeyboardAdapter, "run", stdin_run)
+        monkeypatch.setattr(DummyKeyboardAdapter, "run", dummy_run)
+
+        task = asyncio.create_task(factory.start_keyboard(FakeBus()))
+        await asyncio.sleep(0.01)
+        device.feed(OSError(19, "No such device"))
+        await asyncio.wait_for(task, 1.0)
+
+        assert started == ["DummyKeyboardAdapter"]
+        assert device.closed
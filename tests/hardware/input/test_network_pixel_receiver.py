@@ -0,0 +1,136 @@
+"""
+Tests for sACN / Art-Net network pixel input.
+
+Verifies:
+- E1.31 / ArtDmx header parsing (also in place into a reused DmxHeader)
+- Universe data copied into the right zone buffer (incl. spanning universes)
+- Stale sequence numbers dropped
+- Coalesced flush submits one NETWORK PixelFrame
+"""
+
+import asyncio
+import pytest
+
+from models.enums import ZoneID, FramePriority, FrameSource, NetworkInputProtocol
+from models.frame import PixelFrame
+from models.zone_mapping import NetworkInputConfig, UniverseZoneMapping
+from hardware.input.network import (
+    NetworkPixelReceiver, DmxHeader, build_sacn, build_artnet, parse_sacn, parse_artnet,
+    parse_sacn_into, parse_artnet_into,
+)
+
+
+class FakeFrameManager:
+    def __init__(self):
+        self.frames = []
+
+    def submit_frame(self, frame):
+        self.frames.append(frame)
+
+
+def make_config(protocol=NetworkInputProtocol.SACN, universes=None, channels_per_universe=510):
+    return NetworkInputConfig(
+        enabled=True,
+        protocol=protocol,
+        bind_host="127.0.0.1",
+        port=0,
+        priority=FramePriority.NETWORK,
+        ttl=0.0,
+        channels_per_universe=channels_per_universe,
+        universes=universes or [UniverseZoneMapping(zone_id=ZoneID.FLOOR, universe=1)],
+    )
+
+
+class TestPacketParsing:
+    def test_sacn_roundtrip(self):
+        packet = parse_sacn(build_sacn(42, bytes(range(12)), sequence=7))
+        assert packet is not None
+        assert packet.universe == 42
+        assert packet.sequence == 7
+        assert packet.data_length == 12
+
+    def test_artnet_roundtrip(self):
+        packet = parse_artnet(build_artnet(0x123, bytes(range(12)), sequence=3))
+        assert packet is not None
+        assert packet.universe == 0x123
+        assert packet.data_length == 12
+
+    def test_garbage_rejected(self):
+        assert parse_sacn(b"\x00" * 200) is None
+        assert parse_artnet(b"Art-Net\x00" + b"\x00" * 20) is None
+
+    def test_parse_into_reuses_header(self):
+        header = DmxHeader()
+
+        assert parse_sacn_into(build_sacn(5, bytes(6), sequence=1, priority=150), header)
+        assert (header.universe, header.sequence, header.data_length, header.priority) == (5, 1, 6, 150)
+
+        assert parse_artnet_into(build_artnet(0x101, bytes(4), sequence=2), header)
+        assert (header.universe, header.sequence, header.data_length, header.priority) == (0x101, 2, 4, 100)
+
+        assert not parse_sacn_into(b"\x00" * 200, header)
+        assert header.universe == 0x101    # rejected packets leave the header untouched
+
+
+class TestReceiver:
+    def test_copies_universe_into_zone_buffer(self):
+        fm = FakeFrameManager()
+        receiver = NetworkPixelReceiver(make_config(), {ZoneID.FLOOR: 2}, fm)
+
+        receiver._flush_handle = object()  # suppress scheduling outside a loop
+        receiver.datagram_received(build_sacn(1, bytes([1, 2, 3, 4, 5, 6, 7, 8, 9])), None)
+
+        assert bytes(receiver.buffers[ZoneID.FLOOR]) == bytes([1, 2, 3, 4, 5, 6])
+
+    def test_zone_spans_next_universe(self):
+        config = make_config(channels_per_universe=6)
+        fm = FakeFrameManager()
+        receiver = NetworkPixelReceiver(config, {ZoneID.FLOOR: 3}, fm)
+        receiver._flush_handle = object()
+
+        receiver.datagram_received(build_sacn(1, bytes([1, 1, 1, 2, 2, 2])), None)
+        receiver.datagram_received(build_sacn(2, bytes([3, 3, 3])), None)
+
+        assert bytes(receiver.buffers[ZoneID.FLOOR]) == bytes([1, 1, 1, 2, 2, 2, 3, 3, 3])
+
+    def test_stale_sequence_dropped(self):
+        fm = FakeFrameManager()
+        receiver = NetworkPixelReceiver(make_config(), {ZoneID.FLOOR: 1}, fm)
+        receiver._flush_handle = object()
+
+        receiver.datagram_received(build_sacn(1, bytes([9, 9, 9]), sequence=10), None)
+        receiver.datagram_received(build_sacn(1, bytes([1, 1, 1]), sequence=9), None)
+
+        assert bytes(receiver.buffers[ZoneID.FLOOR]) == bytes([9, 9, 9])
+        assert receiver.packets_out_of_order == 1
+
+    async def test_flush_submits_single_pixel_frame(self):
+        config = make_config(
+            protocol=NetworkInputProtocol.ARTNET,
+            universes=[
+                UniverseZoneMapping(zone_id=ZoneID.FLOOR, universe=0),
+                UniverseZoneMapping(zone_id=ZoneID.LAMP, universe=1),
+            ],
+        )
+        fm = FakeFrameManager()
+        receiver = NetworkPixelReceiver(config, {ZoneID.FLOOR: 2, ZoneID.LAMP: 1}, fm)
+
+        receiver.datagram_received(build_artnet(0, bytes([255, 0, 0, 255, 0, 0])), None)
+        receiver.datagram_received(build_artnet(1, bytes([0, 0, 255])), None)
+        await asyncio.sleep(receiver.COALESCE_DELAY * 5)
+
+        assert len(fm.frames) == 1
+        frame = fm.frames[0]
+        assert isinstance(frame, PixelFrame)
+        assert frame.priority == FramePriority.NETWORK
+        assert frame.source == FrameSource.NETWORK
+        assert [c.to_rgb() for c in frame.zone_pixels[ZoneID.FLOOR]] == [(255, 0, 0), (255, 0, 0)]
+        assert frame.zone_pixels[ZoneID.FLOOR][0] is frame.zone_pixels[ZoneID.FLOOR][1]
+        assert [c.to_rgb() for c in frame.zone_pixels[ZoneID.LAMP]] == [(0, 0, 255)]
+
+    def test_priority_must_override_animation(self):
+        with pytest.raises(ValueError):
+            NetworkInputConfig(
+                enabled=True, protocol=NetworkInputProtocol.SACN, bind_host="", port=0,
+                priority=FramePriority.MANUAL, ttl=1.0, channels_per_universe=510,
+            )
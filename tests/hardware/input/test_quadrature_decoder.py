@@ -0,0 +1,74 @@
+"""
+Tests for QuadratureDecoder and rotation coalescing.
+
+Verifies:
+- Clockwise / counter-clockwise Gray-code sequences produce signed detents
+- Contact bounce cancels out, illegal transitions are counted
+- ControlPanelController publishes one summed rotate event per window
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.control_panel_controller import ControlPanelController
+from hardware.input.quadrature_decoder import QuadratureDecoder
+from models.events.sources import EncoderSource
+
+# (clk, dt) levels for one full clockwise cycle starting at rest (1, 1)
+CW_CYCLE = [(0, 1), (0, 0), (1, 0), (1, 1)]
+
+
+class TestQuadratureDecoder:
+    def test_clockwise_full_cycle(self):
+        decoder = QuadratureDecoder(1, 1, steps_per_detent=4)
+        assert [decoder.update(a, b) for a, b in CW_CYCLE] == [0, 0, 0, 1]
+
+    def test_counter_clockwise_half_steps(self):
+        decoder = QuadratureDecoder(1, 1, steps_per_detent=2)
+        ccw = list(reversed(CW_CYCLE[:-1])) + [(1, 1)]
+        assert sum(decoder.update(a, b) for a, b in ccw) == -2
+
+    def test_bounce_cancels(self):
+        decoder = QuadratureDecoder(1, 1, steps_per_detent=2)
+        bouncy = [(0, 1), (1, 1), (0, 1), (0, 0)]
+        assert sum(decoder.update(a, b) for a, b in bouncy) == 1
+
+    def test_illegal_transition_counted(self):
+        decoder = QuadratureDecoder(1, 1)
+        assert decoder.update(0, 0) == 0
+        assert decoder.errors == 1
+
+    def test_invalid_steps_per_detent(self):
+        with pytest.raises(ValueError):
+            QuadratureDecoder(steps_per_detent=3)
+
+
+class CollectingBus:
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+    def publish_nowait(self, event):
+        self.events.append(event)
+
+
+class TestRotationCoalescing:
+    async def test_one_event_per_window_with_summed_delta(self):
+        panel = SimpleNamespace(selector=None, modulator=None, buttons=[])
+        bus = CollectingBus()
+        controller = ControlPanelController(panel, bus, rotate_interval=0.01)  # type: ignore[arg-type]
+
+        for _ in range(5):
+            controller._queue_rotation(EncoderSource.SELECTOR, 1)
+        controller._queue_rotation(EncoderSource.SELECTOR, -1)
+        controller._queue_rotation(EncoderSource.MODULATOR, -3)
+
+        await asyncio.sleep(0.05)
+
+        deltas = {e.source: e.delta for e in bus.events}
+        assert len(bus.events) == 2
+        assert deltas == {EncoderSource.SELECTOR: 4, EncoderSource.MODULATOR: -3}
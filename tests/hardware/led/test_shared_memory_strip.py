@@ -0,0 +1,65 @@
+"""
+Tests for SharedMemoryStrip (VirtualStrip publishing to shared memory).
+
+Verifies:
+- apply_frame() publishes packed RGB with increasing sequence
+- Reader sees frames from the ring and detects overwritten slots
+- shutdown() unlinks the block
+"""
+
+import os
+import pytest
+
+from models.color import Color
+from hardware.led import SharedMemoryStrip, SharedMemoryFrameReader
+
+
+@pytest.fixture
+def strip():
+    name = f"diuna_test_{os.getpid()}"
+    strip = SharedMemoryStrip(pixel_count=3, name=name, slots=4)
+    yield strip
+    strip.shutdown()
+
+
+class TestSharedMemoryStrip:
+    def test_apply_frame_publishes_rgb(self, strip):
+        reader = SharedMemoryFrameReader(strip.name)
+        assert reader.read_latest() is None
+
+        strip.apply_frame([Color.from_rgb(1, 2, 3), Color.from_rgb(4, 5, 6), Color.from_rgb(7, 8, 9)])
+
+        seq, _, rgb = reader.read_latest()
+        assert seq == 1
+        assert rgb == bytes(range(1, 10))
+        reader.close()
+
+    def test_ring_keeps_last_slots(self, strip):
+        reader = SharedMemoryFrameReader(strip.name)
+
+        for value in range(6):
+            strip.apply_frame([Color.from_rgb(value, 0, 0)] * 3)
+
+        frames = reader.read_since(0)
+        assert [seq for seq, _, _ in frames] == [3, 4, 5, 6]
+        assert frames[-1][2][0] == 5
+        assert reader.read(1) is None  # overwritten
+        reader.close()
+
+    def test_zero_copy_view(self, strip):
+        reader = SharedMemoryFrameReader(strip.name)
+        strip.apply_frame([Color.from_rgb(9, 9, 9)] * 3)
+
+        view = reader.view(reader.sequence)
+        assert bytes(view) == b"\x09" * 9
+        assert reader.is_valid(reader.sequence)
+        view.release()
+        reader.close()
+
+    def test_shutdown_unlinks(self):
+        name = f"diuna_test_unlink_{os.getpid()}"
+        strip = SharedMemoryStrip(pixel_count=1, name=name)
+        strip.shutdown()
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemoryFrameReader(name)
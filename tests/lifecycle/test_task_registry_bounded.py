@@ -0,0 +1,101 @@
+"""
+Tests for the bounded TaskRegistry.
+
+Verifies:
+- Finished records are kept in bounded rings, failures in their own ring
+- Lifetime counters keep counting after records are evicted
+- Origin stacks are captured only for sampled tasks
+- Task changes are broadcast in deduplicated batches, only with a sink set
+"""
+
+import asyncio
+
+from lifecycle.task_registry import TaskCategory, TaskRegistry
+
+
+async def noop():
+    return None
+
+
+async def boom():
+    raise RuntimeError("boom")
+
+
+async def run_tracked(registry: TaskRegistry, coro, category=TaskCategory.BACKGROUND):
+    task = asyncio.create_task(coro)
+    registry.register(task, category, "test task")
+    try:
+        await task
+    except (RuntimeError, asyncio.CancelledError):
+        pass
+    return task
+
+
+class TestBoundedTaskRegistry:
+    async def test_finished_records_bounded(self):
+        registry = TaskRegistry(max_finished=10, max_failed=3)
+        for _ in range(50):
+            await run_tracked(registry, noop())
+        for _ in range(5):
+            await run_tracked(registry, boom(), TaskCategory.HARDWARE)
+
+        assert len(registry.list_all()) == 13
+        assert len(registry.failed()) == 3
+        assert [r.info.id for r in registry.failed()] == [53, 54, 55]
+
+        stats = registry.get_stats()
+        assert stats["total"] == 55
+        assert stats["completed"] == 50
+        assert stats["failed"] == 5
+        assert stats["retained"] == 13
+        assert stats["categories"] == {"BACKGROUND": 50, "HARDWARE": 5}
+        assert registry.get_counters()["HARDWARE"]["failed"] == 5
+
+    async def test_active_tasks_never_evicted(self):
+        registry = TaskRegistry(max_finished=2)
+        blocker = asyncio.Event()
+        long_running = asyncio.create_task(blocker.wait())
+        registry.register(long_running, TaskCategory.SYSTEM, "long running")
+
+        for _ in range(10):
+            await run_tracked(registry, noop())
+
+        assert [r.task for r in registry.active()] == [long_running]
+        assert registry.get_tasks_for_shutdown() == [long_running]
+
+        long_running.cancel()
+        await asyncio.gather(long_running, return_exceptions=True)
+        assert registry.get_stats()["cancelled"] == 1
+        assert registry._get_record_by_task(long_running).cancelled
+
+    async def test_stack_sampling(self):
+        registry = TaskRegistry(stack_sample_every=3)
+        tasks = [await run_tracked(registry, noop()) for _ in range(6)]
+
+        stacks = [registry._get_record_by_task(t).info.origin_stack for t in tasks]
+        assert [bool(stack) for stack in stacks] == [False, False, True, False, False, True]
+
+        unsampled = TaskRegistry()
+        task = await run_tracked(unsampled, noop())
+        assert unsampled._get_record_by_task(task).info.origin_stack == ""
+
+    async def test_broadcasts_batched(self):
+        registry = TaskRegistry(broadcast_interval=0.01)
+        batches = []
+
+        async def sink(batch):
+            batches.append([(event_type, record.info.id) for event_type, record in batch])
+
+        # No sink: nothing is queued
+        await run_tracked(registry, noop())
+        assert registry._pending_broadcasts == {}
+
+        registry.set_broadcast_sink(sink)
+        for _ in range(20):
+            await run_tracked(registry, noop())
+        await asyncio.sleep(0.05)
+
+        assert registry.broadcast_batches == len(batches) == 1
+        # Created and completed within one window: a single "created" event per task, current state
+        assert batches[0] == [("task:created", task_id) for task_id in range(2, 22)]
+        assert all(r.finished_at for r in registry.list_all())
@@ -0,0 +1,90 @@
+"""
+Tests for the compiled config cache (ConfigCache + ConfigManager cache_path).
+
+Verifies:
+- A warm start returns the cached data without parsing YAML
+- Touched but unchanged files still hit (content hash), then take the stat fast path
+- Editing any included file invalidates the cache
+- A corrupt cache or one built from another config is ignored
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+import yaml
+
+from hardware.gpio import MockGPIOManager
+from managers.config_cache import ConfigCache
+from managers.config_manager import ConfigManager
+
+SRC_CONFIG = Path(__file__).resolve().parents[2] / "src" / "config"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    target = tmp_path / "config"
+    shutil.copytree(SRC_CONFIG, target)
+    return target
+
+
+def load(config_dir: Path, cache_path: Path) -> ConfigManager:
+    manager = ConfigManager(MockGPIOManager(), config_path=config_dir / "config.yaml", cache_path=cache_path)
+    manager.load()
+    return manager
+
+
+class TestConfigCache:
+    def test_warm_start_skips_yaml(self, config_dir, tmp_path, monkeypatch):
+        cache_path = tmp_path / "config.cache"
+        cold = load(config_dir, cache_path)
+        assert cache_path.exists() and cold.cache.misses == 1
+
+        def no_yaml(*args, **kwargs):
+            raise AssertionError("YAML parsed on a warm start")
+
+        monkeypatch.setattr(yaml, "safe_load", no_yaml)
+        warm = load(config_dir, cache_path)
+
+        assert warm.cache.hits == 1
+        assert warm.data == cold.data
+        assert [zone.start_index for zone in warm.get_all_zones()] == [zone.start_index for zone in cold.get_all_zones()]
+
+    def test_touched_file_hits_by_hash(self, config_dir, tmp_path, monkeypatch):
+        cache_path = tmp_path / "config.cache"
+        load(config_dir, cache_path)
+
+        zones = config_dir / "zones.yaml"
+        zones.write_bytes(zones.read_bytes())                       # new mtime, same content
+        cache = ConfigCache(cache_path)
+        assert cache.get(config_dir / "config.yaml") is not None
+
+        rehashed = []
+        monkeypatch.setattr(ConfigCache, "_rehash", classmethod(lambda cls, sources: rehashed.append(1)))
+        assert cache.get(config_dir / "config.yaml") is not None    # stats refreshed: fast path
+        assert rehashed == []
+
+    def test_edited_include_invalidates(self, config_dir, tmp_path):
+        cache_path = tmp_path / "config.cache"
+        load(config_dir, cache_path)
+
+        colors = config_dir / "colors.yaml"
+        colors.write_text(colors.read_text() + "\n# edited\n")
+
+        manager = load(config_dir, cache_path)
+        assert manager.cache.misses == 1
+        assert ConfigCache(cache_path).get(config_dir / "config.yaml") is not None   # rebuilt
+
+    def test_corrupt_cache_ignored(self, config_dir, tmp_path):
+        cache_path = tmp_path / "config.cache"
+        cache_path.write_bytes(b"not a pickle")
+
+        manager = load(config_dir, cache_path)
+        assert manager.data["zones"]
+        assert ConfigCache(cache_path).get(config_dir / "config.yaml") is not None
+
+    def test_other_root_ignored(self, config_dir, tmp_path):
+        cache_path = tmp_path / "config.cache"
+        load(config_dir, cache_path)
+
+        assert ConfigCache(cache_path).get(config_dir / "factory_defaults.yaml") is None
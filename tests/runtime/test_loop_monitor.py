@@ -0,0 +1,71 @@
+"""
+Tests for the LoopLagMonitor.
+
+Verifies:
+- Heartbeat lag is bucketed into the histogram
+- A blocking call is recorded as a stall with the TaskRegistry description
+  and the blocking location, sampled while the loop was blocked
+- Lag below the threshold is not a stall
+"""
+
+import asyncio
+import time
+
+from lifecycle.task_registry import TaskCategory, create_tracked_task
+from runtime.loop_monitor import LAG_BUCKETS_MS, LoopLagMonitor
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestLoopLagMonitor:
+    def test_histogram(self):
+        monitor = LoopLagMonitor(stall_threshold_ms=100)
+        for lag_ms in (0.2, 3.0, 3.0, 40.0, 5000.0):
+            monitor.record(lag_ms)
+
+        counts = dict(zip((*LAG_BUCKETS_MS, None), monitor.bucket_counts))
+        assert counts[1.0] == 1
+        assert counts[5.0] == 2
+        assert counts[50.0] == 1
+        assert counts[None] == 1
+        assert monitor.max_lag_ms == 5000.0
+        assert monitor.stalls_total == 1
+
+    async def test_stall_attributed_to_tracked_task(self):
+        monitor = LoopLagMonitor(interval=0.01, stall_threshold_ms=40)
+        heartbeat = asyncio.create_task(monitor.run())
+
+        async def renderer():
+            await asyncio.sleep(0.05)
+            block_the_loop(0.2)
+
+        await create_tracked_task(renderer(), category=TaskCategory.RENDER, description="Blocking renderer")
+        await asyncio.sleep(0.05)
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+        assert monitor.stalls_total == 1
+        stall = monitor.stalls[0]
+        assert stall.lag_ms >= 150
+        assert stall.task_description == "Blocking renderer"
+        assert stall.task_category == "RENDER"
+        assert stall.location.endswith("in block_the_loop")
+
+        stats = monitor.get_stats()
+        assert stats["recent_stalls"][0]["task_id"] == stall.task_id
+        assert monitor._stop.is_set()
+
+    async def test_small_lag_is_not_a_stall(self):
+        monitor = LoopLagMonitor(interval=0.01, stall_threshold_ms=200)
+        heartbeat = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.03)
+        block_the_loop(0.05)
+        await asyncio.sleep(0.03)
+        heartbeat.cancel()
+        await asyncio.gather(heartbeat, return_exceptions=True)
+
+        assert monitor.samples >= 3
+        assert monitor.stalls_total == 0
+        assert monitor.max_lag_ms >= 30
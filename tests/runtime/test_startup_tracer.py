@@ -0,0 +1,57 @@
+"""
+Tests for the StartupTracer.
+
+Verifies:
+- Phases record start offset, duration and thread (also when the block raises)
+- Deferred imports are recorded per module, from a worker thread
+- Milestones keep their first value
+- The summary exposes time to first light
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from runtime.startup_tracer import StartupTracer
+
+
+class TestStartupTracer:
+    def test_phase_recorded(self):
+        tracer = StartupTracer()
+        with tracer.phase("config"):
+            pass
+        with pytest.raises(RuntimeError):
+            with tracer.phase("hardware"):
+                raise RuntimeError("no strip")
+
+        names = [phase.name for phase in tracer.phases]
+        assert names == ["config", "hardware"]
+        assert tracer.phases[0].start_ms <= tracer.phases[1].start_ms
+        assert tracer.phases[0].thread == threading.current_thread().name
+
+    async def test_imports_in_worker_thread(self):
+        tracer = StartupTracer()
+        await asyncio.to_thread(tracer.import_modules, ["json", "colorsys"])
+
+        imports = [phase for phase in tracer.phases if phase.kind == "import"]
+        assert [phase.name for phase in imports] == ["json", "colorsys"]
+        assert all(phase.thread != threading.main_thread().name for phase in imports)
+
+    def test_first_mark_wins(self):
+        tracer = StartupTracer()
+        tracer.mark("first_light")
+        first = tracer.milestones["first_light"]
+        tracer.mark("first_light")
+        assert tracer.milestones["first_light"] == first
+
+    def test_summary(self):
+        tracer = StartupTracer()
+        tracer.import_modules(["json"])
+        tracer.mark("first_light")
+
+        summary = tracer.get_summary()
+        assert summary["time_to_first_light_ms"] == tracer.milestones["first_light"]
+        assert summary["ready_ms"] is None
+        assert summary["phases"][0]["name"] == "json"
+        assert summary["imports_ms"] >= 0
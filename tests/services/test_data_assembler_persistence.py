@@ -0,0 +1,120 @@
+"""
+Tests for DataAssembler state persistence.
+
+Verifies:
+- state.json is read once and then served from memory
+- Saves are debounced into one compact, atomic write off the event loop
+- Sections that did not change are not written
+- A failed write is retried on the next save
+"""
+
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from models.color import Color
+from models.domain import ApplicationState, ZoneCombined, ZoneConfig, ZoneState
+from models.enums import ZoneID
+from services import data_assembler
+from services.data_assembler import DataAssembler
+
+
+def make_zone(zone_id: ZoneID, brightness: int = 50) -> ZoneCombined:
+    config = ZoneConfig(
+        id=zone_id, display_name=zone_id.name.title(), pixel_count=10, enabled=True,
+        reversed=False, order=0, start_index=0, end_index=9,
+    )
+    state = ZoneState(id=zone_id, color=Color.from_rgb(255, 0, 0), brightness=brightness, is_on=True)
+    return ZoneCombined(config=config, state=state)
+
+
+@pytest.fixture
+def assembler(tmp_path):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({
+        "zones": {"floor": {"brightness": 10}},
+        "current_animation": {"id": "BREATHE"},
+        "application": {"edit_mode_on": False},
+    }, indent=2))
+    config_manager = SimpleNamespace(color_manager=None, animation_manager=None)
+    return DataAssembler(config_manager, state_path, debounce_ms=20)
+
+
+class TestStateDocument:
+    def test_loaded_once(self, assembler):
+        first = assembler.load_state()
+        assembler.state_path.unlink()
+        assert assembler.load_state() is first
+
+    async def test_debounced_compact_atomic_write(self, assembler):
+        for brightness in range(10):
+            assembler.save_zone_state([make_zone(ZoneID.FLOOR, brightness)])
+        await asyncio.sleep(0.1)
+
+        assert assembler.writes == 1
+        text = assembler.state_path.read_text()
+        assert "\n" not in text and ": " not in text
+        state = json.loads(text)
+        assert state["zones"]["floor"]["brightness"] == 9
+        assert state["current_animation"] == {"id": "BREATHE"}          # untouched section kept
+        assert list(state) == ["zones", "current_animation", "application"]
+        assert not list(assembler.state_path.parent.glob("*.tmp"))
+
+    async def test_write_runs_off_loop(self, assembler, monkeypatch):
+        threads = []
+        write = assembler._write_state_to_disk
+
+        def recording_write(*args):
+            threads.append(threading.current_thread())
+            return write(*args)
+
+        monkeypatch.setattr(assembler, "_write_state_to_disk", recording_write)
+        assembler.save_zone_state([make_zone(ZoneID.LAMP)])
+        assert await assembler.flush()
+
+        assert threads and threads[0] is not threading.main_thread()
+
+    async def test_logs_on_loop_thread(self, assembler, monkeypatch):
+        logged = []
+
+        class RecordingLog:
+            def debug(self, message, *args):
+                logged.append(threading.current_thread())
+
+            error = debug
+
+        monkeypatch.setattr(data_assembler, "log", RecordingLog())
+        assembler.save_zone_state([make_zone(ZoneID.LAMP)])
+        assert await assembler.flush()
+
+        assert logged and all(thread is threading.main_thread() for thread in logged)
+
+    async def test_unchanged_section_not_written(self, assembler):
+        assembler.save_application_state(ApplicationState())
+        assert await assembler.flush()
+        assert assembler.writes == 1
+
+        assembler.save_application_state(ApplicationState())
+        assert not await assembler.flush()
+        assert assembler.writes == 1
+
+    async def test_failed_write_retried(self, assembler, monkeypatch):
+        write = assembler._write_state_to_disk
+        calls = []
+
+        def failing_once(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            return write(*args)
+
+        monkeypatch.setattr(assembler, "_write_state_to_disk", failing_once)
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 77)])
+        with pytest.raises(OSError):
+            await assembler.flush()
+
+        assert await assembler.flush()
+        assert json.loads(assembler.state_path.read_text())["zones"]["floor"]["brightness"] == 77
@@ -0,0 +1,87 @@
+"""
+Tests for EventBus precompiled dispatch.
+
+Verifies:
+- Sync and async handlers are both dispatched, in priority order
+- Filters are applied from the compiled table
+- Middleware with is_active() == False is skipped
+- Publishing an event type without handlers is a silent no-op
+- A failing handler does not stop the remaining ones
+"""
+
+from models.events import EncoderRotateEvent, EventType
+from models.events.sources import EncoderSource
+from services.event_bus import EventBus
+
+
+class TestCompiledDispatch:
+    async def test_sync_and_async_handlers_in_priority_order(self):
+        bus = EventBus()
+        order = []
+
+        def sync_handler(event):
+            order.append("sync")
+
+        async def async_handler(event):
+            order.append("async")
+
+        bus.subscribe(EventType.ENCODER_ROTATE, sync_handler, priority=0)
+        bus.subscribe(EventType.ENCODER_ROTATE, async_handler, priority=10)
+
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+
+        assert order == ["async", "sync"]
+        assert [is_async for is_async, _, _ in bus._dispatch[EventType.ENCODER_ROTATE]] == [True, False]
+
+    async def test_filter_applied(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(
+            EventType.ENCODER_ROTATE,
+            received.append,
+            filter_fn=lambda e: e.source == EncoderSource.MODULATOR,
+        )
+
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+        await bus.publish(EncoderRotateEvent(EncoderSource.MODULATOR, -1))
+
+        assert [e.delta for e in received] == [-1]
+
+    async def test_inactive_middleware_skipped(self):
+        bus = EventBus()
+        calls = []
+        active = False
+
+        def counting_middleware(event):
+            calls.append(event)
+            return event
+
+        counting_middleware.is_active = lambda: active  # type: ignore[attr-defined]
+        bus.add_middleware(counting_middleware)
+        bus.subscribe(EventType.ENCODER_ROTATE, lambda e: None)
+
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+        assert calls == []
+
+        active = True
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+        assert len(calls) == 1
+
+    async def test_no_handlers_is_noop(self):
+        bus = EventBus()
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+        assert len(bus.get_event_history()) == 1
+
+    async def test_failing_handler_isolated(self):
+        bus = EventBus()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(EventType.ENCODER_ROTATE, broken, priority=10)
+        bus.subscribe(EventType.ENCODER_ROTATE, received.append, priority=0)
+
+        await bus.publish(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+
+        assert len(received) == 1
@@ -0,0 +1,140 @@
+"""
+Tests for EventBus queue mode (start_queue / publish_nowait).
+
+Verifies:
+- publish_nowait dispatches through workers, same-type events stay ordered
+- DROP_OLDEST / COALESCE / BLOCK overflow policies (COALESCE never evicts keyed events)
+- stop_queue drains pending events
+- Queue metrics (depth, drops, handler latency)
+- Without the queue, publish_nowait falls back to a tracked task per event
+"""
+
+import asyncio
+
+from lifecycle.task_registry import TaskRegistry
+from models.enums import ButtonID, EventOverflowPolicy
+from models.events import EncoderRotateEvent, ButtonPressEvent, EventType
+from models.events.sources import EncoderSource
+from services.event_bus import EventBus
+
+
+def rotate(delta: int, source: EncoderSource = EncoderSource.SELECTOR) -> EncoderRotateEvent:
+    return EncoderRotateEvent(source, delta)
+
+
+class TestQueueDispatch:
+    async def test_publish_nowait_keeps_type_order(self):
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            received.append(event.delta)
+
+        bus.subscribe(EventType.ENCODER_ROTATE, handler)
+        bus.start_queue(maxsize=100, workers=3)
+
+        for delta in range(1, 21):
+            bus.publish_nowait(rotate(delta))
+        await bus.join()
+
+        assert received == list(range(1, 21))
+        metrics = bus.get_queue_metrics()
+        assert metrics["dispatched"] == 20
+        assert metrics["handler_latency_ms"]["ENCODER_ROTATE"]["count"] == 20
+        await bus.stop_queue()
+
+    async def test_fallback_without_queue(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.ENCODER_ROTATE, received.append)
+
+        bus.publish_nowait(rotate(1))
+        tracked = TaskRegistry.instance().list_all()[-1]
+        await asyncio.sleep(0)
+
+        assert len(received) == 1
+        assert tracked.info.description == "Publish ENCODER_ROTATE (no queue)"
+
+    async def test_stop_queue_drains(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.BUTTON_PRESS, received.append)
+        bus.start_queue(maxsize=10)
+
+        for _ in range(5):
+            bus.publish_nowait(ButtonPressEvent(ButtonID.BTN1))
+        await bus.stop_queue()
+
+        assert len(received) == 5
+        assert not bus.queue_running
+
+
+class TestOverflowPolicies:
+    async def test_drop_oldest(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.ENCODER_ROTATE, lambda e: received.append(e.delta))
+        bus.start_queue(maxsize=3, overflow=EventOverflowPolicy.DROP_OLDEST)
+
+        for delta in range(1, 6):          # worker has not run yet
+            bus.publish_nowait(rotate(delta))
+        await bus.join()
+
+        assert received == [3, 4, 5]
+        assert bus.get_queue_metrics()["dropped"] == 2
+        await bus.stop_queue()
+
+    async def test_coalesce_replaces_same_key(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.ENCODER_ROTATE, lambda e: received.append((e.source, e.delta)))
+        bus.set_coalesce_key(EventType.ENCODER_ROTATE, lambda e: e.source)
+        bus.start_queue(maxsize=2, overflow=EventOverflowPolicy.COALESCE)
+
+        bus.publish_nowait(rotate(1, EncoderSource.SELECTOR))
+        bus.publish_nowait(rotate(1, EncoderSource.MODULATOR))
+        bus.publish_nowait(rotate(2, EncoderSource.SELECTOR))    # full → replaces queued selector event
+        await bus.join()
+
+        assert received == [(EncoderSource.SELECTOR, 2), (EncoderSource.MODULATOR, 1)]
+        assert bus.get_queue_metrics()["coalesced"] == 1
+        await bus.stop_queue()
+
+    async def test_coalesce_never_evicts_keyed_events(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.ENCODER_ROTATE, lambda e: received.append(e.source))
+        bus.subscribe(EventType.BUTTON_PRESS, lambda e: received.append("button"))
+        bus.set_coalesce_key(EventType.ENCODER_ROTATE, lambda e: e.source)
+        bus.start_queue(maxsize=2, overflow=EventOverflowPolicy.COALESCE)
+
+        bus.publish_nowait(rotate(1, EncoderSource.SELECTOR))
+        bus.publish_nowait(ButtonPressEvent(ButtonID.BTN1))
+        bus.publish_nowait(rotate(1, EncoderSource.MODULATOR))   # full → evicts the button press
+        bus.publish_nowait(ButtonPressEvent(ButtonID.BTN1))      # only keyed events queued → dropped
+        await bus.join()
+
+        assert received == [EncoderSource.SELECTOR, EncoderSource.MODULATOR]
+        assert bus.get_queue_metrics()["dropped"] == 2
+        await bus.stop_queue()
+
+    async def test_block_waits_for_space(self):
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.ENCODER_ROTATE, lambda e: received.append(e.delta))
+        bus.start_queue(maxsize=2, overflow=EventOverflowPolicy.BLOCK)
+
+        bus.publish_nowait(rotate(1))
+        bus.publish_nowait(rotate(2))
+        bus.publish_nowait(rotate(3))      # full and cannot wait → dropped
+        await bus.enqueue(rotate(4))       # waits until the worker frees a slot
+        await bus.enqueue(rotate(5))
+        await bus.join()
+
+        assert received == [1, 2, 4, 5]
+        metrics = bus.get_queue_metrics()
+        assert metrics["blocked"] == 1
+        assert metrics["dropped"] == 1
+        assert metrics["high_water"] == 2
+        await bus.stop_queue()
@@ -0,0 +1,110 @@
+"""
+Tests for EventBus coalescing rules.
+
+Verifies:
+- A burst with the same key collapses into one event per window
+- Different keys are emitted separately
+- merge_zone_static accumulates partial zone state changes
+- publish() (awaited) bypasses coalescing
+- stop_queue flushes held events
+"""
+
+import asyncio
+
+from models.color import Color
+from models.enums import ZoneID
+from models.events import EventType, ZoneStaticStateChangedEvent
+from services.event_bus import CoalesceRule, EventBus
+from services.event_coalescing import DEFAULT_COALESCE_RULES, merge_zone_static
+
+
+def brightness(zone_id: ZoneID, value: int) -> ZoneStaticStateChangedEvent:
+    return ZoneStaticStateChangedEvent(zone_id=zone_id, brightness=value)
+
+
+def latest_wins_bus(window_ms: float = 10) -> EventBus:
+    bus = EventBus()
+    bus.add_coalesce_rule(CoalesceRule(
+        EventType.ZONE_STATIC_STATE_CHANGED,
+        key=lambda e: e.zone_id,
+        window_ms=window_ms,
+    ))
+    return bus
+
+
+class TestCoalescingWindow:
+    async def test_burst_collapses_to_latest(self):
+        bus = latest_wins_bus()
+        received = []
+        bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, lambda e: received.append(e.brightness))
+
+        for value in range(10):
+            bus.publish_nowait(brightness(ZoneID.FLOOR, value))
+        assert received == []                 # held until the window ends
+
+        await asyncio.sleep(0.03)
+        assert received == [9]
+
+        metrics = bus.get_queue_metrics()["coalescing"]["ZONE_STATIC_STATE_CHANGED"]
+        assert (metrics["received"], metrics["emitted"]) == (10, 1)
+
+    async def test_keys_are_independent(self):
+        bus = latest_wins_bus()
+        received = []
+        bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, lambda e: received.append(e.zone_id))
+
+        bus.publish_nowait(brightness(ZoneID.FLOOR, 1))
+        bus.publish_nowait(brightness(ZoneID.PIXEL, 1))
+        bus.publish_nowait(brightness(ZoneID.FLOOR, 2))
+        await asyncio.sleep(0.03)
+
+        assert len(received) == 2
+        assert set(received) == {ZoneID.FLOOR, ZoneID.PIXEL}
+
+    async def test_awaited_publish_not_coalesced(self):
+        bus = latest_wins_bus()
+        received = []
+        bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, received.append)
+
+        await bus.publish(brightness(ZoneID.FLOOR, 1))
+        await bus.publish(brightness(ZoneID.FLOOR, 2))
+
+        assert len(received) == 2
+
+    async def test_stop_queue_flushes_held(self):
+        bus = latest_wins_bus(window_ms=10_000)
+        received = []
+        bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, received.append)
+        bus.start_queue(maxsize=8)
+
+        bus.publish_nowait(brightness(ZoneID.FLOOR, 1))
+        await bus.stop_queue()
+
+        assert len(received) == 1
+
+
+class TestDefaultRules:
+    async def test_zone_static_fields_accumulate(self):
+        bus = EventBus()
+        for rule in DEFAULT_COALESCE_RULES:
+            bus.add_coalesce_rule(rule)
+        received = []
+        bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, received.append)
+
+        red = Color.from_rgb(255, 0, 0)
+        bus.publish_nowait(ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, color=red))
+        bus.publish_nowait(brightness(ZoneID.FLOOR, 40))
+        bus.publish_nowait(brightness(ZoneID.FLOOR, 41))
+        await asyncio.sleep(0.05)
+
+        assert len(received) == 1
+        assert received[0].color == red
+        assert received[0].brightness == 41
+        assert received[0].is_on is None
+
+    def test_merge_prefers_newer_values(self):
+        merged = merge_zone_static(
+            ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, brightness=10, is_on=False),
+            ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, is_on=True),
+        )
+        assert (merged.brightness, merged.is_on) == (10, True)
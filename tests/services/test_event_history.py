@@ -0,0 +1,81 @@
+"""
+Tests for the compact, indexed EventHistory ring.
+
+Verifies:
+- Records are compact dicts with scalar payloads
+- Per-type and per-zone queries return the last N matches, oldest first
+- Old records are evicted at capacity and never returned
+- clear() and since_seconds filtering
+- EventBus records every published event
+"""
+
+from models.color import Color
+from models.enums import ZoneID
+from models.events import EncoderRotateEvent, EventType, ZoneStaticStateChangedEvent
+from models.events.sources import EncoderSource
+from services.event_bus import EventBus
+from services.event_history import EventHistory
+
+
+def zone_event(zone_id: ZoneID, value: int) -> ZoneStaticStateChangedEvent:
+    return ZoneStaticStateChangedEvent(zone_id=zone_id, brightness=value)
+
+
+class TestEventHistory:
+    def test_compact_record(self):
+        history = EventHistory(capacity=10)
+        history.record(ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, color=Color.from_rgb(1, 2, 3)))
+
+        (record,) = history.query()
+        assert record["type"] == "ZONE_STATIC_STATE_CHANGED"
+        assert record["zone_id"] == "FLOOR"
+        assert record["payload"] == {"source": "ZONE_SERVICE", "color": (1, 2, 3)}
+
+    def test_type_and_zone_indexes(self):
+        history = EventHistory(capacity=100)
+        for i in range(30):
+            history.record(EncoderRotateEvent(EncoderSource.SELECTOR, 1))
+            history.record(zone_event(ZoneID.FLOOR if i % 2 else ZoneID.PIXEL, i))
+
+        rotations = history.query(event_type=EventType.ENCODER_ROTATE, limit=5)
+        assert len(rotations) == 5
+        assert [r["seq"] for r in rotations] == sorted(r["seq"] for r in rotations)
+
+        floor = history.query(zone_id=ZoneID.FLOOR, limit=3)
+        assert [r["payload"]["brightness"] for r in floor] == [25, 27, 29]
+
+        floor_static = history.query(event_type=EventType.ZONE_STATIC_STATE_CHANGED, zone_id=ZoneID.FLOOR)
+        assert len(floor_static) == 15
+        assert history.query(event_type=EventType.ENCODER_ROTATE, zone_id=ZoneID.FLOOR) == []
+
+    def test_eviction(self):
+        history = EventHistory(capacity=8)
+        for i in range(20):
+            history.record(zone_event(ZoneID.FLOOR, i))
+
+        records = history.query(zone_id=ZoneID.FLOOR, limit=100)
+        assert [r["payload"]["brightness"] for r in records] == list(range(12, 20))
+        assert len(history) == 8
+        assert history.stats()["total_recorded"] == 20
+
+    def test_clear_and_since(self):
+        history = EventHistory(capacity=8)
+        history.record(zone_event(ZoneID.FLOOR, 1))
+        history.clear()
+        assert history.query() == []
+        assert len(history) == 0
+        assert history.stats()["totals_by_type"] == {}
+
+        history.record(zone_event(ZoneID.FLOOR, 2))
+        assert len(history.query(since_seconds=60)) == 1
+        assert history.query(since_seconds=1e-9) == []
+
+
+class TestEventBusHistory:
+    async def test_published_events_recorded(self):
+        bus = EventBus(history_size=50)
+        await bus.publish(EncoderRotateEvent(EncoderSource.MODULATOR, -2))
+
+        (record,) = bus.get_event_history()
+        assert record["type"] == "ENCODER_ROTATE"
+        assert record["payload"] == {"source": "MODULATOR", "delta": -2}
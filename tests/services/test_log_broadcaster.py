@@ -0,0 +1,162 @@
+"""
+Tests for LogBroadcaster batching and per-client filters.
+
+Verifies:
+- Entries are sent as one 'log:batch' after flush_interval
+- A full batch is sent immediately without waiting for the interval
+- Filtered clients only receive matching entries, via their filter room
+- Nothing is emitted without subscribed clients
+- Invalid filter requests are rejected
+- Entries logged from other threads are handled on the event loop
+- Entries logged before the store is set are persisted when it is
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from services.log_broadcaster import LogBroadcaster, LogClientFilter
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.emits = []
+        self.rooms = {}
+
+    async def emit(self, event, data=None, room=None, skip_sid=None, **kw):
+        self.emits.append((event, data, room, skip_sid))
+
+    async def enter_room(self, sid, room):
+        self.rooms[sid] = room
+
+    async def leave_room(self, sid, room):
+        self.rooms.pop(sid, None)
+
+
+def entry(broadcaster, level="INFO", category="ZONE", message="msg"):
+    broadcaster.log(timestamp="2025-01-01T00:00:00", level=level, category=category, message=message)
+
+
+@pytest.fixture
+async def running():
+    broadcaster = LogBroadcaster(batch_size=5, flush_interval=0.05)
+    sio = FakeSocketIO()
+    broadcaster.set_socketio_server(sio)
+    await broadcaster.set_client_filter("sid-all", LogClientFilter())
+    task = asyncio.create_task(broadcaster._broadcast_worker())
+    yield broadcaster, sio
+    task.cancel()
+
+
+class TestBatching:
+    async def test_entries_batched_per_interval(self, running):
+        broadcaster, sio = running
+        for i in range(3):
+            entry(broadcaster, message=f"m{i}")
+
+        await asyncio.sleep(0.1)
+
+        assert len(sio.emits) == 1
+        event, data, _, _ = sio.emits[0]
+        assert event == "log:batch"
+        assert [e["message"] for e in data["logs"]] == ["m0", "m1", "m2"]
+
+    async def test_full_batch_sent_immediately(self, running):
+        broadcaster, sio = running
+        for i in range(7):
+            entry(broadcaster, message=f"m{i}")
+
+        await asyncio.sleep(0.01)
+        assert [len(d["logs"]) for _, d, _, _ in sio.emits] == [5]
+
+        await asyncio.sleep(0.1)
+        assert [len(d["logs"]) for _, d, _, _ in sio.emits] == [5, 2]
+
+    def test_history_kept_without_server(self):
+        broadcaster = LogBroadcaster(queue_size=3)
+        for i in range(5):
+            entry(broadcaster, message=f"m{i}")
+
+        assert [m.message for m in broadcaster.get_recent_logs()] == ["m2", "m3", "m4"]
+
+
+class TestClientFilters:
+    async def test_filtered_client_gets_matching_entries(self, running):
+        broadcaster, sio = running
+        client_filter = LogClientFilter.from_request({"level": "WARN", "categories": ["zone"]})
+        await broadcaster.set_client_filter("sid-1", client_filter)
+
+        entry(broadcaster, level="DEBUG", category="ZONE", message="debug")
+        entry(broadcaster, level="ERROR", category="ZONE", message="zone error")
+        entry(broadcaster, level="ERROR", category="API", message="api error")
+        await asyncio.sleep(0.1)
+
+        by_room = {room: data["logs"] for _, data, room, _ in sio.emits}
+        assert len(by_room[LogClientFilter().room]) == 3
+        assert client_filter.room == sio.rooms["sid-1"]
+        assert [e["message"] for e in by_room[client_filter.room]] == ["zone error"]
+
+    async def test_clear_filter_keeps_subscription(self, running):
+        broadcaster, sio = running
+        await broadcaster.set_client_filter("sid-1", LogClientFilter.from_request({"level": "ERROR"}))
+        await broadcaster.clear_client_filter("sid-1")
+
+        entry(broadcaster)
+        await asyncio.sleep(0.1)
+
+        assert sio.rooms == {"sid-all": LogClientFilter().room, "sid-1": LogClientFilter().room}
+        assert [room for _, _, room, _ in sio.emits] == [LogClientFilter().room]
+
+    async def test_no_subscribers_no_emit(self, running):
+        broadcaster, sio = running
+        await broadcaster.remove_client_filter("sid-all")
+
+        entry(broadcaster)
+        await asyncio.sleep(0.1)
+
+        assert sio.emits == []
+        assert len(broadcaster.get_recent_logs()) == 1
+
+    @pytest.mark.parametrize("request_data", [{"level": "LOUD"}, {"categories": ["NOPE"]}])
+    def test_invalid_filter_rejected(self, request_data):
+        with pytest.raises(ValueError):
+            LogClientFilter.from_request(request_data)
+
+
+class FakeStore:
+    def __init__(self):
+        self.threads = []
+        self.records = []
+
+    def append(self, level, category, message, timestamp=None):
+        self.threads.append(threading.get_ident())
+        self.records.append((message, timestamp))
+
+
+class TestThreads:
+    async def test_off_loop_entry_handled_on_loop(self):
+        broadcaster = LogBroadcaster()
+        store = FakeStore()
+        broadcaster.set_store(store)
+        broadcaster.start()
+
+        await asyncio.to_thread(entry, broadcaster, message="from worker")
+        await asyncio.sleep(0)
+
+        assert [e["message"] for e in broadcaster.log_history] == ["from worker"]
+        assert store.threads == [threading.get_ident()]
+        await broadcaster.stop()
+
+
+class TestStore:
+    def test_history_backfilled_when_store_set(self):
+        broadcaster = LogBroadcaster()
+        entry(broadcaster, message="early")
+        store = FakeStore()
+        broadcaster.set_store(store)
+        entry(broadcaster, message="late")
+
+        assert store.records[0] == ("early", datetime.fromisoformat("2025-01-01T00:00:00").timestamp())
+        assert [message for message, _ in store.records] == ["early", "late"]
@@ -0,0 +1,95 @@
+"""
+Tests for the persistent LogStore ring.
+
+Verifies:
+- Records round-trip (level, category, message, timestamp)
+- Oldest records are overwritten when full, index follows
+- Queries filter by category, level and time range and page via before_seq
+- Records and index survive reopening the file
+- A different layout starts a fresh file
+"""
+
+import threading
+
+from models.enums import LogCategory, LogLevel
+from services.log_store import LogStore
+
+
+def fill(store, count, start_time=1000.0):
+    categories = ("ZONE", "API", "SYSTEM")
+    levels = ("DEBUG", "INFO", "WARN", "ERROR")
+    for i in range(count):
+        store.append(levels[i % 4], categories[i % 3], f"msg {i}", timestamp=start_time + i)
+
+
+class TestLogStore:
+    def test_round_trip(self, tmp_path):
+        store = LogStore(tmp_path / "log.bin", capacity=8)
+        store.append("WARN", "ZONE", "Zone FLOOR ü", timestamp=1000.0)
+
+        (record,), cursor = store.query()
+        assert record["seq"] == 1
+        assert (record["level"], record["category"], record["message"]) == ("WARN", "ZONE", "Zone FLOOR ü")
+        assert cursor is None
+
+    def test_ring_overwrites_oldest(self, tmp_path):
+        store = LogStore(tmp_path / "log.bin", capacity=10)
+        fill(store, 25)
+
+        records, _ = store.query(limit=100)
+        assert len(store) == 10
+        assert [r["message"] for r in records] == [f"msg {i}" for i in range(15, 25)]
+        assert sum(store.stats()["by_category"].values()) == 10
+
+    def test_filters_and_paging(self, tmp_path):
+        store = LogStore(tmp_path / "log.bin", capacity=100)
+        fill(store, 60)
+
+        zone_warn, _ = store.query(min_level=LogLevel.WARN, categories=[LogCategory.ZONE], limit=100)
+        assert all(r["category"] == "ZONE" and r["level"] in ("WARN", "ERROR") for r in zone_warn)
+        assert [r["seq"] for r in zone_warn] == [i + 1 for i in range(60) if i % 3 == 0 and i % 4 >= 2]
+
+        ranged, _ = store.query(since=1010.0, until=1019.0, limit=100)
+        assert [r["seq"] for r in ranged] == list(range(11, 21))
+
+        page1, cursor = store.query(limit=25)
+        page2, cursor = store.query(limit=25, before_seq=cursor)
+        page3, cursor = store.query(limit=25, before_seq=cursor)
+        assert [r["seq"] for r in page3 + page2 + page1] == list(range(1, 61))
+        assert cursor is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "log.bin"
+        store = LogStore(path, capacity=10)
+        fill(store, 14)
+        store.close()
+
+        reopened = LogStore(path, capacity=10)
+        assert len(reopened) == 10
+        reopened.append("ERROR", "API", "after restart")
+
+        records, _ = reopened.query(categories=[LogCategory.API], limit=100)
+        assert records[-1]["seq"] == 15
+        assert records[-1]["message"] == "after restart"
+        assert [r["seq"] for r in records] == [8, 11, 14, 15]
+
+    def test_layout_change_starts_fresh(self, tmp_path):
+        path = tmp_path / "log.bin"
+        store = LogStore(path, capacity=10)
+        fill(store, 5)
+        store.close()
+
+        assert len(LogStore(path, capacity=20)) == 0
+
+    def test_concurrent_appends(self, tmp_path):
+        store = LogStore(tmp_path / "log.bin", capacity=1000)
+        threads = [threading.Thread(target=fill, args=(store, 20_000)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = store.stats()
+        assert stats["last_seq"] == 80_000
+        assert len(store) == 1000
+        assert sum(stats["by_category"].values()) == 1000
@@ -0,0 +1,151 @@
+"""
+Tests for PortManager.
+
+Verifies:
+- /proc/net/tcp parsing picks LISTEN sockets on the requested port only
+- Listening sockets are found and mapped to their owning process
+- An orphaned listener in another process is killed and the port rebound
+- A listener sharing the port via SO_REUSEPORT is left running
+- TIME_WAIT leftovers of a previous run do not block binding
+- systemd socket activation (LISTEN_PID / LISTEN_FDS) is adopted
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from services.port_manager import PortManager, parse_listening_inodes
+
+pytestmark = pytest.mark.skipif(not os.path.exists("/proc/net/tcp"), reason="needs Linux /proc")
+
+ORPHAN = """
+import socket, sys, time
+s = socket.socket()
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+if len(sys.argv) > 2:
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+s.bind(("0.0.0.0", int(sys.argv[1])))
+s.listen(16)
+print("ready", flush=True)
+time.sleep(60)
+"""
+
+PROC_NET_TCP = [
+    "   0: 00000000:1F40 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 111 1 0 100 0 0 10 0\n",
+    "   1: 0100007F:1F40 0100007F:9C40 06 00000000:00000000 03:00001234 00000000     0        0 0 3 0\n",
+    "   2: 0100007F:1F41 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 222 1 0 100 0 0 10 0\n",
+    "   3: 0100007F:9C40 0100007F:1F40 01 00000000:00000000 00:00000000 00000000     0        0 333 1 0 20 4 30 10 -1\n",
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def listen(port: int, reuse_port: bool = False) -> socket.socket:
+    s = socket.socket()
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    s.bind(("0.0.0.0", port))
+    s.listen(1)
+    return s
+
+
+class TestPortInspection:
+    def test_parse_listening_inodes(self):
+        assert parse_listening_inodes(PROC_NET_TCP, 0x1F40) == {111}
+        assert parse_listening_inodes(PROC_NET_TCP, 0x1F41) == {222}
+        assert parse_listening_inodes(PROC_NET_TCP, 0x9C40) == set()
+
+    async def test_finds_listener(self):
+        pm = PortManager()
+        port = free_port()
+        assert not await pm.is_port_in_use(port)
+
+        with listen(port):
+            assert await pm.is_port_in_use(port)
+            assert pm.find_processes_on_port(port) == [os.getpid()]
+            assert pm.find_process_on_port(port) is None  # own process is never a kill target
+
+        assert not await pm.is_port_in_use(port)
+
+
+class TestOpenListenSocket:
+    async def test_free_port(self):
+        port = free_port()
+        sock = await PortManager().open_listen_socket(port, host="127.0.0.1")
+        with sock:
+            assert sock.getsockname() == ("127.0.0.1", port)
+
+    async def test_time_wait_does_not_block(self):
+        port = free_port()
+        srv = listen(port)
+        cli = socket.create_connection(("127.0.0.1", port))
+        conn, _ = srv.accept()
+        conn.close()  # server side closes first -> TIME_WAIT on the server port
+        srv.close()
+        cli.recv(1)
+        cli.close()
+
+        pm = PortManager()
+        assert not await pm.is_port_in_use(port)
+        started = time.perf_counter()
+        with await pm.open_listen_socket(port):
+            assert time.perf_counter() - started < 0.1
+
+    async def test_kills_orphan(self):
+        port = free_port()
+        orphan = subprocess.Popen([sys.executable, "-c", ORPHAN, str(port)], stdout=subprocess.PIPE, text=True)
+        try:
+            assert orphan.stdout.readline().strip() == "ready"
+            pm = PortManager()
+            assert pm.find_process_on_port(port) == orphan.pid
+
+            with await pm.open_listen_socket(port):
+                assert orphan.wait(timeout=2) == -9
+                assert pm.find_processes_on_port(port) == [os.getpid()]
+        finally:
+            orphan.kill()
+            orphan.wait()
+            orphan.stdout.close()
+
+    async def test_reuse_port_listener_left_running(self):
+        port = free_port()
+        other = subprocess.Popen([sys.executable, "-c", ORPHAN, str(port), "reuse_port"], stdout=subprocess.PIPE, text=True)
+        try:
+            assert other.stdout.readline().strip() == "ready"
+            pm = PortManager()
+
+            with await pm.open_listen_socket(port):
+                with pytest.raises(subprocess.TimeoutExpired):
+                    other.wait(timeout=0.2)
+                assert sorted(pm.find_processes_on_port(port)) == sorted([os.getpid(), other.pid])
+        finally:
+            other.kill()
+            other.wait()
+            other.stdout.close()
+
+    async def test_inherited_socket(self):
+        port = free_port()
+        passed = listen(port)
+        fd = os.dup(passed.fileno())
+        passed.close()
+        environ = {"LISTEN_PID": str(os.getpid()), "LISTEN_FDS": "1"}
+
+        pm = PortManager()
+        inherited = pm.listen_fds(environ, start=fd)
+        assert "LISTEN_FDS" not in environ
+        with inherited[0]:
+            assert inherited[0].fileno() == fd
+            assert await pm.open_listen_socket(port) is inherited[0]
+
+    def test_listen_fds_for_another_process(self):
+        environ = {"LISTEN_PID": "1", "LISTEN_FDS": "1"}
+        assert PortManager().listen_fds(environ) == []
@@ -0,0 +1,145 @@
+"""
+Tests for SnapshotPublisher snapshot caching and frame-rate flushing.
+
+Verifies:
+- ZoneState.version changes on field assignment and touch()
+- Snapshots are rebuilt only when the zone's version changes
+- A burst of zone events publishes one snapshot per zone per flush
+- Unchanged zones are not republished
+- REST zone routes answer If-None-Match with 304
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from api.routes.zones import get_zone, list_zones
+from models.animation_params.animation_param_id import AnimationParamID
+from models.color import Color
+from models.domain.animation import AnimationState
+from models.domain.zone import ZoneCombined, ZoneConfig, ZoneState
+from models.enums import AnimationID, ZoneID, ZoneRenderMode
+from models.events import EventType, ZoneStaticStateChangedEvent
+from services.event_bus import EventBus
+from services.snapshot_publisher import SnapshotPublisher
+
+
+def make_zone(zone_id: ZoneID, order: int) -> ZoneCombined:
+    config = ZoneConfig(
+        id=zone_id, display_name=zone_id.name.title(), pixel_count=10, enabled=True,
+        reversed=False, order=order, start_index=0, end_index=9,
+    )
+    state = ZoneState(id=zone_id, color=Color.from_rgb(255, 0, 0), brightness=50, is_on=True)
+    return ZoneCombined(config=config, state=state)
+
+
+class FakeZoneService:
+    def __init__(self, zones):
+        self.zones = zones
+        self._by_id = {zone.config.id: zone for zone in zones}
+
+    def get_zone(self, zone_id):
+        return self._by_id[zone_id]
+
+    def get_all(self):
+        return self.zones
+
+
+@pytest.fixture
+def setup():
+    zones = [make_zone(ZoneID.FLOOR, 0), make_zone(ZoneID.PIXEL, 1)]
+    bus = EventBus()
+    publisher = SnapshotPublisher(zone_service=FakeZoneService(zones), event_bus=bus, flush_interval_ms=10)
+    published = []
+    bus.subscribe(EventType.ZONE_SNAPSHOT_UPDATED, published.append)
+    return SimpleNamespace(zones=zones, bus=bus, publisher=publisher, published=published)
+
+
+class TestZoneStateVersion:
+    def test_assignment_bumps_version(self):
+        state = make_zone(ZoneID.FLOOR, 0).state
+        before = state.version
+        state.brightness = 60
+        assert state.version == before + 1
+
+    def test_touch_bumps_version(self):
+        state = make_zone(ZoneID.FLOOR, 0).state
+        state.animation = AnimationState(id=AnimationID.BREATHE, parameters={})
+        before = state.version
+        state.animation.parameters[AnimationParamID.SPEED] = 10
+        state.touch()
+        assert state.version == before + 1
+
+    def test_version_not_part_of_equality(self):
+        a = make_zone(ZoneID.FLOOR, 0).state
+        b = make_zone(ZoneID.FLOOR, 0).state
+        a.brightness = 60
+        a.brightness = 50
+        assert a == b and a.version != b.version
+
+
+class TestSnapshotCache:
+    def test_rebuilt_only_on_version_change(self, setup):
+        first = setup.publisher.get_snapshot(ZoneID.FLOOR)
+        assert setup.publisher.get_snapshot(ZoneID.FLOOR) is first
+        assert setup.publisher.snapshots_built == 1
+
+        setup.zones[0].state.brightness = 70
+        second = setup.publisher.get_snapshot(ZoneID.FLOOR)
+        assert second is not first
+        assert second.payload["brightness"] == 70
+        assert second.etag != first.etag
+
+    def test_collection_etag_tracks_any_zone(self, setup):
+        etag = setup.publisher.collection_etag(setup.publisher.get_all_snapshots())
+        setup.zones[1].state.is_on = False
+        assert setup.publisher.collection_etag(setup.publisher.get_all_snapshots()) != etag
+
+
+class TestFlush:
+    async def test_burst_publishes_once_per_zone(self, setup):
+        floor = setup.zones[0]
+        for value in range(20):
+            floor.state.brightness = value
+            await setup.bus.publish(ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, brightness=value))
+        await asyncio.sleep(0.05)
+
+        assert len(setup.published) == 1
+        event = setup.published[0]
+        assert event.payload["brightness"] == 19
+        assert event.payload is setup.publisher.get_snapshot(ZoneID.FLOOR).payload
+        assert setup.publisher.snapshots_built == 1
+
+    async def test_unchanged_zone_not_republished(self, setup):
+        await setup.bus.publish(ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, brightness=50))
+        await asyncio.sleep(0.03)
+        await setup.bus.publish(ZoneStaticStateChangedEvent(zone_id=ZoneID.FLOOR, brightness=50))
+        await asyncio.sleep(0.03)
+
+        assert len(setup.published) == 1
+
+
+class TestZoneRoutes:
+    async def test_list_zones_etag(self, setup):
+        services = SimpleNamespace(snapshot_publisher=setup.publisher)
+        response = await list_zones(if_none_match=None, services=services)
+        assert response.status_code == 200
+        assert [z["id"] for z in json.loads(response.body)] == ["FLOOR", "PIXEL"]
+
+        etag = response.headers["etag"]
+        cached = await list_zones(if_none_match=etag, services=services)
+        assert cached.status_code == 304
+
+        setup.zones[0].state.brightness = 10
+        changed = await list_zones(if_none_match=etag, services=services)
+        assert changed.status_code == 200
+
+    async def test_get_zone_etag(self, setup):
+        services = SimpleNamespace(snapshot_publisher=setup.publisher)
+        response = await get_zone(ZoneID.PIXEL, if_none_match=None, services=services)
+        assert json.loads(response.body)["id"] == "PIXEL"
+
+        cached = await get_zone(ZoneID.PIXEL, if_none_match=f'W/{response.headers["etag"]}', services=services)
+        assert cached.status_code == 304
@@ -0,0 +1,165 @@
+"""
+Tests for the append-only state journal (StateJournal + DataAssembler "journal" backend).
+
+Verifies:
+- Entries replay over the snapshot; a torn last line is dropped
+- Journal saves append only changed zones / sections, not the whole document
+- Restart sees the journaled state
+- Past the size threshold the journal is compacted into state.json
+- A journal left behind is folded into state.json by the snapshot backend
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from models.color import Color
+from models.domain import ApplicationState, ZoneCombined, ZoneConfig, ZoneState
+from models.enums import ZoneID
+from services.data_assembler import DataAssembler
+from services.state_journal import StateJournal
+
+
+def make_zone(zone_id: ZoneID, brightness: int = 50) -> ZoneCombined:
+    config = ZoneConfig(
+        id=zone_id, display_name=zone_id.name.title(), pixel_count=10, enabled=True,
+        reversed=False, order=0, start_index=0, end_index=9,
+    )
+    state = ZoneState(id=zone_id, color=Color.from_rgb(255, 0, 0), brightness=brightness, is_on=True)
+    return ZoneCombined(config=config, state=state)
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({
+        "zones": {"floor": {"brightness": 10}, "lamp": {"brightness": 20}},
+        "current_animation": {"id": "BREATHE"},
+        "application": {"edit_mode_on": False},
+    }))
+    return path
+
+
+def make_assembler(state_path, **kwargs) -> DataAssembler:
+    config_manager = SimpleNamespace(color_manager=None, animation_manager=None)
+    return DataAssembler(config_manager, state_path, debounce_ms=10, persistence="journal", **kwargs)
+
+
+class TestStateJournal:
+    def test_replay(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.journal")
+        journal.append([("zones", "floor", '{"brightness":1}'), ("application", None, '{"edit_mode_on":true}')])
+        journal.append([("zones", "floor", '{"brightness":2}')])
+
+        state = {"zones": {"lamp": {"brightness": 5}}}
+        assert StateJournal(journal.path).replay(state) == 3
+        assert state == {
+            "zones": {"lamp": {"brightness": 5}, "floor": {"brightness": 2}},
+            "application": {"edit_mode_on": True},
+        }
+
+    def test_whole_section_and_zone_entries_keep_order(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.journal")
+        journal.append([
+            ("zones", "floor", '{"brightness":1}'),
+            ("zones", None, '{"floor":{"brightness":2},"lamp":{"brightness":2}}'),
+            ("zones", "lamp", '{"brightness":3}'),
+        ])
+
+        state = {}
+        assert StateJournal(journal.path).replay(state) == 3
+        assert state["zones"] == {"floor": {"brightness": 2}, "lamp": {"brightness": 3}}
+
+    def test_torn_tail_dropped(self, tmp_path):
+        journal = StateJournal(tmp_path / "state.journal")
+        journal.append([("zones", "floor", '{"brightness":1}')])
+        with open(journal.path, "ab") as f:
+            f.write(b'["zones","floor",{"bright')
+
+        state = {}
+        replayed = StateJournal(journal.path)
+        assert replayed.replay(state) == 1
+        assert state["zones"]["floor"] == {"brightness": 1}
+        assert journal.path.read_bytes().endswith(b"\n")
+
+    def test_corrupt_line_skipped(self, tmp_path):
+        path = tmp_path / "state.journal"
+        path.write_bytes(b'["zones","floor",{"brightness":1}]\nnot json\n["zones","lamp",{"brightness":2}]\n')
+
+        state = {}
+        assert StateJournal(path).replay(state) == 2
+        assert set(state["zones"]) == {"floor", "lamp"}
+
+
+class TestJournalBackend:
+    async def test_appends_only_changed_zone(self, state_path):
+        assembler = make_assembler(state_path)
+        snapshot = state_path.read_text()
+
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 40), make_zone(ZoneID.LAMP, 20)])
+        assert await assembler.flush()
+
+        assert state_path.read_text() == snapshot
+        lines = assembler._journal.path.read_text().splitlines()
+        assert len(lines) == 2            # both differ from the seeded snapshot entries
+
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 41), make_zone(ZoneID.LAMP, 20)])
+        assert await assembler.flush()
+
+        lines = assembler._journal.path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[-1])[:2] == ["zones", "floor"]
+
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 41)])
+        assert not await assembler.flush()
+
+    async def test_restart_replays(self, state_path):
+        assembler = make_assembler(state_path)
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 77)])
+        assembler.save_application_state(ApplicationState(edit_mode=True))
+        await assembler.flush()
+
+        state = make_assembler(state_path).load_state()
+        assert state["zones"]["floor"]["brightness"] == 77
+        assert state["zones"]["lamp"] == {"brightness": 20}
+        assert state["application"]["edit_mode_on"] is True
+
+    async def test_compaction(self, state_path):
+        assembler = make_assembler(state_path, journal_compact_bytes=300)
+        for brightness in range(10):
+            assembler.save_zone_state([make_zone(ZoneID.FLOOR, brightness)])
+            await assembler.flush()
+
+        assert assembler.compactions >= 1
+        assert assembler._journal.size < 300
+        state = make_assembler(state_path).load_state()
+        assert state["zones"]["floor"]["brightness"] == 9
+
+    async def test_value_restored_after_compaction(self, state_path):
+        assembler = make_assembler(state_path, journal_compact_bytes=1)
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 1)])
+        await assembler.flush()                                   # journaled
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 2)])
+        await assembler.flush()                                   # compacted (floor = 2)
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 1)])
+        assert await assembler.flush()                            # not mistaken for "already written"
+
+        assert make_assembler(state_path).load_state()["zones"]["floor"]["brightness"] == 1
+
+    async def test_snapshot_backend_folds_leftover_journal(self, state_path):
+        assembler = make_assembler(state_path)
+        assembler.save_zone_state([make_zone(ZoneID.FLOOR, 66)])
+        await assembler.flush()
+
+        config_manager = SimpleNamespace(color_manager=None, animation_manager=None)
+        snapshot = DataAssembler(config_manager, state_path, debounce_ms=10)
+        assert snapshot.load_state()["zones"]["floor"]["brightness"] == 66
+        assert await snapshot.flush()
+
+        assert not snapshot._journal.path.read_bytes()
+        assert json.loads(state_path.read_text())["zones"]["floor"]["brightness"] == 66
+
+    def test_unknown_mode(self, state_path):
+        with pytest.raises(ValueError):
+            DataAssembler(SimpleNamespace(color_manager=None, animation_manager=None), state_path, persistence="sqlite")
@@ -0,0 +1,153 @@
+"""
+Tests for batch zone updates (ZoneService.apply_static_batch).
+
+Verifies:
+- A batch is saved once and announced with one ZoneStaticBatchChangedEvent
+- StaticModeController pushes one MultiZoneFrame for the whole batch
+- SnapshotPublisher flushes every changed zone once
+- Invalid batches are rejected and leave state untouched
+- ZoneBatchRequest converts to domain changes
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from api.schemas.zone import ZoneBatchRequest
+from controllers.led_controller.static_mode_controller import StaticModeController
+from models.color import Color
+from models.domain import ZoneCombined, ZoneConfig, ZoneState, ZoneStaticChange
+from models.enums import ZoneID
+from models.events import EventType
+from models.frame import MultiZoneFrame
+from services.event_bus import EventBus
+from services.snapshot_publisher import SnapshotPublisher
+from services.zone_service import ZoneService
+
+
+def make_zone(zone_id: ZoneID, order: int) -> ZoneCombined:
+    config = ZoneConfig(
+        id=zone_id, display_name=zone_id.name.title(), pixel_count=10, enabled=True,
+        reversed=False, order=order, start_index=0, end_index=9,
+    )
+    state = ZoneState(id=zone_id, color=Color.from_rgb(255, 0, 0), brightness=50, is_on=True)
+    return ZoneCombined(config=config, state=state)
+
+
+class FakeAssembler:
+    def __init__(self, zones):
+        self.zones = zones
+        self.saves = []
+
+    def build_zones(self):
+        return self.zones
+
+    def save_zone_state(self, zones):
+        self.saves.append([zone.config.id for zone in zones])
+
+
+class FakeFrameManager:
+    def __init__(self):
+        self.frames = []
+
+    async def push_frame(self, frame):
+        self.frames.append(frame)
+
+
+@pytest.fixture
+def setup():
+    zones = [make_zone(ZoneID.FLOOR, 0), make_zone(ZoneID.PIXEL, 1), make_zone(ZoneID.LAMP, 2)]
+    bus = EventBus()
+    assembler = FakeAssembler(zones)
+    zone_service = ZoneService(assembler, None, bus)
+    frame_manager = FakeFrameManager()
+    app_state = SimpleNamespace(selected_zone_edit_target=None)
+    services = SimpleNamespace(
+        zone_service=zone_service,
+        app_state_service=SimpleNamespace(get_state=lambda: app_state, set_selected_zone_edit_target=lambda t: None),
+        frame_manager=frame_manager,
+        color_manager=None,
+        event_bus=bus,
+    )
+    batches = []
+    bus.subscribe(EventType.ZONE_STATIC_BATCH_CHANGED, batches.append)
+    return SimpleNamespace(
+        zones=zones, bus=bus, assembler=assembler, zone_service=zone_service,
+        frame_manager=frame_manager, services=services, batches=batches,
+    )
+
+
+class TestApplyStaticBatch:
+    async def test_one_save_one_event(self, setup):
+        setup.zone_service.apply_static_batch([
+            ZoneStaticChange(zone_id=ZoneID.FLOOR, color=Color.from_rgb(0, 0, 255)),
+            ZoneStaticChange(zone_id=ZoneID.PIXEL, brightness=120, is_on=False),
+        ])
+        await asyncio.sleep(0.01)
+
+        assert setup.assembler.saves == [[ZoneID.FLOOR, ZoneID.PIXEL]]
+        assert len(setup.batches) == 1
+        changes = setup.batches[0].changes
+        assert [c.zone_id for c in changes] == [ZoneID.FLOOR, ZoneID.PIXEL]
+        assert changes[1].brightness == 100 and changes[1].is_on is False
+        assert setup.zones[0].state.color.to_rgb() == (0, 0, 255)
+
+    async def test_single_multi_zone_frame(self, setup):
+        await StaticModeController(setup.services).initialize()
+        setup.frame_manager.frames.clear()
+
+        setup.zone_service.apply_static_batch([
+            ZoneStaticChange(zone_id=zone.config.id, color=Color.from_rgb(0, 255, 0)) for zone in setup.zones
+        ])
+        await asyncio.sleep(0.01)
+
+        assert len(setup.frame_manager.frames) == 1
+        frame = setup.frame_manager.frames[0]
+        assert isinstance(frame, MultiZoneFrame)
+        assert set(frame.zone_colors) == {ZoneID.FLOOR, ZoneID.PIXEL, ZoneID.LAMP}
+
+    async def test_snapshots_flushed_once_per_zone(self, setup):
+        SnapshotPublisher(zone_service=setup.zone_service, event_bus=setup.bus, flush_interval_ms=10)
+        published = []
+        setup.bus.subscribe(EventType.ZONE_SNAPSHOT_UPDATED, lambda e: published.append(e.zone_id))
+
+        setup.zone_service.apply_static_batch([
+            ZoneStaticChange(zone_id=ZoneID.FLOOR, brightness=10),
+            ZoneStaticChange(zone_id=ZoneID.LAMP, brightness=20),
+        ])
+        await asyncio.sleep(0.05)
+
+        assert sorted(published, key=lambda z: z.name) == [ZoneID.FLOOR, ZoneID.LAMP]
+
+    def test_invalid_value_rolls_back(self, setup):
+        with pytest.raises(TypeError):
+            setup.zone_service.apply_static_batch([
+                ZoneStaticChange(zone_id=ZoneID.FLOOR, brightness=10),
+                ZoneStaticChange(zone_id=ZoneID.PIXEL, is_on="yes"),  # type: ignore[arg-type]
+            ])
+
+        assert setup.zones[0].state.brightness == 50
+        assert setup.assembler.saves == []
+        assert setup.batches == []
+
+    def test_duplicate_zone_rejected(self, setup):
+        with pytest.raises(ValueError):
+            setup.zone_service.apply_static_batch([
+                ZoneStaticChange(zone_id=ZoneID.FLOOR, brightness=10),
+                ZoneStaticChange(zone_id=ZoneID.FLOOR, brightness=20),
+            ])
+        assert setup.zones[0].state.brightness == 50
+
+
+class TestZoneBatchRequest:
+    def test_to_changes(self):
+        request = ZoneBatchRequest.model_validate({"zones": [
+            {"zone_id": "FLOOR", "color": {"mode": "RGB", "rgb": [1, 2, 3]}},
+            {"zone_id": "PIXEL", "is_on": False},
+        ]})
+        changes = request.to_changes(color_manager=None)
+
+        assert changes[0].zone_id == ZoneID.FLOOR
+        assert changes[0].color.to_rgb() == (1, 2, 3)
+        assert changes[1] == ZoneStaticChange(zone_id=ZoneID.PIXEL, is_on=False)
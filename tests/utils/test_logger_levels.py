@@ -0,0 +1,101 @@
+"""
+Tests for Logger level thresholds, lazy messages and threaded output.
+
+Verifies:
+- Per-category thresholds override min_level
+- Disabled messages are never formatted (callables not called, %-args not applied)
+- %-style args and callables are rendered for enabled levels
+- Threaded output writes every line once flushed
+- BoundLogger.is_enabled_for respects its own category
+"""
+
+import pytest
+
+from models.enums import LogCategory, LogLevel
+from utils.logger import Logger, TerminalWriter
+
+
+@pytest.fixture
+def logger():
+    return Logger(min_level=LogLevel.INFO, use_colors=False)
+
+
+class TestThresholds:
+    def test_category_override(self, logger):
+        logger.set_category_level(LogCategory.FRAME_MANAGER, LogLevel.WARN)
+        logger.set_category_level(LogCategory.SYSTEM, LogLevel.DEBUG)
+
+        assert not logger.is_enabled_for(LogLevel.INFO, LogCategory.FRAME_MANAGER)
+        assert logger.is_enabled_for(LogLevel.DEBUG, LogCategory.SYSTEM)
+        assert not logger.is_enabled_for(LogLevel.DEBUG, LogCategory.ZONE)
+
+        logger.set_category_level(LogCategory.FRAME_MANAGER, None)
+        assert logger.is_enabled_for(LogLevel.INFO, LogCategory.FRAME_MANAGER)
+
+    def test_min_level_change_keeps_overrides(self, logger):
+        logger.set_category_level(LogCategory.SYSTEM, LogLevel.ERROR)
+        logger.min_level = LogLevel.DEBUG
+
+        assert logger.is_enabled_for(LogLevel.DEBUG, LogCategory.ZONE)
+        assert not logger.is_enabled_for(LogLevel.WARN, LogCategory.SYSTEM)
+
+    def test_bound_logger_uses_own_category(self, logger):
+        logger.set_category_level(LogCategory.EVENT, LogLevel.DEBUG)
+
+        assert logger.for_category(LogCategory.EVENT).is_enabled_for(LogLevel.DEBUG)
+        assert not logger.for_category(LogCategory.ZONE).is_enabled_for(LogLevel.DEBUG)
+
+
+class TestLazyMessages:
+    def test_disabled_message_not_formatted(self, logger, capsys):
+        log = logger.for_category(LogCategory.ZONE)
+
+        def expensive():
+            raise AssertionError("formatted a disabled message")
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("formatted a disabled argument")
+
+        log.debug(expensive)
+        log.debug("value %s", Exploding())
+
+        assert capsys.readouterr().out == ""
+
+    def test_args_and_callable_rendered(self, logger, capsys):
+        log = logger.for_category(LogCategory.ZONE)
+
+        log.info("zone %s at %d%%", "FLOOR", 40)
+        log.warn(lambda: "computed")
+        log.info("literal 100%")
+
+        out = capsys.readouterr().out
+        assert "zone FLOOR at 40%" in out
+        assert "computed" in out
+        assert "literal 100%" in out
+
+    def test_bad_args_do_not_raise(self, logger, capsys):
+        logger.for_category(LogCategory.ZONE).info("no placeholders", 1)
+        assert "no placeholders (1,)" in capsys.readouterr().out
+
+
+class TestThreadedOutput:
+    def test_lines_written_after_flush(self, logger, capsys):
+        logger.set_threaded_output(True)
+        log = logger.for_category(LogCategory.SYSTEM)
+        for i in range(50):
+            log.info("line %d", i)
+        logger.flush()
+
+        out = capsys.readouterr().out
+        assert all(f"line {i}\n" in out for i in range(50))
+        logger.set_threaded_output(False)
+
+    def test_overflow_drops_oldest(self):
+        writer = TerminalWriter(max_pending=3)
+        writer._thread = object()           # keep the thread from starting
+        for i in range(5):
+            writer.write(str(i))
+
+        assert list(writer._pending) == ["2", "3", "4"]
+        assert writer.dropped == 2
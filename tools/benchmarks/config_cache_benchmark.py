@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Config Cache Benchmark
+
+Times ConfigManager.load() on a copy of src/config:
+
+    no cache   YAML parse of config.yaml + includes (previous behaviour)
+    cold       cache missing: YAML parse + cache write
+    touched    files re-saved unchanged: content hashes checked, cache hit
+    warm       nothing changed: stat check + unpickle
+
+Sub-managers (GPIO registration, animation / color managers) are built in
+every case; the cache only replaces reading and parsing YAML.
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/config_cache_benchmark.py
+        python tools/benchmarks/config_cache_benchmark.py --runs 50
+"""
+
+import argparse
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from hardware.gpio import MockGPIOManager
+from managers.config_manager import ConfigManager
+from utils.logger import configure_logger
+from models.enums import LogLevel
+
+
+def timed_load(config_dir: Path, cache_path) -> float:
+    manager = ConfigManager(MockGPIOManager(), config_path=config_dir / "config.yaml", cache_path=cache_path)
+    started = time.perf_counter()
+    manager.load()
+    return (time.perf_counter() - started) * 1000
+
+
+def measure(runs: int, prepare, config_dir: Path, cache_path) -> float:
+    timings = []
+    for _ in range(runs):
+        prepare()
+        timings.append(timed_load(config_dir, cache_path))
+    return statistics.median(timings)
+
+
+def run(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = Path(tmp) / "config"
+        shutil.copytree(REPO_ROOT / "src" / "config", config_dir)
+        cache_path = Path(tmp) / "config.cache"
+
+        def drop_cache():
+            cache_path.unlink(missing_ok=True)
+
+        def touch_sources():
+            for path in config_dir.glob("*.yaml"):
+                path.touch()
+
+        results = {
+            "no cache": measure(args.runs, lambda: None, config_dir, None),
+            "cold": measure(args.runs, drop_cache, config_dir, cache_path),
+            "touched": measure(args.runs, touch_sources, config_dir, cache_path),
+            "warm": measure(args.runs, lambda: None, config_dir, cache_path),
+        }
+        cache_bytes = cache_path.stat().st_size
+
+    print(f"ConfigManager.load() median over {args.runs} runs (cache {cache_bytes} bytes)")
+    for label, ms in results.items():
+        print(f"  {label:10s}{ms:>8.2f} ms")
+    print(f"Warm start speedup: {results['no cache'] / results['warm']:.1f}x")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Config cache cold / warm startup benchmark")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.WARN)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
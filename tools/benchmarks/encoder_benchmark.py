@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Rotary Encoder Benchmark
+
+Drives a synthetic quadrature signal through MockGPIOManager edge callbacks
+into RotaryEncoder + ControlPanelController and checks that every detent
+arrives, coalesced into at most one EncoderRotateEvent per UI frame.
+For comparison, the same signal is sampled the legacy way (read() at 50 Hz).
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/encoder_benchmark.py
+        python tools/benchmarks/encoder_benchmark.py --rate 1000 --detents 5000 --bounce 0.2
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from controllers.control_panel_controller import ControlPanelController
+from hardware.gpio import MockGPIOManager
+from hardware.input.rotary_encoder import RotaryEncoder
+from models.events.sources import EncoderSource
+from utils.logger import configure_logger
+from models.enums import LogLevel
+
+CLK, DT, SW = 5, 6, 13
+UNUSED_CLK, UNUSED_DT, UNUSED_SW = 17, 27, 16
+
+
+class CollectingBus:
+    """EventBus stand-in that records published events"""
+
+    def __init__(self):
+        self.events = []
+
+    async def publish(self, event):
+        self.events.append(event)
+
+    def publish_nowait(self, event):
+        self.events.append(event)
+
+
+def build_signal(detents: int, seed: int, reverse_probability: float):
+    """Return (edges, expected_net) where edges is a list of (pin, level)"""
+    rng = random.Random(seed)
+    clk, dt = 1, 1
+    edges = []
+    net = 0
+    direction = 1
+
+    for _ in range(detents):
+        if rng.random() < reverse_probability:
+            direction = -direction
+        # Two Gray-code transitions per detent; CW changes CLK first, CCW DT first
+        for _ in range(2):
+            if direction > 0:
+                if clk == dt:
+                    clk ^= 1
+                    edges.append((CLK, clk))
+                else:
+                    dt ^= 1
+                    edges.append((DT, dt))
+            else:
+                if clk == dt:
+                    dt ^= 1
+                    edges.append((DT, dt))
+                else:
+                    clk ^= 1
+                    edges.append((CLK, clk))
+        net += direction
+
+    return edges, net
+
+
+def add_bounce(edges, probability: float, seed: int):
+    """Insert contact bounce (edge, revert, edge again) on a fraction of edges"""
+    rng = random.Random(seed + 1)
+    out = []
+    for pin, level in edges:
+        if rng.random() < probability:
+            out.extend(((pin, level), (pin, level ^ 1)))
+        out.append((pin, level))
+    return out
+
+
+def inject(gpio: MockGPIOManager, edges, duration: float):
+    """Inject edges evenly over `duration` from a separate thread (like the RPi.GPIO event thread)"""
+    interval = duration / len(edges)
+    start = time.perf_counter()
+    for i, (pin, level) in enumerate(edges):
+        target = start + i * interval
+        while time.perf_counter() < target:
+            pass
+        gpio.inject_edge(pin, level)
+
+
+def legacy_poll(gpio: MockGPIOManager, stop: threading.Event, result: dict):
+    """Old behaviour: sample CLK/DT at 50 Hz, one step per observed CLK change"""
+    last_clk = gpio.read(CLK)
+    total = 0
+    while not stop.is_set():
+        clk, dt = gpio.read(CLK), gpio.read(DT)
+        if clk != last_clk:
+            last_clk = clk
+            total += 1 if dt != clk else -1
+        time.sleep(0.02)
+    result["net"] = total
+
+
+async def run(args) -> int:
+    gpio = MockGPIOManager()
+    for pin in (CLK, DT, SW, UNUSED_CLK, UNUSED_DT, UNUSED_SW):
+        gpio.register_input(pin, f"Bench({pin})")
+
+    panel = SimpleNamespace(
+        selector=RotaryEncoder(clk=CLK, dt=DT, sw=SW, gpio_manager=gpio),
+        modulator=RotaryEncoder(clk=UNUSED_CLK, dt=UNUSED_DT, sw=UNUSED_SW, gpio_manager=gpio),
+        buttons=[],
+    )
+    bus = CollectingBus()
+    controller = ControlPanelController(panel, bus, rotate_interval=1 / 60)  # type: ignore[arg-type]
+    assert controller.enable_edge_callbacks()
+
+    edges, expected_net = build_signal(args.detents, args.seed, args.reverse)
+    edges = add_bounce(edges, args.bounce, args.seed)
+
+    stop = threading.Event()
+    legacy = {}
+    poller = threading.Thread(target=legacy_poll, args=(gpio, stop, legacy), daemon=True)
+    poller.start()
+
+    started = time.perf_counter()
+    await asyncio.to_thread(inject, gpio, edges, args.detents / args.rate)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(controller.rotate_interval * 3)
+    stop.set()
+    poller.join()
+
+    events = [e for e in bus.events if e.source == EncoderSource.SELECTOR]
+    received_net = sum(e.delta for e in events)
+    decoder = panel.selector.decoder
+
+    print(f"Signal:        {args.detents} detents at {args.rate:.0f}/s "
+          f"({len(edges)} edges, bounce {args.bounce:.0%}) in {elapsed:.2f}s")
+    print(f"Expected net:  {expected_net:+d}")
+    print(f"Edge decoder:  {received_net:+d}  "
+          f"(events {len(events)}, ~{len(events) / max(elapsed, 1e-9):.0f}/s, "
+          f"illegal transitions {decoder.errors})")
+    print(f"Legacy 50 Hz:  {legacy.get('net', 0):+d}")
+    print(f"Coalescing:    {controller.detents_received} detents -> {controller.rotate_events_published} events")
+
+    ok = received_net == expected_net
+    print("PASS: no lost steps" if ok else "FAIL: steps lost")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Quadrature decoder / coalescing benchmark")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Detents per second")
+    parser.add_argument("--detents", type=int, default=3000)
+    parser.add_argument("--bounce", type=float, default=0.1, help="Fraction of edges with contact bounce")
+    parser.add_argument("--reverse", type=float, default=0.01, help="Probability of direction change per detent")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.WARN)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
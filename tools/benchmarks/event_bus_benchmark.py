@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+EventBus Benchmark
+
+Publishes an encoder-heavy workload (EncoderRotateEvent with a mix of sync,
+async and filtered handlers, log_middleware registered, logger at INFO)
+through the current EventBus and through a copy of the previous publish()
+that introspected every handler per event, and prints events/sec for both.
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/event_bus_benchmark.py
+        python tools/benchmarks/event_bus_benchmark.py --events 200000 --handlers 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from models.enums import LogLevel
+from models.events import EncoderRotateEvent, Event, EventType
+from models.events.sources import EncoderSource
+from services.event_bus import EventBus, log
+from services.middleware import log_middleware
+from utils.logger import configure_logger
+
+
+class LegacyEventBus(EventBus):
+    """EventBus with the pre-compilation publish() path, for comparison"""
+
+    async def publish(self, event: Event) -> None:
+        log.debug("Event: ", event_type=event.type.name)
+
+        for middleware, _ in self._middleware:
+            processed_event = middleware(event)
+            if processed_event is None:
+                return
+            event = processed_event
+
+        self.history.record(event)
+
+        handlers = self._handlers.get(event.type, [])
+        if not handlers:
+            log.info(f"No event handlers registered for event {event.type.name}")
+            return
+
+        for handler_entry in handlers:
+            if handler_entry.filter_fn and not handler_entry.filter_fn(event):
+                continue
+            try:
+                if asyncio.iscoroutinefunction(handler_entry.handler):
+                    await handler_entry.handler(event)
+                else:
+                    handler_entry.handler(event)
+            except Exception:
+                log.error(f"Event handler failed: {handler_entry.handler.__name__}", exc_info=True)
+
+
+def build(bus_cls, handlers: int) -> EventBus:
+    bus = bus_cls()
+    bus.add_middleware(log_middleware)
+    counter = [0]
+
+    def sync_handler(event):
+        counter[0] += event.delta
+
+    async def async_handler(event):
+        counter[0] += event.delta
+
+    for i in range(handlers):
+        kind = i % 3
+        if kind == 0:
+            bus.subscribe(EventType.ENCODER_ROTATE, sync_handler, priority=i)
+        elif kind == 1:
+            bus.subscribe(EventType.ENCODER_ROTATE, async_handler, priority=i)
+        else:
+            bus.subscribe(
+                EventType.ENCODER_ROTATE,
+                async_handler,
+                priority=i,
+                filter_fn=lambda e: e.source == EncoderSource.MODULATOR,
+            )
+    return bus
+
+
+async def measure(bus: EventBus, events) -> float:
+    started = time.perf_counter()
+    for event in events:
+        await bus.publish(event)
+    return len(events) / (time.perf_counter() - started)
+
+
+async def run(args) -> None:
+    sources = (EncoderSource.SELECTOR, EncoderSource.MODULATOR)
+    events = [EncoderRotateEvent(sources[i % 2], 1 if i % 5 else -1) for i in range(args.events)]
+
+    results = {}
+    for name, bus_cls in (("legacy", LegacyEventBus), ("compiled", EventBus)):
+        bus = build(bus_cls, args.handlers)
+        await measure(bus, events[: args.events // 10])          # warm-up
+        results[name] = max([await measure(bus, events) for _ in range(args.repeat)])
+
+    print(f"Workload: {args.events} EncoderRotateEvent, {args.handlers} handlers "
+          f"(sync/async/filtered), log_middleware, logger at INFO")
+    for name, rate in results.items():
+        print(f"  {name:9s} {rate:12,.0f} events/s")
+    print(f"  speedup   {results['compiled'] / results['legacy']:12.2f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EventBus publish throughput benchmark")
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--handlers", type=int, default=6)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.INFO)
+    asyncio.run(run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Event Coalescing Benchmark
+
+Simulates a user turning the brightness knob / dragging a slider on one
+STATIC zone (ZoneService.adjust_brightness at --rate calls/s) through the real
+ZoneService, SnapshotPublisher and StaticModeController, with and without
+DEFAULT_COALESCE_RULES, and counts the downstream work: snapshot rebuilds,
+frame pushes to FrameManager and handler invocations.
+
+The state file is copied to a temporary directory, the real one is untouched.
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/event_coalescing_benchmark.py
+        python tools/benchmarks/event_coalescing_benchmark.py --rate 500 --duration 3
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+sys.path.insert(0, str(SRC))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from controllers.led_controller.static_mode_controller import StaticModeController
+from engine.frame_manager import FrameManager
+from hardware.gpio import MockGPIOManager
+from managers.config_manager import ConfigManager
+from models.enums import LogLevel, ZoneRenderMode
+from models.events import EventType
+from services import AnimationService, ApplicationStateService, DataAssembler, ServiceContainer, ZoneService
+from services.event_bus import EventBus
+from services.event_coalescing import DEFAULT_COALESCE_RULES
+from services.snapshot_publisher import SnapshotPublisher
+from utils.logger import configure_logger
+
+
+async def run_once(args, coalesce: bool, state_dir: Path) -> dict:
+    state_file = state_dir / f"state_{'on' if coalesce else 'off'}.json"
+    shutil.copy(SRC / "state" / "state.json", state_file)
+
+    config_manager = ConfigManager(MockGPIOManager())
+    config_manager.load()
+
+    event_bus = EventBus()
+    event_bus.start_queue(maxsize=256, workers=2)
+    if coalesce:
+        for rule in DEFAULT_COALESCE_RULES:
+            event_bus.add_coalesce_rule(rule)
+
+    assembler = DataAssembler(config_manager, state_file, debounce_ms=10_000)
+    app_state_service = ApplicationStateService(assembler)
+    zone_service = ZoneService(assembler, app_state_service, event_bus)
+    frame_manager = FrameManager(fps=60)
+
+    services = ServiceContainer(
+        event_bus=event_bus,
+        zone_service=zone_service,
+        animation_service=AnimationService(assembler),
+        app_state_service=app_state_service,
+        frame_manager=frame_manager,
+        color_manager=config_manager.color_manager,
+        config_manager=config_manager,
+        data_assembler=assembler,
+    )
+    SnapshotPublisher(zone_service=zone_service, event_bus=event_bus)
+
+    zone = next(iter(zone_service.get_by_render_mode(ZoneRenderMode.STATIC)), None) or zone_service.get_all()[0]
+    zone.state.mode = ZoneRenderMode.STATIC
+    await StaticModeController(services).initialize()
+
+    counts = {"events": 0, "snapshots": 0, "frames": 0, "handler_calls": 0}
+    last_snapshot = {}
+
+    def count_event(event):
+        counts["events"] += 1
+
+    def count_snapshot(event):
+        counts["snapshots"] += 1
+        last_snapshot["brightness"] = event.snapshot.brightness
+
+    event_bus.subscribe(EventType.ZONE_STATIC_STATE_CHANGED, count_event, priority=100)
+    event_bus.subscribe(EventType.ZONE_SNAPSHOT_UPDATED, count_snapshot)
+
+    submit_frame = frame_manager.submit_frame
+
+    def counting_submit(frame):
+        counts["frames"] += 1
+        submit_frame(frame)
+
+    frame_manager.submit_frame = counting_submit  # type: ignore[method-assign]
+
+    calls = int(args.rate * args.duration)
+    interval = 1.0 / args.rate
+    zone_service.set_brightness(zone.config.id, 50)
+    await asyncio.sleep(0.1)
+    await event_bus.join()
+    for key in counts:
+        counts[key] = 0
+    dispatched_before = event_bus.get_queue_metrics()["dispatched"]
+
+    started = time.perf_counter()
+    for i in range(calls):
+        # Sweep up and down like a user searching for the right level
+        zone_service.adjust_brightness(zone.config.id, 1 if (i // 40) % 2 == 0 else -1)
+        target = started + (i + 1) * interval
+        delay = target - time.perf_counter()
+        await asyncio.sleep(max(0.0, delay))
+
+    await asyncio.sleep(0.1)
+    await event_bus.stop_queue()
+    elapsed = time.perf_counter() - started
+
+    metrics = event_bus.get_queue_metrics()
+    counts["handler_calls"] = metrics["dispatched"] - dispatched_before
+    counts["final_ok"] = last_snapshot.get("brightness") == zone.state.brightness
+    counts["calls"] = calls
+    counts["elapsed"] = elapsed
+    return counts
+
+
+async def run(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        off = await run_once(args, coalesce=False, state_dir=Path(tmp))
+        on = await run_once(args, coalesce=True, state_dir=Path(tmp))
+
+    print(f"Knob simulation: {off['calls']} adjust_brightness calls at {args.rate:.0f}/s")
+    print(f"{'':24s}{'no rules':>12s}{'coalesced':>12s}{'reduction':>12s}")
+    for key, label in (
+        ("events", "ZONE_STATIC events"),
+        ("snapshots", "Snapshot rebuilds"),
+        ("frames", "Frame pushes"),
+        ("handler_calls", "Queued dispatches"),
+    ):
+        reduction = 1 - on[key] / off[key] if off[key] else 0.0
+        print(f"{label:24s}{off[key]:>12d}{on[key]:>12d}{reduction:>11.0%}")
+    print(f"Final snapshot matches state: {off['final_ok']} / {on['final_ok']}")
+    return 0 if on["final_ok"] else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Event coalescing downstream-work benchmark")
+    parser.add_argument("--rate", type=float, default=200.0, help="adjust_brightness calls per second")
+    parser.add_argument("--duration", type=float, default=2.0)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.WARN)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
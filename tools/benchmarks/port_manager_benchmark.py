@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Port Manager Benchmark
+
+Measures how long PortManager.open_listen_socket() takes to hand the API
+server a listening socket in the situations met on restart:
+
+    free          nothing on the port
+    time_wait     previous run closed its connections first (TIME_WAIT left)
+    orphan        previous run still listening (SO_REUSEADDR, e.g. uvicorn
+                  left orphaned by the Starlette lifespan bug)
+    orphan_rp     previous run still listening with SO_REUSEPORT (binds next
+                  to it; the orphan is only reported, not killed)
+    suspended     previous run stopped with Ctrl+Z (SIGSTOP) while listening
+
+Each orphan is a separate Python process; the benchmark checks it was killed
+(orphan_rp: that it was left running).
+
+Usage:
+    From command line (run from repo root; orphans owned by other users need sudo):
+        python tools/benchmarks/port_manager_benchmark.py
+        python tools/benchmarks/port_manager_benchmark.py --port 8765 --runs 5
+"""
+
+import argparse
+import asyncio
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from services.port_manager import PortManager
+from utils.logger import configure_logger
+from models.enums import LogLevel
+
+ORPHAN = """
+import socket, sys, time
+s = socket.socket()
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+if sys.argv[2] == "1":
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+s.bind(("0.0.0.0", int(sys.argv[1])))
+s.listen(16)
+print("ready", flush=True)
+time.sleep(600)
+"""
+
+
+def make_time_wait(port: int) -> None:
+    """Leave a TIME_WAIT connection on the server side of port"""
+    srv = socket.socket()
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind(("0.0.0.0", port))
+    srv.listen(1)
+    cli = socket.create_connection(("127.0.0.1", port))
+    conn, _ = srv.accept()
+    conn.close()
+    srv.close()
+    cli.recv(1)
+    cli.close()
+
+
+def start_orphan(port: int, reuse_port: bool, suspend: bool) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [sys.executable, "-c", ORPHAN, str(port), "1" if reuse_port else "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    proc.stdout.readline()
+    if suspend:
+        proc.send_signal(signal.SIGSTOP)
+    return proc
+
+
+async def measure(port: int, scenario: str) -> tuple:
+    orphan = None
+    if scenario == "time_wait":
+        make_time_wait(port)
+    elif scenario != "free":
+        orphan = start_orphan(port, reuse_port=scenario == "orphan_rp", suspend=scenario == "suspended")
+
+    pm = PortManager()
+    started = time.perf_counter()
+    try:
+        sock = await pm.open_listen_socket(port)
+        elapsed = (time.perf_counter() - started) * 1000
+        sock.close()
+        result = "ok"
+    except (RuntimeError, OSError) as e:
+        elapsed = (time.perf_counter() - started) * 1000
+        result = f"FAILED ({e.__class__.__name__})"
+
+    if orphan is not None:
+        try:
+            killed = orphan.wait(timeout=0.2 if scenario == "orphan_rp" else 2) == -signal.SIGKILL
+        except subprocess.TimeoutExpired:
+            killed = False
+        if scenario == "orphan_rp":
+            if killed:
+                result += ", orphan killed"
+        elif not killed:
+            result += ", orphan survived"
+        orphan.kill()
+        orphan.wait()
+        orphan.stdout.close()
+    return elapsed, result
+
+
+async def run(args) -> int:
+    print(f"open_listen_socket() on port {args.port}, median of {args.runs} runs")
+    for scenario in ("free", "time_wait", "orphan", "orphan_rp", "suspended"):
+        times, results = [], set()
+        for _ in range(args.runs):
+            elapsed, result = await measure(args.port, scenario)
+            times.append(elapsed)
+            results.add(result)
+            await asyncio.sleep(0.05)
+        print(f"  {scenario:12s}{statistics.median(times):>9.2f} ms   {', '.join(sorted(results))}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PortManager restart benchmark")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.ERROR)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
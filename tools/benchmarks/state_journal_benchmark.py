@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+State Journal Benchmark
+
+Measures startup replay of the append-only state journal and compares the
+bytes written per save with the full state.json rewrite.
+
+A journal of --entries per-zone deltas (cycling through the zones of
+src/state/state.json with changing color / brightness) is replayed through
+DataAssembler.load_state(), as at startup. Compaction is disabled so the
+journal really holds every entry.
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/state_journal_benchmark.py
+        python tools/benchmarks/state_journal_benchmark.py --entries 100000 --runs 5 --limit-ms 500
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from services.data_assembler import DataAssembler
+from services.state_journal import StateJournal
+from utils.logger import configure_logger
+from models.enums import LogLevel
+
+STATE_FILE = REPO_ROOT / "src" / "state" / "state.json"
+NO_COMPACTION = 1 << 62
+
+
+def make_assembler(state_path: Path, persistence: str) -> DataAssembler:
+    config_manager = SimpleNamespace(color_manager=None, animation_manager=None)
+    return DataAssembler(config_manager, state_path, persistence=persistence, journal_compact_bytes=NO_COMPACTION)
+
+
+def write_journal(state_path: Path, entries: int) -> int:
+    """Append `entries` zone deltas in batches; returns the journal size"""
+    zones = json.loads(state_path.read_text())["zones"]
+    keys = list(zones)
+    journal = StateJournal(state_path.with_suffix(".journal"), NO_COMPACTION)
+
+    batch = []
+    for i in range(entries):
+        key = keys[i % len(keys)]
+        zone = dict(zones[key])
+        zone["brightness"] = i % 101
+        zone["color"] = {"mode": "HUE", "hue": i % 360}
+        batch.append(("zones", key, json.dumps(zone, separators=(",", ":"))))
+        if len(batch) == 1000:
+            journal.append(batch)
+            batch = []
+    journal.append(batch)
+    return journal.size
+
+
+async def bytes_per_save(state_dir: Path, persistence: str) -> float:
+    """Average bytes written per single-zone save for one backend"""
+    state_path = state_dir / f"{persistence}.json"
+    shutil.copy(STATE_FILE, state_path)
+    assembler = make_assembler(state_path, persistence)
+    zones = list(assembler.load_state()["zones"])
+
+    saves = 50
+    written = 0
+    for i in range(saves):
+        state = assembler.load_state()
+        key = zones[i % len(zones)]
+        state["zones"][key] = {**state["zones"][key], "brightness": i}
+        assembler._mark_dirty("zones", key)
+        before = assembler._journal.size
+        await assembler.flush()
+        if persistence == "journal":
+            written += assembler._journal.size - before
+        else:
+            written += state_path.stat().st_size
+    return written / saves
+
+
+def run(args) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        state_dir = Path(tmp)
+        state_path = state_dir / "state.json"
+        shutil.copy(STATE_FILE, state_path)
+        journal_bytes = write_journal(state_path, args.entries)
+
+        timings = []
+        for _ in range(args.runs):
+            assembler = make_assembler(state_path, "journal")
+            started = time.perf_counter()
+            assembler.load_state()
+            timings.append((time.perf_counter() - started) * 1000)
+            replayed = assembler._journal.entries
+
+        snapshot_save = asyncio.run(bytes_per_save(state_dir, "snapshot"))
+        journal_save = asyncio.run(bytes_per_save(state_dir, "journal"))
+
+    median = statistics.median(timings)
+    print(f"Journal: {replayed} entries, {journal_bytes / 1024:.0f} KiB")
+    print(f"Startup replay (load_state): median {median:.1f} ms, "
+          f"min {min(timings):.1f} ms, max {max(timings):.1f} ms over {args.runs} runs")
+    print(f"Replay rate: {replayed / median * 1000:,.0f} entries/s")
+    print(f"Bytes per single-zone save: snapshot {snapshot_save:.0f}, journal {journal_save:.0f} "
+          f"({1 - journal_save / snapshot_save:.0%} less)")
+
+    ok = replayed == args.entries and median <= args.limit_ms
+    if median > args.limit_ms:
+        print(f"FAIL: replay slower than {args.limit_ms:.0f} ms")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="State journal replay benchmark")
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--limit-ms", type=float, default=1000.0, help="fail if median replay exceeds this")
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.WARN)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Task Registry Soak Benchmark
+
+Simulates a week of uptime compressed into a few seconds: each simulated day
+runs --tasks-per-day short tracked tasks (transitions, animation steps,
+hardware writes...), a few of them failing, through one TaskRegistry.
+After every day it reports retained records and traced memory.
+
+Two registries are compared:
+
+    bounded     defaults (finished ring, failed ring, no stack capture)
+    unbounded   every record kept, origin stack captured for every task
+                (previous behaviour)
+
+Also reports the cost of register() with and without stack capture.
+
+Usage:
+    From command line (run from repo root):
+        python tools/benchmarks/task_registry_soak_benchmark.py
+        python tools/benchmarks/task_registry_soak_benchmark.py --tasks-per-day 20000 --days 7
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import lifecycle.handlers  # noqa: F401  (same import order as main_asyncio, avoids circular import)
+from lifecycle.task_registry import TaskCategory, TaskRegistry
+from utils.logger import configure_logger
+from models.enums import LogLevel
+
+CATEGORIES = [TaskCategory.TRANSITION, TaskCategory.ANIMATION, TaskCategory.HARDWARE, TaskCategory.RENDER]
+FAIL_EVERY = 1000
+
+
+async def short_task(n: int) -> None:
+    if n % FAIL_EVERY == 0:
+        raise RuntimeError("simulated failure")
+
+
+async def simulate_day(registry: TaskRegistry, day: int, tasks_per_day: int, batch: int = 500) -> None:
+    for start in range(0, tasks_per_day, batch):
+        tasks = []
+        for i in range(start, min(start + batch, tasks_per_day)):
+            n = day * tasks_per_day + i + 1
+            task = asyncio.create_task(short_task(n))
+            registry.register(task, CATEGORIES[n % len(CATEGORIES)], f"simulated task {n}")
+            tasks.append(task)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def soak(label: str, registry: TaskRegistry, days: int, tasks_per_day: int) -> None:
+    print(f"\n{label}")
+    print(f"  {'day':>4}{'created':>10}{'retained':>10}{'memory':>12}")
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for day in range(days):
+        await simulate_day(registry, day, tasks_per_day)
+        current = tracemalloc.get_traced_memory()[0] - baseline
+        stats = registry.get_stats()
+        print(f"  {day + 1:>4}{stats['total']:>10}{stats['retained']:>10}{current / 1024:>9.0f} KiB")
+    tracemalloc.stop()
+
+
+async def register_cost(stack_sample_every: int, count: int) -> float:
+    registry = TaskRegistry(stack_sample_every=stack_sample_every)
+    tasks = [asyncio.create_task(short_task(1)) for _ in range(count)]
+    started = time.perf_counter()
+    for task in tasks:
+        registry.register(task, TaskCategory.BACKGROUND, "cost probe")
+    elapsed = time.perf_counter() - started
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return elapsed / count * 1e6
+
+
+async def run(args) -> int:
+    print(f"Simulating {args.days} days x {args.tasks_per_day} tasks/day (1 in {FAIL_EVERY} fails)")
+
+    await soak("bounded", TaskRegistry(), args.days, args.tasks_per_day)
+    await soak(
+        "unbounded",
+        TaskRegistry(max_finished=None, max_failed=None, stack_sample_every=1),
+        args.days,
+        args.tasks_per_day,
+    )
+
+    print("\nregister() cost")
+    for label, every in (("no stack", 0), ("stack every 100th", 100), ("stack every task", 1)):
+        print(f"  {label:20s}{await register_cost(every, 5000):>8.2f} us")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="TaskRegistry memory soak benchmark")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--tasks-per-day", type=int, default=10000)
+    args = parser.parse_args()
+
+    configure_logger(LogLevel.WARN)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
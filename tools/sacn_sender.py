@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+sACN / Art-Net Test Sender
+
+Streams a moving rainbow over sACN (E1.31) or Art-Net to exercise the
+network_input section of zone_mapping.yaml without external lighting software.
+
+Usage:
+    From command line (run from repo root):
+        python tools/sacn_sender.py                          # sACN, universe 1, 60fps
+        python tools/sacn_sender.py --universes 1 2 --fps 40
+        python tools/sacn_sender.py --protocol artnet --host 192.168.1.50 --universes 0
+"""
+
+import argparse
+import colorsys
+import socket
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hardware.input.network.packets import build_sacn, build_artnet, SACN_PORT, ARTNET_PORT
+
+
+def rainbow(pixels: int, offset: float) -> bytes:
+    """RGB bytes for a rainbow shifted by offset (0..1)"""
+    data = bytearray()
+    for i in range(pixels):
+        r, g, b = colorsys.hsv_to_rgb((offset + i / max(pixels, 1)) % 1.0, 1.0, 1.0)
+        data += bytes((int(r * 255), int(g * 255), int(b * 255)))
+    return bytes(data)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Send test pixel data over sACN / Art-Net")
+    parser.add_argument("--protocol", choices=["sacn", "artnet"], default="sacn")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--universes", type=int, nargs="+", default=[1])
+    parser.add_argument("--pixels", type=int, default=170, help="Pixels per universe (max 170)")
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds to run (0 = forever)")
+    args = parser.parse_args()
+
+    is_sacn = args.protocol == "sacn"
+    port = args.port or (SACN_PORT if is_sacn else ARTNET_PORT)
+    pixels = max(1, min(args.pixels, 170))
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+    print(f"Sending {args.protocol} to {args.host}:{port}, universes={args.universes}, "
+          f"{pixels} px, {args.fps:.0f} fps (Ctrl+C to stop)")
+
+    interval = 1.0 / args.fps
+    started = time.perf_counter()
+    next_tick = started
+    sequence = 0
+    sent = 0
+
+    try:
+        while not args.duration or time.perf_counter() - started < args.duration:
+            offset = (time.perf_counter() - started) * 0.25
+            data = rainbow(pixels, offset)
+            sequence = (sequence + 1) & 0xFF
+
+            for universe in args.universes:
+                packet = build_sacn(universe, data, sequence) if is_sacn else build_artnet(universe, data, sequence)
+                sock.sendto(packet, (args.host, port))
+                sent += 1
+
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.perf_counter()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sock.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Sent {sent} packets in {elapsed:.1f}s ({sent / max(elapsed, 1e-9):.0f} pkt/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
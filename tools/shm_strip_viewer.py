@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared-Memory Strip Viewer
+
+Renders frames published by SharedMemoryStrip (virtual_strips.shared_memory
+in hardware.yaml) as truecolor blocks in the terminal, and reports the
+observed frame rate and dropped frames.
+
+Usage:
+    From command line (run from repo root, while the app is running):
+        python tools/shm_strip_viewer.py --gpio 18
+        python tools/shm_strip_viewer.py --name diuna_strip_19 --stats-only
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hardware.led.shared_memory_strip import SharedMemoryFrameReader
+
+
+def render(rgb: bytes) -> str:
+    it = iter(rgb)
+    return "".join(f"\x1b[48;2;{r};{g};{b}m \x1b[0m" for r, g, b in zip(it, it, it))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="View SharedMemoryStrip frames")
+    parser.add_argument("--gpio", type=int, default=18)
+    parser.add_argument("--name", default=None, help="Shared memory block name (overrides --gpio)")
+    parser.add_argument("--stats-only", action="store_true", help="Print only fps / drop statistics")
+    parser.add_argument("--poll", type=float, default=0.002, help="Poll interval in seconds")
+    args = parser.parse_args()
+
+    name = args.name or f"diuna_strip_{args.gpio}"
+    try:
+        reader = SharedMemoryFrameReader(name)
+    except FileNotFoundError:
+        print(f"Shared memory block '{name}' not found - is the app running with virtual_strips.shared_memory?")
+        return 1
+
+    print(f"Attached to {name}: {reader.pixel_count} px, {reader.slots} slots")
+
+    last_seq = reader.sequence
+    received = dropped = 0
+    window_start = time.perf_counter()
+
+    try:
+        while True:
+            frames = reader.read_since(last_seq)
+            for seq, _, rgb in frames:
+                dropped += max(0, seq - last_seq - 1)
+                received += 1
+                last_seq = seq
+                if not args.stats_only:
+                    sys.stdout.write("\r" + render(rgb))
+
+            now = time.perf_counter()
+            if now - window_start >= 1.0:
+                fps = received / (now - window_start)
+                sys.stdout.write(f"\n{fps:6.1f} fps, dropped {dropped}, seq {last_seq}\n")
+                received = dropped = 0
+                window_start = now
+            sys.stdout.flush()
+            time.sleep(args.poll)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())